@@ -1,9 +1,11 @@
-from typing import Dict, Iterable, Optional, Sequence, Union
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+from copy import deepcopy
 import csv
 from pathlib import Path
 
 import json
 import numpy as np
+import pandas as pd
 import PySAM.Singleowner as Singleowner
 from attrs import field, define
 
@@ -22,9 +24,13 @@ from hopp.simulation.technologies.grid import Grid, GridConfig
 from hopp.simulation.technologies.reopt import REopt
 from hopp.simulation.technologies.layout.hybrid_layout import HybridLayout
 from hopp.simulation.technologies.dispatch.hybrid_dispatch_builder_solver import HybridDispatchBuilderSolver
+from hopp.simulation.hybrid_snapshot import HybridSimulationSnapshot
 from hopp.utilities.log import hybrid_logger as logger
+from hopp.utilities.fork_pool import ForkPool, is_fork_available
 from hopp.simulation.base import BaseClass
 
+# The snapshot restored before each candidate by the workers of (this process in) HybridSimulation.evaluate_batch
+_batch_snapshot = None
 
 PowerSourceTypes = Union[
     PVPlant,
@@ -843,6 +849,100 @@ class HybridSimulation(BaseClass):
         self.calculate_financials()
         self.simulate_financials(project_life)
 
+    def evaluate_batch(self,
+                       candidates: List[dict],
+                       project_life: int = 25,
+                       lifetime_sim=False,
+                       n_processes: int = 1) -> pd.DataFrame:
+        """
+        Simulates a batch of design candidates with this hybrid plant, reusing its site, resources, system models,
+        dispatch model and cost calculator.
+
+        Each candidate is a nested dictionary of values to assign, i.e., ``{'pv': {'system_capacity_kw': 5e3}}``,
+        like :py:func:`assign`. A :py:func:`snapshot` of the plant is taken before the batch and restored before each
+        candidate, so every candidate starts from the plant as it was before the batch, including state carried over
+        by a simulation such as the CSP plant state and battery state of charge, and its results do not depend on
+        its position in the batch. The snapshot is restored after the batch, also if a candidate raises an error.
+
+        :param candidates: list of nested dictionaries of values to assign per candidate
+        :param project_life: ``int``,
+            Number of year in the analysis period (execepted project lifetime) [years]
+        :param lifetime_sim: ``bool``,
+            For simulation modules which support simulating each year of the project_life, whether or not to do so; otherwise the first year data is repeated
+        :param n_processes: ``int``,
+            Number of forked worker processes used to simulate candidates. If 1, candidates are simulated in this process
+
+        :returns: DataFrame with one row per candidate, with a ``<tech>.<name>`` column for each candidate input and
+            a column for each scalar output of :py:func:`hybrid_simulation_outputs`
+        """
+        if n_processes < 1:
+            raise ValueError("'n_processes' must be at least 1")
+        if n_processes > 1 and not is_fork_available():
+            raise ValueError("'n_processes' > 1 requires the 'fork' process start method, which is not available on this platform")
+
+        baseline = {}
+        for candidate in candidates:
+            for tech, values in candidate.items():
+                if tech not in self.technologies.keys():
+                    raise ValueError(f"Candidate technology '{tech}' is not included in hybrid plant")
+                for name in values.keys():
+                    if f"{tech}.{name}" not in baseline:
+                        baseline[f"{tech}.{name}"] = self.technologies[tech].value(name)
+
+        global _batch_snapshot
+        snapshot = self.snapshot()
+        args = [(candidate, project_life, lifetime_sim) for candidate in candidates]
+        try:
+            if n_processes == 1 or len(candidates) < 2:
+                rows = [self.evaluate_candidate(*arg, snapshot=snapshot) for arg in args]
+            else:
+                # forked workers inherit the snapshot, so it is not pickled for every candidate. It is not an
+                # attribute of the plant, which restoring the snapshot would reset
+                _batch_snapshot = snapshot
+                with ForkPool(self, min(n_processes, len(candidates))) as pool:
+                    rows = pool.starmap(HybridSimulation._evaluate_batch_candidate, args)
+        finally:
+            _batch_snapshot = None
+            self.restore(snapshot)
+        return pd.DataFrame([dict(baseline, **row) for row in rows])
+
+    def evaluate_candidate(self,
+                           candidate: dict,
+                           project_life: int = 25,
+                           lifetime_sim=False,
+                           snapshot: Optional[HybridSimulationSnapshot] = None) -> dict:
+        """
+        Assigns a design candidate's values, simulates the hybrid plant and returns the candidate's inputs and scalar
+        outputs. Used by :py:func:`evaluate_batch`.
+
+        :param candidate: nested dictionary of values to assign, i.e., ``{'pv': {'system_capacity_kw': 5e3}}``
+        :param project_life: ``int``,
+            Number of year in the analysis period (execepted project lifetime) [years]
+        :param lifetime_sim: ``bool``,
+            For simulation modules which support simulating each year of the project_life, whether or not to do so; otherwise the first year data is repeated
+        :param snapshot: (optional) snapshot restored before the candidate's values are assigned
+
+        :returns: dictionary of candidate inputs, keyed by ``<tech>.<name>``, and scalar hybrid simulation outputs
+        """
+        if snapshot is not None:
+            self.restore(snapshot)
+        row = {}
+        for tech, values in candidate.items():
+            for name, value in values.items():
+                self.technologies[tech].value(name, value)
+                row[f"{tech}.{name}"] = value
+
+        self.simulate(project_life, lifetime_sim)
+
+        for name, value in self.hybrid_simulation_outputs().items():
+            if isinstance(value, (int, float, np.number, str)):
+                row[name] = value
+        return row
+
+    def _evaluate_batch_candidate(self, candidate: dict, project_life: int, lifetime_sim) -> dict:
+        """Evaluates a candidate in a worker of :py:func:`evaluate_batch`, starting from the batch's snapshot"""
+        return self.evaluate_candidate(candidate, project_life, lifetime_sim, snapshot=_batch_snapshot)
+
     @property
     def interconnect_kw(self) -> float:
         """Interconnection limit [kW]"""
@@ -1299,12 +1399,41 @@ class HybridSimulation(BaseClass):
             export_dicts[tech] = self.technologies[tech.lower()].export()
         return export_dicts
 
-    def copy(self):
+    def copy(self) -> "HybridSimulation":
         """
+        Builds a new hybrid plant from this plant's configuration, sharing its site, and restores a snapshot of this
+        plant into it. Outputs of the PySAM models are not copied, simulate the copy to update them.
+
         :return: a clone
         """
-        # TODO implement deep copy
-        raise NotImplementedError
+        clone = HybridSimulation(
+            self.site,
+            deepcopy(self.tech_config),
+            dispatch_options=deepcopy(self.dispatch_options),
+            cost_info=deepcopy(self.cost_info),
+            simulation_options=deepcopy(self.simulation_options),
+        )
+        clone.restore(self.snapshot())
+        return clone
+
+    def snapshot(self) -> HybridSimulationSnapshot:
+        """
+        Captures the inputs of the PySAM models and the state of the technologies, dispatch and cost calculator,
+        to reset this plant, or another plant built from the same configuration, with :py:func:`restore`. This is
+        much faster than building a new plant, e.g., to reset the plant between design candidates.
+
+        :return: the snapshot, which can be pickled
+        """
+        return HybridSimulationSnapshot.capture(self)
+
+    def restore(self, snapshot: HybridSimulationSnapshot):
+        """
+        Restores a snapshot taken with :py:func:`snapshot`. Outputs of the PySAM models are not restored, simulate
+        the plant to update them.
+
+        :param snapshot: snapshot of this plant or of a plant built from the same configuration
+        """
+        snapshot.restore(self)
 
     def plot_layout(self,
                     figure=None,
@@ -0,0 +1,171 @@
+import io
+import pickle
+from typing import TYPE_CHECKING, Dict
+
+from hopp.simulation.technologies.csp.pySSC_daotk.ssc_wrap import PysscWrap
+from hopp.utilities.log import hybrid_logger as logger
+
+if TYPE_CHECKING:
+    from hopp.simulation.hybrid_simulation import HybridSimulation
+
+
+class HybridSimulationSnapshot:
+    """Captured state of a :class:`hopp.simulation.hybrid_simulation.HybridSimulation`, which can be restored into
+    the same plant or into another plant built from the same configuration.
+
+    Objects that are expensive to build, i.e., the site, the PySAM models, the Pyomo dispatch models, the dispatch
+    builder and the ssc library of the CSP plants, are not copied: PySAM models are captured through ``export()``
+    and restored in place with ``replace()`` or ``assign()``, and the other objects are referenced by name. The
+    remaining attributes of the hybrid simulation, its technologies and their Python financial and system models,
+    e.g., layouts, battery state, CSP plant state and parameters, the cost calculator and dispatch solve metrics, are
+    captured in a pickle.
+
+    PySAM outputs cannot be assigned, so the outputs of PySAM models are not restored: simulate the plant after
+    restoring a snapshot to update them. Likewise, the state of the Pyomo dispatch models, i.e., their parameter and
+    variable values, is not captured: it is rebuilt from the restored technologies when the plant is simulated.
+
+    The snapshot is serializable with pickle, e.g., to seed worker processes from one snapshot.
+    """
+
+    def __init__(self, state: bytes, models: Dict[str, dict]):
+        """
+        Args:
+            state: pickled attributes of the hybrid simulation and its technologies
+            models: exported inputs of each PySAM model, keyed by name
+        """
+        self.state = state
+        self.models = models
+
+    @classmethod
+    def capture(cls, hybrid: "HybridSimulation") -> "HybridSimulationSnapshot":
+        """Captures the state of `hybrid`."""
+        shared = _shared_objects(hybrid)
+
+        models = dict()
+        objects = dict()
+        for name, obj in shared.items():
+            if _is_pysam(obj):
+                models[name] = {
+                    group: values for group, values in obj.export().items() if group != "Outputs"
+                }
+            elif _is_stateful(name):
+                objects[name] = _get_state(obj)
+
+        state = {"objects": objects}
+        if hybrid.dispatch_builder.needs_dispatch:
+            state["problem_state"] = hybrid.dispatch_builder.problem_state
+
+        buffer = io.BytesIO()
+        _SharedPickler(buffer, shared).dump(state)
+        return cls(buffer.getvalue(), models)
+
+    def restore(self, hybrid: "HybridSimulation"):
+        """Restores the captured state into `hybrid`, which must have the same technologies."""
+        shared = _shared_objects(hybrid)
+        missing = set(self.models.keys()).difference(shared.keys())
+        if missing:
+            raise ValueError(f"Snapshot does not match the hybrid simulation, missing {sorted(missing)}")
+
+        state = _SharedUnpickler(io.BytesIO(self.state), shared).load()
+        for name, values in self.models.items():
+            model = shared[name]
+            # financial models created from their system model share its data, so they must not unassign it
+            if name.startswith("financial:") and _shares_data(model, shared.get("system:" + name.split(":")[1])):
+                model.assign(values)
+            else:
+                model.replace(values)
+        for name, attributes in state["objects"].items():
+            if name not in shared:
+                raise ValueError(f"Snapshot does not match the hybrid simulation, missing {name}")
+            _set_state(shared[name], attributes)
+        if "problem_state" in state:
+            hybrid.dispatch_builder.problem_state = state["problem_state"]
+
+    def __getstate__(self):
+        return {"state": self.state, "models": self.models}
+
+    def __setstate__(self, state):
+        self.state = state["state"]
+        self.models = state["models"]
+
+
+def _shared_objects(hybrid: "HybridSimulation") -> dict:
+    """Returns the objects of `hybrid` that are referenced by name instead of being copied into a snapshot."""
+    shared = {
+        "hybrid": hybrid,
+        "site": hybrid.site,
+        "dispatch_builder": hybrid.dispatch_builder,
+    }
+    for name, tech in hybrid.technologies.items():
+        shared["plant:" + name] = tech
+        if tech._system_model is not None:
+            shared["system:" + name] = tech._system_model
+        # the CSP plants' ssc library is loaded once per plant
+        if isinstance(getattr(tech, "ssc", None), PysscWrap):
+            shared["ssc:" + name] = tech.ssc.ssc
+        if tech._financial_model is not None:
+            shared["financial:" + name] = tech._financial_model
+        if getattr(tech, "_dispatch", None) is not None and not isinstance(tech._dispatch, type):
+            shared["dispatch:" + name] = tech._dispatch
+    return shared
+
+
+def _is_stateful(name: str) -> bool:
+    # attributes of the site and the dispatch objects are left as they are
+    return name == "hybrid" or name.split(":")[0] in ("plant", "system", "financial")
+
+
+def _is_pysam(obj) -> bool:
+    return all(hasattr(obj, attr) for attr in ("get_data_ptr", "export", "replace"))
+
+
+def _shares_data(model, other) -> bool:
+    return _is_pysam(other) and model.get_data_ptr() == other.get_data_ptr()
+
+
+def _get_state(obj) -> dict:
+    """Returns the attributes of `obj`, including those stored in slots."""
+    state = dict(getattr(obj, "__dict__", {}))
+    for cls in type(obj).__mro__:
+        for name in getattr(cls, "__slots__", ()):
+            if name in ("__dict__", "__weakref__") or name in state:
+                continue
+            try:
+                state[name] = object.__getattribute__(obj, name)
+            except AttributeError:
+                pass
+    return state
+
+
+def _set_state(obj, state: dict):
+    """Sets the attributes of `obj`, bypassing attrs validators and converters, which already ran when captured."""
+    for name, value in state.items():
+        object.__setattr__(obj, name, value)
+
+
+class _SharedPickler(pickle.Pickler):
+    def __init__(self, file, shared: dict):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._names = {id(obj): name for name, obj in shared.items()}
+
+    def persistent_id(self, obj):
+        name = self._names.get(id(obj))
+        if name is not None:
+            return name
+        if _is_pysam(obj):
+            # PySAM models that don't belong to a technology, e.g., in a layout, cannot be captured
+            logger.warning(f"Snapshot does not capture {type(obj).__name__} model that is not part of a technology")
+            raise pickle.PicklingError(f"Cannot capture {type(obj).__name__} model")
+        return None
+
+
+class _SharedUnpickler(pickle.Unpickler):
+    def __init__(self, file, shared: dict):
+        super().__init__(file)
+        self._shared = shared
+
+    def persistent_load(self, name):
+        if name not in self._shared:
+            raise ValueError(f"Snapshot does not match the hybrid simulation, missing {name}")
+        return self._shared[name]
+
@@ -1,7 +1,6 @@
 from dataclasses import dataclass, asdict
 from typing import Optional, Sequence, List, Union
 import numpy as np
-import pandas as pd
 import math
 
 
@@ -330,25 +329,18 @@ class Battery(PowerSource):
             raise ValueError("No dispatch set for this battery.")
 
         # Set stateful control value [Discharging (+) + Charging (-)]
-        if self.value("control_mode") == 1.0:
+        control_mode = self.value_owner("control_mode").control_mode
+        if control_mode == 1.0:
             control = [pow_MW*1e3 for pow_MW in self.dispatch.power]    # MW -> kW
-        elif self.value("control_mode") == 0.0:
+        elif control_mode == 0.0:
             control = [cur_MA * 1e6 for cur_MA in self.dispatch.current]    # MA -> A
         else:
             raise ValueError("Stateful battery module 'control_mode' invalid value.")
 
-        time_step_duration = self.dispatch.time_duration
-        for t in range(n_periods):
-            self.value('dt_hr', time_step_duration[t])
-            self.value(self.dispatch.control_variable, control[t])
-
-            # Only store information if passed the previous day simulations (used in clustering)
-            if sim_start_time is not None:
-                index_time_step = sim_start_time + t  # Store information
-            else:
-                index_time_step = None
-
-            self.simulate_power(time_step=index_time_step)
+        # Only store information if passed the previous day simulations (used in clustering)
+        self.simulate_with_control(control[0:n_periods],
+                                   self.dispatch.time_duration[0:n_periods],
+                                   sim_start_time=sim_start_time)
 
         if self.config.system_model_source == "hopp" and self.dispatch.options.include_lifecycle_count:
             self.cycle_count += self.dispatch.lifecycles[0]
@@ -369,6 +361,64 @@ class Battery(PowerSource):
 
         # logger.info("battery.outputs at start time {}".format(sim_start_time, self.outputs))
 
+    def simulate_with_control(self, control: Sequence, dt_hr: Union[float, Sequence], sim_start_time: Optional[int] = None):
+        """
+        Simulate battery over a horizon of control values in a single call
+
+        Equivalent to setting the control value and calling `simulate_power` for each time step. For the 'hopp'
+        `system_model_source` the horizon is simulated by `LDES.simulate_power_series`, o.w. the PySAM model groups are
+        resolved once and stepped directly. Stored outputs are written as slices.
+
+        Args:
+            control: Control value for each time step, power [kW] if `control_mode` is 1 or current [A] if
+                `control_mode` is 0 [Discharging (+) + Charging (-)]
+            dt_hr: Time step duration, either one value or a value for each time step [hrs]
+            sim_start_time: (optional) Start time step of horizon, if provided outputs are stored, o.w. they are not stored.
+        """
+        if not self._system_model:
+            return
+
+        n_periods = len(control)
+        if n_periods == 0:
+            return
+        dt_hr = np.broadcast_to(np.asarray(dt_hr, dtype=float), (n_periods,))
+
+        if self.config.system_model_source == "hopp":
+            power, soc = self._system_model.simulate_power_series(control, dt_hr)
+            self._system_model.params.dt_hr = float(dt_hr[-1])
+            if sim_start_time is None:
+                return
+            values = {'P': power.tolist(), 'SOC': soc.tolist(), 'gen': power.tolist()}
+            for attr in self.outputs.stateful_attributes:
+                if attr not in values and hasattr(self._system_model.state, attr):
+                    values[attr] = [getattr(self._system_model.state, attr)] * n_periods
+        else:
+            controls = self._system_model.Controls
+            control_variable = "input_power" if controls.control_mode == 1.0 else "input_current"
+            state_groups = {}
+            for attr in self.outputs.stateful_attributes:
+                for group in (self._system_model.StatePack, self._system_model.StateCell):
+                    if attr in group.__dir__():
+                        state_groups[attr] = group
+                        break
+            values = {attr: [0.0] * n_periods for attr in state_groups}
+
+            for t, (dt_t, control_t) in enumerate(zip(dt_hr.tolist(), control)):
+                controls.dt_hr = dt_t
+                setattr(controls, control_variable, float(control_t))
+                self._system_model.execute(0)
+                if sim_start_time is not None:
+                    for attr, group in state_groups.items():
+                        values[attr][t] = getattr(group, attr)
+
+            if sim_start_time is None:
+                return
+            values['gen'] = values['P']
+
+        time_slice = slice(sim_start_time, sim_start_time + n_periods)
+        for attr, val in values.items():
+            getattr(self.outputs, attr)[time_slice] = val
+
     def simulate_power(self, time_step=None):
         """
         Runs battery simulate and stores values if time step is provided
@@ -394,16 +444,16 @@ class Battery(PowerSource):
         for attr in self.outputs.stateful_attributes: # TODO include State in LDES model
             if self.config.system_model_source == "pysam":
                 if hasattr(self._system_model.StatePack, attr) or hasattr(self._system_model.StateCell, attr):
-                    getattr(self.outputs, attr)[time_step] = self.value(attr)
+                    getattr(self.outputs, attr)[time_step] = getattr(self.value_owner(attr), attr)
                 elif attr == 'gen':
-                    getattr(self.outputs, attr)[time_step] = self.value('P')
+                    getattr(self.outputs, attr)[time_step] = self.value_owner('P').P
             else:
                 if hasattr(self._system_model.state, attr):
-                    getattr(self.outputs, attr)[time_step] = self.value(attr)
+                    getattr(self.outputs, attr)[time_step] = getattr(self.value_owner(attr), attr)
                     if attr == 'n_cycles' and self.dispatch.options.include_lifecycle_count:
                         getattr(self.outputs, attr)[time_step] = math.floor(self.dispatch.lifecycles[0])
                 elif attr == 'gen':
-                    getattr(self.outputs, attr)[time_step] = self.value('P')
+                    getattr(self.outputs, attr)[time_step] = self.value_owner('P').P
 
     def validate_replacement_inputs(self, project_life):
         """
@@ -536,23 +586,18 @@ class Battery(PowerSource):
             Maximum feasible capacity [kWh]
         """
         t_step = self.site.interval / 60                                                # hr
-        df = pd.DataFrame()
-        df['E_delivered'] = [max(0, x * t_step) for x in self.outputs.P]                # [kWh]
-        df['SOC_perc'] = self.outputs.SOC                                               # [%]
-        df['E_stored'] = df.SOC_perc / 100 * self.system_capacity_kwh                   # [kWh]
-
-        def max_feasible_kwh(row):
-            return min(self.system_capacity_kw * t_step, row.E_delivered + row.E_stored)
+        E_delivered = np.maximum(0, np.asarray(self.outputs.P, dtype=float) * t_step)   # [kWh]
+        E_stored = np.asarray(self.outputs.SOC, dtype=float) / 100 * self.system_capacity_kwh     # [kWh]
 
         if use_avail_storage:
-            E_max_feasible = df.apply(max_feasible_kwh, axis=1)                             # [kWh]
+            E_max_feasible = np.minimum(self.system_capacity_kw * t_step, E_delivered + E_stored)  # [kWh]
         else:
-            E_max_feasible = df['E_delivered']
+            E_max_feasible = E_delivered
 
         W_ac_nom = self.calc_nominal_capacity(interconnect_kw)
         E_max_feasible = np.minimum(E_max_feasible, W_ac_nom*t_step) 
         
-        return list(E_max_feasible)
+        return E_max_feasible.tolist()
 
     @property
     def generation_profile(self) -> Sequence:
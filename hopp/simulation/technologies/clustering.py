@@ -32,6 +32,8 @@ class Clustering:
         self.n_cluster = 20                      # Number of clusters
         self.Nmaxiter = 200                      # Maximum iterations for clustering algorithm
         self.sim_hard_partitions = True          # Use hard partitioning for simulation weighting factors?
+        self.dtype = np.float64                  # Floating point type of classification data and similarity matrices (np.float32 halves memory for large inputs)
+        self.chunk_size = 256                    # Number of rows of the pairwise distance matrix computed at a time
 
         self.afp_preference_mult = 1.0          # Multiplier for default preference values (median of input similarities = negative Euclidean distance b/w points i and k) --> Larger multiplier = fewer clusters
         self.afp_damping = 0.5                  # Damping factor in affinity propagation algorithm
@@ -266,11 +268,9 @@ class Clustering:
                 print ('Warning: Wind speed data for wind generation was not supplied to clustering algorithm. Using wind speed from solar resource file')
         
  
-        self.daily_resource = {k:np.zeros(365) for k in ['dni', 'ghi', 'wspd']}
-        for d in range(365):
-            self.daily_resource['dni'][d] = hourly_data['dni'][d*n_pts_day : (d+1)*n_pts_day].sum() / 1000.  # kWh/m2/day
-            self.daily_resource['ghi'][d] = hourly_data['ghi'][d*n_pts_day : (d+1)*n_pts_day].sum() / 1000.  # kWh/m2/day
-            self.daily_resource['wspd'][d] = hourly_data['wspd'][d*n_pts_day : (d+1)*n_pts_day].sum()  
+        self.daily_resource = {k: np.asarray(hourly_data[k][:365*n_pts_day], float).reshape(365, n_pts_day).sum(1) for k in ['dni', 'ghi', 'wspd']}
+        self.daily_resource['dni'] /= 1000.  # kWh/m2/day
+        self.daily_resource['ghi'] /= 1000.  # kWh/m2/day
 
         #--- Replace dni, ghi or wind speed at all points with wind speed > stow limit
         csp_stow_wspd = None
@@ -292,7 +292,7 @@ class Clustering:
 
         #--- Read in price data
         hourly_data['price'] = np.ones(n_pts)
-        if self.price is None or self.price == {}:
+        if self.price is None or len(self.price) == 0:
             if self.weights['price'] > 0 or self.weights['price_prev'] > 0 or self.weights['price_next'] > 0:
                 print('Warning: Electricity price array was not provided. ' +
                     'Classification metrics will be calculated with a uniform price multiplier.')
@@ -359,17 +359,16 @@ class Clustering:
                     wts[i][0] = float(1.0 - (pstart - int(pstart))) / n  # Weighting factor for first point
                     wts[i][npt - 1] = float(pend - int(pend)) / n  # Weighting factor for last point   
 
-                # Calculate metrics for each day and each division
-                for d in range(365):
-                    for i in range(n_div):
-                        for h in range(len(pts[i])):  # Loop over hours which are at least partially contained in division i
-                            if pts[i][h] == n_pts:
-                                # Hour falls outside of allowed number of hours in the day (allowed as long as weighting factor is 0)
-                                if wts[i][h] > 0.0:
-                                    print('Error calculating weighted average for key ' + key + ' and division ' + str(i))
-                            else:
-                                p = d * n_pts_day + p1 + pts[i][h]  # Point in yearly array
-                                daily_metrics[key][d, i] += (hourly_data[data_name][p] * wts[i][h])
+                # Calculate metrics for all days at once for each division
+                daily_data = np.asarray(hourly_data[data_name][:365*n_pts_day], float).reshape(365, n_pts_day)[:, p1:p1 + n_pts]
+                for i in range(n_div):
+                    for h in range(len(pts[i])):  # Loop over hours which are at least partially contained in division i
+                        if pts[i][h] == n_pts:
+                            # Hour falls outside of allowed number of hours in the day (allowed as long as weighting factor is 0)
+                            if wts[i][h] > 0.0:
+                                print('Error calculating weighted average for key ' + key + ' and division ' + str(i))
+                        else:
+                            daily_metrics[key][:, i] += daily_data[:, pts[i][h]] * wts[i][h]
 
                 # Normalize daily metrics
                 max_metric = daily_metrics[key].max()
@@ -380,38 +379,30 @@ class Clustering:
         
 
         #--- Create arrays of classification data for groups of days
-        def get_data_for_group(d1, name):  # Get data for metric "name" for group starting on day d1
+        def get_data_for_groups(d1, name):  # Get data for metric "name" for groups starting on days d1
             if '_prev' in name:
-                days = [d1-1]
+                offsets = np.array([-1])
             elif '_next' in name:
-                days = [d1+self.ndays]
+                offsets = np.array([self.ndays])
             else:
-                days = [d1+i for i in range(self.ndays)]
-            ndays = len(days)
-            ndiv = self.divisions[name]
-            data = np.zeros(ndiv*ndays)
-            for j in range(ndays):
-                d = days[j]
-                if (d >= 0) and (d < 365):
-                    data[j*ndiv:(j+1)*ndiv] = daily_metrics[name][d, :] * self.weights[name]
-                else:
-                    data[j*ndiv:(j+1)*ndiv] = -1e8  # Use a large neative value to designate metrics that don't exist for this group (all others are scaled between 0-1)
-            return data          
+                offsets = np.arange(self.ndays)
+            days = d1[:, np.newaxis] + offsets  # Days included in each group
+            exists = (days >= 0) & (days < 365)
+            data = daily_metrics[name][np.clip(days, 0, 364), :] * self.weights[name]
+            data[~exists] = -1e8  # Use a large neative value to designate metrics that don't exist for this group (all others are scaled between 0-1)
+            return data.reshape(len(d1), -1)
 
         n_group = int(((365-2) / self.ndays))            # Number of complete groups (with existing days before/after)
-        self.data = np.zeros((n_group, int(n_metrics)))  # Classification data for complete groups
-        self.data_first, self.data_last = [np.zeros(n_metrics) for v in range(2)]  # Classification data for incomplete groups at beginning/end of year
-        j = 0
+        group_start_days = np.arange(n_group) * self.ndays + 1
+        data, data_first, data_last = [], [], []
         for k, wt in self.weights.items():
             if wt>0:
-                for g in range(n_group):
-                    d1 = g * self.ndays + 1
-                    groupdata = get_data_for_group(d1, k)
-                    n = len(groupdata)
-                    self.data[g,j:j+n] = groupdata
-                self.data_first[j:j+n] = get_data_for_group(0, k)
-                self.data_last[j:j+n] = get_data_for_group(self.ndays*n_group+1, k)
-                j+=n
+                data.append(get_data_for_groups(group_start_days, k))
+                data_first.append(get_data_for_groups(np.array([0]), k)[0])
+                data_last.append(get_data_for_groups(np.array([self.ndays*n_group+1]), k)[0])
+        self.data = np.hstack(data + [np.zeros((n_group, 0))]).astype(self.dtype)  # Classification data for complete groups
+        self.data_first = np.hstack(data_first + [np.zeros(0)]).astype(self.dtype)  # Classification data for incomplete groups at beginning/end of year
+        self.data_last = np.hstack(data_last + [np.zeros(0)]).astype(self.dtype)
 
         return 
 
@@ -484,8 +475,6 @@ class Clustering:
             print('    Created %d clusters. WCSS = %.2f' % (self.clusters['n_cluster'], self.clusters['wcss']))
 
         # Sort clusters in order of lowest to highest exemplar points
-        n_group = self.data.shape[0]  # Number of data points
-        n_cluster = self.clusters['n_cluster']
         inds = self.clusters['exemplars'].argsort()
         clusters_sorted = {}
         for key in self.clusters.keys():
@@ -493,16 +482,11 @@ class Clustering:
                 clusters_sorted[key] = self.clusters[key]
             else:
                 clusters_sorted[key] = np.empty_like(self.clusters[key])
-        for i in range(n_cluster):
-            k = inds[i]
-            clusters_sorted['partition_matrix'][:, i] = self.clusters['partition_matrix'][:, k]
-            for key in ['count', 'weights', 'exemplars']:
-                clusters_sorted[key][i] = self.clusters[key][k]
-            for key in ['means']:
-                clusters_sorted[key][i, :] = self.clusters[key][k, :]
-        for g in range(n_group):
-            k = self.clusters['index'][g]
-            clusters_sorted['index'][g] = inds.argsort()[k]
+        clusters_sorted['partition_matrix'][:, :] = self.clusters['partition_matrix'][:, inds]
+        for key in ['count', 'weights', 'exemplars']:
+            clusters_sorted[key][:] = self.clusters[key][inds]
+        clusters_sorted['means'][:, :] = self.clusters['means'][inds, :]
+        clusters_sorted['index'][:] = inds.argsort()[self.clusters['index']]
         
         self.clusters = clusters_sorted
         return 
@@ -526,12 +510,11 @@ class Clustering:
         if self.afp_preference_mult == 1.0:  # Run with default preference
             pref = None
         else:
-            distsqr = np.zeros((n_group,n_group))
-            for g in range(n_group):
-                distsqr[g,:] =  -((data[g,:] - data[:,:])**2).sum(1)  
+            distsqr = -pairwise_squared_distances(data, data, self.chunk_size)
             pref = (np.median(distsqr)) * self.afp_preference_mult
 
-        alg = AffinityPropagation(damping = self.afp_damping, max_iter=self.Nmaxiter, convergence_iter=self.afp_Nconverge, preference=pref)
+        alg = AffinityPropagation(damping = self.afp_damping, max_iter=self.Nmaxiter, convergence_iter=self.afp_Nconverge, preference=pref,
+                                  dtype=self.dtype, chunk_size=self.chunk_size)
         alg.fit_predict(data)
         clusters['index'] = alg.cluster_index
         clusters['n_cluster'] = alg.n_clusters
@@ -544,21 +527,17 @@ class Clustering:
         clusters['count'] = np.zeros(n_cluster, int)  # Number of data points nominally assigned to each Cluster
         clusters['partition_matrix'] = np.zeros((n_group, n_cluster))
 
-        for k in range(n_cluster):
-            clusters['count'][k] = np.sum(clusters['index'] == k)
+        clusters['count'][:] = np.bincount(clusters['index'], minlength=n_cluster)
 
         if self.sim_hard_partitions:
             inds = np.arange(n_group)
             clusters['partition_matrix'][inds, clusters['index'][inds]] = 1.0
 
         else:  # Compute "fuzzy" partition matrix
-            distsqr = np.zeros((n_group, n_cluster))
-            for k in range(n_cluster):
-                distsqr[:, k] = ((data - clusters['means'][k, :]) ** 2).sum(1)  # Squared distance between all data points and Cluster mean k
+            distsqr = pairwise_squared_distances(data, clusters['means'], self.chunk_size)  # Squared distance between all data points and Cluster means
             distsqr[distsqr == 0] = 1.e-10
             sumval = (distsqr ** (-2. / (self.mfuzzy - 1))).sum(1)  # Sum of dik^(-2/m-1) over all clusters k
-            for k in range(n_cluster):
-                clusters['partition_matrix'][:, k] = (distsqr[:, k] ** (2. / (self.mfuzzy - 1)) * sumval) ** -1
+            clusters['partition_matrix'][:, :] = (distsqr ** (2. / (self.mfuzzy - 1)) * sumval[:, np.newaxis]) ** -1
 
         # Sum of wij over all data points (i) / n_group
         clusters['weights'] = clusters['partition_matrix'].sum(0) / n_group
@@ -577,15 +556,10 @@ class Clustering:
         (excluded from original clustering algorithm because these days cannot be used as exemplar points)
         """
         ngroup, nfeatures = self.data.shape
-        n_clusters = self.clusters['n_cluster']
-        dist_first = np.zeros(n_clusters)
-        dist_last = np.zeros(n_clusters)
-        for k in range(n_clusters): 
-            for f in range(nfeatures):
-                if self.data_first[f] > -1.e6:  # Data feature f is defined for first set
-                    dist_first[k] += (self.data_first[f] - self.clusters['means'][k, f]) ** 2
-                if self.data_last[f] > -1.e6:
-                    dist_last[k] += (self.data_last[f] - self.clusters['means'][k, f]) ** 2
+        defined_first = self.data_first > -1.e6  # Data features defined for first set
+        defined_last = self.data_last > -1.e6
+        dist_first = ((self.data_first[defined_first] - self.clusters['means'][:, defined_first]) ** 2).sum(1)
+        dist_last = ((self.data_last[defined_last] - self.clusters['means'][:, defined_last]) ** 2).sum(1)
 
         self.index_first = dist_first.argmin()  # Cluster which best represents first days
         self.index_last = dist_last.argmin()    # Cluster which best represents last days
@@ -718,14 +692,13 @@ class Clustering:
         nptshr = int(npts / 8760)
         nptsday = nptshr * 24
 
-        data = np.zeros((nptsday * self.ndays, ncluster))  # Hourly data for each Cluster exemplar
-        for k in range(ncluster):
-            d = self.sim_start_days[k]   # Starting days for each exemplar grouping
-            data[:, k] = exemplardata[d * nptsday:(d + self.ndays) * nptsday]
+        exemplardata = np.asarray(exemplardata, dtype=float)
+        npts_group = nptsday * self.ndays
+        starts = np.asarray(self.sim_start_days[:ncluster]) * nptsday  # Starting points for each exemplar grouping
+        data = exemplardata[starts[np.newaxis, :] + np.arange(npts_group)[:, np.newaxis]]  # Hourly data for each Cluster exemplar
 
-        for g in range(ngroup):
-            d = g * self.ndays + 1  # Starting day for data group g
-            fulldata[d * nptsday:(d + self.ndays) * nptsday] = (self.clusters['partition_matrix'][g, :] * data).sum(1)  # Sum of partition matrix x exemplar data points for each hour
+        # Sum of partition matrix x exemplar data points for each hour of each data group, starting on day 1
+        fulldata[nptsday:nptsday + ngroup * npts_group] = (self.clusters['partition_matrix'][:, np.newaxis, :] * data).sum(2).ravel()
 
         # Fill in first/last days 
         k1 = self.index_first
@@ -742,10 +715,7 @@ class Clustering:
                 print(
                     'First day of the year was not assigned to a Cluster and will be assigned average generation profile from the next ' + str(
                         navg) + ' days.')
-                hourly_avg = np.zeros((nptsday))
-                for d in range(1, navg + 1):
-                    for h in range(24 * nptshr):
-                        hourly_avg[h] += fulldata[d * nptsday + h] / navg
+                hourly_avg = (fulldata[nptsday:(navg + 1) * nptsday].reshape(navg, nptsday) / navg).sum(0)
                 fulldata[0:nptsday] = hourly_avg
 
             nexclude = 364 - ngroup * self.ndays # Number of excluded days at the end of the year
@@ -757,9 +727,7 @@ class Clustering:
                         navg) + ' days.')
                     hourly_avg = np.zeros((nexclude * nptsday))
                     d1 = 365 - nexclude - navg  # First day to include in average
-                    for d in range(d1, d1 + navg):
-                        for h in range(nptsday):
-                            hourly_avg[h] += fulldata[d * nptsday + h] / navg
+                    hourly_avg[0:nptsday] = (fulldata[d1 * nptsday:(d1 + navg) * nptsday].reshape(navg, nptsday) / navg).sum(0)
                     fulldata[h1: h1 + nexclude * nptsday] = hourly_avg
 
         if dtype is bool:
@@ -779,27 +747,17 @@ class Clustering:
         Ndaystot = self.ndays + Nprev + Nnext  # Number of days that will be included in the simulation (including previous / next days)
         Nptshr = int(len(hourly) / 8760)
 
-        avg = np.zeros((Ncluster, Ndaystot * 24 * Nptshr))
-        for g in range(Ngroup):
-            d = g * self.ndays + 1  # First day to be counted in simulation group g
-            d1 = max(0, d - Nprev)  # First day to be included in simulation group g (Nprev days before day d if possible)
-            Nprev_actual = d - d1   # Actual number of previous days that can be included
-            Ndaystot_actual = self.ndays + Nprev_actual + Nnext
-            h = d1 * 24 * Nptshr  # First time point included in simulation group g
-            if Nprev == Nprev_actual:
-                vals = np.array(hourly[h:h + Ndaystot * 24 * Nptshr])  # Hourly values for only the days included in the simulation for group g
-            else:  # Number of previous days was reduced (only occurs at beginning of the year)
-                Nvoid = Nprev - Nprev_actual  # Number of previous days which don't exist in the data file (only occurs when Nprev >1)
-                vals = []
-                for v in range(Nvoid):  # Days for which data doesn't exist
-                    vals = np.append(vals, hourly[0:24 * Nptshr])  # Use data from first day
-                vals = np.append(vals, hourly[h:h + Ndaystot_actual * 24 * Nptshr])
-
-            for k in range(Ncluster):
-                avg[k, :] += vals * self.clusters['partition_matrix'][g, k]  # Sum of hourly array * partition_matrix value for Cluster k over all points (g)
-
-        for k in range(Ncluster):
-            avg[k, :] = avg[k, :] / self.clusters['partition_matrix'].sum(0)[k]  # Divide by sum of partition matrix over all groups to normalize
+        hourly = np.asarray(hourly, dtype=float)
+        Nptsday = 24 * Nptshr
+        d = np.arange(Ngroup) * self.ndays + 1  # First day to be counted in each simulation group
+        # Days included in the simulation of each group.  Previous days which don't exist in the data file use data from first day
+        days = np.maximum(0, d[:, np.newaxis] - Nprev + np.arange(Ndaystot))
+        points = (days[:, :, np.newaxis] * Nptsday + np.arange(Nptsday)).reshape(Ngroup, -1)
+        vals = hourly[points]  # Hourly values for only the days included in the simulation for each group
+
+        # Sum of hourly array * partition_matrix value for each Cluster over all points (g)
+        avg = (self.clusters['partition_matrix'].T[:, :, np.newaxis] * vals[np.newaxis, :, :]).sum(1)
+        avg = avg / self.clusters['partition_matrix'].sum(0)[:, np.newaxis]  # Divide by sum of partition matrix over all groups to normalize
 
         if self.ndays == 2:  # Adjust averages to include first/last days of the year (Not currently defined/tested except for 2-day clusters)
             k1 = self.index_first
@@ -815,10 +773,22 @@ class Clustering:
 
         return avg.tolist()
 
+def pairwise_squared_distances(a, b, chunk_size=256):
+    """
+    Squared Euclidean distance between each row of a and each row of b
+    Rows of a are processed in chunks of chunk_size to limit the memory of the intermediate (chunk_size x len(b) x n_features) array
+    """
+    dist = np.empty((a.shape[0], b.shape[0]), dtype=np.result_type(a, b))
+    for start in range(0, a.shape[0], chunk_size):
+        stop = start + chunk_size
+        dist[start:stop, :] = ((a[start:stop, np.newaxis, :] - b[np.newaxis, :, :]) ** 2).sum(2)
+    return dist
+
+
 class AffinityPropagation:
     # Affinity propagation algorithm
 
-    def __init__(self, damping=0.5, max_iter=300, convergence_iter=10, preference=None):
+    def __init__(self, damping=0.5, max_iter=300, convergence_iter=10, preference=None, dtype=np.float64, chunk_size=256):
         self.damping = damping  # Damping factor for update of responsibility and availability matrices (0.5 - 1)
         self.max_iter = max_iter  # Maximum number of iterations
         # Number of iterations without change in clusters or exemplars to define convergence
@@ -827,6 +797,8 @@ class AffinityPropagation:
         #   If None, the preference will be set to the median of the input similarities
         self.preference = preference
         self.random_seed = 123
+        self.dtype = dtype  # Floating point type of the similarity, responsibility and availability matrices
+        self.chunk_size = chunk_size  # Number of rows of the similarity matrix computed at a time
 
         # This attributes are filled by fit_predict()
         self.n_clusters = None
@@ -839,20 +811,17 @@ class AffinityPropagation:
     def compute_wcss(self, data, cluster_index, means):
         # Computes the within-cluster sum-of-squares
         n_clusters = means.shape[0]
-        self.wcss = 0.0
-        for k in range(n_clusters):
-            dist = ((data - means[k, :]) ** 2).sum(1)  # Distance to Cluster k centroid
-            self.wcss += (dist * (cluster_index == k)).sum()
+        dist = pairwise_squared_distances(data, means, self.chunk_size)  # Distance to each Cluster centroid
+        self.wcss = float((dist * (cluster_index[:, np.newaxis] == np.arange(n_clusters))).sum(0).sum())
 
     def fit_predict(self, data):
+        data = np.asarray(data, dtype=self.dtype)
         n_obs, n_features = data.shape  # Number of observations and features
 
         # Compute similarities between data points (negative of Euclidean distance)
-        S = np.zeros((n_obs, n_obs))
+        S = pairwise_squared_distances(data, data, self.chunk_size)
+        np.negative(S, out=S)
         inds = np.arange(n_obs)
-        for p in range(n_obs):
-            # Negative squared Euclidean distance between pt p and all other points
-            S[p, :] = -((data[p, :] - data[:, :]) ** 2).sum(1)
 
         if self.preference:  # Preference is specified
             S[inds, inds] = self.preference
@@ -862,41 +831,55 @@ class AffinityPropagation:
 
         np.random.seed(self.random_seed)
         mag = abs(S).min()
-        S += 1.e-8*mag * S * (np.random.random_sample((n_obs, n_obs)) - 0.5)
-
-        # Initialize availability and responsibility matrices
-        A = np.zeros((n_obs, n_obs))
-        R = np.zeros((n_obs, n_obs))
+        # Tie-breaking noise, computed in double precision and at least the resolution of the working precision, so
+        # it is not rounded away in single precision. It is added one chunk of rows at a time to limit its memory
+        noise_scale = 1.e-8*mag
+        if noise_scale > 0:
+            noise_scale = max(noise_scale, 4 * np.finfo(self.dtype).eps)
+        for start in range(0, n_obs, self.chunk_size):
+            rows = S[start:start + self.chunk_size]
+            noise = noise_scale * rows.astype(np.float64)
+            noise *= np.random.random_sample(rows.shape) - 0.5
+            rows += noise.astype(self.dtype)
+
+        # Initialize availability and responsibility matrices, and work arrays that are updated in place
+        A = np.zeros((n_obs, n_obs), dtype=self.dtype)
+        R = np.zeros((n_obs, n_obs), dtype=self.dtype)
+        M = np.empty((n_obs, n_obs), dtype=self.dtype)
+        update = np.empty((n_obs, n_obs), dtype=self.dtype)
+        posR = np.empty((n_obs, n_obs), dtype=self.dtype)
         exemplars = np.zeros(n_obs, bool)
 
         q = 0
         count = 0
         while (q < self.max_iter) and (count < self.convergence_iter):
             exemplars_prev = exemplars
-            update = np.zeros((n_obs, n_obs))
 
             # Update responsibility
-            M = A + S
+            np.add(A, S, out=M)
             k = M.argmax(axis=1)  # Location of maximum value in each row of M
             maxval = M[inds, k]  # Maximum values in each row of M
-            update = S - np.reshape(maxval, (n_obs, 1))  # S - max value in each row
+            np.subtract(S, maxval[:, np.newaxis], out=update)  # S - max value in each row
             M[inds, k] = -np.inf
             k2 = M.argmax(axis=1)  # Location of second highest value in each row of M
             maxval = M[inds, k2]  # Second highest value in each row of M
             update[inds, k] = S[inds, k] - maxval
-            R = self.damping * R + (1. - self.damping) * update
+            R *= self.damping
+            update *= (1. - self.damping)
+            R += update
 
             # Update availability
-            posR = R.copy()
-            posR[posR < 0] = 0.0  # Only positive values of R matrix
+            np.maximum(R, 0.0, out=posR)  # Only positive values of R matrix
             sumR = posR.sum(0)
             values = sumR - np.diag(posR)
             update[:] = values  # Sum positive values of R over all rows (i)
             update -= posR
-            update[:, inds] += np.diag(R)
-            update[update > 0] = 0.0
+            update += np.diag(R)
+            np.minimum(update, 0.0, out=update)
             update[inds, inds] = values
-            A = self.damping * A + (1. - self.damping) * update
+            A *= self.damping
+            update *= (1. - self.damping)
+            A += update
 
             # Identify exemplars
             exemplars = (np.diag(A) + np.diag(R)) > 0
@@ -924,10 +907,8 @@ class AffinityPropagation:
             pts = np.where(clusters == k)[0]  # All points in Cluster k
             n_pts = len(pts)
             if n_pts > 2:
-                dist_sum = np.zeros(n_pts)
-                for p in range(n_pts):
-                    # Calculate total distance between point p and all other points in Cluster k
-                    dist_sum[p] += (S[pts[p], pts]).sum()
+                # Calculate total distance between each point and all other points in Cluster k
+                dist_sum = S[np.ix_(pts, pts)].sum(1)
                 i = dist_sum.argmin()
                 exemplars[k] = pts[i]  # Replace exemplar k with point that minimizes wcss
 
@@ -1,5 +1,8 @@
 import os
+import copy
 import datetime
+import hashlib
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional, Union
 
 import rapidjson                # NOTE: install 'python-rapidjson' NOT 'rapidjson'
@@ -15,10 +18,75 @@ from hopp.simulation.technologies.dispatch.power_sources.csp_dispatch import Csp
 from hopp.simulation.technologies.power_source import PowerSource
 from hopp.simulation.technologies.sites import SiteInfo
 from hopp.simulation.technologies.financial import FinancialModelType, CustomFinancialModel
+from hopp.utilities.atomic_write import atomic_write
 from hopp.utilities.validators import contains, gt_zero
 from hopp.utilities.log import hybrid_logger as logger
 
 
+# SSC inputs that are overwritten or do not affect the annual thermal production forecast
+FORECAST_CACHE_EXCLUDED_PARAMS = [
+    'time_start', 'time_stop', 'is_dispatch_targets', 'is_rec_su_allowed_in', 'is_rec_sb_allowed_in',
+    'is_pc_su_allowed_in', 'is_pc_sb_allowed_in', 'q_pc_target_su_in', 'q_pc_target_on_in', 'q_pc_max_in',
+    'tshours', 'rec_su_delay', 'rec_qf_delay', 'h_tank', 'cold_tank_max_heat', 'hot_tank_max_heat',
+    'ppa_multiplier_model', 'dispatch_factors_ts'
+]
+
+# SSC outputs of the forecast simulation used by the dispatch model
+FORECAST_OUTPUT_NAMES = [
+    'cycle_eff_load_table', 'cycle_eff_Tdb_table', 'cycle_wcond_Tdb_table', 'pc_config', 'ud_ind_od',
+    'Q_thermal', 'qsf_expected'
+]
+
+# Maximum number of thermal production forecasts held in memory
+FORECAST_CACHE_MAX_SIZE = 16
+
+
+class CspResultCache:
+    """
+    In-memory least-recently-used cache of simulation results, e.g., field layouts, shared by all CSP plants.
+
+    Results are copied when they are stored and when they are returned, so plants can modify the results they get
+    without changing the cache.
+    """
+    def __init__(self, max_size: int):
+        """
+        Args:
+            max_size: maximum number of results held in memory
+        """
+        self.max_size = max_size
+        self._results = OrderedDict()
+
+    def get(self, key: str) -> Optional[dict]:
+        """Returns a copy of the result stored under `key`, or None if it is not cached."""
+        if key not in self._results:
+            return None
+        self._results.move_to_end(key)
+        return copy.deepcopy(self._results[key])
+
+    def put(self, key: str, result: dict):
+        """Stores a copy of `result` under `key`, evicting the least recently used results beyond `max_size`."""
+        self._results[key] = copy.deepcopy(result)
+        self._results.move_to_end(key)
+        while len(self._results) > self.max_size:
+            self._results.popitem(last=False)
+
+    def clear(self):
+        self._results.clear()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._results
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+
+def _hash_ssc_params(params: dict) -> str:
+    """Returns a SHA-256 hash of SSC input values, independent of their order."""
+    encoded = rapidjson.dumps(params, sort_keys=True, number_mode=rapidjson.NM_NATIVE | rapidjson.NM_NAN,
+                              default=lambda v: v.tolist() if hasattr(v, 'tolist') else str(v))
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
 class CspOutputs:
     """Object for storing CSP outputs from SSC (SAM's Simulation Core) and dispatch optimization."""
     def __init__(self):
@@ -90,6 +158,9 @@ class CspConfig(BaseClass):
         tes_hours: Full load hours of thermal energy storage [hrs]
         fin_model: Financial model for the specific technology
         name: Configured name for this plant
+        forecast_cache_dir: (optional) Directory where annual thermal production forecasts are saved and reused,
+            keyed by a hash of the forecast-relevant SSC inputs, e.g., the directory of the solar resource files.
+            Forecasts are always reused within a process.
     """
     tech_name: str = field(validator=contains(["tcsmolten_salt", "trough_physical"]))
     cycle_capacity_kw: float = field(validator=gt_zero)
@@ -97,6 +168,7 @@ class CspConfig(BaseClass):
     tes_hours: float = field(validator=gt_zero)
     fin_model: Optional[Union[dict, FinancialModelType]] = field(default=None)
     name: str = field(default="TowerPlant")
+    forecast_cache_dir: Optional[str] = field(default=None)
 
 
 @define
@@ -120,6 +192,8 @@ class CspPlant(PowerSource):
     # Initialize in subclass
     param_files: Dict[str, str] = field(init=False)
 
+    _thermal_forecast_cache = CspResultCache(FORECAST_CACHE_MAX_SIZE)    # forecast outputs, shared by all instances
+
     def __attrs_post_init__(self):
         if self.config.fin_model is None:
             raise AttributeError("Financial model must be set in `config.fin_model`")
@@ -472,16 +546,23 @@ class CspPlant(PowerSource):
 
         .. note::
             Solar field production is "forecasted" by setting TES hours to 100 and receiver start-up time
-            and energy to very small values.
+            and energy to very small values. The forecast does not depend on storage size, dispatch or financial
+            inputs, so it is reused from the forecast cache when available.
 
         Returns:
-            ssc_outputs: SSC's output dictionary containing the previous simulation results
+            ssc_outputs: copy of the outputs in ``FORECAST_OUTPUT_NAMES`` of the forecast simulation
         """
         self.value('is_dispatch_targets',  0)
         # Setting simulation times and simulate the horizon
         self.value('time_start', 0)
         self.value('time_stop', 8760*60*60)
 
+        cache_key = self.ssc_params_hash(FORECAST_CACHE_EXCLUDED_PARAMS)
+        ssc_outputs = self.load_cached_thermal_forecast(cache_key)
+        if ssc_outputs is not None:
+            print("Using cached CSP thermal energy production forecast.")
+            return ssc_outputs
+
         # Inflate TES capacity, set near-zero startup requirements, and run ssc estimates
         original_values = {k: self.ssc.get(k) for k in ['tshours', 'rec_su_delay', 'rec_qf_delay']}
         self.ssc.set({'tshours': 100, 'rec_su_delay': 0.001, 'rec_qf_delay': 0.001})
@@ -489,7 +570,70 @@ class CspPlant(PowerSource):
         ssc_outputs = self.ssc.execute()
         self.ssc.set(original_values)
 
-        return ssc_outputs
+        self.cache_thermal_forecast(cache_key, ssc_outputs)
+        return CspPlant._thermal_forecast_cache.get(cache_key)
+
+    def ssc_params_hash(self, excluded_params: list) -> str:
+        """
+        Returns a SHA-256 hash of the current SSC inputs, excluding plant state inputs and ``excluded_params``.
+
+        Args:
+            excluded_params: SSC input names that are not included in the hash
+        """
+        excluded = set(excluded_params) | set(self.get_plant_state_io_map().keys())
+        params = {k: v for k, v in self.ssc.export_params().items() if k not in excluded}
+        return _hash_ssc_params(params)
+
+    def ssc_inputs_hash(self, param_names: list) -> str:
+        """
+        Returns a SHA-256 hash of the current values of the given SSC inputs. Inputs that are not set are skipped.
+
+        Args:
+            param_names: SSC input names that are included in the hash
+        """
+        params = {}
+        for name in param_names:
+            try:
+                params[name] = self.ssc.get(name)
+            except Exception:
+                pass
+        return _hash_ssc_params(params)
+
+    def load_cached_thermal_forecast(self, cache_key: str) -> Optional[dict]:
+        """
+        Returns thermal production forecast outputs from the in-memory cache or, if configured, the on-disk cache.
+
+        Args:
+            cache_key: hash of forecast-relevant SSC inputs
+        """
+        forecast = CspPlant._thermal_forecast_cache.get(cache_key)
+        if forecast is not None:
+            return forecast
+        if self.config.forecast_cache_dir is not None:
+            cache_file = os.path.join(self.config.forecast_cache_dir, cache_key + '.npz')
+            if os.path.isfile(cache_file):
+                with np.load(cache_file) as data:
+                    forecast = {k: data[k].item() if data[k].ndim == 0 else data[k].tolist() for k in data.files}
+                CspPlant._thermal_forecast_cache.put(cache_key, forecast)
+                return forecast
+        return None
+
+    def cache_thermal_forecast(self, cache_key: str, ssc_outputs: dict):
+        """
+        Stores the thermal production forecast outputs used by the dispatch model in the in-memory cache and, if
+        configured, as a compressed array file in the on-disk cache.
+
+        Args:
+            cache_key: hash of forecast-relevant SSC inputs
+            ssc_outputs: SSC's output dictionary of the forecast simulation
+        """
+        forecast = {k: ssc_outputs[k] for k in FORECAST_OUTPUT_NAMES if k in ssc_outputs}
+        CspPlant._thermal_forecast_cache.put(cache_key, forecast)
+        if self.config.forecast_cache_dir is not None:
+            os.makedirs(self.config.forecast_cache_dir, exist_ok=True)
+            cache_file = os.path.join(self.config.forecast_cache_dir, cache_key + '.npz')
+            with atomic_write(cache_file, 'wb') as f:
+                np.savez_compressed(f, **{k: np.asarray(v) for k, v in forecast.items()})
 
     def set_cycle_efficiency_tables(self, ssc_outputs: dict):
         """
@@ -558,7 +702,13 @@ class CspPlant(PowerSource):
         self.set_dispatch_targets(n_periods)
         self.update_ssc_inputs_from_plant_state()
 
-        results = self.simulate_power()
+        # Only read back outputs that are stored or used to update the plant state
+        output_names = None
+        if len(self.outputs.ssc_time_series) > 0:
+            output_names = ['time_steps_per_hour', 'time_start', 'time_stop']
+            output_names += list(self.get_plant_state_io_map().values())
+            output_names += list(self.outputs.ssc_time_series.keys())
+        results = self.simulate_power(output_names)
 
         # Save plant state at end of simulation
         simulation_time = int((end_datetime - start_datetime).total_seconds())
@@ -569,16 +719,18 @@ class CspPlant(PowerSource):
             self.outputs.update_from_ssc_output(results)
             self.outputs.store_dispatch_outputs(self.dispatch, n_periods, sim_start_time)
 
-    def simulate_power(self) -> dict:
+    def simulate_power(self, output_names: Optional[list] = None) -> dict:
         """
         Runs CSP system model simulate
 
+        :param output_names: (optional) SSC output names to return, if None all outputs are returned
+
         :returns: SSC results dictionary
         """
         if not self.ssc:
             raise ValueError('SSC was not correctly setup...')
 
-        results = self.ssc.execute()
+        results = self.ssc.execute(output_names)
         if not results["cmod_success"]:
             raise ValueError('PySSC simulation failed...')
 
@@ -763,117 +915,74 @@ class CspPlant(PowerSource):
             raise NotImplementedError("Capacity credit calculations have not been implemented \
                                       for power block startup times greater than one timestep.")
 
-        df = pd.DataFrame()
-        df['Q_pb_startup'] = [x * 1e3 for x in self.outputs.ssc_time_series["q_dot_pc_startup"]]    # [kWt]
-        df['E_pb_startup'] = [x * 1e3 for x in self.outputs.ssc_time_series["q_pc_startup"]]        # [kWht]
-        df['W_pb_gross'] = [x * 1e3 for x in self.outputs.ssc_time_series["P_cycle"]]               # [kWe] Always average over entire timestep
-        df['E_tes'] = [x * 1e3 for x in self.outputs.ssc_time_series["e_ch_tes"]]                   # [kWht]
-        df['eta_pb'] = self.outputs.ssc_time_series["eta"]                                          # [-]
-        df['W_pb_net'] = [x * 1e3 for x in self.outputs.ssc_time_series["P_out_net"]]  # kWe 
-        df['Q_pb'] = [x * 1e3 for x in self.outputs.ssc_time_series["q_pb"]]  # kWt 
-
-        def power_block_state(Q_pb_startup: float, W_pb_gross: float) -> Optional[str]:
-            """Simplified power block operating states.
-
-            ===========   ==========================================
-            State         Condition
-            ===========   ==========================================
-            [off]         (startup == 0 and gross output power == 0)
-            [starting]    (startup  > 0 and gross output power == 0)
-            [started]     (startup  > 0 and gross output power  > 0)
-            [on]          (startup == 0 and gross output power  > 0) -> on to off transition still applicable
-            ===========   ==========================================
-
-            Args:
-                Q_pb_startup
-                W_pb_gross
-
-            Returns:
-                'off'|'starting'|'started'|'on'
-            """
-            if abs(Q_pb_startup) < SIGMA and abs(W_pb_gross) < SIGMA:
-                return 'off'
-            elif Q_pb_startup > SIGMA and abs(W_pb_gross) < SIGMA:
-                return 'starting'
-            elif Q_pb_startup > SIGMA and W_pb_gross > SIGMA:
-                return 'started'
-            elif abs(Q_pb_startup) < SIGMA and W_pb_gross > SIGMA:
-                return 'on'
-            else:
-                return None
-
-        def max_feasible_kwh(row) -> Optional[float]:
-            """
-            [off]      = E_pb_possible|t_pb_on - E_startup
-            [starting] = 0
-            [started]  = E_pb_possible|t_pb_on
-            [on]       = E_pb_possible|t_step
-
-            Args:
-                row: Pandas Series of a row from main dataframe
+        ssc_time_series = self.outputs.ssc_time_series
+        W_pb_net = np.asarray(ssc_time_series["P_out_net"], dtype=float) * 1e3   # [kWe]
 
-            Returns:
-                Maximum feasible energy from power block [kWhe]
-            """
-            state = power_block_state(row.Q_pb_startup, row.W_pb_gross)
-
-            if state == 'starting':
-                return 0    # [kWhe]
+        if not cap_cred_avail_storage:
+            E_pb_max_feasible = W_pb_net * t_step
+        else:
+            Q_pb_startup = np.asarray(ssc_time_series["q_dot_pc_startup"], dtype=float) * 1e3   # [kWt]
+            E_pb_startup = np.asarray(ssc_time_series["q_pc_startup"], dtype=float) * 1e3       # [kWht]
+            W_pb_gross = np.asarray(ssc_time_series["P_cycle"], dtype=float) * 1e3              # [kWe] Always average over entire timestep
+            E_tes = np.asarray(ssc_time_series["e_ch_tes"], dtype=float) * 1e3                  # [kWht]
+            eta_pb = np.asarray(ssc_time_series["eta"], dtype=float)                            # [-]
+            Q_pb = np.asarray(ssc_time_series["q_pb"], dtype=float) * 1e3                       # [kWt]
+
+            # Simplified power block operating states:
+            #   [off]         (startup == 0 and gross output power == 0)
+            #   [starting]    (startup  > 0 and gross output power == 0)
+            #   [started]     (startup  > 0 and gross output power  > 0)
+            #   [on]          (startup == 0 and gross output power  > 0) -> on to off transition still applicable
+            no_startup = np.abs(Q_pb_startup) < SIGMA
+            no_output = np.abs(W_pb_gross) < SIGMA
+            is_off = no_startup & no_output
+            is_starting = (Q_pb_startup > SIGMA) & no_output
+            is_started = (Q_pb_startup > SIGMA) & (W_pb_gross > SIGMA)
+            is_on = no_startup & (W_pb_gross > SIGMA)
+
+            # Maximum feasible energy from power block [kWhe]:
+            #   [off]      = E_pb_possible|t_pb_on - E_startup
+            #   [starting] = 0
+            #   [started]  = E_pb_possible|t_pb_on
+            #   [on]       = E_pb_possible|t_step
 
             # 1. What's the maximum the power block could generate with unlimited resource, outside of startup time?
-            if state == 'off':
-                t_pb_startup = self.value("startup_time")                 # [hr]
-            elif state == 'started':
-                #t_pb_startup = row.E_pb_startup / row.Q_pb_startup \
-                #                if row.E_pb_startup > SIGMA and \
-                #                row.Q_pb_startup > SIGMA \
-                #                else 0  #TODO: reported q_dot_pc_startup is timestep average so t_pb_startup = t_step from this calculation
-
-                t_pb_startup  = t_step * (1.0 - row.eta_pb / (row.W_pb_gross / (row.Q_pb - row.Q_pb_startup)))  \
-                                if row.E_pb_startup > SIGMA and row.Q_pb_startup > SIGMA \
-                                else 0    # Fraction of timestep used for startup = 1.0 - (timestep-averaged efficiency / instantaneous efficiency while on)             
-
-            elif state == 'on':
-                t_pb_startup = 0
-            else:
-                return None
+            t_pb_startup = np.zeros(len(W_pb_net))                                      # [hr]
+            t_pb_startup[is_off] = self.value("startup_time")
+            # Fraction of timestep used for startup = 1.0 - (timestep-averaged efficiency / instantaneous efficiency while on)
+            # TODO: reported q_dot_pc_startup is timestep average so t_pb_startup = t_step from E_pb_startup / Q_pb_startup
+            partial_startup = is_started & (E_pb_startup > SIGMA)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                t_pb_startup[partial_startup] = t_step * (1.0 - eta_pb[partial_startup] / (
+                    W_pb_gross[partial_startup] / (Q_pb[partial_startup] - Q_pb_startup[partial_startup])))
             W_pb_nom = self.cycle_capacity_kw                                           # [kWe]
-            f_pb_max = self.value("cycle_max_frac")                       # [-]
+            f_pb_max = self.value("cycle_max_frac")                                     # [-]
             W_pb_max = W_pb_nom * f_pb_max                                              # [kWe]
-            E_pb_max = max(W_pb_max * (t_step - t_pb_startup), row.W_pb_gross * t_step)  # [kWhe]  
+            E_pb_max = np.maximum(W_pb_max * (t_step - t_pb_startup), W_pb_gross * t_step)  # [kWhe]
 
             # 2. What did the power block actually generate?
-            if state == 'off':
-                E_pb_gross = 0                                                          # [kWhe]
-            elif state == 'started' or state == 'on':
-                E_pb_gross = row.W_pb_gross * t_step                                    # [kWhe] W_pb_gross avg over entire timestep
-            else:
-                return None
+            E_pb_gross = np.where(is_off, 0, W_pb_gross * t_step)                       # [kWhe] W_pb_gross avg over entire timestep
 
             # 3. What more could the power block generate if it used all the remaining TES (with no physical constraints)?
-            if state == 'off':
-                eta_pb_nom = self.cycle_nominal_efficiency                     # [-]
-                f_pb_startup_of_nominal = self.value("startup_frac")      # [-]
-                E_pb_startup = W_pb_nom / eta_pb_nom * f_pb_startup_of_nominal * t_pb_startup  # [kWht]
-                dE_pb_rest_of_tes = max(0, row.E_tes - E_pb_startup) * eta_pb_nom              # [kWht]
-            elif state == 'started' or state == 'on':
-                dE_pb_rest_of_tes = row.E_tes * row.eta_pb                              # [kWhe]
-            else:
-                return None
+            dE_pb_rest_of_tes = E_tes * eta_pb                                          # [kWhe]
+            if is_off.any():
+                eta_pb_nom = self.cycle_nominal_efficiency                              # [-]
+                f_pb_startup_of_nominal = self.value("startup_frac")                    # [-]
+                E_pb_startup_off = W_pb_nom / eta_pb_nom * f_pb_startup_of_nominal * self.value("startup_time")  # [kWht]
+                dE_pb_rest_of_tes[is_off] = np.maximum(0, E_tes[is_off] - E_pb_startup_off) * eta_pb_nom        # [kWht]
 
             # 4. Thus, what could the power block have generated if it utilized more TES?
-            E_pb_gross_max_feasible = min(E_pb_max, E_pb_gross + dE_pb_rest_of_tes)     # [kWhe]
-            return E_pb_gross_max_feasible
+            E_pb_gross_max_feasible = np.minimum(E_pb_max, E_pb_gross + dE_pb_rest_of_tes)     # [kWhe]
+            E_pb_gross_max_feasible[is_starting] = 0
+            E_pb_gross_max_feasible[~(is_off | is_starting | is_started | is_on)] = np.nan
 
-        if cap_cred_avail_storage:
-            E_pb_max_feasible = np.maximum(df['W_pb_net']*t_step, df.apply(max_feasible_kwh, axis=1)*self.value('gross_net_conversion_factor')) # [kWhe]
-        else:
-            E_pb_max_feasible = df['W_pb_net']*t_step 
+            E_pb_max_feasible = np.maximum(W_pb_net * t_step,
+                                           E_pb_gross_max_feasible * self.value('gross_net_conversion_factor'))  # [kWhe]
 
         W_ac_nom = self.calc_nominal_capacity(interconnect_kw)
         E_pb_max_feasible = np.minimum(E_pb_max_feasible, W_ac_nom*t_step)  # Limit to nominal capacity here, to avoid discrepancies between single-technology and hybrid capacity credits
 
-        return list(E_pb_max_feasible)
+        return E_pb_max_feasible.tolist()
 
     def value(self, var_name, var_value=None):
         """
@@ -41,7 +41,7 @@ class SscWrap(metaclass=abc.ABCMeta):
         return
 
     @abc.abstractmethod
-    def execute(self):
+    def execute(self, output_names=None):
         return
 
     @abc.abstractmethod
@@ -50,6 +50,14 @@ class SscWrap(metaclass=abc.ABCMeta):
 
 
 class PysscWrap(SscWrap):
+    """PySSC wrapper that keeps a long-lived ssc data container and compute module handles.
+
+    The data container is built from all parameters on the first call to execute(). Later calls only push the
+    parameters set since the previous call (and INOUT variables, which ssc may overwrite during a run), so repeated
+    executions, e.g. rolling-horizon windows, do not re-marshal the full weather table and field maps. Outputs,
+    and INOUT variables that are not parameters, are removed from the container before each run, so every run
+    starts from the parameters only, like it would with a new container.
+    """
     def __init__(self, tech_name, financial_name, defaults=None):
         self.ssc = PySSC()
         self.wrapper = 'pyssc'
@@ -63,20 +71,127 @@ class PysscWrap(SscWrap):
             self.params = {}
         self.params['tech_model'] = self.tech_name
         self.params['financial_model'] = self.financial_name
-    
+        self._data = None           # ssc data container handle
+        self._modules = {}          # compute module name -> (module handle, {variable name: (data type, var type)})
+        self._changed_keys = set()  # parameters set since the data container was last updated
+
+    def __getstate__(self):
+        """
+        ssc handles are not copied, the data container is rebuilt on the next execute()
+        """
+        state = self.__dict__.copy()
+        state['_data'] = None
+        state['_modules'] = {}
+        state['_changed_keys'] = set()
+        return state
+
+    def __del__(self):
+        # ssc may already be unloaded during interpreter shutdown
+        # noinspection PyBroadException
+        try:
+            if not sys.is_finalizing():
+                self.free()
+        except:
+            pass
+
+    def free(self):
+        """Frees the ssc data container and compute modules"""
+        if getattr(self, '_data', None) is not None:
+            self.ssc.data_free(self._data)
+            self._data = None
+        for cmod, _ in getattr(self, '_modules', {}).values():
+            self.ssc.module_free(cmod)
+        self._modules = {}
+
     def set(self, param_dict):
         if 'is_elec_heat_dur_off' in param_dict and type(param_dict['is_elec_heat_dur_off']) == list:
             param_dict['is_elec_heat_dur_off'] = param_dict['is_elec_heat_dur_off'][0]
 
         self.params.update(param_dict)
+        self._changed_keys.update(param_dict.keys())
 
     def get(self, name):
         return self.params[name]
 
-    def execute(self):
-        results = ssc_sim_from_dict(self.ssc, self.params)
+    def execute(self, output_names=None):
+        """
+        Runs the technology (and financial) compute modules.
+
+        Args:
+            output_names: (optional) names of the variables to read back from ssc. If None, all variables of the
+                compute modules are returned.
+
+        Returns:
+            dict of ssc variables, including 'cmod_success'
+        """
+        model_names = [name for name in [self.params['tech_model'], self.params['financial_model']]
+                       if name not in [None, "none"]]
+        modules = [self._get_module(name) for name in model_names]
+
+        if self._data is None:
+            self._data = self.ssc.data_create()
+            keys = self.params.keys()
+        else:
+            # Remove the values ssc wrote during the previous run that are not reset from the parameters
+            for _, var_info in modules:
+                for name, (_, var_type) in var_info.items():
+                    if var_type == 2 or (var_type == 3 and name not in self.params):
+                        self.ssc.data_unassign(self._data, name.encode("ascii"))
+            keys = self._changed_keys.union(
+                name for _, var_info in modules for name, (_, var_type) in var_info.items() if var_type == 3)
+        for key in keys:
+            for _, var_info in modules:
+                # Only set variables of type INPUT (1) or INOUT (3)
+                if key in var_info and var_info[key][1] in [1, 3] and key in self.params:
+                    data_type = var_info[key][0]
+                    value = self.params[key]
+                    if data_type > 2 and len(value) == 0:
+                        self.ssc.data_unassign(self._data, key.encode("ascii"))
+                    else:
+                        set_ssc_var(data_type, self.ssc, self._data, key, value)
+                    break
+        self._changed_keys = set()
+
+        results = {"tech_model": self.params['tech_model'], "financial_model": self.params['financial_model']}
+        for name, (cmod, var_info) in zip(model_names, modules):
+            self.ssc.module_exec_set_print(0)
+            success = self.ssc.module_exec(cmod, self._data) != 0
+            if not success:
+                print(name + ' simulation error')
+                idx = 1
+                msg = self.ssc.module_log(cmod, 0)
+                while msg is not None:
+                    print(' : ' + msg.decode("utf - 8"))
+                    msg = self.ssc.module_log(cmod, idx)
+                    idx = idx + 1
+            names = var_info.keys() if output_names is None else [n for n in output_names if n in var_info]
+            for var_name in names:
+                value = get_ssc_var(var_info[var_name][0], self.ssc, self._data, var_name)
+                if value is not None:
+                    results[var_name] = value
+            if not success:
+                results["cmod_success"] = 0
+                return results
+        results["cmod_success"] = 1
         return results
 
+    def _get_module(self, name):
+        if name not in self._modules:
+            cmod = self.ssc.module_create(name.encode("utf-8"))
+            var_info = {}
+            ii = 0
+            while (True):
+                p_ssc_entry = self.ssc.module_var_info(cmod, ii)
+                data_type = self.ssc.info_data_type(p_ssc_entry)
+                # 1 = String, 2 = Number, 3 = Array, 4 = Matrix, 5 = Table
+                if (data_type <= 0 or data_type > 5):
+                    break
+                var_name = str(self.ssc.info_name(p_ssc_entry).decode("ascii"))
+                var_info[var_name] = (data_type, self.ssc.info_var_type(p_ssc_entry))
+                ii = ii + 1
+            self._modules[name] = (cmod, var_info)
+        return self._modules[name]
+
     def export_params(self):
         return copy.deepcopy(self.params)
 
@@ -185,12 +300,14 @@ class PysamWrap(SscWrap):
         except Exception as err:
             raise(err)
 
-    def execute(self):
+    def execute(self, output_names=None):
         self.tech_model.execute(1)
         results = self.tech_model.Outputs.export()
         if self.financial_name is not None:
             self.financial_model.execute(1)
             results.update(self.financial_model.Outputs.export())
+        if output_names is not None:
+            results = {k: v for k, v in results.items() if k in output_names}
         return results
 
     def export_params(self):
@@ -390,6 +507,23 @@ def ssc_data_type(v):
     return ssc_data_type
 
 
+# Returns value of an SSC variable, or None if it is not assigned in the data container
+def get_ssc_var(ssc_output_data_type, ssc, dat, ssc_output_data_name):
+    name = ssc_output_data_name.encode("ascii")
+    if ssc.data_query(dat, name) <= 0:
+        return None
+    if (ssc_output_data_type == 1):
+        return ssc.data_get_string(dat, name).decode("ascii")
+    elif (ssc_output_data_type == 2):
+        return ssc.data_get_number(dat, name)
+    elif (ssc_output_data_type == 3):
+        return ssc.data_get_array(dat, name)
+    elif (ssc_output_data_type == 4):
+        return ssc.data_get_matrix(dat, name)
+    elif (ssc_output_data_type == 5):
+        return ssc.data_get_table(dat, name)
+
+
 # Returns python dictionary representing SSC compute module w/ all required inputs/outputs defined
 def ssc_table_to_dict(ssc, cmod, dat):
     # ssc = PySSC()
@@ -401,20 +535,9 @@ def ssc_table_to_dict(ssc, cmod, dat):
         if (ssc_output_data_type <= 0 or ssc_output_data_type > 5):
             break
         ssc_output_data_name = str(ssc.info_name(p_ssc_entry).decode("ascii"))
-        ssc_data_query = ssc.data_query(dat, ssc_output_data_name.encode("ascii"))
-        if (ssc_data_query > 0):
-            if (ssc_output_data_type == 1):
-                ssc_out[ssc_output_data_name] = ssc.data_get_string(dat,
-                                                                    ssc_output_data_name.encode("ascii")).decode(
-                    "ascii")
-            elif (ssc_output_data_type == 2):
-                ssc_out[ssc_output_data_name] = ssc.data_get_number(dat, ssc_output_data_name.encode("ascii"))
-            elif (ssc_output_data_type == 3):
-                ssc_out[ssc_output_data_name] = ssc.data_get_array(dat, ssc_output_data_name.encode("ascii"))
-            elif (ssc_output_data_type == 4):
-                ssc_out[ssc_output_data_name] = ssc.data_get_matrix(dat, ssc_output_data_name.encode("ascii"))
-            elif (ssc_output_data_type == 5):
-                ssc_out[ssc_output_data_name] = ssc.data_get_table(dat, ssc_output_data_name.encode("ascii"))
+        value = get_ssc_var(ssc_output_data_type, ssc, dat, ssc_output_data_name)
+        if value is not None:
+            ssc_out[ssc_output_data_name] = value
         i = i + 1
 
     ssc.data_free(dat)
@@ -439,6 +562,10 @@ class PySSC:
         print('Process ID = ' + str(os.getpid()))       # attach to process will not work until after the above CDLL() call
         pass
 
+    def __reduce__(self):
+        # the ctypes library handle cannot be pickled, the library is loaded again when unpickled
+        return PySSC, ()
+
     INVALID = 0
     STRING = 1
     NUMBER = 2
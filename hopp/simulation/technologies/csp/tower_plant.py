@@ -1,13 +1,16 @@
 import os
 import numpy as np
 from math import pi, log, sin
+from typing import Optional
 
+import rapidjson                # NOTE: install 'python-rapidjson' NOT 'rapidjson'
 from attrs import define, field
 import PySAM.Singleowner as Singleowner
 
 from hopp.simulation.technologies.csp.csp_plant import CspConfig
-from hopp.simulation.technologies.csp.csp_plant import CspPlant
+from hopp.simulation.technologies.csp.csp_plant import CspPlant, CspResultCache
 from hopp.simulation.technologies.sites import SiteInfo
+from hopp.utilities.atomic_write import atomic_write
 from hopp.utilities.validators import contains
 
 
@@ -26,6 +29,34 @@ def copydoc(fromfunc, sep="\n"):
     return _decorator
 
 
+# SSC inputs that determine the heliostat field layout and flux/eta maps
+FIELD_CACHE_PARAMS = [
+    # weather and site
+    'solar_resource_data', 'solar_resource_file',
+    # design point
+    'P_ref', 'design_eff', 'gross_net_conversion_factor', 'solarm', 'dni_des', 'T_htf_cold_des', 'T_htf_hot_des',
+    'rec_htf', 'field_fl_props',
+    # heliostats and field
+    'helio_width', 'helio_height', 'helio_optical_error_mrad', 'helio_active_fraction', 'dens_mirror',
+    'helio_reflectance', 'n_facet_x', 'n_facet_y', 'focus_type', 'cant_type', 'c_atm_0', 'c_atm_1', 'c_atm_2',
+    'c_atm_3', 'land_max', 'land_min', 'p_start', 'p_track', 'hel_stow_deploy', 'v_wind_max',
+    'csp.pt.sf.fixed_land_area', 'csp.pt.sf.land_overhead_factor',
+    # tower and receiver
+    'h_tower', 'rec_height', 'D_rec', 'rec_absorptance', 'rec_hl_perm2', 'N_panels', 'd_tube_out', 'th_tube',
+    'Flow_type', 'mat_tube', 'piping_length_const', 'piping_length_mult', 'piping_loss', 'f_rec_min',
+    'csp.pt.rec.max_oper_frac',
+    # flux maps
+    'n_flux_days', 'delta_flux_hrs', 'n_flux_x', 'n_flux_y', 'flux_max', 'check_max_flux', 'sf_excess',
+    # field and tower optimization, including the costs it trades off
+    'field_model_type', 'opt_algorithm', 'opt_conv_tol', 'opt_flux_penalty', 'opt_init_step', 'opt_max_iter',
+    'tower_fixed_cost', 'tower_exp', 'rec_ref_cost', 'rec_ref_area', 'rec_cost_exp', 'site_spec_cost',
+    'heliostat_spec_cost', 'cost_sf_fixed', 'land_spec_cost', 'contingency_rate', 'sales_tax_rate', 'sales_tax_frac'
+]
+
+# Maximum number of field layouts and flux/eta maps held in memory
+FIELD_CACHE_MAX_SIZE = 16
+
+
 @define
 class TowerConfig(CspConfig):
     """
@@ -41,10 +72,14 @@ class TowerConfig(CspConfig):
             inputs.
         scale_input_params: If True, HOPP will run
             :py:func:`hopp.simulation.technologies.csp.tower_plant.scale_params` before system simulation.
+        field_cache_dir: (optional) Directory where generated heliostat field layouts and flux/eta maps are saved
+            and reused, keyed by a hash of the field-relevant SSC inputs. Field layouts are always reused within a
+            process.
     """
     tech_name: str = field(validator=contains(["tcsmolten_salt", "trough_physical"]), default="tcsmolten_salt")
     optimize_field_before_sim: bool = field(default=True)
     scale_input_params: bool = field(default=False)
+    field_cache_dir: Optional[str] = field(default=None)
     name: str = field(default="TowerPlant")
 
 
@@ -62,6 +97,9 @@ class TowerPlant(CspPlant):
 
     optimize_field_before_sim: bool = field(init=False)
 
+    # cache key -> field layout and flux/eta maps, shared by all instances
+    _field_and_flux_maps_cache = CspResultCache(FIELD_CACHE_MAX_SIZE)
+
     def __attrs_post_init__(self):
         if self.config.fin_model is None:
             self.config.fin_model = Singleowner.default('MSPTSingleOwner')
@@ -178,21 +216,27 @@ class TowerPlant(CspPlant):
             self.ssc.set({'field_model_type': 1})
             print('Generating field layout and simulating flux and eta maps ...')
 
-        original_values = {k: self.ssc.get(k) for k in['is_dispatch_targets', 'rec_clearsky_model', 'time_steps_per_hour', 'sf_adjust:hourly']}
-        # set so unneeded dispatch targets and clearsky DNI are not required
-        # TODO: probably don't need hourly sf adjustment factors
-        self.ssc.set({'is_dispatch_targets': False, 'rec_clearsky_model': 1, 'time_steps_per_hour': 1,
-                      'sf_adjust:hourly': [0.0 for j in range(8760)]})
-        tech_outputs = self.ssc.execute()
-        print('Finished creating field layout and simulating flux and eta maps. # Heliostats = %d, Tower height = %.1fm, Receiver height = %.2fm, Receiver diameter = %.2fm'%
-             (tech_outputs['N_hel'], tech_outputs['h_tower'], tech_outputs['rec_height'], tech_outputs['D_rec']))
-        self.ssc.set(original_values)
-        eta_map = tech_outputs["eta_map_out"]
-        flux_maps = [r[2:] for r in tech_outputs['flux_maps_for_import']]  # don't include first two columns
-        A_sf_in = tech_outputs["A_sf"]
-        field_and_flux_maps = {'eta_map': eta_map, 'flux_maps': flux_maps, 'A_sf_in': A_sf_in}
-        for k in ['helio_positions', 'N_hel', 'D_rec', 'rec_height', 'h_tower', 'land_area_base']:
-            field_and_flux_maps[k] = tech_outputs[k]
+        cache_key = self.field_and_flux_maps_cache_key()
+        field_and_flux_maps = self.load_cached_field_and_flux_maps(cache_key)
+        if field_and_flux_maps is not None:
+            print('Using cached field layout and flux and eta maps.')
+        else:
+            original_values = {k: self.ssc.get(k) for k in['is_dispatch_targets', 'rec_clearsky_model', 'time_steps_per_hour', 'sf_adjust:hourly']}
+            # set so unneeded dispatch targets and clearsky DNI are not required
+            # TODO: probably don't need hourly sf adjustment factors
+            self.ssc.set({'is_dispatch_targets': False, 'rec_clearsky_model': 1, 'time_steps_per_hour': 1,
+                          'sf_adjust:hourly': [0.0 for j in range(8760)]})
+            tech_outputs = self.ssc.execute()
+            print('Finished creating field layout and simulating flux and eta maps. # Heliostats = %d, Tower height = %.1fm, Receiver height = %.2fm, Receiver diameter = %.2fm'%
+                 (tech_outputs['N_hel'], tech_outputs['h_tower'], tech_outputs['rec_height'], tech_outputs['D_rec']))
+            self.ssc.set(original_values)
+            eta_map = tech_outputs["eta_map_out"]
+            flux_maps = [r[2:] for r in tech_outputs['flux_maps_for_import']]  # don't include first two columns
+            A_sf_in = tech_outputs["A_sf"]
+            field_and_flux_maps = {'eta_map': eta_map, 'flux_maps': flux_maps, 'A_sf_in': A_sf_in}
+            for k in ['helio_positions', 'N_hel', 'D_rec', 'rec_height', 'h_tower', 'land_area_base']:
+                field_and_flux_maps[k] = tech_outputs[k]
+            self.cache_field_and_flux_maps(cache_key, field_and_flux_maps)
 
         # Check if specified receiver dimensions make sense relative to heliostat dimensions
         if min(field_and_flux_maps['rec_height'], field_and_flux_maps['D_rec']) < max(self.ssc.get('helio_width'), self.ssc.get('helio_height')):
@@ -208,6 +252,49 @@ class TowerPlant(CspPlant):
 
         return field_and_flux_maps
 
+    def field_and_flux_maps_cache_key(self) -> str:
+        """
+        Returns a hash of the SSC inputs that determine the heliostat field layout and flux/eta maps, listed in
+        ``FIELD_CACHE_PARAMS``. Inputs replaced by a generated layout, e.g., heliostat positions, are not part of the
+        key. When the field and tower are optimized, the optimized tower and receiver dimensions replace the inputs,
+        so regenerating that plant's field starts from, and is keyed on, the optimized design.
+        """
+        return self.ssc_inputs_hash(FIELD_CACHE_PARAMS)
+
+    def load_cached_field_and_flux_maps(self, cache_key: str) -> Optional[dict]:
+        """
+        Returns field layout and flux/eta maps from the in-memory cache or, if configured, the on-disk cache.
+
+        Args:
+            cache_key: hash of field-relevant SSC inputs from :py:func:`field_and_flux_maps_cache_key`
+        """
+        field_and_flux_maps = TowerPlant._field_and_flux_maps_cache.get(cache_key)
+        if field_and_flux_maps is not None:
+            return field_and_flux_maps
+        if self.config.field_cache_dir is not None:
+            cache_file = os.path.join(self.config.field_cache_dir, cache_key + '.json')
+            if os.path.isfile(cache_file):
+                with open(cache_file, 'r') as f:
+                    field_and_flux_maps = rapidjson.load(f)
+                TowerPlant._field_and_flux_maps_cache.put(cache_key, field_and_flux_maps)
+                return field_and_flux_maps
+        return None
+
+    def cache_field_and_flux_maps(self, cache_key: str, field_and_flux_maps: dict):
+        """
+        Stores field layout and flux/eta maps in the in-memory cache and, if configured, the on-disk cache.
+
+        Args:
+            cache_key: hash of field-relevant SSC inputs from :py:func:`field_and_flux_maps_cache_key`
+            field_and_flux_maps: field layout and flux/eta maps to store
+        """
+        TowerPlant._field_and_flux_maps_cache.put(cache_key, field_and_flux_maps)
+        if self.config.field_cache_dir is not None:
+            os.makedirs(self.config.field_cache_dir, exist_ok=True)
+            cache_file = os.path.join(self.config.field_cache_dir, cache_key + '.json')
+            with atomic_write(cache_file, 'w') as f:
+                rapidjson.dump(field_and_flux_maps, f)
+
     def optimize_field_and_tower(self):
         """
         Optimizes heliostat field, tower height, and receiver geometry (diameter and height). This method uses
@@ -463,4 +550,3 @@ class TowerPlant(CspPlant):
         """Returns initial thermal energy storage fraction of mass in hot tank [-]"""
         return self.plant_state['csp.pt.tes.init_hot_htf_percent'] / 100.
 
-
@@ -28,6 +28,9 @@ from hopp.simulation.technologies.dispatch.hybrid_dispatch import HybridDispatch
 from hopp.simulation.technologies.dispatch.dispatch_problem_state import (
     DispatchProblemState,
 )
+from hopp.simulation.technologies.dispatch.dispatch_solve_cache import (
+    DispatchSolveCache,
+)
 from hopp.simulation.technologies.dispatch.power_storage.simple_battery_dispatch import (
     SimpleBatteryDispatch,
 )
@@ -1,3 +1,4 @@
+import numpy as np
 import pyomo.environ as pyomo
 from pyomo.environ import units as u
 
@@ -31,6 +32,9 @@ class Dispatch:
         self._system_model = system_model
         self._financial_model = financial_model
 
+        # Block parameters and variables over the horizon, by name
+        self._horizon_component_lists = {}
+
     @staticmethod
     def dispatch_block_rule(block, t):
         raise NotImplemented(
@@ -47,6 +51,76 @@ class Dispatch:
             "This function must be overridden for specific dispatch model"
         )
 
+    def _horizon_components(self, name: str) -> list:
+        """Returns a block parameter or variable of every block, in horizon order.
+
+        The component lists are built once per name, since blocks do not change after the model is built.
+
+        Args:
+            name: Name of the parameter or variable on each block.
+
+        """
+        components = self._horizon_component_lists.get(name)
+        if components is None:
+            components = [getattr(self.blocks[t], name) for t in self.blocks.index_set()]
+            self._horizon_component_lists[name] = components
+        return components
+
+    def _set_horizon_parameter(self, param_name: str, values):
+        """Sets a mutable block parameter over the dispatch horizon.
+
+        Values are rounded as an array and compared with the parameter's current values, so only
+        the periods that changed are written to the Pyomo model, which keeps rolling-horizon
+        updates cheap. Comparing with the model, rather than with the previously set values,
+        keeps the update correct if the parameter was also set in another way.
+
+        Args:
+            param_name: Name of the parameter on each block.
+            values: Horizon values, one per block, or a single value for all blocks.
+
+        """
+        components = self._horizon_components(param_name)
+        values = np.round(np.asarray(values, dtype=float), self.round_digits)
+        if values.ndim == 0:
+            values = np.full(len(components), values)
+        current = np.fromiter(
+            (_param_value(component) for component in components), dtype=float, count=len(components)
+        )
+        for i in np.flatnonzero(values != current):
+            components[i].set_value(float(values[i]))
+
+    def _horizon_window(self, series, start_time: int) -> np.ndarray:
+        """Gets the values of a time series over the dispatch horizon, wrapping around to the start of the series.
+
+        Args:
+            series: Time series, i.e., an annual profile.
+            start_time: Index of the series at the start of the horizon.
+
+        """
+        periods = np.arange(start_time, start_time + len(self.blocks))
+        return np.take(np.asarray(series, dtype=float), periods, mode="wrap")
+
+    def _get_horizon_values(self, name: str) -> list:
+        """Gets the values of a block parameter or variable over the dispatch horizon.
+
+        Args:
+            name: Name of the parameter or variable on each block.
+
+        """
+        return [component.value for component in self._horizon_components(name)]
+
+    def get_horizon_array(self, name: str) -> np.ndarray:
+        """Gets the values of a block parameter or variable over the dispatch horizon as an array.
+
+        Args:
+            name: Name of the parameter or variable on each block.
+
+        Returns:
+            Horizon values, with unset values as NaN.
+
+        """
+        return np.array(self._get_horizon_values(name), dtype=float)
+
     @staticmethod
     def _check_efficiency_value(efficiency):
         """Checks efficiency is between 0 and 1 or 0 and 100. Returns fractional value"""
@@ -65,3 +139,11 @@ class Dispatch:
     @property
     def model(self) -> pyomo.ConcreteModel:
         return self._model
+
+
+def _param_value(component) -> float:
+    """Returns the value of a parameter as a float, or NaN if it has no numeric value yet."""
+    try:
+        return float(component.value)
+    except (TypeError, ValueError):
+        return np.nan
@@ -21,36 +21,81 @@ class DispatchProblemState:
     def store_problem_metrics(
         self, solver_results, start_time, n_days, objective_value
     ):
-        self.start_time = start_time
-        self.n_days = n_days
-        self.termination_condition = str(solver_results.solver.termination_condition)
+        self.store_metrics(
+            self.get_problem_metrics(solver_results, objective_value), start_time, n_days
+        )
+
+    @staticmethod
+    def get_problem_metrics(solver_results, objective_value) -> dict:
+        """Returns the metrics of a single dispatch solve as a dictionary."""
         try:
-            self.solve_time = solver_results.solver.time
+            solve_time = solver_results.solver.time
         except AttributeError:
-            self.solve_time = solver_results.solver.wallclock_time
-        self.objective = objective_value
-        self.upper_bound = solver_results.problem.upper_bound
-        self.lower_bound = solver_results.problem.lower_bound
-        self.constraints = solver_results.problem.number_of_constraints
-        self.variables = solver_results.problem.number_of_variables
-        self.non_zeros = solver_results.problem.number_of_nonzeros
+            solve_time = solver_results.solver.wallclock_time
+        upper_bound = solver_results.problem.upper_bound
+        lower_bound = solver_results.problem.lower_bound
 
         # solver_results.solution.Gap not define
-        if solver_results.problem.upper_bound != 0.0:
-            self.gap = abs(
-                solver_results.problem.upper_bound - solver_results.problem.lower_bound
-            ) / abs(solver_results.problem.upper_bound)
-        elif solver_results.problem.lower_bound == 0.0:
-            self.gap = 0.0
+        if upper_bound != 0.0:
+            gap = abs(upper_bound - lower_bound) / abs(upper_bound)
+        elif lower_bound == 0.0:
+            gap = 0.0
         else:
-            self.gap = float("inf")
-
-        if (
-            not solver_results.solver.termination_condition
-            == TerminationCondition.optimal
-        ):
+            gap = float("inf")
+
+        return {
+            "termination_condition": str(solver_results.solver.termination_condition),
+            "solve_time": solve_time,
+            "objective": objective_value,
+            "upper_bound": upper_bound,
+            "lower_bound": lower_bound,
+            "constraints": solver_results.problem.number_of_constraints,
+            "variables": solver_results.problem.number_of_variables,
+            "non_zeros": solver_results.problem.number_of_nonzeros,
+            "gap": gap,
+            "optimal": solver_results.solver.termination_condition
+            == TerminationCondition.optimal,
+        }
+
+    def store_metrics(self, metrics: dict, start_time, n_days):
+        """Stores the metrics of a dispatch solve, e.g., as returned by ``get_problem_metrics``."""
+        self.start_time = start_time
+        self.n_days = n_days
+        self.termination_condition = metrics["termination_condition"]
+        self.solve_time = metrics["solve_time"]
+        self.objective = metrics["objective"]
+        self.upper_bound = metrics["upper_bound"]
+        self.lower_bound = metrics["lower_bound"]
+        self.constraints = metrics["constraints"]
+        self.variables = metrics["variables"]
+        self.non_zeros = metrics["non_zeros"]
+        self.gap = metrics["gap"]
+
+        if not metrics["optimal"]:
             self._n_non_optimal_solves += 1
 
+    def extend(self, problem_state: "DispatchProblemState"):
+        """Appends the metrics stored by another problem state, e.g., one tracked in a worker process."""
+        for metric_name in [
+            "start_time",
+            "n_days",
+            "termination_condition",
+            "solve_time",
+            "objective",
+            "upper_bound",
+            "lower_bound",
+            "constraints",
+            "variables",
+            "non_zeros",
+            "gap",
+        ]:
+            setattr(
+                self,
+                "_" + metric_name,
+                getattr(self, metric_name) + getattr(problem_state, metric_name),
+            )
+        self._n_non_optimal_solves += problem_state.n_non_optimal_solves
+
     def _update_metric(self, metric_name, value):
         data = list(getattr(self, metric_name))
         data.append(value)
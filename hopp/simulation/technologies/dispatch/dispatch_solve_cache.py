@@ -0,0 +1,138 @@
+import hashlib
+import io
+import json
+import sqlite3
+from collections import OrderedDict
+from contextlib import closing
+from typing import Optional
+
+import numpy as np
+import pyomo.environ as pyomo
+
+
+class DispatchSolveCache:
+    """Memoizes rolling-horizon dispatch window solutions.
+
+    Windows are keyed by a hash of every parameter value of the dispatch model, which includes the initial
+    state of each technology, together with the model structure and solver settings. Each entry stores the
+    values of all dispatch variables and the solve metrics of ``DispatchProblemState``, so a repeated window
+    can be restored without solving the MILP again.
+
+    Entries are held in an in-memory LRU cache of ``max_size`` windows. If ``path`` is given, entries are also
+    written to a SQLite database, which can be shared between simulations and processes.
+    """
+
+    def __init__(
+        self,
+        pyomo_model: pyomo.ConcreteModel,
+        max_size: int = 128,
+        path: Optional[str] = None,
+        salt: str = "",
+    ):
+        """
+        Args:
+            pyomo_model: Dispatch model whose windows are cached. Its structure must not change afterwards.
+            max_size: Maximum number of windows held in memory.
+            path: Optional SQLite database file for persistent storage of window solutions.
+            salt: Additional key material, e.g., the solver name and options.
+        """
+        if max_size < 1:
+            raise ValueError("'max_size' must be at least 1")
+        self.max_size = max_size
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+        self._params = list(pyomo_model.component_data_objects(pyomo.Param, descend_into=True))
+        self._variables = list(pyomo_model.component_data_objects(pyomo.Var, descend_into=True))
+
+        structure = hashlib.sha256(salt.encode())
+        for component in self._params + self._variables:
+            structure.update(component.name.encode())
+            structure.update(b"\0")
+        self._structure_hash = structure.digest()
+
+        if self.path is not None:
+            with closing(sqlite3.connect(self.path, timeout=60)) as connection, connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS dispatch_windows "
+                    "(key TEXT PRIMARY KEY, solution BLOB, metrics TEXT)"
+                )
+
+    def window_key(self) -> str:
+        """Returns the key of the dispatch window currently set in the model's parameters."""
+        values = np.array(
+            [pyomo.value(param, exception=False) for param in self._params], dtype=float
+        )
+        key = hashlib.sha256(self._structure_hash)
+        key.update(values.tobytes())
+        return key.hexdigest()
+
+    def get(self, key: str) -> Optional[dict]:
+        """Returns the cached metrics of the window and restores its solution to the model variables.
+
+        Returns None if the window is not cached.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        elif self.path is not None:
+            entry = self._read_entry(key)
+            if entry is not None:
+                self._add_entry(key, entry)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        solution, metrics = entry
+        for variable, value in zip(self._variables, solution.tolist()):
+            variable.set_value(None if np.isnan(value) else value, skip_validation=True)
+        return dict(metrics)
+
+    def put(self, key: str, metrics: dict):
+        """Stores the current solution of the model variables and the window's solve metrics."""
+        solution = np.array(
+            [np.nan if variable.value is None else variable.value for variable in self._variables],
+            dtype=float,
+        )
+        entry = (solution, dict(metrics))
+        self._add_entry(key, entry)
+        if self.path is not None:
+            self._write_entry(key, entry)
+
+    def clear(self):
+        """Clears the in-memory cache. Entries in the SQLite database are kept."""
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _add_entry(self, key: str, entry: tuple):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def _read_entry(self, key: str) -> Optional[tuple]:
+        with closing(sqlite3.connect(self.path, timeout=60)) as connection, connection:
+            row = connection.execute(
+                "SELECT solution, metrics FROM dispatch_windows WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        with np.load(io.BytesIO(row[0])) as data:
+            solution = data["solution"]
+        return solution, json.loads(row[1])
+
+    def _write_entry(self, key: str, entry: tuple):
+        solution, metrics = entry
+        buffer = io.BytesIO()
+        np.savez_compressed(buffer, solution=solution)
+        with closing(sqlite3.connect(self.path, timeout=60)) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO dispatch_windows (key, solution, metrics) VALUES (?, ?, ?)",
+                (key, buffer.getvalue(), json.dumps(metrics, default=str)),
+            )
@@ -239,35 +239,21 @@ class GridDispatch(Dispatch):
         )
 
     def update_time_series_parameters(self, start_time: int):
-        n_horizon = len(self.blocks.index_set())
         dispatch_factors = self._financial_model.value("dispatch_factors_ts")
         ppa_price = self._financial_model.value("ppa_price_input")[0]
-        if start_time + n_horizon > len(dispatch_factors):
-            prices = list(dispatch_factors[start_time:])
-            prices.extend(list(dispatch_factors[0 : n_horizon - len(prices)]))
-        else:
-            prices = dispatch_factors[start_time : start_time + n_horizon]
+        prices = self._horizon_window(dispatch_factors, start_time)
         # NOTE: Assuming the same prices
-        self.electricity_sell_price = [
-            norm_price * ppa_price * 1e3 for norm_price in prices
-        ]
-        self.electricity_purchase_price = [
-            norm_price * ppa_price * 1e3 for norm_price in prices
-        ]
+        self.electricity_sell_price = prices * ppa_price * 1e3
+        self.electricity_purchase_price = prices * ppa_price * 1e3
 
     @property
     def electricity_sell_price(self) -> list:
-        return [
-            self.blocks[t].electricity_sell_price.value for t in self.blocks.index_set()
-        ]
+        return self._get_horizon_values("electricity_sell_price")
 
     @electricity_sell_price.setter
     def electricity_sell_price(self, price_per_mwh: list):
         if len(price_per_mwh) == len(self.blocks):
-            for t, price in zip(self.blocks, price_per_mwh):
-                self.blocks[t].electricity_sell_price.set_value(
-                    round(price, self.round_digits)
-                )
+            self._set_horizon_parameter("electricity_sell_price", price_per_mwh)
         else:
             raise ValueError(
                 "'price_per_mwh' list must be the same length as time horizon"
@@ -275,18 +261,12 @@ class GridDispatch(Dispatch):
 
     @property
     def electricity_purchase_price(self) -> list:
-        return [
-            self.blocks[t].electricity_purchase_price.value
-            for t in self.blocks.index_set()
-        ]
+        return self._get_horizon_values("electricity_purchase_price")
 
     @electricity_purchase_price.setter
     def electricity_purchase_price(self, price_per_mwh: list):
         if len(price_per_mwh) == len(self.blocks):
-            for t, price in zip(self.blocks, price_per_mwh):
-                self.blocks[t].electricity_purchase_price.set_value(
-                    round(price, self.round_digits)
-                )
+            self._set_horizon_parameter("electricity_purchase_price", price_per_mwh)
         else:
             raise ValueError(
                 "'price_per_mwh' list must be the same length as time horizon"
@@ -294,41 +274,29 @@ class GridDispatch(Dispatch):
 
     @property
     def generation_transmission_limit(self) -> list:
-        return [
-            self.blocks[t].generation_transmission_limit.value
-            for t in self.blocks.index_set()
-        ]
+        return self._get_horizon_values("generation_transmission_limit")
 
     @generation_transmission_limit.setter
     def generation_transmission_limit(self, limit_mw: list):
         if len(limit_mw) == len(self.blocks):
-            for t, limit in zip(self.blocks, limit_mw):
-                self.blocks[t].generation_transmission_limit.set_value(
-                    round(limit, self.round_digits)
-                )
+            self._set_horizon_parameter("generation_transmission_limit", limit_mw)
         else:
             raise ValueError("'limit_mw' list must be the same length as time horizon")
 
     @property
     def load_transmission_limit(self) -> list:
-        return [
-            self.blocks[t].load_transmission_limit.value
-            for t in self.blocks.index_set()
-        ]
+        return self._get_horizon_values("load_transmission_limit")
 
     @load_transmission_limit.setter
     def load_transmission_limit(self, limit_mw: list):
         if len(limit_mw) == len(self.blocks):
-            for t, limit in zip(self.blocks, limit_mw):
-                self.blocks[t].load_transmission_limit.set_value(
-                    round(limit, self.round_digits)
-                )
+            self._set_horizon_parameter("load_transmission_limit", limit_mw)
         else:
             raise ValueError("'limit_mw' list must be the same length as time horizon")
 
     @property
     def system_generation(self) -> list:
-        return [self.blocks[t].system_generation.value for t in self.blocks.index_set()]
+        return self._get_horizon_values("system_generation")
 
     # @system_generation.setter
     # def system_generation(self, system_gen_mw: list):
@@ -340,7 +308,7 @@ class GridDispatch(Dispatch):
 
     @property
     def system_load(self) -> list:
-        return [self.blocks[t].system_load.value for t in self.blocks.index_set()]
+        return self._get_horizon_values("system_load")
 
     # @system_load.setter
     # def system_load(self, system_load_mw: list):
@@ -352,18 +320,16 @@ class GridDispatch(Dispatch):
 
     @property
     def electricity_sold(self) -> list:
-        return [self.blocks[t].electricity_sold.value for t in self.blocks.index_set()]
+        return self._get_horizon_values("electricity_sold")
 
     @property
     def electricity_purchased(self) -> list:
-        return [
-            self.blocks[t].electricity_purchased.value for t in self.blocks.index_set()
-        ]
+        return self._get_horizon_values("electricity_purchased")
 
     @property
     def is_generating(self) -> list:
-        return [self.blocks[t].is_generating.value for t in self.blocks.index_set()]
+        return self._get_horizon_values("is_generating")
 
     @property
     def not_generating(self) -> list:
-        return [self.blocks[t].not_generating.value for t in self.blocks.index_set()]
+        return self._get_horizon_values("not_generating")
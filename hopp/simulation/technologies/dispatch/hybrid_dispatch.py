@@ -1,3 +1,4 @@
+import numpy as np
 import pyomo.environ as pyomo
 from pyomo.network import Port, Arc
 from pyomo.environ import units as u
@@ -208,16 +209,12 @@ class HybridDispatch(Dispatch):
 
     @time_weighting_factor.setter
     def time_weighting_factor(self, weighting: float):
-        for t in self.blocks.index_set():
-            self.blocks[t].time_weighting_factor = round(
-                weighting**t, self.round_digits
-            )
+        periods = np.fromiter(self.blocks.index_set(), dtype=float)
+        self._set_horizon_parameter("time_weighting_factor", weighting**periods)
 
     @property
     def time_weighting_factor_list(self) -> list:
-        return [
-            self.blocks[t].time_weighting_factor.value for t in self.blocks.index_set()
-        ]
+        return self._get_horizon_values("time_weighting_factor")
 
     # Outputs
     @property
@@ -226,55 +223,55 @@ class HybridDispatch(Dispatch):
 
     @property
     def pv_generation(self) -> list:
-        return [self.blocks[t].pv_generation.value for t in self.blocks.index_set()]
+        return self._get_horizon_values("pv_generation")
 
     @property
     def wind_generation(self) -> list:
-        return [self.blocks[t].wind_generation.value for t in self.blocks.index_set()]
+        return self._get_horizon_values("wind_generation")
 
     @property
     def wave_generation(self) -> list:
-        return [self.blocks[t].wave_generation.value for t in self.blocks.index_set()]
+        return self._get_horizon_values("wave_generation")
     
     @property
     def tidal_generation(self) -> list:
-        return [self.blocks[t].tidal_generation.value for t in self.blocks.index_set()]
+        return self._get_horizon_values("tidal_generation")
     
     @property
     def generic_generation(self) -> list:
-        return [self.blocks[t].generic_generation.value for t in self.blocks.index_set()]
+        return self._get_horizon_values("generic_generation")
 
     @property
     def tower_generation(self) -> list:
-        return [self.blocks[t].tower_generation.value for t in self.blocks.index_set()]
+        return self._get_horizon_values("tower_generation")
 
     @property
     def tower_load(self) -> list:
-        return [self.blocks[t].tower_load.value for t in self.blocks.index_set()]
+        return self._get_horizon_values("tower_load")
 
     @property
     def trough_generation(self) -> list:
-        return [self.blocks[t].trough_generation.value for t in self.blocks.index_set()]
+        return self._get_horizon_values("trough_generation")
 
     @property
     def trough_load(self) -> list:
-        return [self.blocks[t].trough_load.value for t in self.blocks.index_set()]
+        return self._get_horizon_values("trough_load")
 
     @property
     def battery_charge(self) -> list:
-        return [self.blocks[t].battery_charge.value for t in self.blocks.index_set()]
+        return self._get_horizon_values("battery_charge")
 
     @property
     def battery_discharge(self) -> list:
-        return [self.blocks[t].battery_discharge.value for t in self.blocks.index_set()]
+        return self._get_horizon_values("battery_discharge")
 
     @property
     def system_generation(self) -> list:
-        return [self.blocks[t].system_generation.value for t in self.blocks.index_set()]
+        return self._get_horizon_values("system_generation")
 
     @property
     def system_load(self) -> list:
-        return [self.blocks[t].system_load.value for t in self.blocks.index_set()]
+        return self._get_horizon_values("system_load")
 
     @property
     def electricity_sales(self) -> list:
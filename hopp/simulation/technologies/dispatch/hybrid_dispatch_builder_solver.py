@@ -1,8 +1,17 @@
 import sys, os
+import io
+import tempfile
+import threading
 from pathlib import Path
 import time
+from typing import Tuple
 import numpy as np
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 import pyomo.environ as pyomo
 from pyomo.opt import TerminationCondition
 from pyomo.util.check_units import assert_units_consistent
@@ -12,10 +21,38 @@ from hopp.simulation.technologies.dispatch import (
     HybridDispatch,
     HybridDispatchOptions,
     DispatchProblemState,
+    DispatchSolveCache,
 )
 from hopp.simulation.technologies.clustering import Clustering
+from hopp.utilities.fork_pool import ForkPool
 from hopp.utilities.log import hybrid_logger as logger
 
+GUROBI_AMPL_EXECUTABLE = "/opt/solvers/gurobi"
+
+# Default options of each solver, updated with the user's solver options
+# Ref. on GLPK solver options: https://en.wikibooks.org/wiki/GLPK/Using_GLPSOL
+GLPK_SOLVER_OPTIONS = {
+    "cuts": None,
+    "presol": None,
+    # 'mostf': None,
+    # 'mipgap': 0.001,
+    "tmlim": 30,
+}
+# Ref. on Gurobi solver options: https://www.gurobi.com/documentation/9.1/ampl-gurobi/parameters.html
+GUROBI_SOLVER_OPTIONS = {"timelim": 60, "threads": 1}
+# CBC solver options can be found by launching executable 'start cbc.exe', verbose 15, ?
+# https://coin-or.github.io/Cbc/faq.html (a bit outdated)
+CBC_SOLVER_OPTIONS = {"seconds": 60}  # 'ratioGap': 0.001,
+# Ref. on Xpress solver options: https://ampl.com/products/solvers/solvers-we-sell/xpress/options/
+XPRESS_SOLVER_OPTIONS = {"mipgap": 0.001, "maxtime": 30}
+XPRESS_PERSISTENT_SOLVER_OPTIONS = {"mipgap": 0.001, "MAXTIME": 30}
+# Time limit [s] of persistent horizon dispatch solves, unless set in the solver options, either as 'timelimit' or
+# as the solver's own time limit option
+PERSISTENT_SOLVER_TIME_LIMIT = 60
+PERSISTENT_SOLVER_TIME_LIMIT_OPTIONS = ("timelimit", "seconds", "sec", "TimeLimit", "timelim")
+
+_solver_log_lock = threading.Lock()
+
 
 class HybridDispatchBuilderSolver:
     """Helper class for building hybrid system dispatch problem, solving dispatch problem, and simulating system
@@ -34,6 +71,8 @@ class HybridDispatchBuilderSolver:
 
         """
         self.opt = None
+        self._solver_pool = {}
+        self._solver_options = {}
         self.site: SiteInfo = site
         self.power_sources = power_sources
         self.options = HybridDispatchOptions(dispatch_options)
@@ -41,6 +80,8 @@ class HybridDispatchBuilderSolver:
         # deletes previous log file under same name
         if os.path.isfile(self.options.log_name):
             os.remove(self.options.log_name)
+        # in-memory sink of the solver output of each solve
+        self.solver_log = io.StringIO() if self.options.log_in_memory else None
 
         self.needs_dispatch = any(
             item in ["battery", "tower", "trough"] for item in self.power_sources.keys()
@@ -48,13 +89,31 @@ class HybridDispatchBuilderSolver:
 
         if self.needs_dispatch:
             self._pyomo_model = self._create_dispatch_optimization_model()
+            self.problem_state = DispatchProblemState()
+
+        # Heuristic battery dispatch is computed directly and never solves the model
+        if self.needs_dispatch and "heuristic" not in self.options.battery_dispatch:
             if self.site.follow_desired_schedule:
                 self.dispatch.create_min_operating_cost_objective()
             else:
                 self.dispatch.create_max_gross_profit_objective()
             self.dispatch.create_arcs()
             assert_units_consistent(self.pyomo_model)
-            self.problem_state = DispatchProblemState()
+
+        self.solve_cache = None
+        if self.needs_dispatch and self.options.use_solve_cache:
+            self.solve_cache = DispatchSolveCache(
+                self.pyomo_model,
+                max_size=self.options.solve_cache_size,
+                path=self.options.solve_cache_path or None,
+                salt=repr(
+                    (
+                        self.options.solver,
+                        sorted(self.options.solver_options.items()),
+                        self.options.use_persistent_horizon,
+                    )
+                ),
+            )
 
         # Clustering (optional)
         self.clustering = None
@@ -133,9 +192,61 @@ class HybridDispatchBuilderSolver:
         )
         return model
 
+    def pooled_solver(self, solver_name: str, **solver_kwargs):
+        """Returns the builder's solver instance for the given solver name and factory arguments.
+
+        Solver instances are created on first use and reused for every rolling-horizon window of the
+        simulation, which avoids repeated plugin construction and executable discovery.
+        """
+        key = _solver_key(solver_name, solver_kwargs)
+        if key not in self._solver_pool:
+            self._solver_pool[key] = pyomo.SolverFactory(solver_name, **solver_kwargs)
+        return self._solver_pool[key]
+
+    def pooled_solver_options(self, solver_spec_options: dict, solver_name: str, **solver_kwargs) -> dict:
+        """Returns the options of the builder's solver instance for the given solver name and factory arguments.
+
+        The solver's default options are updated with the user's solver options once, alongside the pooled solver,
+        and reused for every rolling-horizon window of the simulation.
+        """
+        key = _solver_key(solver_name, solver_kwargs)
+        if key not in self._solver_options:
+            self._solver_options[key] = SolverOptions(solver_spec_options, self.options.solver_options).constructed
+        return self._solver_options[key]
+
+    @property
+    def solver_logging(self) -> bool:
+        """True if the solver output of each solve is logged, to the log file or in memory"""
+        return self.options.log_name != "" or self.solver_log is not None
+
+    def close_solvers(self):
+        """Closes the pooled solver instances, releasing e.g. the models and licenses held by persistent solvers.
+
+        Called at the end of each simulation, the next solve creates new solver instances.
+        """
+        for solver in self._solver_pool.values():
+            # looked up on the class, unavailable solvers raise on any instance attribute access
+            close = getattr(type(solver), "close", None)
+            if callable(close):
+                close(solver)
+        self._solver_pool.clear()
+        self._solver_options.clear()
+        self.opt = None
+
     def solve_dispatch_model(self, start_time: int, n_days: int):
+        window_key = None
+        if self.solve_cache is not None:
+            window_key = self.solve_cache.window_key()
+            metrics = self.solve_cache.get(window_key)
+            if metrics is not None:
+                # Identical window was solved before, its solution is restored to the model
+                self.problem_state.store_metrics(metrics, start_time, n_days)
+                return
+
         # Solve dispatch model
-        if self.options.solver == "glpk":
+        if self.options.use_persistent_horizon:
+            solver_results = self.persistent_solve()
+        elif self.options.solver == "glpk":
             solver_results = self.glpk_solve()
         elif self.options.solver == "cbc":
             solver_results = self.cbc_solve()
@@ -150,42 +261,44 @@ class HybridDispatchBuilderSolver:
         else:
             raise ValueError("{} is not a supported solver".format(self.options.solver))
 
-        self.problem_state.store_problem_metrics(
-            solver_results, start_time, n_days, self.dispatch.objective_value
+        metrics = DispatchProblemState.get_problem_metrics(
+            solver_results, self.dispatch.objective_value
         )
+        self.problem_state.store_metrics(metrics, start_time, n_days)
+        if window_key is not None:
+            self.solve_cache.put(window_key, metrics)
 
     @staticmethod
     def glpk_solve_call(
         pyomo_model: pyomo.ConcreteModel,
         log_name: str = "",
         user_solver_options: dict = None,
+        solver=None,
+        solver_options: dict = None,
+        log_stream=None,
     ):
-
         # log_name = "annual_solve_GLPK.log"  # For debugging MILP solver
-        # Ref. on solver options: https://en.wikibooks.org/wiki/GLPK/Using_GLPSOL
-        glpk_solver_options = {
-            "cuts": None,
-            "presol": None,
-            # 'mostf': None,
-            # 'mipgap': 0.001,
-            "tmlim": 30,
-        }
-        solver_options = SolverOptions(
-            glpk_solver_options, log_name, user_solver_options, "log"
-        )
-        with pyomo.SolverFactory("glpk") as solver:
-            results = solver.solve(pyomo_model, options=solver_options.constructed)
+        if solver_options is None:
+            solver_options = SolverOptions(GLPK_SOLVER_OPTIONS, user_solver_options).constructed
+        if solver is None:
+            solver = pyomo.SolverFactory("glpk")
+        results = solver.solve(pyomo_model, options=solver_options)
         HybridDispatchBuilderSolver.log_and_solution_check(
             log_name,
-            solver_options.instance_log,
+            _solver_output(solver),
             results.solver.termination_condition,
             pyomo_model,
+            log_stream,
         )
         return results
 
     def glpk_solve(self):
         return HybridDispatchBuilderSolver.glpk_solve_call(
-            self.pyomo_model, self.options.log_name, self.options.solver_options
+            self.pyomo_model,
+            self.options.log_name,
+            solver=self.pooled_solver("glpk"),
+            solver_options=self.pooled_solver_options(GLPK_SOLVER_OPTIONS, "glpk"),
+            log_stream=self.solver_log,
         )
 
     @staticmethod
@@ -193,29 +306,34 @@ class HybridDispatchBuilderSolver:
         pyomo_model: pyomo.ConcreteModel,
         log_name: str = "",
         user_solver_options: dict = None,
+        solver=None,
+        solver_options: dict = None,
+        log_stream=None,
     ):
-
-        # Ref. on solver options: https://www.gurobi.com/documentation/9.1/ampl-gurobi/parameters.html
-        gurobi_solver_options = {"timelim": 60, "threads": 1}
-        solver_options = SolverOptions(
-            gurobi_solver_options, log_name, user_solver_options, "logfile"
-        )
-
-        with pyomo.SolverFactory(
-            "gurobi", executable="/opt/solvers/gurobi", solver_io="nl"
-        ) as solver:
-            results = solver.solve(pyomo_model, options=solver_options.constructed)
+        if solver_options is None:
+            solver_options = SolverOptions(GUROBI_SOLVER_OPTIONS, user_solver_options).constructed
+        if solver is None:
+            solver = pyomo.SolverFactory(
+                "gurobi", executable=GUROBI_AMPL_EXECUTABLE, solver_io="nl"
+            )
+        results = solver.solve(pyomo_model, options=solver_options)
         HybridDispatchBuilderSolver.log_and_solution_check(
             log_name,
-            solver_options.instance_log,
+            _solver_output(solver),
             results.solver.termination_condition,
             pyomo_model,
+            log_stream,
         )
         return results
 
     def gurobi_ampl_solve(self):
+        solver_kwargs = {"executable": GUROBI_AMPL_EXECUTABLE, "solver_io": "nl"}
         return HybridDispatchBuilderSolver.gurobi_ampl_solve_call(
-            self.pyomo_model, self.options.log_name, self.options.solver_options
+            self.pyomo_model,
+            self.options.log_name,
+            solver=self.pooled_solver("gurobi", **solver_kwargs),
+            solver_options=self.pooled_solver_options(GUROBI_SOLVER_OPTIONS, "gurobi", **solver_kwargs),
+            log_stream=self.solver_log,
         )
 
     @staticmethod
@@ -224,83 +342,102 @@ class HybridDispatchBuilderSolver:
         pyomo_model: pyomo.ConcreteModel,
         log_name: str = "",
         user_solver_options: dict = None,
+        log_stream=None,
+        set_options: bool = True,
     ):
-
-        # Ref. on solver options: https://www.gurobi.com/documentation/9.1/ampl-gurobi/parameters.html
-        gurobi_solver_options = {"timelim": 60, "threads": 1}
-        solver_options = SolverOptions(
-            gurobi_solver_options, log_name, user_solver_options, "logfile"
-        )
-
-        opt.options.update(solver_options.constructed)
+        # The builder sets the options of its persistent solver once, when it is created, see gurobi_solve
+        if set_options:
+            opt.options.update(SolverOptions(GUROBI_SOLVER_OPTIONS, user_solver_options).constructed)
         opt.set_instance(pyomo_model)
         results = opt.solve(save_results=False)
         HybridDispatchBuilderSolver.log_and_solution_check(
             log_name,
-            solver_options.instance_log,
+            _solver_output(opt),
             results.solver.termination_condition,
             pyomo_model,
+            log_stream,
         )
         return results
 
     def gurobi_solve(self):
         if self.opt is None:
-            self.opt = pyomo.SolverFactory("gurobi", solver_io="persistent")
+            self.opt = self.pooled_solver("gurobi", solver_io="persistent")
+            self.opt.options.update(self.pooled_solver_options(GUROBI_SOLVER_OPTIONS, "gurobi", solver_io="persistent"))
 
         return HybridDispatchBuilderSolver.gurobi_solve_call(
             self.opt,
             self.pyomo_model,
             self.options.log_name,
-            self.options.solver_options,
+            log_stream=self.solver_log,
+            set_options=False,
         )
 
+    @staticmethod
+    def cbc_solver_spec(logging: bool = False) -> Tuple[str, dict]:
+        """Returns the solver name and factory keyword arguments of the CBC solver for this platform"""
+        if sys.platform == "win32" or sys.platform == "cygwin":
+            cbc_path = Path(__file__).parent / "cbc_solver" / "cbc-win64" / "cbc"
+            if logging:
+                return "asl:cbc", {"executable": cbc_path}
+            return "cbc", {"executable": cbc_path, "solver_io": "nl"}
+        elif sys.platform == "darwin" or sys.platform == "linux":
+            return "cbc", {}
+        else:
+            raise SystemError("Platform not supported ", sys.platform)
+
+    @staticmethod
+    def cbc_solver_options(solver_name: str, user_solver_options: dict = None) -> dict:
+        """Returns the CBC solver options, updated with the user's solver options"""
+        cbc_solver_options = dict(CBC_SOLVER_OPTIONS)
+        if solver_name == "asl:cbc":
+            # the ASL interface only prints the solver log when asked to
+            cbc_solver_options["log"] = 2
+        return SolverOptions(cbc_solver_options, user_solver_options).constructed
+
     @staticmethod
     def cbc_solve_call(
         pyomo_model: pyomo.ConcreteModel,
         log_name: str = "",
         user_solver_options: dict = None,
+        solver=None,
+        solver_options: dict = None,
+        log_stream=None,
     ):
         # log_name = "annual_solve_CBC.log"
-        # Solver options can be found by launching executable 'start cbc.exe', verbose 15, ?
-        # https://coin-or.github.io/Cbc/faq.html (a bit outdated)
-        cbc_solver_options = {"seconds": 60}  # 'ratioGap': 0.001,
-        solver_options = SolverOptions(
-            cbc_solver_options, log_name, user_solver_options, "log"
+        solver_name, solver_kwargs = HybridDispatchBuilderSolver.cbc_solver_spec(
+            log_name != "" or log_stream is not None
         )
-
-        if sys.platform == "win32" or sys.platform == "cygwin":
-            cbc_path = Path(__file__).parent / "cbc_solver" / "cbc-win64" / "cbc"
-            if log_name != "":
-                logger.warning(
-                    "Warning: CBC solver logging is active... This will significantly increase simulation time."
-                )
-                solver_options.constructed["log"] = 2
-                solver = pyomo.SolverFactory("asl:cbc", executable=cbc_path)
-                results = solver.solve(
-                    pyomo_model,
-                    logfile=solver_options.instance_log,
-                    options=solver_options.constructed,
-                )
-            else:
-                solver = pyomo.SolverFactory("cbc", executable=cbc_path, solver_io="nl")
-                results = solver.solve(pyomo_model, options=solver_options.constructed)
-        elif sys.platform == "darwin" or sys.platform == "linux":
-            solver = pyomo.SolverFactory("cbc")
-            results = solver.solve(pyomo_model, options=solver_options.constructed)
-        else:
-            raise SystemError("Platform not supported ", sys.platform)
-
+        if solver_name == "asl:cbc":
+            logger.warning(
+                "Warning: CBC solver logging is active... This will significantly increase simulation time."
+            )
+        if solver_options is None:
+            solver_options = HybridDispatchBuilderSolver.cbc_solver_options(solver_name, user_solver_options)
+        if solver is None:
+            solver = pyomo.SolverFactory(solver_name, **solver_kwargs)
+        results = solver.solve(pyomo_model, options=solver_options)
         HybridDispatchBuilderSolver.log_and_solution_check(
             log_name,
-            solver_options.instance_log,
+            _solver_output(solver),
             results.solver.termination_condition,
             pyomo_model,
+            log_stream,
         )
         return results
 
     def cbc_solve(self):
+        solver_name, solver_kwargs = HybridDispatchBuilderSolver.cbc_solver_spec(self.solver_logging)
+        key = _solver_key(solver_name, solver_kwargs)
+        if key not in self._solver_options:
+            self._solver_options[key] = HybridDispatchBuilderSolver.cbc_solver_options(
+                solver_name, self.options.solver_options
+            )
         return HybridDispatchBuilderSolver.cbc_solve_call(
-            self.pyomo_model, self.options.log_name, self.options.solver_options
+            self.pyomo_model,
+            self.options.log_name,
+            solver=self.pooled_solver(solver_name, **solver_kwargs),
+            solver_options=self._solver_options[key],
+            log_stream=self.solver_log,
         )
 
     @staticmethod
@@ -308,29 +445,32 @@ class HybridDispatchBuilderSolver:
         pyomo_model: pyomo.ConcreteModel,
         log_name: str = "",
         user_solver_options: dict = None,
+        solver=None,
+        solver_options: dict = None,
+        log_stream=None,
     ):
-
-        # FIXME: Logging does not work
         # log_name = "annual_solve_Xpress.log"  # For debugging MILP solver
-        # Ref. on solver options: https://ampl.com/products/solvers/solvers-we-sell/xpress/options/
-        xpress_solver_options = {"mipgap": 0.001, "maxtime": 30}
-        solver_options = SolverOptions(
-            xpress_solver_options, log_name, user_solver_options, "LOGFILE"
-        )
-
-        with pyomo.SolverFactory("xpress_direct") as solver:
-            results = solver.solve(pyomo_model, options=solver_options.constructed)
+        if solver_options is None:
+            solver_options = SolverOptions(XPRESS_SOLVER_OPTIONS, user_solver_options).constructed
+        if solver is None:
+            solver = pyomo.SolverFactory("xpress_direct")
+        results = solver.solve(pyomo_model, options=solver_options)
         HybridDispatchBuilderSolver.log_and_solution_check(
             log_name,
-            solver_options.instance_log,
+            _solver_output(solver),
             results.solver.termination_condition,
             pyomo_model,
+            log_stream,
         )
         return results
 
     def xpress_solve(self):
         return HybridDispatchBuilderSolver.xpress_solve_call(
-            self.pyomo_model, self.options.log_name, self.options.solver_options
+            self.pyomo_model,
+            self.options.log_name,
+            solver=self.pooled_solver("xpress_direct"),
+            solver_options=self.pooled_solver_options(XPRESS_SOLVER_OPTIONS, "xpress_direct"),
+            log_stream=self.solver_log,
         )
 
     @staticmethod
@@ -339,36 +479,103 @@ class HybridDispatchBuilderSolver:
         pyomo_model: pyomo.ConcreteModel,
         log_name: str = "",
         user_solver_options: dict = None,
+        log_stream=None,
+        set_options: bool = True,
     ):
-
         # log_name = "annual_solve_Xpress.log"  # For debugging MILP solver
-        # Ref. on solver options: https://ampl.com/products/solvers/solvers-we-sell/xpress/options/
-        xpress_solver_options = {"mipgap": 0.001, "MAXTIME": 30}
-        solver_options = SolverOptions(
-            xpress_solver_options, log_name, user_solver_options, "LOGFILE"
-        )
-
-        opt.options.update(solver_options.constructed)
+        # The builder sets the options of its persistent solver once, when it is created, see xpress_persistent_solve
+        if set_options:
+            opt.options.update(SolverOptions(XPRESS_PERSISTENT_SOLVER_OPTIONS, user_solver_options).constructed)
         opt.set_instance(pyomo_model)
         results = opt.solve(save_results=False)
         HybridDispatchBuilderSolver.log_and_solution_check(
             log_name,
-            solver_options.instance_log,
+            _solver_output(opt),
             results.solver.termination_condition,
             pyomo_model,
+            log_stream,
         )
         return results
 
     def xpress_persistent_solve(self):
         if self.opt is None:
-            self.opt = pyomo.SolverFactory("xpress", solver_io="persistent")
+            self.opt = self.pooled_solver("xpress", solver_io="persistent")
+            self.opt.options.update(
+                self.pooled_solver_options(XPRESS_PERSISTENT_SOLVER_OPTIONS, "xpress", solver_io="persistent")
+            )
 
         return HybridDispatchBuilderSolver.xpress_persistent_solve_call(
             self.opt,
             self.pyomo_model,
             self.options.log_name,
-            self.options.solver_options,
+            log_stream=self.solver_log,
+            set_options=False,
+        )
+
+    @staticmethod
+    def persistent_solve_call(
+        opt,
+        pyomo_model: pyomo.ConcreteModel,
+        user_solver_options: dict = None,
+        warmstart: bool = False,
+    ):
+        # Ref. on persistent solver interfaces: https://pyomo.readthedocs.io/en/stable/contributed_packages/appsi.html
+        solver_options = {} if user_solver_options is None else dict(user_solver_options)
+        time_limit = next(
+            (solver_options[name] for name in PERSISTENT_SOLVER_TIME_LIMIT_OPTIONS if name in solver_options),
+            PERSISTENT_SOLVER_TIME_LIMIT,
+        )
+        # 'timelimit' is an argument of the solve, not an option of the solver
+        solver_options.pop("timelimit", None)
+        results = opt.solve(
+            pyomo_model, timelimit=time_limit, options=solver_options, warmstart=warmstart
         )
+        HybridDispatchBuilderSolver.check_solve_condition(
+            results.solver.termination_condition, pyomo_model
+        )
+        return results
+
+    def persistent_solve(self):
+        warmstart = self.opt is not None
+        if self.opt is None:
+            if self.solver_logging:
+                logger.warning(
+                    "Warning: Solver logging is not available for persistent horizon dispatch."
+                )
+            self.opt = self.pooled_solver(self.options.persistent_solver)
+            # The model structure is fixed across windows, only parameter values change
+            self.opt.update_config.check_for_new_or_removed_constraints = False
+            self.opt.update_config.check_for_new_or_removed_vars = False
+            self.opt.update_config.check_for_new_or_removed_params = False
+            self.opt.update_config.check_for_new_objective = False
+            self.opt.update_config.update_constraints = False
+            self.opt.update_config.update_named_expressions = False
+            self.opt.update_config.update_objective = False
+        else:
+            self.shift_dispatch_solution(self.options.n_roll_periods)
+
+        return HybridDispatchBuilderSolver.persistent_solve_call(
+            self.opt,
+            self.pyomo_model,
+            self.pooled_solver_options({}, self.options.persistent_solver),
+            warmstart,
+        )
+
+    def shift_dispatch_solution(self, n_shift: int):
+        """Shifts the dispatch variable values forward by ``n_shift`` periods, so the previous window's
+        solution can be used to warm-start the next window. Periods past the end of the previous solution
+        keep their values."""
+        index = self.pyomo_model.forecast_horizon.ordered_data()
+        dispatch_blocks = [self.dispatch.blocks] + [
+            tech.dispatch.blocks for tech in self.power_sources.values()
+        ]
+        for blocks in dispatch_blocks:
+            for t, t_shifted in zip(index, index[n_shift:]):
+                for var in blocks[t].component_objects(pyomo.Var, descend_into=False):
+                    if var.fixed:
+                        continue
+                    shifted_value = getattr(blocks[t_shifted], var.local_name).value
+                    var.set_value(shifted_value, skip_validation=True)
 
     @staticmethod
     def mindtpy_solve_call(pyomo_model: pyomo.ConcreteModel, log_name: str = ""):
@@ -385,8 +592,10 @@ class HybridDispatchBuilderSolver:
 
     @staticmethod
     def log_and_solution_check(
-        log_name: str, solve_log: str, solver_termination_condition, pyomo_model
+        log_name: str, solve_log: str, solver_termination_condition, pyomo_model, log_stream=None
     ):
+        if log_stream is not None:
+            log_stream.write("=" * 50 + "\n" + solve_log)
         if log_name != "":
             HybridDispatchBuilderSolver.append_solve_to_log(log_name, solve_log)
         HybridDispatchBuilderSolver.check_solve_condition(
@@ -406,33 +615,31 @@ class HybridDispatchBuilderSolver:
 
     @staticmethod
     def append_solve_to_log(log_name: str, solve_log: str):
-        # Appends single problem instance log to annual log file
-        fin = open(solve_log, "r")
-        data = fin.read()
-        fin.close()
-
-        ann_log = open(log_name, "a+")
-        ann_log.write("=" * 50 + "\n")
-        ann_log.write(data)
-        ann_log.close()
+        # Appends the solver output of a single problem instance to the annual log file
+        # Single write per solve, so concurrent simulations sharing a log file do not interleave lines. The file lock
+        # serializes the writes of simulations in other processes, e.g., forked workers; closing the file releases it.
+        with _solver_log_lock, open(log_name, "a+") as ann_log:
+            if fcntl is not None:
+                fcntl.flock(ann_log, fcntl.LOCK_EX)
+            ann_log.write("=" * 50 + "\n" + solve_log)
 
     @staticmethod
     def print_infeasible_problem(model: pyomo.ConcreteModel):
-        original_stdout = sys.stdout
-        with open("infeasible_instance.txt", "w") as f:
-            sys.stdout = f
-            print("\n" + "#" * 20 + " Model Parameter Values " + "#" * 20 + "\n")
-            HybridDispatchBuilderSolver.print_all_parameters(model)
-            print("\n" + "#" * 20 + " Model Blocks Display " + "#" * 20 + "\n")
-            HybridDispatchBuilderSolver.display_all_blocks(model)
-            sys.stdout = original_stdout
+        fd, dump_name = tempfile.mkstemp(
+            prefix="infeasible_instance_", suffix=".txt", dir=os.getcwd()
+        )
+        with os.fdopen(fd, "w") as f:
+            print("\n" + "#" * 20 + " Model Parameter Values " + "#" * 20 + "\n", file=f)
+            HybridDispatchBuilderSolver.print_all_parameters(model, ostream=f)
+            print("\n" + "#" * 20 + " Model Blocks Display " + "#" * 20 + "\n", file=f)
+            HybridDispatchBuilderSolver.display_all_blocks(model, ostream=f)
         raise ValueError(
             "Dispatch optimization model is infeasible.\n"
-            "See 'infeasible_instance.txt' for parameter values."
+            "See '{}' for parameter values.".format(dump_name)
         )
 
     @staticmethod
-    def print_all_parameters(model: pyomo.ConcreteModel):
+    def print_all_parameters(model: pyomo.ConcreteModel, ostream=None):
         param_list = list()
         block_list = list()
         for param_object in model.component_objects(pyomo.Param, active=True):
@@ -442,19 +649,19 @@ class HybridDispatchBuilderSolver:
             if (name_to_print not in param_list) or (block_name not in block_list):
                 block_list.append(block_name)
                 param_list.append(name_to_print)
-                print("\nParent Block Name: ", block_name)
-                print("Parameter: ", name_to_print)
+                print("\nParent Block Name: ", block_name, file=ostream)
+                print("Parameter: ", name_to_print, file=ostream)
                 for index in parent_block.index_set():
                     val_to_print = pyomo.value(
                         getattr(parent_block[index], param_object.getname())
                     )
-                    print("\t", index, "\t", val_to_print)
+                    print("\t", index, "\t", val_to_print, file=ostream)
 
     @staticmethod
-    def display_all_blocks(model: pyomo.ConcreteModel):
+    def display_all_blocks(model: pyomo.ConcreteModel, ostream=None):
         for block_object in model.component_objects(pyomo.Block, active=True):
             for index in block_object.index_set():
-                block_object[index].display()
+                block_object[index].display(ostream=ostream)
 
     def simulate_power(self):
         if self.needs_dispatch:
@@ -466,119 +673,244 @@ class HybridDispatchBuilderSolver:
         ti = list(range(0, self.site.n_timesteps, self.options.n_roll_periods))
         self.dispatch.initialize_parameters()
 
-        if self.clustering is None:
-            # Solving the year in series
-            for i, t in enumerate(ti):
-                if self.options.is_test_start_year or self.options.is_test_end_year:
-                    if (self.options.is_test_start_year and i < 5) or (
-                        self.options.is_test_end_year and i > 359
-                    ):
-                        start_time = time.time()
-                        self.simulate_with_dispatch(t)
-                        sim_w_dispath_time = time.time()
-                        logger.info("Day {} dispatch optimized.".format(i))
-                        logger.info(
-                            "      %6.2f seconds required to simulate with dispatch"
-                            % (sim_w_dispath_time - start_time)
-                        )
+        try:
+            if self.clustering is None:
+                # Solving the year in series
+                for i, t in enumerate(ti):
+                    if self.options.is_test_start_year or self.options.is_test_end_year:
+                        if (self.options.is_test_start_year and i < 5) or (
+                            self.options.is_test_end_year and i > 359
+                        ):
+                            start_time = time.time()
+                            self.simulate_with_dispatch(t)
+                            sim_w_dispath_time = time.time()
+                            logger.info("Day {} dispatch optimized.".format(i))
+                            logger.info(
+                                "      %6.2f seconds required to simulate with dispatch"
+                                % (sim_w_dispath_time - start_time)
+                            )
+                        else:
+                            continue
+                            # TODO: can we make the csp and battery model run with heuristic dispatch here?
+                            #  Maybe calling a simulate_with_heuristic() method
                     else:
-                        continue
-                        # TODO: can we make the csp and battery model run with heuristic dispatch here?
-                        #  Maybe calling a simulate_with_heuristic() method
+                        if (i % 73) == 0:
+                            logger.info("\t {:.0f} % complete".format(i * 20 / 73))
+                        self.simulate_with_dispatch(t)
+            else:
+
+                initial_states = {
+                    tech: {"day": [], "soc": [], "load": []}
+                    for tech in ["trough", "tower", "battery"]
+                    if tech in self.power_sources.keys()
+                }  # List of known charge states at 12 am from completed simulations
+                npercluster = self.clustering.clusters["count"]
+                inds = sorted(
+                    range(len(npercluster)), key=npercluster.__getitem__
+                )  # Indicies to sort clusters by low-to-high number of days represented
+                inds = inds[: self.clustering.clusters["n_cluster"]]
+                if self.options.n_cluster_processes > 1:
+                    self.simulate_cluster_exemplars_in_parallel(inds, initial_states)
                 else:
-                    if (i % 73) == 0:
-                        logger.info("\t {:.0f} % complete".format(i * 20 / 73))
-                    self.simulate_with_dispatch(t)
-        else:
+                    for j in inds:
+                        self.simulate_cluster_exemplar(j, initial_states)
+                        self.append_cluster_initial_states(j, initial_states)
+
+                # After exemplar simulations, update to full annual generation array for dispatchable technologies
+                for tech in self.power_sources.keys():
+                    if tech in ["battery"]:
+                        for key in ["gen", "P", "SOC"]:
+                            val = getattr(self.power_sources[tech].outputs, key)
+                            setattr(
+                                self.power_sources[tech].outputs,
+                                key,
+                                list(
+                                    self.clustering.compute_annual_array_from_cluster_exemplar_data(
+                                        val
+                                    )
+                                ),
+                            )
+                    elif tech in ["trough", "tower"]:
+                        for key in [
+                            "gen",
+                            "P_out_net",
+                            "P_cycle",
+                            "q_dot_pc_startup",
+                            "q_pc_startup",
+                            "e_ch_tes",
+                            "eta",
+                            "q_pb",
+                        ]:  # Data quantities used in capacity value calculations
+                            self.power_sources[tech].outputs.ssc_time_series[key] = list(
+                                self.clustering.compute_annual_array_from_cluster_exemplar_data(
+                                    self.power_sources[tech].outputs.ssc_time_series[key]
+                                )
+                            )
+        finally:
+            self.close_solvers()
 
-            initial_states = {
-                tech: {"day": [], "soc": [], "load": []}
-                for tech in ["trough", "tower", "battery"]
-                if tech in self.power_sources.keys()
-            }  # List of known charge states at 12 am from completed simulations
-            npercluster = self.clustering.clusters["count"]
-            inds = sorted(
-                range(len(npercluster)), key=npercluster.__getitem__
-            )  # Indicies to sort clusters by low-to-high number of days represented
-            for i in range(self.clustering.clusters["n_cluster"]):
-                j = inds[i]  # cluster index
-                time_start, time_stop = self.clustering.get_sim_start_end_times(j)
-                battery_soc = (
-                    self.clustering.battery_soc_heuristic(j, initial_states["battery"])
-                    if "battery" in self.power_sources.keys()
-                    else None
-                )
+    def simulate_cluster_exemplar(self, cluster_id: int, initial_states: dict = None):
+        """Simulates the exemplar days of a cluster with dispatch.
 
-                # Set CSP initial states (need to do this prior to update_time_series_parameters() or update_initial_conditions(), both pull from the stored plant state)
-                for tech in ["trough", "tower"]:
-                    if tech in self.power_sources.keys():
-                        self.power_sources[tech].plant_state = self.power_sources[
-                            tech
-                        ].set_initial_plant_state()  # Reset to default initial state
-                        csp_soc, is_cycle_on, initial_cycle_load = (
-                            self.clustering.csp_initial_state_heuristic(
-                                j,
-                                self.power_sources[tech].solar_multiple,
-                                initial_states[tech],
-                            )
-                        )
-                        self.power_sources[tech].set_tes_soc(csp_soc)
-                        self.power_sources[tech].set_cycle_state(is_cycle_on)
-                        self.power_sources[tech].set_cycle_load(initial_cycle_load)
+        Args:
+            cluster_id: Index of the cluster to simulate
+            initial_states: (optional) Known plant states at 12 am from previously simulated clusters, by technology.
+                When not provided, the default initial state heuristics are used.
+        """
+        if initial_states is None:
+            initial_states = {}
+        time_start, time_stop = self.clustering.get_sim_start_end_times(cluster_id)
+        battery_soc = (
+            self.clustering.battery_soc_heuristic(
+                cluster_id, initial_states.get("battery")
+            )
+            if "battery" in self.power_sources.keys()
+            else None
+        )
 
-                self.simulate_with_dispatch(
-                    time_start, self.clustering.ndays + 1, battery_soc, n_initial_sims=1
+        # Set CSP initial states (need to do this prior to update_time_series_parameters() or update_initial_conditions(), both pull from the stored plant state)
+        for tech in ["trough", "tower"]:
+            if tech in self.power_sources.keys():
+                self.power_sources[tech].plant_state = self.power_sources[
+                    tech
+                ].set_initial_plant_state()  # Reset to default initial state
+                csp_soc, is_cycle_on, initial_cycle_load = (
+                    self.clustering.csp_initial_state_heuristic(
+                        cluster_id,
+                        self.power_sources[tech].solar_multiple,
+                        initial_states.get(tech),
+                    )
                 )
+                self.power_sources[tech].set_tes_soc(csp_soc)
+                self.power_sources[tech].set_cycle_state(is_cycle_on)
+                self.power_sources[tech].set_cycle_load(initial_cycle_load)
 
-                # Update lists of known states at 12am
-                for tech in ["trough", "tower", "battery"]:
-                    if tech in self.power_sources.keys():
-                        for d in range(self.clustering.ndays):
-                            day = self.clustering.sim_start_days[j] + d
-                            initial_states[tech]["day"].append(day)
-                            if tech in ["trough", "tower"]:
-                                initial_states[tech]["soc"].append(
-                                    self.power_sources[tech].get_tes_soc(day * 24)
-                                )
-                                initial_states[tech]["load"].append(
-                                    self.power_sources[tech].get_cycle_load(day * 24)
-                                )
-                            elif tech in ["battery"]:
-                                step = day * 24 * int(self.site.n_timesteps / 8760)
-                                initial_states[tech]["soc"].append(
-                                    self.power_sources[tech].Outputs.SOC[step]
-                                )
+        self.simulate_with_dispatch(
+            time_start, self.clustering.ndays + 1, battery_soc, n_initial_sims=1
+        )
 
-            # After exemplar simulations, update to full annual generation array for dispatchable technologies
-            for tech in self.power_sources.keys():
-                if tech in ["battery"]:
-                    for key in ["gen", "P", "SOC"]:
-                        val = getattr(self.power_sources[tech].Outputs, key)
-                        setattr(
-                            self.power_sources[tech].Outputs,
-                            key,
-                            list(
-                                self.clustering.compute_annual_array_from_cluster_exemplar_data(
-                                    val
-                                )
-                            ),
+    def append_cluster_initial_states(self, cluster_id: int, initial_states: dict):
+        """Appends the plant states at 12 am of the exemplar days of a simulated cluster to the known states.
+
+        Args:
+            cluster_id: Index of the simulated cluster
+            initial_states: Known plant states at 12 am, by technology, which are updated in place
+        """
+        for tech in ["trough", "tower", "battery"]:
+            if tech in self.power_sources.keys():
+                for d in range(self.clustering.ndays):
+                    day = self.clustering.sim_start_days[cluster_id] + d
+                    initial_states[tech]["day"].append(day)
+                    if tech in ["trough", "tower"]:
+                        initial_states[tech]["soc"].append(
+                            self.power_sources[tech].get_tes_soc(day * 24)
                         )
-                elif tech in ["trough", "tower"]:
-                    for key in [
-                        "gen",
-                        "P_out_net",
-                        "P_cycle",
-                        "q_dot_pc_startup",
-                        "q_pc_startup",
-                        "e_ch_tes",
-                        "eta",
-                        "q_pb",
-                    ]:  # Data quantities used in capacity value calculations
-                        self.power_sources[tech].outputs.ssc_time_series[key] = list(
-                            self.clustering.compute_annual_array_from_cluster_exemplar_data(
-                                self.power_sources[tech].outputs.ssc_time_series[key]
-                            )
+                        initial_states[tech]["load"].append(
+                            self.power_sources[tech].get_cycle_load(day * 24)
                         )
+                    elif tech in ["battery"]:
+                        step = day * 24 * int(self.site.n_timesteps / 8760)
+                        initial_states[tech]["soc"].append(
+                            self.power_sources[tech].outputs.SOC[step]
+                        )
+
+    def simulate_cluster_exemplars_in_parallel(self, cluster_ids: list, initial_states: dict = None):
+        """Simulates cluster exemplars using a pool of forked processes.
+
+        Each worker inherits a copy of this builder, including the dispatch model and plant states, simulates the
+        clusters it is assigned, and returns the stored outputs for the exemplar days. These are then written into
+        the outputs of this process' power sources.
+
+        Clusters are simulated in rounds of `n_cluster_processes` clusters, in order. Each round uses the known plant
+        states at 12 am of the clusters simulated in previous rounds, so a cluster only misses the states of the
+        clusters simulated in the same round, which it would use if the clusters were simulated in series.
+
+        Args:
+            cluster_ids: Indices of the clusters to simulate
+            initial_states: (optional) Known plant states at 12 am, by technology, which are updated in place
+        """
+        if initial_states is None:
+            initial_states = {
+                tech: {"day": [], "soc": [], "load": []}
+                for tech in ["trough", "tower", "battery"]
+                if tech in self.power_sources.keys()
+            }
+        n_processes = min(self.options.n_cluster_processes, len(cluster_ids))
+        with ForkPool(self, n_processes, initializer=_reset_problem_state) as pool:
+            for start in range(0, len(cluster_ids), n_processes):
+                round_ids = cluster_ids[start:start + n_processes]
+                results = pool.starmap(
+                    _simulate_cluster_exemplar,
+                    [(cluster_id, initial_states) for cluster_id in round_ids],
+                )
+                for cluster_id, cluster_outputs in zip(round_ids, results):
+                    self.set_cluster_exemplar_outputs(cluster_id, cluster_outputs)
+                for cluster_id in round_ids:
+                    self.append_cluster_initial_states(cluster_id, initial_states)
+
+    def get_cluster_exemplar_outputs(self, cluster_id: int) -> dict:
+        """Returns stored outputs and problem metrics for the exemplar days of a simulated cluster."""
+        hour_start, hour_end = self.clustering.get_soln_start_end_times(cluster_id)
+        cluster_outputs = {"problem_state": self.problem_state}
+        for tech in self.power_sources.keys():
+            if tech in ["battery"]:
+                battery_outputs = self.power_sources[tech].outputs
+                steps = _exemplar_slice(
+                    hour_start, hour_end, len(battery_outputs.SOC) / 8760
+                )
+                days = slice(hour_start // 24, hour_end // 24)
+                cluster_outputs[tech] = {
+                    key: getattr(battery_outputs, key)[steps]
+                    for key in battery_outputs.stateful_attributes
+                    + ["dispatch_I", "dispatch_P", "dispatch_SOC"]
+                }
+                cluster_outputs[tech]["dispatch_lifecycles_per_day"] = (
+                    battery_outputs.dispatch_lifecycles_per_day[days]
+                )
+            elif tech in ["trough", "tower"]:
+                csp_outputs = self.power_sources[tech].outputs
+                cluster_outputs[tech] = {
+                    "ssc_time_series": {
+                        key: val[_exemplar_slice(hour_start, hour_end, len(val) / 8760)]
+                        for key, val in csp_outputs.ssc_time_series.items()
+                    },
+                    "dispatch": {
+                        key: val[hour_start:hour_end]
+                        for key, val in csp_outputs.dispatch.items()
+                    },
+                }
+        return cluster_outputs
+
+    def set_cluster_exemplar_outputs(self, cluster_id: int, cluster_outputs: dict):
+        """Writes outputs returned by `get_cluster_exemplar_outputs` into the stored outputs of the power sources."""
+        hour_start, hour_end = self.clustering.get_soln_start_end_times(cluster_id)
+        self.problem_state.extend(cluster_outputs["problem_state"])
+        for tech in self.power_sources.keys():
+            if tech in ["battery"]:
+                battery_outputs = self.power_sources[tech].outputs
+                steps = _exemplar_slice(
+                    hour_start, hour_end, len(battery_outputs.SOC) / 8760
+                )
+                days = slice(hour_start // 24, hour_end // 24)
+                for key, val in cluster_outputs[tech].items():
+                    getattr(battery_outputs, key)[
+                        days if key == "dispatch_lifecycles_per_day" else steps
+                    ] = val
+            elif tech in ["trough", "tower"]:
+                csp_outputs = self.power_sources[tech].outputs
+                for key, val in cluster_outputs[tech]["ssc_time_series"].items():
+                    steps_per_hour = len(val) / (hour_end - hour_start)
+                    if key not in csp_outputs.ssc_time_series:
+                        csp_outputs.ssc_time_series[key] = [0.0] * int(
+                            8760 * steps_per_hour
+                        )
+                    csp_outputs.ssc_time_series[key][
+                        _exemplar_slice(hour_start, hour_end, steps_per_hour)
+                    ] = val
+                for key, val in cluster_outputs[tech]["dispatch"].items():
+                    if key not in csp_outputs.dispatch:
+                        csp_outputs.dispatch[key] = [0.0] * 8760
+                    csp_outputs.dispatch[key][hour_start:hour_end] = val
 
     def simulate_with_dispatch(
         self,
@@ -725,22 +1057,46 @@ class HybridDispatchBuilderSolver:
         return self._dispatch
 
 
+def _exemplar_slice(hour_start: int, hour_end: int, steps_per_hour: float) -> slice:
+    return slice(int(hour_start * steps_per_hour), int(hour_end * steps_per_hour))
+
+
+def _reset_problem_state(builder: HybridDispatchBuilderSolver):
+    """Only tracks problem metrics of solves in this process"""
+    builder.problem_state = DispatchProblemState()
+
+
+def _simulate_cluster_exemplar(builder: HybridDispatchBuilderSolver, cluster_id: int, initial_states: dict) -> dict:
+    """Simulates the given cluster with a forked worker's builder and returns its exemplar outputs"""
+    builder.simulate_cluster_exemplar(cluster_id, initial_states)
+    cluster_outputs = builder.get_cluster_exemplar_outputs(cluster_id)
+    _reset_problem_state(builder)
+    return cluster_outputs
+
+
 class SolverOptions:
     """Class for housing solver options"""
 
     def __init__(
         self,
         solver_spec_options: dict,
-        log_name: str = "",
         user_solver_options: dict = None,
-        solver_spec_log_key: str = "logfile",
     ):
-        self.instance_log = "dispatch_solver.log"
         self.solver_spec_options = solver_spec_options
         self.user_solver_options = user_solver_options
 
-        self.constructed = solver_spec_options
-        if log_name != "":
-            self.constructed[solver_spec_log_key] = self.instance_log
+        self.constructed = dict(solver_spec_options)
         if user_solver_options is not None:
             self.constructed.update(user_solver_options)
+
+
+def _solver_key(solver_name: str, solver_kwargs: dict) -> tuple:
+    """Returns the key of a solver instance in the solver pool"""
+    return solver_name, tuple(sorted((k, str(v)) for k, v in solver_kwargs.items()))
+
+
+def _solver_output(solver) -> str:
+    """Returns the output of the solver's last solve, which Pyomo's shell and direct solver interfaces keep in
+    memory, or an empty str if it is not available"""
+    log = getattr(solver, "_log", None)
+    return log if isinstance(log, str) else ""
@@ -1,5 +1,7 @@
 import numpy as np
 
+from hopp.utilities.fork_pool import is_fork_available
+
 from hopp.simulation.technologies.dispatch.power_storage import (
     OneCycleBatteryDispatchHeuristic,
     SimpleBatteryDispatchHeuristic,
@@ -39,7 +41,9 @@ class HybridDispatchOptions:
 
             - **time_weighting_factor** (float, default=0.995): Discount factor for the time periods in the look ahead period.
 
-            - **log_name** (str, default=''): Dispatch log file name, empty str will result in no log (for development).
+            - **log_name** (str, default=''): Dispatch log file name, empty str will result in no log (for development). The solver output of each solve is captured in memory and appended to this file in a single locked write.
+
+            - **log_in_memory** (bool, default=False): If True, the solver output of each solve is kept in the in-memory text buffer `HybridDispatchBuilderSolver.solver_log`, with or without a log file.
 
             - **is_test_start_year** (bool, default=False): If True, simulation solves for first 5 days of the year.
 
@@ -53,6 +57,16 @@ class HybridDispatchOptions:
 
             - **clustering_divisions** (dict, default={}): Custom number of averaging periods for classification metrics for data clustering. If empty, default values will be used.
 
+            - **n_cluster_processes** (int, default=1): Number of worker processes used to simulate clustered exemplar days in parallel. Values greater than 1 require the 'fork' process start method.
+
+            - **use_persistent_horizon** (bool, default=False): If True, a single persistent solver instance is kept alive across rolling-horizon windows. Only parameter values that changed are pushed to the solver and each solve is warm-started from the previous window's shifted solution. Supported for `('cbc', 'gurobi')` solvers.
+
+            - **use_solve_cache** (bool, default=False): If True, the solution and solve metrics of each rolling-horizon window are cached, keyed by a hash of the window's model parameters and initial state. Windows identical to a previously solved one are restored from the cache instead of being solved.
+
+            - **solve_cache_size** (int, default=128): Maximum number of windows kept in the in-memory solve cache.
+
+            - **solve_cache_path** (str, default=''): SQLite database file used to persist the solve cache, so it can be shared between simulations and processes. Empty str keeps the cache in memory only.
+
             - **use_higher_hours** bool (default = False): if True, the simulation will run extra hours analysis (must be used with load following)
 
             - **higher_hours** (dict, default = {}): Higher hour count parameters: the value of power that must be available above the schedule and the number of hours in a row
@@ -75,7 +89,8 @@ class HybridDispatchOptions:
         self.n_look_ahead_periods: int = 48
         self.time_weighting_factor: float = 0.995
         self.n_roll_periods: int = 24
-        self.log_name: str = ""  # NOTE: Logging is not thread safe
+        self.log_name: str = ""
+        self.log_in_memory: bool = False
         self.is_test_start_year: bool = False
         self.is_test_end_year: bool = False
 
@@ -83,6 +98,13 @@ class HybridDispatchOptions:
         self.n_clusters: int = 30
         self.clustering_weights: dict = {}
         self.clustering_divisions: dict = {}
+        self.n_cluster_processes: int = 1
+
+        self.use_persistent_horizon: bool = False
+
+        self.use_solve_cache: bool = False
+        self.solve_cache_size: int = 128
+        self.solve_cache_path: str = ""
 
         self.use_higher_hours: bool = False
         self.higher_hours: dict = {}
@@ -123,6 +145,29 @@ class HybridDispatchOptions:
                 "Battery cannot be restricted to charge from PV only if grid_charging is enabled"
             )
 
+        if self.n_cluster_processes < 1:
+            raise ValueError("'n_cluster_processes' must be at least 1")
+        if self.n_cluster_processes > 1 and not is_fork_available():
+            raise ValueError(
+                "'n_cluster_processes' > 1 requires the 'fork' process start method, which is not available on this platform"
+            )
+
+        if self.solve_cache_size < 1:
+            raise ValueError("'solve_cache_size' must be at least 1")
+
+        self._persistent_solvers = {
+            "cbc": "appsi_cbc",
+            "gurobi": "appsi_gurobi",
+        }
+        if self.use_persistent_horizon:
+            if self.solver not in self._persistent_solvers:
+                raise ValueError(
+                    "'{}' solver does not support persistent horizon dispatch. Options are {}".format(
+                        self.solver, tuple(self._persistent_solvers.keys())
+                    )
+                )
+            self.persistent_solver = self._persistent_solvers[self.solver]
+
         self._battery_dispatch_model_options = {
             "one_cycle_heuristic": OneCycleBatteryDispatchHeuristic,
             "heuristic": SimpleBatteryDispatchHeuristic,
@@ -979,19 +979,10 @@ class CspDispatch(Dispatch):
         self.time_duration = [1.0] * n_horizon  # assume hourly for now
 
         # Set available thermal energy based on forecast
-        thermal_resource = self._system_model.solar_thermal_resource
-        temperature = list(self._system_model.year_weather_df.Temperature.values)
-        if start_time + n_horizon > len(thermal_resource):
-            field_gen = list(thermal_resource[start_time:])
-            field_gen.extend(list(thermal_resource[0 : n_horizon - len(field_gen)]))
-
-            dry_bulb_temperature = list(temperature[start_time:])
-            dry_bulb_temperature.extend(
-                list(temperature[0 : n_horizon - len(dry_bulb_temperature)])
-            )
-        else:
-            field_gen = thermal_resource[start_time : start_time + n_horizon]
-            dry_bulb_temperature = temperature[start_time : start_time + n_horizon]
+        field_gen = self._horizon_window(self._system_model.solar_thermal_resource, start_time)
+        dry_bulb_temperature = self._horizon_window(
+            self._system_model.year_weather_df.Temperature.values, start_time
+        )
 
         self.available_thermal_generation = field_gen
         # Set cycle performance parameters that depend on ambient temperature
@@ -1153,22 +1144,15 @@ class CspDispatch(Dispatch):
             ambient temperature(s) and tabulated values. The corrections are set for each dispatch time step.
 
         """
-        n = len(
-            Tdb
-        )  # Tdb = set of ambient temperature points for each dispatch time step
+        Tdb = np.asarray(Tdb, dtype=float)  # Tdb = set of ambient temperature points for each dispatch time step
+        etapts = np.asarray(etapts, dtype=float)
+        wcondfpts = np.asarray(wcondfpts, dtype=float)
         npts = len(Tpts)  # Tpts = ambient temperature points with tabulated values
-        cycle_ambient_efficiency_correction = [1.0] * n
-        condenser_losses = [0.0] * n
         Tstep = Tpts[1] - Tpts[0]
-        for j in range(n):
-            i = max(0, min(int((Tdb[j] - Tpts[0]) / Tstep), npts - 2))
-            r = (Tdb[j] - Tpts[i]) / Tstep
-            cycle_ambient_efficiency_correction[j] = (
-                etapts[i] + (etapts[i + 1] - etapts[i]) * r
-            )
-            condenser_losses[j] = wcondfpts[i] + (wcondfpts[i + 1] - wcondfpts[i]) * r
-        self.cycle_ambient_efficiency_correction = cycle_ambient_efficiency_correction
-        self.condenser_losses = condenser_losses
+        i = np.clip(((Tdb - Tpts[0]) / Tstep).astype(int), 0, npts - 2)
+        r = (Tdb - np.asarray(Tpts, dtype=float)[i]) / Tstep
+        self.cycle_ambient_efficiency_correction = etapts[i] + (etapts[i + 1] - etapts[i]) * r
+        self.condenser_losses = wcondfpts[i] + (wcondfpts[i + 1] - wcondfpts[i]) * r
         return
 
     @staticmethod
@@ -1239,19 +1223,16 @@ class CspDispatch(Dispatch):
         """
         self.min_receiver_start_time = self._system_model.value("rec_su_delay")
 
-        su_fraction = [1.0] * len(field_gen)
-        epsilon = 1e-6
-        time_duration = self.time_duration
-
-        for i in range(len(field_gen)):
-            su_fraction[i] = min(
-                1.0,
-                max(
-                    self.min_receiver_start_time / time_duration[i],
-                    self.receiver_required_startup_energy
-                    / max(1e-6, field_gen[i] * time_duration[i]),
-                ),
-            )
+        field_gen = np.asarray(field_gen, dtype=float)
+        time_duration = np.asarray(self.time_duration, dtype=float)
+        su_fraction = np.minimum(
+            1.0,
+            np.maximum(
+                self.min_receiver_start_time / time_duration,
+                self.receiver_required_startup_energy
+                / np.maximum(1e-6, field_gen * time_duration),
+            ),
+        )
 
         self.receiver_startup_fraction = su_fraction
 
@@ -1386,98 +1367,73 @@ class CspDispatch(Dispatch):
     def time_duration(self) -> list:
         """Dispatch horizon time steps [hour]"""
         # TODO: Should we make this constant within dispatch horizon?
-        return [self.blocks[t].time_duration.value for t in self.blocks.index_set()]
+        return self._get_horizon_values("time_duration")
 
     @time_duration.setter
     def time_duration(self, time_duration: list):
         if len(time_duration) == len(self.blocks):
-            for t, delta in zip(self.blocks, time_duration):
-                self.blocks[t].time_duration = round(delta, self.round_digits)
+            self._set_horizon_parameter("time_duration", time_duration)
         else:
             raise ValueError(
-                self.time_duration.__name__
-                + " list must be the same length as time horizon"
+                "time_duration list must be the same length as time horizon"
             )
 
     @property
     def available_thermal_generation(self) -> list:
         """Available solar thermal generation from the csp field [MWt]"""
-        return [
-            self.blocks[t].available_thermal_generation.value
-            for t in self.blocks.index_set()
-        ]
+        return self._get_horizon_values("available_thermal_generation")
 
     @available_thermal_generation.setter
     def available_thermal_generation(self, available_thermal_generation: list):
         if len(available_thermal_generation) == len(self.blocks):
-            for t, value in zip(self.blocks, available_thermal_generation):
-                self.blocks[t].available_thermal_generation = round(
-                    value, self.round_digits
-                )
+            self._set_horizon_parameter("available_thermal_generation", available_thermal_generation)
         else:
             raise ValueError(
-                self.available_thermal_generation.__name__
-                + " list must be the same length as time horizon"
+                "available_thermal_generation list must be the same length as time horizon"
             )
 
     @property
     def cycle_ambient_efficiency_correction(self) -> list:
         """Cycle efficiency ambient temperature adjustment factor [-]"""
-        return [
-            self.blocks[t].cycle_ambient_efficiency_correction.value
-            for t in self.blocks.index_set()
-        ]
+        return self._get_horizon_values("cycle_ambient_efficiency_correction")
 
     @cycle_ambient_efficiency_correction.setter
     def cycle_ambient_efficiency_correction(
         self, cycle_ambient_efficiency_correction: list
     ):
         if len(cycle_ambient_efficiency_correction) == len(self.blocks):
-            for t, value in zip(self.blocks, cycle_ambient_efficiency_correction):
-                self.blocks[t].cycle_ambient_efficiency_correction = round(
-                    value, self.round_digits
-                )
+            self._set_horizon_parameter("cycle_ambient_efficiency_correction", cycle_ambient_efficiency_correction)
         else:
             raise ValueError(
-                self.cycle_ambient_efficiency_correction.__name__
-                + " list must be the same length as time horizon"
+                "cycle_ambient_efficiency_correction list must be the same length as time horizon"
             )
 
     @property
     def condenser_losses(self) -> list:
         """Normalized condenser parasitic losses [-]"""
-        return [self.blocks[t].condenser_losses.value for t in self.blocks.index_set()]
+        return self._get_horizon_values("condenser_losses")
 
     @condenser_losses.setter
     def condenser_losses(self, condenser_losses: list):
         if len(condenser_losses) == len(self.blocks):
-            for t, value in zip(self.blocks, condenser_losses):
-                self.blocks[t].condenser_losses = round(value, self.round_digits)
+            self._set_horizon_parameter("condenser_losses", condenser_losses)
         else:
             raise ValueError(
-                self.condenser_losses.__name__
-                + " list must be the same length as time horizon"
+                "condenser_losses list must be the same length as time horizon"
             )
 
     @property
     def receiver_startup_fraction(self) -> list:
         """Estimated fraction of time period required for receiver start-up [-]"""
-        return [
-            self.blocks[t].receiver_startup_fraction.value
-            for t in self.blocks.index_set()
-        ]
+        return self._get_horizon_values("receiver_startup_fraction")
 
     @receiver_startup_fraction.setter
     def receiver_startup_fraction(self, receiver_startup_fraction: list):
         if len(receiver_startup_fraction) == len(self.blocks):
-            for t, value in zip(self.blocks, receiver_startup_fraction):
-                self.blocks[t].receiver_startup_fraction = round(
-                    value, self.round_digits
-                )
+            self._set_horizon_parameter("receiver_startup_fraction", receiver_startup_fraction)
         else:
             raise ValueError(
-                self.receiver_startup_fraction.__name__
-                + " list must be the same length as time horizon"
+                "receiver_startup_fraction list must be the same length as time horizon"
             )
 
     @property
@@ -1488,10 +1444,7 @@ class CspDispatch(Dispatch):
 
     @min_receiver_start_time.setter
     def min_receiver_start_time(self, min_receiver_start_time_hr: float):
-        for t in self.blocks.index_set():
-            self.blocks[t].min_receiver_start_time.set_value(
-                round(min_receiver_start_time_hr, self.round_digits)
-            )
+        self._set_horizon_parameter("min_receiver_start_time", min_receiver_start_time_hr)
 
     @property
     def cost_per_field_generation(self) -> float:
@@ -1501,10 +1454,7 @@ class CspDispatch(Dispatch):
 
     @cost_per_field_generation.setter
     def cost_per_field_generation(self, om_dollar_per_mwh_thermal: float):
-        for t in self.blocks.index_set():
-            self.blocks[t].cost_per_field_generation.set_value(
-                round(om_dollar_per_mwh_thermal, self.round_digits)
-            )
+        self._set_horizon_parameter("cost_per_field_generation", om_dollar_per_mwh_thermal)
 
     @property
     def cost_per_field_start(self) -> float:
@@ -1514,10 +1464,7 @@ class CspDispatch(Dispatch):
 
     @cost_per_field_start.setter
     def cost_per_field_start(self, dollars_per_start: float):
-        for t in self.blocks.index_set():
-            self.blocks[t].cost_per_field_start.set_value(
-                round(dollars_per_start, self.round_digits)
-            )
+        self._set_horizon_parameter("cost_per_field_start", dollars_per_start)
 
     @property
     def cost_per_cycle_generation(self) -> float:
@@ -1527,10 +1474,7 @@ class CspDispatch(Dispatch):
 
     @cost_per_cycle_generation.setter
     def cost_per_cycle_generation(self, om_dollar_per_mwh_electric: float):
-        for t in self.blocks.index_set():
-            self.blocks[t].cost_per_cycle_generation.set_value(
-                round(om_dollar_per_mwh_electric, self.round_digits)
-            )
+        self._set_horizon_parameter("cost_per_cycle_generation", om_dollar_per_mwh_electric)
 
     @property
     def cost_per_cycle_start(self) -> float:
@@ -1540,10 +1484,7 @@ class CspDispatch(Dispatch):
 
     @cost_per_cycle_start.setter
     def cost_per_cycle_start(self, dollars_per_start: float):
-        for t in self.blocks.index_set():
-            self.blocks[t].cost_per_cycle_start.set_value(
-                round(dollars_per_start, self.round_digits)
-            )
+        self._set_horizon_parameter("cost_per_cycle_start", dollars_per_start)
 
     @property
     def cost_per_change_thermal_input(self) -> float:
@@ -1553,10 +1494,7 @@ class CspDispatch(Dispatch):
 
     @cost_per_change_thermal_input.setter
     def cost_per_change_thermal_input(self, dollars_per_thermal_power: float):
-        for t in self.blocks.index_set():
-            self.blocks[t].cost_per_change_thermal_input.set_value(
-                round(dollars_per_thermal_power, self.round_digits)
-            )
+        self._set_horizon_parameter("cost_per_change_thermal_input", dollars_per_thermal_power)
 
     @property
     def field_startup_losses(self) -> float:
@@ -1566,10 +1504,7 @@ class CspDispatch(Dispatch):
 
     @field_startup_losses.setter
     def field_startup_losses(self, field_startup_losses: float):
-        for t in self.blocks.index_set():
-            self.blocks[t].field_startup_losses.set_value(
-                round(field_startup_losses, self.round_digits)
-            )
+        self._set_horizon_parameter("field_startup_losses", field_startup_losses)
 
     @property
     def receiver_required_startup_energy(self) -> float:
@@ -1579,10 +1514,7 @@ class CspDispatch(Dispatch):
 
     @receiver_required_startup_energy.setter
     def receiver_required_startup_energy(self, energy: float):
-        for t in self.blocks.index_set():
-            self.blocks[t].receiver_required_startup_energy.set_value(
-                round(energy, self.round_digits)
-            )
+        self._set_horizon_parameter("receiver_required_startup_energy", energy)
 
     @property
     def storage_capacity(self) -> float:
@@ -1592,8 +1524,7 @@ class CspDispatch(Dispatch):
 
     @storage_capacity.setter
     def storage_capacity(self, energy: float):
-        for t in self.blocks.index_set():
-            self.blocks[t].storage_capacity.set_value(round(energy, self.round_digits))
+        self._set_horizon_parameter("storage_capacity", energy)
 
     @property
     def receiver_pumping_losses(self) -> float:
@@ -1603,10 +1534,7 @@ class CspDispatch(Dispatch):
 
     @receiver_pumping_losses.setter
     def receiver_pumping_losses(self, electric_per_thermal: float):
-        for t in self.blocks.index_set():
-            self.blocks[t].receiver_pumping_losses.set_value(
-                round(electric_per_thermal, self.round_digits)
-            )
+        self._set_horizon_parameter("receiver_pumping_losses", electric_per_thermal)
 
     @property
     def minimum_receiver_power(self) -> float:
@@ -1616,10 +1544,7 @@ class CspDispatch(Dispatch):
 
     @minimum_receiver_power.setter
     def minimum_receiver_power(self, thermal_power: float):
-        for t in self.blocks.index_set():
-            self.blocks[t].minimum_receiver_power.set_value(
-                round(thermal_power, self.round_digits)
-            )
+        self._set_horizon_parameter("minimum_receiver_power", thermal_power)
 
     @property
     def allowable_receiver_startup_power(self) -> float:
@@ -1629,10 +1554,7 @@ class CspDispatch(Dispatch):
 
     @allowable_receiver_startup_power.setter
     def allowable_receiver_startup_power(self, thermal_power: float):
-        for t in self.blocks.index_set():
-            self.blocks[t].allowable_receiver_startup_power.set_value(
-                round(thermal_power, self.round_digits)
-            )
+        self._set_horizon_parameter("allowable_receiver_startup_power", thermal_power)
 
     @property
     def field_track_losses(self) -> float:
@@ -1642,10 +1564,7 @@ class CspDispatch(Dispatch):
 
     @field_track_losses.setter
     def field_track_losses(self, electric_power: float):
-        for t in self.blocks.index_set():
-            self.blocks[t].field_track_losses.set_value(
-                round(electric_power, self.round_digits)
-            )
+        self._set_horizon_parameter("field_track_losses", electric_power)
 
     # @property
     # def heat_trace_losses(self) -> float:
@@ -1667,10 +1586,7 @@ class CspDispatch(Dispatch):
 
     @cycle_required_startup_energy.setter
     def cycle_required_startup_energy(self, thermal_energy: float):
-        for t in self.blocks.index_set():
-            self.blocks[t].cycle_required_startup_energy.set_value(
-                round(thermal_energy, self.round_digits)
-            )
+        self._set_horizon_parameter("cycle_required_startup_energy", thermal_energy)
 
     @property
     def cycle_nominal_efficiency(self) -> float:
@@ -1681,10 +1597,7 @@ class CspDispatch(Dispatch):
     @cycle_nominal_efficiency.setter
     def cycle_nominal_efficiency(self, efficiency: float):
         efficiency = self._check_efficiency_value(efficiency)
-        for t in self.blocks.index_set():
-            self.blocks[t].cycle_nominal_efficiency.set_value(
-                round(efficiency, self.round_digits)
-            )
+        self._set_horizon_parameter("cycle_nominal_efficiency", efficiency)
 
     @property
     def cycle_performance_slope(self) -> float:
@@ -1694,10 +1607,7 @@ class CspDispatch(Dispatch):
 
     @cycle_performance_slope.setter
     def cycle_performance_slope(self, slope: float):
-        for t in self.blocks.index_set():
-            self.blocks[t].cycle_performance_slope.set_value(
-                round(slope, self.round_digits)
-            )
+        self._set_horizon_parameter("cycle_performance_slope", slope)
 
     @property
     def cycle_pumping_losses(self) -> float:
@@ -1707,10 +1617,7 @@ class CspDispatch(Dispatch):
 
     @cycle_pumping_losses.setter
     def cycle_pumping_losses(self, electric_per_thermal: float):
-        for t in self.blocks.index_set():
-            self.blocks[t].cycle_pumping_losses.set_value(
-                round(electric_per_thermal, self.round_digits)
-            )
+        self._set_horizon_parameter("cycle_pumping_losses", electric_per_thermal)
 
     @property
     def allowable_cycle_startup_power(self) -> float:
@@ -1720,10 +1627,7 @@ class CspDispatch(Dispatch):
 
     @allowable_cycle_startup_power.setter
     def allowable_cycle_startup_power(self, thermal_power: float):
-        for t in self.blocks.index_set():
-            self.blocks[t].allowable_cycle_startup_power.set_value(
-                round(thermal_power, self.round_digits)
-            )
+        self._set_horizon_parameter("allowable_cycle_startup_power", thermal_power)
 
     @property
     def minimum_cycle_thermal_power(self) -> float:
@@ -1733,10 +1637,7 @@ class CspDispatch(Dispatch):
 
     @minimum_cycle_thermal_power.setter
     def minimum_cycle_thermal_power(self, thermal_power: float):
-        for t in self.blocks.index_set():
-            self.blocks[t].minimum_cycle_thermal_power.set_value(
-                round(thermal_power, self.round_digits)
-            )
+        self._set_horizon_parameter("minimum_cycle_thermal_power", thermal_power)
 
     @property
     def maximum_cycle_thermal_power(self) -> float:
@@ -1746,10 +1647,7 @@ class CspDispatch(Dispatch):
 
     @maximum_cycle_thermal_power.setter
     def maximum_cycle_thermal_power(self, thermal_power: float):
-        for t in self.blocks.index_set():
-            self.blocks[t].maximum_cycle_thermal_power.set_value(
-                round(thermal_power, self.round_digits)
-            )
+        self._set_horizon_parameter("maximum_cycle_thermal_power", thermal_power)
 
     # @property
     # def minimum_cycle_power(self) -> float:
@@ -1771,10 +1669,7 @@ class CspDispatch(Dispatch):
 
     @maximum_cycle_power.setter
     def maximum_cycle_power(self, electric_power: float):
-        for t in self.blocks.index_set():
-            self.blocks[t].maximum_cycle_power.set_value(
-                round(electric_power, self.round_digits)
-            )
+        self._set_horizon_parameter("maximum_cycle_power", electric_power)
 
     # INITIAL CONDITIONS
     @property
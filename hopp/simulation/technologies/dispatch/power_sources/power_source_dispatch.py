@@ -104,21 +104,14 @@ class PowerSourceDispatch(Dispatch):
             None
 
         """
-        n_horizon = len(self.blocks.index_set())
         generation = self._system_model.value("gen")
-        if start_time + n_horizon > len(generation):
-            horizon_gen = list(generation[start_time:])
-            horizon_gen.extend(list(generation[0 : n_horizon - len(horizon_gen)]))
-        else:
-            horizon_gen = generation[start_time : start_time + n_horizon]
-
-        if len(horizon_gen) < len(self.blocks):
+        if len(generation) < len(self.blocks):
             raise RuntimeError(
                 f"Dispatch parameter update error at start_time {start_time}: System model "
                 f"{type(self._system_model)} generation profile should have at least {len(self.blocks)} "
                 f"length but has only {len(generation)}"
             )
-        self.available_generation = [gen_kw / 1e3 for gen_kw in horizon_gen]
+        self.available_generation = self._horizon_window(generation, start_time) / 1e3
 
     def _create_variables(self, hybrid):
         """Create variables method (abstract).
@@ -162,10 +155,7 @@ class PowerSourceDispatch(Dispatch):
 
     @cost_per_generation.setter
     def cost_per_generation(self, om_dollar_per_mwh: float):
-        for t in self.blocks.index_set():
-            self.blocks[t].cost_per_generation.set_value(
-                round(om_dollar_per_mwh, self.round_digits)
-            )
+        self._set_horizon_parameter("cost_per_generation", om_dollar_per_mwh)
 
     @property
     def available_generation(self) -> list:
@@ -175,17 +165,12 @@ class PowerSourceDispatch(Dispatch):
             list: List of available generation.
 
         """
-        return [
-            self.blocks[t].available_generation.value for t in self.blocks.index_set()
-        ]
+        return self._get_horizon_values("available_generation")
 
     @available_generation.setter
     def available_generation(self, resource: list):
         if len(resource) == len(self.blocks):
-            for t, gen in zip(self.blocks, resource):
-                self.blocks[t].available_generation.set_value(
-                    round(gen, self.round_digits)
-                )
+            self._set_horizon_parameter("available_generation", resource)
         else:
             raise ValueError(
                 f"'resource' list ({len(resource)}) must be the same length as time horizon ({len(self.blocks)})"
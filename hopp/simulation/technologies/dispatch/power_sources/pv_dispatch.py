@@ -1,4 +1,6 @@
 from typing import Union
+
+import numpy as np
 from pyomo.environ import ConcreteModel, Expression, NonNegativeReals, Set, units, Var
 from pyomo.network import Port
 
@@ -52,7 +54,7 @@ class PvDispatch(PowerSourceDispatch):
         super().update_time_series_parameters(start_time)
 
         # zero out any negative load
-        self.available_generation = [max(0, i) for i in self.available_generation]
+        self.available_generation = np.maximum(self.get_horizon_array("available_generation"), 0.0)
 
     def max_gross_profit_objective(self, hybrid_blocks):
         """PV instance of maximum gross profit objective.
@@ -1,5 +1,6 @@
 from typing import Optional, List
 
+import numpy as np
 import pyomo.environ as pyomo
 from pyomo.environ import units as u
 import PySAM.BatteryStateful as PySAMBatteryModel
@@ -75,12 +76,9 @@ class HeuristicLoadFollowingDispatch(SimpleBatteryDispatchHeuristic):
             goal_power: Goal power.
 
         """
-        for t in self.blocks.index_set():
-            fd = (goal_power[t] - gen[t]) / self.maximum_power
-            if fd > 0.0:  # Discharging
-                if fd > self.max_discharge_fraction[t]:
-                    fd = self.max_discharge_fraction[t]
-            elif fd < 0.0:  # Charging
-                if -fd > self.max_charge_fraction[t]:
-                    fd = -self.max_charge_fraction[t]
-            self._fixed_dispatch[t] = fd
+        fixed_dispatch = (
+            np.asarray(goal_power, dtype=float) - np.asarray(gen, dtype=float)
+        ) / self.maximum_power
+        self._fixed_dispatch = np.clip(
+            fixed_dispatch, -self.max_charge_fraction, self.max_discharge_fraction
+        )
@@ -284,9 +284,7 @@ class ConvexLinearVoltageBatteryDispatch(NonConvexLinearVoltageBatteryDispatch):
     @property
     def aux_charge_current_soc(self) -> list:
         """List of auxiliary charge current state of charge."""
-        return [
-            self.blocks[t].aux_charge_current_soc.value for t in self.blocks.index_set()
-        ]
+        return self._get_horizon_values("aux_charge_current_soc")
 
     @property
     def real_charge_current_soc(self) -> list:
@@ -299,18 +297,12 @@ class ConvexLinearVoltageBatteryDispatch(NonConvexLinearVoltageBatteryDispatch):
     @property
     def aux_charge_current_is_charging(self) -> list:
         """List of auxiliary charge current charging status."""
-        return [
-            self.blocks[t].aux_charge_current_is_charging.value
-            for t in self.blocks.index_set()
-        ]
+        return self._get_horizon_values("aux_charge_current_is_charging")
 
     @property
     def aux_discharge_current_soc(self) -> list:
         """List of auxiliary discharge current state of charge."""
-        return [
-            self.blocks[t].aux_discharge_current_soc.value
-            for t in self.blocks.index_set()
-        ]
+        return self._get_horizon_values("aux_discharge_current_soc")
 
     @property
     def real_discharge_current_soc(self) -> list:
@@ -323,7 +315,4 @@ class ConvexLinearVoltageBatteryDispatch(NonConvexLinearVoltageBatteryDispatch):
     @property
     def aux_discharge_current_is_discharging(self) -> list:
         """List of auxiliary discharge current discharging status."""
-        return [
-            self.blocks[t].aux_discharge_current_is_discharging.value
-            for t in self.blocks.index_set()
-        ]
+        return self._get_horizon_values("aux_discharge_current_is_discharging")
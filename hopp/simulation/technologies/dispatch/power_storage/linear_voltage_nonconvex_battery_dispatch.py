@@ -351,8 +351,7 @@ class NonConvexLinearVoltageBatteryDispatch(SimpleBatteryDispatch):
 
     @voltage_slope.setter
     def voltage_slope(self, voltage_slope: float):
-        for t in self.blocks.index_set():
-            self.blocks[t].voltage_slope = round(voltage_slope, self.round_digits)
+        self._set_horizon_parameter("voltage_slope", voltage_slope)
 
     @property
     def voltage_intercept(self) -> float:
@@ -362,10 +361,7 @@ class NonConvexLinearVoltageBatteryDispatch(SimpleBatteryDispatch):
 
     @voltage_intercept.setter
     def voltage_intercept(self, voltage_intercept: float):
-        for t in self.blocks.index_set():
-            self.blocks[t].voltage_intercept = round(
-                voltage_intercept, self.round_digits
-            )
+        self._set_horizon_parameter("voltage_intercept", voltage_intercept)
 
     # # TODO: Add this if wanted
     # # self.alphaP = Param(None)  # [kW_DC]    Bi-directional intercept for charge
@@ -381,8 +377,7 @@ class NonConvexLinearVoltageBatteryDispatch(SimpleBatteryDispatch):
 
     @average_current.setter
     def average_current(self, average_current: float):
-        for t in self.blocks.index_set():
-            self.blocks[t].average_current = round(average_current, self.round_digits)
+        self._set_horizon_parameter("average_current", average_current)
 
     @property
     def internal_resistance(self) -> float:
@@ -392,10 +387,7 @@ class NonConvexLinearVoltageBatteryDispatch(SimpleBatteryDispatch):
 
     @internal_resistance.setter
     def internal_resistance(self, internal_resistance: float):
-        for t in self.blocks.index_set():
-            self.blocks[t].internal_resistance = round(
-                internal_resistance, self.round_digits
-            )
+        self._set_horizon_parameter("internal_resistance", internal_resistance)
 
     @property
     def minimum_charge_current(self) -> float:
@@ -405,10 +397,7 @@ class NonConvexLinearVoltageBatteryDispatch(SimpleBatteryDispatch):
 
     @minimum_charge_current.setter
     def minimum_charge_current(self, minimum_charge_current: float):
-        for t in self.blocks.index_set():
-            self.blocks[t].minimum_charge_current = round(
-                minimum_charge_current, self.round_digits
-            )
+        self._set_horizon_parameter("minimum_charge_current", minimum_charge_current)
 
     @property
     def maximum_charge_current(self) -> float:
@@ -418,10 +407,7 @@ class NonConvexLinearVoltageBatteryDispatch(SimpleBatteryDispatch):
 
     @maximum_charge_current.setter
     def maximum_charge_current(self, maximum_charge_current: float):
-        for t in self.blocks.index_set():
-            self.blocks[t].maximum_charge_current = round(
-                maximum_charge_current, self.round_digits
-            )
+        self._set_horizon_parameter("maximum_charge_current", maximum_charge_current)
 
     @property
     def minimum_discharge_current(self) -> float:
@@ -431,10 +417,7 @@ class NonConvexLinearVoltageBatteryDispatch(SimpleBatteryDispatch):
 
     @minimum_discharge_current.setter
     def minimum_discharge_current(self, minimum_discharge_current: float):
-        for t in self.blocks.index_set():
-            self.blocks[t].minimum_discharge_current = round(
-                minimum_discharge_current, self.round_digits
-            )
+        self._set_horizon_parameter("minimum_discharge_current", minimum_discharge_current)
 
     @property
     def maximum_discharge_current(self) -> float:
@@ -444,21 +427,18 @@ class NonConvexLinearVoltageBatteryDispatch(SimpleBatteryDispatch):
 
     @maximum_discharge_current.setter
     def maximum_discharge_current(self, maximum_discharge_current: float):
-        for t in self.blocks.index_set():
-            self.blocks[t].maximum_discharge_current = round(
-                maximum_discharge_current, self.round_digits
-            )
+        self._set_horizon_parameter("maximum_discharge_current", maximum_discharge_current)
 
     # Outputs
     @property
     def charge_current(self) -> list:
         """Charge current."""
-        return [self.blocks[t].charge_current.value for t in self.blocks.index_set()]
+        return self._get_horizon_values("charge_current")
 
     @property
     def discharge_current(self) -> list:
         """Discharge current."""
-        return [self.blocks[t].discharge_current.value for t in self.blocks.index_set()]
+        return self._get_horizon_values("discharge_current")
 
     @property
     def current(self) -> list:
@@ -1,4 +1,6 @@
 from typing import Tuple
+
+import numpy as np
 import pyomo.environ as pyomo
 from pyomo.environ import units as u
 
@@ -63,10 +65,9 @@ class OneCycleBatteryDispatchHeuristic(SimpleBatteryDispatchHeuristic):
             raise ValueError("prices must be set before calling heuristic method.")
 
         discharge_time, charge_time = self._get_duration_battery_full_cycle()
-        fixed_dispatch = [0.0] * len(self.prices)
-        price_and_gen = zip(range(0, len(self.prices)), self.prices, gen)
-        sorted_prices = sorted(price_and_gen, key=lambda i: i[2], reverse=True)
-        sorted_prices = sorted(sorted_prices, key=lambda i: i[1])
+        fixed_dispatch = np.zeros(len(self.prices))
+        # Periods by ascending price, ties broken by descending generation
+        sorted_prices = np.lexsort((-np.asarray(gen, dtype=float), self.prices))
 
         # Set initial fixed dispatch
         fixed_dispatch, next_charge_idx = self._charge_battery(
@@ -122,7 +123,7 @@ class OneCycleBatteryDispatchHeuristic(SimpleBatteryDispatchHeuristic):
         period_count = next_discharge_idx
         while discharge_remaining > 0:
             if period_count < len(sorted_prices):
-                idx = sorted_prices[-(period_count + 1)][0]
+                idx = sorted_prices[-(period_count + 1)]
                 if self.max_discharge_fraction[idx] < discharge_remaining:
                     fixed_dispatch[idx] = self.max_discharge_fraction[idx]
                 else:
@@ -147,7 +148,7 @@ class OneCycleBatteryDispatchHeuristic(SimpleBatteryDispatchHeuristic):
         period_count = next_charge_idx
         while charge_remaining > 0:
             if period_count < len(sorted_prices):
-                idx = sorted_prices[period_count][0]
+                idx = sorted_prices[period_count]
                 if self.max_charge_fraction[idx] < charge_remaining:
                     fixed_dispatch[idx] = -self.max_charge_fraction[idx]
                 else:
@@ -182,15 +183,12 @@ class OneCycleBatteryDispatchHeuristic(SimpleBatteryDispatchHeuristic):
             Tuple[bool, int]: Tuple indicating SOC feasibility and index of first infeasible operation.
 
         """
-        soc0 = self.model.initial_soc.value
-        for idx, fd in enumerate(fixed_dispatch):
-            soc = self.update_soc(fd, soc0)
-            if (
-                round(soc, 6) * 100.0 < self.minimum_soc
-                or round(soc, 6) * 100.0 > self.maximum_soc
-            ):
-                return False, idx
-            soc0 = soc
+        soc = np.round(
+            self._soc_trajectory(fixed_dispatch, self.model.initial_soc.value), 6
+        ) * 100.0
+        infeasible = np.flatnonzero((soc < self.minimum_soc) | (soc > self.maximum_soc))
+        if len(infeasible):
+            return False, int(infeasible[0])
         return True, None
 
     @property
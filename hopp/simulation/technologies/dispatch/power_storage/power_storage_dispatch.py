@@ -511,17 +511,15 @@ class PowerStorageDispatch(Dispatch):
     @property
     def time_duration(self) -> list:
         """Time duration."""
-        return [self.blocks[t].time_duration.value for t in self.blocks.index_set()]
+        return self._get_horizon_values("time_duration")
 
     @time_duration.setter
     def time_duration(self, time_duration: list):
         if len(time_duration) == len(self.blocks):
-            for t, delta in zip(self.blocks, time_duration):
-                self.blocks[t].time_duration = round(delta, self.round_digits)
+            self._set_horizon_parameter("time_duration", time_duration)
         else:
             raise ValueError(
-                self.time_duration.__name__
-                + " list must be the same length as time horizon"
+                "time_duration list must be the same length as time horizon"
             )
 
     @property
@@ -532,8 +530,7 @@ class PowerStorageDispatch(Dispatch):
 
     @cost_per_charge.setter
     def cost_per_charge(self, om_dollar_per_mwh: float):
-        for t in self.blocks.index_set():
-            self.blocks[t].cost_per_charge = round(om_dollar_per_mwh, self.round_digits)
+        self._set_horizon_parameter("cost_per_charge", om_dollar_per_mwh)
 
     @property
     def cost_per_discharge(self) -> float:
@@ -543,10 +540,7 @@ class PowerStorageDispatch(Dispatch):
 
     @cost_per_discharge.setter
     def cost_per_discharge(self, om_dollar_per_mwh: float):
-        for t in self.blocks.index_set():
-            self.blocks[t].cost_per_discharge = round(
-                om_dollar_per_mwh, self.round_digits
-            )
+        self._set_horizon_parameter("cost_per_discharge", om_dollar_per_mwh)
 
     @property
     def minimum_power(self) -> float:
@@ -556,8 +550,7 @@ class PowerStorageDispatch(Dispatch):
 
     @minimum_power.setter
     def minimum_power(self, minimum_power_mw: float):
-        for t in self.blocks.index_set():
-            self.blocks[t].minimum_power = round(minimum_power_mw, self.round_digits)
+        self._set_horizon_parameter("minimum_power", minimum_power_mw)
 
     @property
     def maximum_power(self) -> float:
@@ -567,8 +560,7 @@ class PowerStorageDispatch(Dispatch):
 
     @maximum_power.setter
     def maximum_power(self, maximum_power_mw: float):
-        for t in self.blocks.index_set():
-            self.blocks[t].maximum_power = round(maximum_power_mw, self.round_digits)
+        self._set_horizon_parameter("maximum_power", maximum_power_mw)
 
     @property
     def minimum_soc(self) -> float:
@@ -580,8 +572,7 @@ class PowerStorageDispatch(Dispatch):
     def minimum_soc(self, minimum_soc: float):
         if minimum_soc > 1:
             minimum_soc /= 100.0
-        for t in self.blocks.index_set():
-            self.blocks[t].minimum_soc = round(minimum_soc, self.round_digits)
+        self._set_horizon_parameter("minimum_soc", minimum_soc)
 
     @property
     def maximum_soc(self) -> float:
@@ -593,8 +584,7 @@ class PowerStorageDispatch(Dispatch):
     def maximum_soc(self, maximum_soc: float):
         if maximum_soc > 1:
             maximum_soc /= 100.0
-        for t in self.blocks.index_set():
-            self.blocks[t].maximum_soc = round(maximum_soc, self.round_digits)
+        self._set_horizon_parameter("maximum_soc", maximum_soc)
 
     @property
     def charge_efficiency(self) -> float:
@@ -605,8 +595,7 @@ class PowerStorageDispatch(Dispatch):
     @charge_efficiency.setter
     def charge_efficiency(self, efficiency: float):
         efficiency = self._check_efficiency_value(efficiency)
-        for t in self.blocks.index_set():
-            self.blocks[t].charge_efficiency = round(efficiency, self.round_digits)
+        self._set_horizon_parameter("charge_efficiency", efficiency)
 
     @property
     def discharge_efficiency(self) -> float:
@@ -617,8 +606,7 @@ class PowerStorageDispatch(Dispatch):
     @discharge_efficiency.setter
     def discharge_efficiency(self, efficiency: float):
         efficiency = self._check_efficiency_value(efficiency)
-        for t in self.blocks.index_set():
-            self.blocks[t].discharge_efficiency = round(efficiency, self.round_digits)
+        self._set_horizon_parameter("discharge_efficiency", efficiency)
 
     @property
     def round_trip_efficiency(self) -> float:
@@ -641,8 +629,7 @@ class PowerStorageDispatch(Dispatch):
 
     @capacity.setter
     def capacity(self, capacity_mwh: float):
-        for t in self.blocks.index_set():
-            self.blocks[t].capacity = round(capacity_mwh, self.round_digits)
+        self._set_horizon_parameter("capacity", capacity_mwh)
 
     @property
     def initial_soc(self) -> float:
@@ -679,12 +666,12 @@ class PowerStorageDispatch(Dispatch):
     @property
     def is_charging(self) -> list:
         """Storage is charging."""
-        return [self.blocks[t].is_charging.value for t in self.blocks.index_set()]
+        return self._get_horizon_values("is_charging")
 
     @property
     def is_discharging(self) -> list:
         """Storage is discharging."""
-        return [self.blocks[t].is_discharging.value for t in self.blocks.index_set()]
+        return self._get_horizon_values("is_discharging")
 
     @property
     def soc(self) -> list:
@@ -694,12 +681,12 @@ class PowerStorageDispatch(Dispatch):
     @property
     def charge_power(self) -> list:
         """Charge power."""
-        return [self.blocks[t].charge_power.value for t in self.blocks.index_set()]
+        return self._get_horizon_values("charge_power")
 
     @property
     def discharge_power(self) -> list:
         """Discharge power."""
-        return [self.blocks[t].discharge_power.value for t in self.blocks.index_set()]
+        return self._get_horizon_values("discharge_power")
 
     @property
     def lifecycles(self) -> float:
@@ -1,11 +1,13 @@
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Union
 
+import numpy as np
 import pyomo.environ as pyomo
 from pyomo.environ import units as u
 
 import PySAM.BatteryStateful as PySAMBatteryModel
 import PySAM.Singleowner as Singleowner
 
+import hopp.simulation.technologies.power_source as power_source
 from hopp.simulation.technologies.dispatch.power_storage.simple_battery_dispatch import (
     SimpleBatteryDispatch,
 )
@@ -51,15 +53,19 @@ class SimpleBatteryDispatchHeuristic(SimpleBatteryDispatch):
             dispatch_options=dispatch_options,
         )
 
-        self.max_charge_fraction = list([0.0] * len(self.blocks.index_set()))
-        self.max_discharge_fraction = list([0.0] * len(self.blocks.index_set()))
-        self.user_fixed_dispatch = list([0.0] * len(self.blocks.index_set()))
+        n_horizon = len(self.blocks.index_set())
+        self.max_charge_fraction = np.zeros(n_horizon)
+        self.max_discharge_fraction = np.zeros(n_horizon)
+        self.user_fixed_dispatch = list([0.0] * n_horizon)
         # TODO: should I enforce either a day schedule or a year schedule year and save it as user input.
         #  Additionally, Should I drop it as input in the init function?
         if fixed_dispatch is not None:
             self.user_fixed_dispatch = fixed_dispatch
 
-        self._fixed_dispatch = list([0.0] * len(self.blocks.index_set()))
+        self._fixed_dispatch = np.zeros(n_horizon)
+        self._fixed_soc = np.full(n_horizon, np.nan)
+        self._fixed_charge_power = np.full(n_horizon, np.nan)
+        self._fixed_discharge_power = np.full(n_horizon, np.nan)
 
     def set_fixed_dispatch(self, gen: list, grid_limit: list):
         """Sets charge and discharge power of battery dispatch using fixed_dispatch attribute and enforces available
@@ -105,29 +111,32 @@ class SimpleBatteryDispatchHeuristic(SimpleBatteryDispatch):
         NOTE: This method assumes that battery cannot be charged by the grid.
 
         """
-        for t in self.blocks.index_set():
-            self.max_charge_fraction[t] = self.enforce_power_fraction_simple_bounds(
-                gen[t] / self.maximum_power
-            )
-            self.max_discharge_fraction[t] = self.enforce_power_fraction_simple_bounds(
-                (grid_limit[t] - gen[t]) / self.maximum_power
-            )
+        gen = np.asarray(gen, dtype=float)
+        grid_limit = np.asarray(grid_limit, dtype=float)
+        maximum_power = self.maximum_power
+        self.max_charge_fraction = self.enforce_power_fraction_simple_bounds(
+            gen / maximum_power
+        )
+        self.max_discharge_fraction = self.enforce_power_fraction_simple_bounds(
+            (grid_limit - gen) / maximum_power
+        )
 
     @staticmethod
-    def enforce_power_fraction_simple_bounds(power_fraction: float) -> float:
+    def enforce_power_fraction_simple_bounds(
+        power_fraction: Union[float, np.ndarray]
+    ) -> Union[float, np.ndarray]:
         """Enforces simple bounds (0, .9) for battery power fractions.
 
         Args:
-            power_fraction (float): Power fraction from heuristic method.
+            power_fraction (float or np.ndarray): Power fraction(s) from heuristic method.
 
         Returns:
-            power_fraction (float): Bounded power fraction.
+            power_fraction (float or np.ndarray): Bounded power fraction(s).
 
         """
-        if power_fraction > 0.9:
-            power_fraction = 0.9
-        elif power_fraction < 0.0:
-            power_fraction = 0.0
+        power_fraction = np.clip(power_fraction, 0.0, 0.9)
+        if np.ndim(power_fraction) == 0:
+            return float(power_fraction)
         return power_fraction
 
     def update_soc(self, power_fraction: float, soc0: float) -> float:
@@ -142,30 +151,38 @@ class SimpleBatteryDispatchHeuristic(SimpleBatteryDispatch):
             soc (float): Updated SOC.
             
         """
-        if power_fraction > 0.0:
-            discharge_power = power_fraction * self.maximum_power
-            soc = (
-                soc0
-                - self.time_duration[0]
-                * (1 / (self.discharge_efficiency / 100.0) * discharge_power)
-                / self.capacity
-            )
-        elif power_fraction < 0.0:
-            charge_power = -power_fraction * self.maximum_power
-            soc = (
-                soc0
-                + self.time_duration[0]
-                * (self.charge_efficiency / 100.0 * charge_power)
-                / self.capacity
-            )
-        else:
-            soc = soc0
+        return float(self._soc_trajectory([power_fraction], soc0)[0])
+
+    def _soc_trajectory(self, fixed_dispatch, soc0: float) -> np.ndarray:
+        """Calculates the SOC at the end of each period of a fixed dispatch.
+
+        Args:
+            fixed_dispatch: Power fractions [-1, 1] (Charging (-), Discharging (+)).
+            soc0 (float): Initial SOC.
+
+        Returns:
+            np.ndarray: SOC at the end of each period, bounded by the battery SOC limits.
+
+        """
+        fixed_dispatch = np.asarray(fixed_dispatch, dtype=float)
+        energy_scale = self.time_duration[0] * self.maximum_power / self.capacity
+        delta_soc = np.where(
+            fixed_dispatch > 0.0,
+            -energy_scale * fixed_dispatch / (self.discharge_efficiency / 100.0),
+            -energy_scale * fixed_dispatch * (self.charge_efficiency / 100.0),
+        )
 
-        min_soc = self._system_model.value("minimum_SOC") / 100
-        max_soc = self._system_model.value("maximum_SOC") / 100
+        min_soc = power_source.PowerSource.model_value_owner(self._system_model, "minimum_SOC").minimum_SOC / 100
+        max_soc = power_source.PowerSource.model_value_owner(self._system_model, "maximum_SOC").maximum_SOC / 100
 
-        soc = max(min_soc, min(max_soc, soc))
+        soc = soc0 + np.cumsum(delta_soc)
+        if np.all((soc >= min_soc) & (soc <= max_soc)):
+            return soc
 
+        # Bounds are applied every period, so the trajectory is path dependent once they bind
+        for t, delta in enumerate(delta_soc):
+            soc0 = max(min_soc, min(max_soc, soc0 + delta))
+            soc[t] = soc0
         return soc
 
     def _heuristic_method(self, _):
@@ -174,41 +191,31 @@ class SimpleBatteryDispatchHeuristic(SimpleBatteryDispatch):
 
     def _enforce_power_fraction_limits(self):
         """Enforces battery power fraction limits and sets _fixed_dispatch attribute."""
-        for t in self.blocks.index_set():
-            fd = self.user_fixed_dispatch[t]
-            if fd > 0.0:  # Discharging
-                if fd > self.max_discharge_fraction[t]:
-                    fd = self.max_discharge_fraction[t]
-            elif fd < 0.0:  # Charging
-                if -fd > self.max_charge_fraction[t]:
-                    fd = -self.max_charge_fraction[t]
-            self._fixed_dispatch[t] = fd
+        self._fixed_dispatch = np.clip(
+            self.user_fixed_dispatch,
+            -self.max_charge_fraction,
+            self.max_discharge_fraction,
+        )
 
     def _fix_dispatch_model_variables(self):
-        """Fixes dispatch model variables based on the fixed dispatch values."""
-        soc0 = self.model.initial_soc.value
-        for t in self.blocks.index_set():
-            dispatch_factor = self._fixed_dispatch[t]
-            self.blocks[t].soc.fix(self.update_soc(dispatch_factor, soc0))
-            soc0 = self.blocks[t].soc.value
-
-            if dispatch_factor == 0.0:
-                # Do nothing
-                self.blocks[t].charge_power.fix(0.0)
-                self.blocks[t].discharge_power.fix(0.0)
-            elif dispatch_factor > 0.0:
-                # Discharging
-                self.blocks[t].charge_power.fix(0.0)
-                self.blocks[t].discharge_power.fix(dispatch_factor * self.maximum_power)
-            elif dispatch_factor < 0.0:
-                # Charging
-                self.blocks[t].discharge_power.fix(0.0)
-                self.blocks[t].charge_power.fix(-dispatch_factor * self.maximum_power)
+        """Stores the battery SOC, charge and discharge power of the fixed dispatch.
+
+        The heuristic schedule is kept as arrays rather than fixing the Pyomo variables of each block.
+
+        """
+        fixed_dispatch = np.asarray(self._fixed_dispatch, dtype=float)
+        self._fixed_soc = self._soc_trajectory(
+            fixed_dispatch, self.model.initial_soc.value
+        )
+        self._fixed_charge_power = np.maximum(-fixed_dispatch, 0.0) * self.maximum_power
+        self._fixed_discharge_power = (
+            np.maximum(fixed_dispatch, 0.0) * self.maximum_power
+        )
 
     @property
     def fixed_dispatch(self) -> list:
         """list: List of fixed dispatch."""
-        return self._fixed_dispatch
+        return list(self._fixed_dispatch)
 
     @property
     def user_fixed_dispatch(self) -> list:
@@ -228,3 +235,23 @@ class SimpleBatteryDispatchHeuristic(SimpleBatteryDispatch):
             )
         else:
             self._user_fixed_dispatch = fixed_dispatch
+
+    @property
+    def soc(self) -> list:
+        """State-of-charge."""
+        return (self._fixed_soc * 100.0).tolist()
+
+    @property
+    def charge_power(self) -> list:
+        """Charge power."""
+        return self._fixed_charge_power.tolist()
+
+    @property
+    def discharge_power(self) -> list:
+        """Discharge power."""
+        return self._fixed_discharge_power.tolist()
+
+    @property
+    def power(self) -> list:
+        """Power."""
+        return (self._fixed_discharge_power - self._fixed_charge_power).tolist()
@@ -228,8 +228,8 @@ class GenericSystem(BaseClass):
 
         W_ac_nom = self.calc_nominal_capacity(interconnect_kw)
         
-        E_net_max_feasible = [min(x,W_ac_nom) * self.t_step for x in self.gen[0:self.n_timesteps]]      # [kWh]
-        return E_net_max_feasible
+        E_net_max_feasible = np.minimum(self.gen[0:self.n_timesteps], W_ac_nom) * self.t_step      # [kWh]
+        return E_net_max_feasible.tolist()
 
 @define
 class GenericPlant(PowerSource):
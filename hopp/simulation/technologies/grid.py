@@ -10,6 +10,7 @@ from hopp.simulation.technologies.power_source import PowerSource
 from hopp.simulation.base import BaseClass
 from hopp.simulation.technologies.financial import FinancialModelType, CustomFinancialModel
 from hopp.type_dec import NDArrayFloat
+from hopp.tools.utils import run_lengths
 from hopp.utilities.validators import gt_zero
 from hopp.utilities.log import hybrid_logger as logger
 
@@ -122,35 +123,29 @@ class Grid(PowerSource):
 
         """
         if self.site.follow_desired_schedule:
+            total_gen = np.asarray(total_gen, dtype=float)
+            n_repeats = int(project_life / (len(self.site.desired_schedule) // self.site.n_timesteps))
+            desired_schedule = np.tile(np.asarray(self.site.desired_schedule, dtype=float) * 1e3, n_repeats)
+
             # Desired schedule sets the upper bound of the system output, any over generation is curtailed
             if self.site.curtailment_value_type == "interconnect_kw":
-                lifetime_schedule: NDArrayFloat = np.tile([self.interconnect_kw],
-                    len(total_gen))
-                desired_schedule = np.tile(
-                    [x * 1e3 for x in self.site.desired_schedule],
-                    int(project_life / (len(self.site.desired_schedule) // self.site.n_timesteps))
-                )
+                lifetime_schedule: NDArrayFloat = np.full(len(total_gen), self.interconnect_kw, dtype=float)
             elif self.site.curtailment_value_type == "desired_schedule":
-                lifetime_schedule: NDArrayFloat = np.tile([
-                    x * 1e3 for x in self.site.desired_schedule],
-                    int(project_life / (len(self.site.desired_schedule) // self.site.n_timesteps))
-                )
-                desired_schedule = lifetime_schedule
+                lifetime_schedule: NDArrayFloat = desired_schedule
 
             # Generate the final generation profile by curtailing over-generation
             self.generation_profile = np.minimum(total_gen, lifetime_schedule)
 
             # Calculate missed load and missed load percentage
-            self.missed_load = np.array([
-                max(schedule - gen, 0) 
-                for schedule, gen in zip(desired_schedule, self.generation_profile)
-            ])
-            self.missed_load_percentage = (sum(self.missed_load)/sum(desired_schedule)) * 100
+            self.missed_load = np.subtract(desired_schedule, self.generation_profile)
+            np.maximum(self.missed_load, 0., out=self.missed_load)
+            desired_schedule_total = desired_schedule.sum()
+            self.missed_load_percentage = (self.missed_load.sum()/desired_schedule_total) * 100
 
             # Calculate curtailed schedule and curtailed schedule percentage
-            self.schedule_curtailed = np.array([gen - schedule if gen > schedule else 0. for (gen, schedule) in
-                                            zip(total_gen, lifetime_schedule)])
-            self.schedule_curtailed_percentage = (sum(self.schedule_curtailed)/sum(lifetime_schedule)) * 100
+            self.schedule_curtailed = np.subtract(total_gen, lifetime_schedule)
+            np.maximum(self.schedule_curtailed, 0., out=self.schedule_curtailed)
+            self.schedule_curtailed_percentage = (self.schedule_curtailed.sum()/lifetime_schedule.sum()) * 100
 
             # NOTE: This is currently only happening for load following, would be good to make it more general
             #           i.e. so that this analysis can be used when load following isn't being used (without storage)
@@ -158,17 +153,15 @@ class Grid(PowerSource):
             # Hybrid power production for load following
             N_hybrid = len(self.generation_profile)
 
-            final_power_production = total_gen
-            schedule = [x for x in desired_schedule]
-            hybrid_power = [(final_power_production[x] - (schedule[x]*0.95)) for x in range(len(final_power_production))]
+            hybrid_power = np.multiply(desired_schedule, -0.95)
+            hybrid_power += total_gen
 
             # Count the instances where load is met
-            load_met = len([i for i in hybrid_power if i  >= 0])
+            load_met = np.count_nonzero(hybrid_power >= 0)
             self.time_load_met = 100 * load_met/N_hybrid
 
-            final_power_array = np.array(final_power_production)
-            power_met = np.where(final_power_array > schedule, schedule, final_power_array)
-            self.capacity_factor_load = np.sum(power_met) / np.sum(schedule) * 100
+            power_met = np.minimum(total_gen, desired_schedule)
+            self.capacity_factor_load = power_met.sum() / desired_schedule_total * 100
             
             logger.info('Percent of time firm power requirement is met: %s', np.round(self.time_load_met,2))
             logger.info('Percent total firm power requirement is satisfied: %s', np.round(self.capacity_factor_load,2))
@@ -195,21 +188,13 @@ class Grid(PowerSource):
                 min_regulation_hours = dispatch_options.higher_hours['min_regulation_hours']
                 min_regulation_power = dispatch_options.higher_hours['min_regulation_power']
 
-                frequency_power_array = np.array(hybrid_power)
-                frequency_test = np.where(frequency_power_array > min_regulation_power, frequency_power_array, 0)
-                mask = (frequency_test!=0).astype(int)
-                padded_mask = np.pad(mask,(1,), "constant")
-                edge_mask = padded_mask[1:] - padded_mask[:-1]  # finding the difference between each array value
-
-                group_starts = np.where(edge_mask == 1)[0]
-                group_stops = np.where(edge_mask == -1)[0]
+                frequency_mask = (hybrid_power > min_regulation_power) & (hybrid_power != 0)
 
                 # Find groups and drop groups that are too small
-                groups = [group for group in zip(group_starts,group_stops) if ((group[1]-group[0]) >= min_regulation_hours)]
-                group_lengths = [len(final_power_production[group[0]:group[1]]) for group in groups]
-                self.total_number_hours = sum(group_lengths)
+                _, group_lengths = run_lengths(frequency_mask)
+                self.total_number_hours = int(group_lengths[group_lengths >= min_regulation_hours].sum())
 
-                logger.info('Total number of hours available for ERS: ', np.round(self.total_number_hours,2))
+                logger.info('Total number of hours available for ERS: %s', np.round(self.total_number_hours,2))
         else:
             self.generation_profile = total_gen #actual
 
@@ -235,8 +220,8 @@ class Grid(PowerSource):
         """
         W_ac_nom = self.calc_nominal_capacity(interconnect_kw)
         t_step = self.site.interval / 60                                                # hr
-        E_net_max_feasible = [min(x,W_ac_nom) * t_step for x in self.total_gen_max_feasible_year1[0:self.site.n_timesteps]]      # [kWh]
-        return E_net_max_feasible
+        E_net_max_feasible = np.minimum(self.total_gen_max_feasible_year1[0:self.site.n_timesteps], W_ac_nom) * t_step      # [kWh]
+        return E_net_max_feasible.tolist()
 
     @property
     def system_capacity_kw(self) -> float:
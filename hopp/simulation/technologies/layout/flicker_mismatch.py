@@ -10,13 +10,14 @@ sys.path.append('.')
 
 from shapely.geometry import MultiPoint, Polygon, Point, MultiPolygon, box
 from shapely.affinity import translate
-from pvmismatch import pvsystem
+from pvmismatch import pvconstants, pvmodule, pvstring, pvsystem
 import PySAM.Pvwattsv8 as pv
 
 from hopp import ROOT_DIR
 from hopp.utilities.log import flicker_logger as logger
 from hopp.simulation.technologies.resource import SolarResource
-from hopp.simulation.technologies.layout.shadow_flicker import get_sun_pos, get_turbine_shadows_timeseries, create_pv_string_points
+from hopp.simulation.technologies.layout.shadow_flicker import get_sun_pos, get_turbine_shadows_timeseries, \
+    get_turbine_shadow_masks, create_pv_string_points
 from hopp.simulation.technologies.layout.pv_module import *
 
 # global variables
@@ -28,6 +29,91 @@ lon_range = range(-161, -68, 18)
 func_space = product(lat_range, lon_range)
 
 
+class MismatchLossTable:
+    """
+    Lookup table of the power loss of a string of PV modules, modeled by PVMismatch, for which some modules are shaded.
+
+    The modules of a string are in series, so the loss only depends on the plane-of-array irradiance and the number of
+    shaded modules, not on which modules are shaded. Losses are computed with PVMismatch on a grid of geometrically
+    spaced irradiance levels, as the levels are needed, and linearly interpolated between levels. The loss changes
+    fastest with irradiance at low irradiance, where the levels are most closely spaced.
+    """
+    min_poa_suns: float = 1e-3
+
+    def __init__(self,
+                 modules_per_string: int,
+                 poa_shading_ratio: float = 0.9,
+                 resolution: float = 0.02
+                 ) -> None:
+        """
+        :param modules_per_string: number of modules in a string
+        :param poa_shading_ratio: how much of the poa is blocked by the shadow
+        :param resolution: relative spacing of the irradiance levels of the table
+        """
+        if resolution <= 0:
+            raise ValueError("'resolution' must be greater than zero")
+        self.modules_per_string = modules_per_string
+        self.poa_shading_ratio = poa_shading_ratio
+        self.resolution = resolution
+        self.pvconst = pvconstants.PVconstants()
+        # dimension [irradiance level, number of shaded modules], NaN for levels not yet computed
+        self.table = np.full((0, modules_per_string + 1), np.nan)
+
+    def _compute_level(self,
+                       level: int
+                       ) -> np.ndarray:
+        """
+        Calculate the losses at the irradiance of `level` for each number of shaded modules. Strings are assembled
+        from one unshaded and one shaded module so that the module IV curves are only calculated once per level.
+        """
+        poa_suns = self.min_poa_suns * (1 + self.resolution) ** level
+        shaded_poa_suns = poa_suns * (1 - self.poa_shading_ratio)
+
+        unshaded_module = pvmodule.PVmodule(pvconst=self.pvconst)
+        unshaded_module.setSuns(poa_suns)
+        shaded_module = pvmodule.PVmodule(pvconst=self.pvconst)
+        shaded_module.setSuns(np.full(len(cell_num_map_flat), shaded_poa_suns), cells=cell_num_map_flat)
+
+        losses = np.zeros(self.modules_per_string + 1)
+        kwh_unshaded = None
+        for n_shaded in range(self.modules_per_string + 1):
+            modules = [shaded_module] * n_shaded + [unshaded_module] * (self.modules_per_string - n_shaded)
+            pvsys = pvsystem.PVsystem(pvconst=self.pvconst,
+                                      pvstrs=[pvstring.PVstring(pvconst=self.pvconst, pvmods=modules)])
+            if kwh_unshaded is None:
+                kwh_unshaded = pvsys.Pmp
+            else:
+                losses[n_shaded] = (kwh_unshaded - pvsys.Pmp) / kwh_unshaded
+        return losses
+
+    def loss(self,
+             poa_suns: Union[float, np.ndarray],
+             n_shaded: Union[int, np.ndarray]
+             ) -> np.ndarray:
+        """
+        Get the loss ratio of a string relative to an unshaded string
+
+        :param poa_suns: plane-of-array irradiance in suns, broadcastable with n_shaded
+        :param n_shaded: number of shaded modules in the string
+        :return: loss ratios (0 - 1)
+        """
+        poa_suns = np.maximum(np.asarray(poa_suns, dtype=float), self.min_poa_suns)
+        level = np.log(poa_suns / self.min_poa_suns) / np.log(1 + self.resolution)
+        level_low = np.floor(level).astype(int)
+        frac = level - level_low
+
+        n_levels = int(level_low.max(initial=0)) + 2
+        if n_levels > len(self.table):
+            self.table = np.vstack((self.table, np.full((n_levels - len(self.table), self.modules_per_string + 1),
+                                                        np.nan)))
+        for lvl in np.unique(np.concatenate((level_low.ravel(), level_low.ravel() + 1))):
+            if np.isnan(self.table[lvl, 0]):
+                self.table[lvl] = self._compute_level(lvl)
+
+        n_shaded = np.minimum(n_shaded, self.modules_per_string)
+        return (1 - frac) * self.table[level_low, n_shaded] + frac * self.table[level_low + 1, n_shaded]
+
+
 class FlickerMismatch:
     """
     Simulates a wind turbine's flicker over a grid for a given location. The shadow cast by the tower and the three
@@ -56,6 +142,11 @@ class FlickerMismatch:
     :var diam_mult_s: similarly, the number of turbine diameters the heatmap extends from (0, 0) south
     :var periodic: if true, then the top of the heatmap continues onto the bottom, and vice versa for the east / west
     :var turbine_tower_shadow: if true, then include the tower shadow
+    :var raster_max_batch_cells: for the 'raster' engine, max number of timesteps x grid cells to compute at once
+    :var raster_subsamples: for the 'raster' engine, number of sample points per cell side to compute the shaded
+            area of a cell for the 'time' heat map
+    :var loss_table_resolution: for the 'raster' engine, relative spacing of the irradiance levels of the string loss
+            lookup table
 
     """
     # model properties
@@ -68,6 +159,10 @@ class FlickerMismatch:
     periodic: bool = False
     # shadow properties
     turbine_tower_shadow: bool = True
+    # raster engine properties
+    raster_max_batch_cells: int = 2 ** 21
+    raster_subsamples: int = 4
+    loss_table_resolution: float = 0.02
 
     def __init__(self,
                  lat: float,
@@ -78,7 +173,8 @@ class FlickerMismatch:
                  wind_dir: Optional[list] = None,
                  gridcell_width: float = module_width,
                  gridcell_height: float = module_height,
-                 gridcells_per_string: int = modules_per_string
+                 gridcells_per_string: int = modules_per_string,
+                 engine: str = "polygon"
                  ) -> None:
         """
         Setup file output paths, the solar panel array, and the heat map template.
@@ -94,7 +190,14 @@ class FlickerMismatch:
         :param gridcell_width: grid cells of the heat map dimension
         :param gridcell_height: grid cells of the heat map dimension
         :param gridcells_per_string: for 'poa' heatmaps
+        :param engine: how shadows are calculated over the grid
+                    - "polygon": intersect Shapely shadow polygons with the grid for each timestep
+                    - "raster": evaluate analytic shadow masks on the grid for batches of timesteps, and look up
+                        string losses from a MismatchLossTable
         """
+        if engine not in ("polygon", "raster"):
+            raise ValueError("'engine' must be either 'polygon' or 'raster'")
+        self.engine = engine
         self.lat = lat
         self.lon = lon
         self.solar_resource_data = solar_resource_data
@@ -129,6 +232,10 @@ class FlickerMismatch:
             np.average(self.wind_dir if self.wind_dir is not None else 0),
             np.std((self.wind_dir if self.wind_dir is not None else 0)))
 
+        # raster engine
+        self.loss_table = None
+        self.string_cells = None
+
         # mp
         self.step_intervals = None
 
@@ -483,15 +590,17 @@ class FlickerMismatch:
                                                     step_to_minute,
                                                     steps=steps)
 
-        self.turbine_shadow = get_turbine_shadows_timeseries(self.blade_length,
-                                                             steps,
-                                                             self.angles_per_step,
-                                                             self.azi_ang,
-                                                             self.elv_ang,
-                                                             self.wind_dir,
-                                                             FlickerMismatch.turbine_tower_shadow)
+        if self.engine == "polygon":
+            self.turbine_shadow = get_turbine_shadows_timeseries(self.blade_length,
+                                                                 steps,
+                                                                 self.angles_per_step,
+                                                                 self.azi_ang,
+                                                                 self.elv_ang,
+                                                                 self.wind_dir,
+                                                                 FlickerMismatch.turbine_tower_shadow)
 
         by_poa = by_power = by_time = False
+        heat_map_shadow = heat_map_flicker = heat_map_time = None
 
         for i in weight_option:
             if i == "poa":
@@ -515,33 +624,37 @@ class FlickerMismatch:
                 self._setup_irradiance()
             total_poa = sum(self.poa[steps])
 
-        progress_size = int(len(steps) / min(10, len(steps)))
-        for i, step in enumerate(steps):
-            if i % progress_size == 0:
-                logger.info("Proc {} created heat maps for {} / 100 steps".format(proc_id, int(i / len(steps) * 100)))
+        if self.engine == "raster":
+            self._create_heat_maps_raster(steps, heat_map_shadow, heat_map_flicker, heat_map_time,
+                                          total_poa if by_poa else None)
+        else:
+            progress_size = int(len(steps) / min(10, len(steps)))
+            for i, step in enumerate(steps):
+                if i % progress_size == 0:
+                    logger.info("Proc {} created heat maps for {} / 100 steps".format(proc_id, int(i / len(steps) * 100)))
 
-            hr = int(step / FlickerMismatch.steps_per_hour)
+                hr = int(step / FlickerMismatch.steps_per_hour)
 
-            shadows = self._calculate_turbine_shadow(i)
+                shadows = self._calculate_turbine_shadow(i)
 
-            if not shadows:
-                continue
+                if not shadows:
+                    continue
 
-            if by_poa:
-                poa_weight = self.poa[hr] / total_poa
-                FlickerMismatch._calculate_shading(poa_weight, shadows, self.site_points,
-                                                   heat_map_shadow, self.gridcell_width, self.gridcell_height)
+                if by_poa:
+                    poa_weight = self.poa[hr] / total_poa
+                    FlickerMismatch._calculate_shading(poa_weight, shadows, self.site_points,
+                                                       heat_map_shadow, self.gridcell_width, self.gridcell_height)
 
-            if by_power:
-                xs, ys = np.min(self.heat_map_template[1]), np.min(self.heat_map_template[2])
-                FlickerMismatch._calculate_power_loss(self.poa[hr], self.elv_ang[i], shadows,
-                                                      self.array_string_points,
-                                                      heat_map_flicker, self.gridcell_width, self.gridcell_height, xs, ys)
+                if by_power:
+                    xs, ys = np.min(self.heat_map_template[1]), np.min(self.heat_map_template[2])
+                    FlickerMismatch._calculate_power_loss(self.poa[hr], self.elv_ang[i], shadows,
+                                                          self.array_string_points,
+                                                          heat_map_flicker, self.gridcell_width, self.gridcell_height, xs, ys)
 
-            if by_time:
-                FlickerMismatch._calculate_shading(1, shadows, self.site_points,
-                                                   heat_map_time, self.gridcell_width, self.gridcell_height,
-                                                   normalize_by_area=True)
+                if by_time:
+                    FlickerMismatch._calculate_shading(1, shadows, self.site_points,
+                                                       heat_map_time, self.gridcell_width, self.gridcell_height,
+                                                       normalize_by_area=True)
 
         # normalize by angles per hour (since each will use the same weight) or by number of hours total
         step_normalize = self.angles_per_step if self.angles_per_step else 1
@@ -564,6 +677,149 @@ class FlickerMismatch:
         logger.info("Finished heat maps")
         return tuple(heat_maps_to_return)
 
+    def _setup_string_cells(self) -> None:
+        """
+        Get the flat heat map indices of the modules of each string in `array_string_points`, for the 'raster' engine.
+
+        Strings that share a module with a preceding string, which happens if FlickerMismatch.periodic, are split into
+        rounds in which no two strings share a module, so that their losses can be averaged in the same order as in
+        _calculate_power_loss.
+        """
+        xs_min, ys_min = np.min(self.heat_map_template[1]), np.min(self.heat_map_template[2])
+        n_x = len(self.heat_map_template[1])
+        n_cells = self.heat_map_template[0].size
+
+        strings = []
+        for array in self.array_string_points:
+            if not array:
+                continue
+            for string in array:
+                x_ind = np.round((np.array([pt.x for pt in string]) - xs_min) / self.gridcell_width).astype(int)
+                y_ind = np.round((np.array([pt.y for pt in string]) - ys_min) / self.gridcell_height).astype(int)
+                strings.append(y_ind * n_x + x_ind)
+
+        # cells of strings padded with an always unshaded cell at index n_cells
+        string_cells = np.full((len(strings), max([len(c) for c in strings], default=0)), n_cells)
+        cell_round = dict()
+        rounds = [[]]
+        for i, cells in enumerate(strings):
+            string_cells[i, :len(cells)] = cells
+            shared = [cell_round[c] for c in cells if c in cell_round]
+            string_round = max(shared) + 1 if shared else 0
+            if string_round == len(rounds):
+                rounds.append([])
+            rounds[string_round].append(i)
+            for c in cells:
+                cell_round[c] = string_round
+        self.string_cells = string_cells, [np.array(r, dtype=int) for r in rounds if r]
+
+    def _calculate_power_loss_raster(self,
+                                     poa: np.ndarray,
+                                     elv_ang: np.ndarray,
+                                     shaded: np.ndarray
+                                     ) -> np.ndarray:
+        """
+        Calculate the flicker losses for a batch of shading masks, using an unshaded string as baseline for normalizing
+
+        :param poa: irradiance of each timestep
+        :param elv_ang: solar elevation degree of each timestep
+        :param shaded: boolean array of dimension [n_timesteps, n_y, n_x], True where the cell is shaded
+        :return: flicker losses summed over the timesteps
+        """
+        if self.loss_table is None:
+            self.loss_table = MismatchLossTable(self.modules_per_string, resolution=self.loss_table_resolution)
+        if self.string_cells is None:
+            self._setup_string_cells()
+        string_cells, rounds = self.string_cells
+
+        poa_suns = np.asarray(poa) / 1000
+        active = (elv_ang >= 0) & (poa_suns >= 1e-3)
+        n_steps = shaded.shape[0]
+        shaded = np.hstack((shaded.reshape((n_steps, -1)), np.zeros((n_steps, 1), dtype=bool)))
+        heat_map = np.zeros(shaded.shape)
+
+        n_shaded = shaded[:, string_cells].sum(axis=2)
+        string_shaded = (n_shaded > 0) & active[:, np.newaxis]
+        losses = self.loss_table.loss(poa_suns[:, np.newaxis], n_shaded)
+
+        for strings in rounds:
+            cells = string_cells[strings]
+            loss = losses[:, strings, np.newaxis]
+            current = heat_map[:, cells]
+            if FlickerMismatch.periodic:
+                # if reusing a module, take the average
+                loss = np.where(current == 0, loss, (current + loss) / 2)
+            heat_map[:, cells] = np.where(string_shaded[:, strings, np.newaxis], loss, current)
+        heat_map[:, -1] = 0
+        return heat_map[:, :-1].sum(axis=0).reshape(self.heat_map_template[0].shape)
+
+    def _create_heat_maps_raster(self,
+                                 steps: range,
+                                 heat_map_shadow: Optional[np.ndarray],
+                                 heat_map_flicker: Optional[np.ndarray],
+                                 heat_map_time: Optional[np.ndarray],
+                                 total_poa: Optional[float]
+                                 ) -> None:
+        """
+        Update the heat maps for the simulation steps by rasterizing the turbine shadows onto the heat map grid for
+        batches of timesteps. Heat maps that are None are not calculated.
+
+        :param steps: which steps to run
+        :param heat_map_shadow: array with shading losses weighted by poa
+        :param heat_map_flicker: array with flicker losses
+        :param heat_map_time: array with shaded area weighted by timestep
+        :param total_poa: poa of all steps, for normalizing the shading losses
+        """
+        xs_grid, ys_grid = self.heat_map_template[1], self.heat_map_template[2]
+        xxs, yys = np.meshgrid(xs_grid, ys_grid)
+        if heat_map_time is not None:
+            n_sub = self.raster_subsamples
+            offsets = (np.arange(n_sub) + 0.5) / n_sub - 0.5
+            xxs_sub, yys_sub = np.meshgrid((xs_grid[:, np.newaxis] + offsets * self.gridcell_width).ravel(),
+                                           (ys_grid[:, np.newaxis] + offsets * self.gridcell_height).ravel())
+
+        if self.angles_per_step is None:
+            angles_range = (None,)
+        else:
+            step_to_angle = 120 / self.angles_per_step
+            angles_range = [i * step_to_angle for i in range(self.angles_per_step)]
+
+        hrs = np.array([int(step / FlickerMismatch.steps_per_hour) for step in steps], dtype=int)
+        steps = np.array(steps, dtype=int)
+        wind_dir = None if self.wind_dir is None else np.asarray(self.wind_dir)[steps]
+        n_cells = xxs.size if heat_map_time is None else xxs_sub.size
+        batch_size = max(1, self.raster_max_batch_cells // n_cells)
+
+        for start in range(0, len(steps), batch_size):
+            batch = slice(start, start + batch_size)
+            # skip nighttime steps
+            day = np.flatnonzero(self.elv_ang[batch] >= 0) + start
+            if len(day) == 0:
+                continue
+            logger.info("Rasterizing shadows for steps {} - {}".format(steps[day[0]], steps[day[-1]]))
+            batch_wind_dir = None if wind_dir is None else wind_dir[day]
+
+            for angle in angles_range:
+                if heat_map_shadow is not None or heat_map_flicker is not None:
+                    shaded = get_turbine_shadow_masks(self.blade_length, angle, self.azi_ang[day], self.elv_ang[day],
+                                                      batch_wind_dir, xxs, yys,
+                                                      tower_shadow=FlickerMismatch.turbine_tower_shadow,
+                                                      turb_pos=self.turb_pos)
+                    if heat_map_shadow is not None:
+                        poa_weight = self.poa[hrs[day]] / total_poa
+                        heat_map_shadow += np.tensordot(poa_weight, shaded, axes=1)
+                    if heat_map_flicker is not None:
+                        heat_map_flicker += self._calculate_power_loss_raster(self.poa[hrs[day]],
+                                                                              self.elv_ang[day], shaded)
+
+                if heat_map_time is not None:
+                    shaded = get_turbine_shadow_masks(self.blade_length, angle, self.azi_ang[day], self.elv_ang[day],
+                                                      batch_wind_dir, xxs_sub, yys_sub,
+                                                      tower_shadow=FlickerMismatch.turbine_tower_shadow,
+                                                      turb_pos=self.turb_pos)
+                    shaded_area = shaded.reshape((len(day), len(ys_grid), n_sub, len(xs_grid), n_sub)).mean(axis=(2, 4))
+                    heat_map_time += shaded_area.sum(axis=0)
+
     def run_parallel(self,
                      n_procs: int,
                      weight_option: tuple,
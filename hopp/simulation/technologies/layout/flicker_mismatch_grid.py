@@ -50,7 +50,8 @@ class FlickerMismatchGrid(FlickerMismatch):
                  turbine_ny: float,
                  angle: float = 0,
                  blade_length: int = 35,
-                 angles_per_step: int = 1):
+                 angles_per_step: int = 1,
+                 engine: str = "polygon"):
         """
 
         :param lat: latitude
@@ -60,6 +61,7 @@ class FlickerMismatchGrid(FlickerMismatch):
         :param angle: degree of rotation for turbine grid
         :param blade_length: meters
         :param angles_per_step: number of blade angles per step of the hour
+        :param engine: how shadows are calculated over the grid, either "polygon" or "raster"
         """
         FlickerMismatch.periodic = True
         self.center_grid = None
@@ -67,7 +69,7 @@ class FlickerMismatchGrid(FlickerMismatch):
         self.turbine_dy = turbine_ny * blade_length * 2
         self.grid_angle = int(angle) % 90
         self.n_rows_modules = int(turbine_nx / (0.124 * 12))
-        super().__init__(lat, lon, blade_length=blade_length, angles_per_step=angles_per_step)
+        super().__init__(lat, lon, blade_length=blade_length, angles_per_step=angles_per_step, engine=engine)
 
         self.filename_full = "{}_{}_{}_{}_{}_{}_{}".format(self.lat, self.lon,
                                                            self.steps_per_hour, self.angles_per_step,
@@ -43,7 +43,8 @@ class HybridLayout:
             `steps_per_hour` is the timestep interval of shadow calculation
             `angles_per_step` is how many different angles of the blades are calculated per timestep
 
-        If not flicker_load_nearest, generate a low-resolution flicker heat map
+        If not flicker_load_nearest, generate a low-resolution flicker heat map for the site using the 'raster'
+        engine of FlickerMismatch
 
         :return: tuple:
                     (turbine diameter,
@@ -77,7 +78,8 @@ class HybridLayout:
             flicker_no_tower = FlickerMismatch(self.site.data['lat'], self.site.data['lon'],
                                                blade_length=flicker_diam // 2,
                                                angles_per_step=None,
-                                               gridcell_height=90, gridcell_width=90, gridcells_per_string=1)
+                                               gridcell_height=90, gridcell_width=90, gridcells_per_string=1,
+                                               engine="raster")
 
             (flicker_heatmap,) = flicker_no_tower.create_heat_maps(range(8760), ("power",))
             heatmap_template = flicker_no_tower.heat_map_template
@@ -1,4 +1,4 @@
-from typing import Union, Tuple, Optional, List
+from typing import Union, Tuple, Optional, List, Sequence
 import datetime
 import pytz
 
@@ -254,6 +254,103 @@ def get_turbine_shadows_timeseries(blade_length: float,
     return turbine_shadows_per_timestep
 
 
+def get_turbine_shadow_masks(blade_length: float,
+                             blade_angle: Optional[float],
+                             azi_ang: Union[list, np.ndarray],
+                             elv_ang: Union[list, np.ndarray],
+                             wind_dir: Optional[Union[list, np.ndarray]],
+                             x: np.ndarray,
+                             y: np.ndarray,
+                             tower_shadow: bool = True,
+                             turb_pos: Sequence = ((0, 0),),
+                             tower_height: Optional[float] = None
+                             ) -> np.ndarray:
+    """
+    Rasterized version of get_turbine_shadow_polygons for a batch of timesteps. Instead of constructing Shapely
+    polygons, the tower rectangle, the blade parallelograms and the swept-area ellipse are tested analytically at each
+    of the (x, y) points, e.g., the centers of the cells of a heat map.
+
+    The shadows of turbines located at each position in `turb_pos` are combined, as in get_turbine_grid_shadow.
+
+    :param blade_length: meters, radius in spherical coords
+    :param blade_angle: degrees from z-axis, or None to use ellipse as swept area
+    :param azi_ang: azimuth degrees of each timestep, clockwise from north as 0
+    :param elv_ang: elevation degrees of each timestep, from x-y plane as 0
+    :param wind_dir: wind direction degrees of each timestep, or None to assume north
+    :param x: x coordinates of points to test
+    :param y: y coordinates of points to test, same shape as x
+    :param tower_shadow: if false, do not include the tower's shadow
+    :param turb_pos: (x, y) positions of the turbines
+    :param tower_height: meters, if None, 2.5 x blade_length
+    :returns: boolean array of dimension [n_timesteps, *x.shape], True where the point is shaded
+    """
+    blade_width = blade_length / 16
+    if tower_height is None:
+        tower_height = 2.5 * blade_length
+    tower_dx = blade_width / 2.0
+
+    azi_ang = np.asarray(azi_ang, dtype=float)[:, np.newaxis]
+    elv_ang = np.asarray(elv_ang, dtype=float)[:, np.newaxis]
+    if wind_dir is None:
+        wind_dir = np.zeros(azi_ang.shape)
+    else:
+        wind_dir = np.array([0 if not w else w for w in wind_dir], dtype=float)[:, np.newaxis]
+
+    # shadows only exist while the sun is up, see get_turbine_shadow_polygons and get_turbine_shadows_timeseries
+    shadow_ang = azi_ang - 180.0
+    shadow_ang[shadow_ang < 0.0] += 360.0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        tan_elv_inv = np.tan(np.radians(elv_ang)) ** -1
+    valid = (elv_ang > 0.0) & (shadow_ang != 0.0) & (tan_elv_inv > 0.0)
+    tan_elv_inv = np.where(valid, tan_elv_inv, 0.0)
+
+    shadow_tower_length = tower_height * tan_elv_inv
+    # semi-axes of the swept area ellipse along and across the shadow direction
+    radius_along = blade_length * tan_elv_inv
+    radius_across = blade_length * np.abs(np.cos(np.radians(shadow_ang - wind_dir)))
+
+    # unit vectors along (u) and across (v) the shadow direction
+    theta = np.radians(shadow_ang)
+    ux, uy = np.sin(theta), np.cos(theta)
+    vx, vy = -uy, ux
+    center_x, center_y = shadow_tower_length * ux, shadow_tower_length * uy
+
+    if blade_angle is not None:
+        blades = []
+        for angle in (blade_angle, blade_angle + 120, blade_angle - 120):
+            blade_theta = np.radians(angle - 90)
+            along = radius_along * np.cos(blade_theta)
+            across = radius_across * np.sin(blade_theta)
+            # blade runs from the center of the ellipse to the tip, with a width of tower_dx on either side
+            dx, dy = along * ux + across * vx, along * uy + across * vy
+            nx, ny = np.cos(np.radians(angle + 90)), np.sin(np.radians(angle + 90))
+            det = dx * ny - dy * nx
+            blades.append((dx, dy, nx, ny, det))
+
+    x = np.asarray(x, dtype=float)
+    px, py = x.ravel()[np.newaxis, :], np.asarray(y, dtype=float).ravel()[np.newaxis, :]
+    mask = np.zeros((len(azi_ang), px.shape[1]), dtype=bool)
+    for offset_x, offset_y in turb_pos:
+        qx, qy = px - offset_x, py - offset_y
+        a = qx * ux + qy * uy
+        b = qx * vx + qy * vy
+        if tower_shadow:
+            mask |= (a >= 0) & (a <= shadow_tower_length) & (np.abs(b) <= tower_dx)
+
+        if blade_angle is None:
+            da = a - shadow_tower_length
+            mask |= (da * radius_across) ** 2 + (b * radius_along) ** 2 <= (radius_along * radius_across) ** 2
+        else:
+            rx, ry = qx - center_x, qy - center_y
+            for dx, dy, nx, ny, det in blades:
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    s_blade = (rx * ny - ry * nx) / det
+                    s_width = (dx * ry - dy * rx) / (det * tower_dx)
+                mask |= (s_blade >= 0) & (s_blade <= 1) & (np.abs(s_width) <= 1)
+    mask &= valid
+    return mask.reshape((len(azi_ang),) + x.shape)
+
+
 def shadow_cast_over_panel(panel_x: float,
                            panel_y: float,
                            n_mod: int,
@@ -182,6 +182,49 @@ class LDES(PowerSource):
         self.state.gen = self.state.P
         self.state.SOC += (-control_power*dt_hr/self.system_capacity_kwh ) * 100
 
+    def simulate_power_series(self, control_power, dt_hr) -> tuple:
+        """Simulate a horizon of power controls in a single call. Equivalent to setting `input_power` and `dt_hr`
+        and calling `execute` for each time step, without the per-step attribute lookups.
+
+        Args:
+            control_power (array_like): power control for each time step [kW], discharging (+) charging (-)
+            dt_hr (float or array_like): time step duration(s) [hr]
+
+        Returns:
+            tuple: arrays of power [kW] and state of charge [%] at the end of each time step
+        """
+        if self.control_mode != 1.0:
+            raise(ValueError(f"control_mode {self.control_mode} has not been implemented. Must be one of [1.0]."))
+
+        # check power capacity constraint
+        control_power = np.clip(np.asarray(control_power, dtype=float), -self.system_capacity_kw, self.system_capacity_kw)
+        dt_hr = np.broadcast_to(np.asarray(dt_hr, dtype=float), control_power.shape)
+        max_soc_dec = self.maximum_SOC/100.0
+        min_soc_dec = self.minimum_SOC/100.0
+        nominal_energy = self.params.nominal_energy
+
+        power = np.empty_like(control_power)
+        soc = np.empty_like(control_power)
+        soc_t = self.state.SOC
+        # energy capacity constraint depends on the previous state of charge, so step through plain floats
+        for t, (power_t, dt_t) in enumerate(zip(control_power.tolist(), dt_hr.tolist())):
+            prev_soc_dec = soc_t/100.0
+            if -(power_t*dt_t) + prev_soc_dec*nominal_energy > nominal_energy*max_soc_dec:
+                power_t = -(max_soc_dec - prev_soc_dec)*nominal_energy/dt_t
+            elif -(power_t*dt_t) + prev_soc_dec*nominal_energy < nominal_energy*min_soc_dec:
+                power_t = (prev_soc_dec - min_soc_dec)*nominal_energy/dt_t
+            soc_t += (-power_t*dt_t/self.system_capacity_kwh) * 100
+            power[t] = power_t
+            soc[t] = soc_t
+
+        # update state
+        if len(power) > 0:
+            self.state.input_power = float(control_power[-1])
+            self.state.P = float(power[-1])
+            self.state.gen = self.state.P
+            self.state.SOC = soc_t
+        return power, soc
+
     @property
     def control_mode(self):
         return self.params.control_mode
@@ -212,7 +255,7 @@ class LDES(PowerSource):
     
     @dt_hr.setter
     def dt_hr(self, dt_hr_in):
-        self.params.control_mode = dt_hr_in
+        self.params.dt_hr = dt_hr_in
 
     @property
     def minimum_SOC(self):
@@ -1,7 +1,6 @@
 from typing import Iterable, Optional, Sequence, Union
 import inspect
 import numpy as np
-import pandas as pd
 import PySAM.Singleowner as Singleowner
 
 from hopp.simulation.technologies.sites.site_info import SiteInfo
@@ -23,6 +22,7 @@ class PowerSource(BaseClass):
     site : :class:`hybrid.sites.SiteInfo`
         Power source site information
     """
+    _value_group_cache = {}     # model type -> {variable name: name of model group containing variable, or None}
 
     def __init__(self, name, site: SiteInfo, system_model, financial_model):
         """
@@ -96,6 +96,66 @@ class PowerSource(BaseClass):
         self._financial_model.unassign("battery_total_cost_lcos")
         self._financial_model.value("cp_battery_nameplate", 0)
 
+    @staticmethod
+    def _find_value_group(model, var_name: str) -> Optional[str]:
+        """
+        Returns the name of the group within a PySAM-like model that contains the variable, or None if not found.
+        Misses are cached too, as the system model is searched before the financial model on every lookup
+        """
+        group_names = PowerSource._value_group_cache.setdefault(type(model), {})
+        if var_name in group_names:
+            return group_names[var_name]
+        group_names[var_name] = None
+        for a in model.__dir__():
+            try:
+                group_obj = getattr(model, a)
+                if var_name in group_obj.__dir__():
+                    group_names[var_name] = a
+                    break
+            except:
+                pass
+        return group_names[var_name]
+
+    def value_owner(self, var_name: str):
+        """
+        Returns the object that holds a variable: this technology, a group of the system model, or a group of the
+        financial model, in that order. Lookups of system and financial model groups are cached by model type, so
+        hot code paths can resolve the owner once and then get or set the attribute directly.
+
+        :param var_name: PySAM variable name
+
+        :returns: Object with `var_name` attribute
+        """
+        if hasattr(type(self), var_name) or var_name in getattr(self, '__dict__', {}):
+            return self
+        for model in (self._system_model, self._financial_model):
+            if model is None:
+                continue
+            group_name = self._find_value_group(model, var_name)
+            if group_name is not None:
+                return getattr(model, group_name)
+        raise ValueError("Variable {} not found in technology or financial model {}".format(
+            var_name, self.__class__.__name__))
+
+    @staticmethod
+    def model_value_owner(model, var_name: str):
+        """
+        Returns the object that holds a variable of either a technology or a PySAM-like model, such as the system
+        model passed to dispatch classes. Technologies resolve through `value_owner`, PySAM-like models through the
+        same per-model-type group cache.
+
+        :param model: technology or PySAM-like model
+        :param var_name: PySAM variable name
+
+        :returns: Object with `var_name` attribute
+        """
+        if isinstance(model, PowerSource):
+            return model.value_owner(var_name)
+        group_name = PowerSource._find_value_group(model, var_name)
+        if group_name is None:
+            raise ValueError("Variable {} not found in model {}".format(var_name, model.__class__.__name__))
+        return getattr(model, group_name)
+
     def value(self, var_name: str, var_value=None):
         """
         Gets or Sets a variable value within either the system or financial PySAM models. Method looks in system
@@ -116,30 +176,7 @@ class PowerSource(BaseClass):
         :returns: Variable value (when getter)
         """
         var_name = var_name.replace('adjust:', '')
-        attr_obj = None
-        if var_name in self.__dir__():
-            attr_obj = self
-        if not attr_obj:
-            for a in self._system_model.__dir__():
-                try:
-                    group_obj = getattr(self._system_model, a)
-                    if var_name in group_obj.__dir__():
-                        attr_obj = group_obj
-                        break
-                except:
-                    pass
-        if not attr_obj:
-            for a in self._financial_model.__dir__():
-                try:
-                    group_obj = getattr(self._financial_model, a)
-                    if var_name in group_obj.__dir__():
-                        attr_obj = group_obj
-                        break
-                except:
-                    pass
-        if not attr_obj:
-            raise ValueError("Variable {} not found in technology or financial model {}".format(
-                var_name, self.__class__.__name__))
+        attr_obj = self.value_owner(var_name)
 
         if var_value is None:
             try:
@@ -200,8 +237,8 @@ class PowerSource(BaseClass):
         """
         W_ac_nom = self.calc_nominal_capacity(interconnect_kw)
         t_step = self.site.interval / 60                                                # hr
-        E_net_max_feasible = [min(x,W_ac_nom) * t_step for x in self.generation_profile[0:self.site.n_timesteps]]      # [kWh]
-        return E_net_max_feasible
+        E_net_max_feasible = np.minimum(self.generation_profile[0:self.site.n_timesteps], W_ac_nom) * t_step      # [kWh]
+        return E_net_max_feasible.tolist()
 
     def calc_capacity_credit_percent(self, interconnect_kw: float) -> float:
         """
@@ -220,19 +257,16 @@ class PowerSource(BaseClass):
                     + type(self).__name__)
                 return 0
             else:
-                df = pd.DataFrame()
-                df['cap_hours'] = self.site.capacity_hours
-                df['E_net_max_feasible'] = self.gen_max_feasible  # [kWh]
-
-                sel_df = df[df['cap_hours'] == True]
+                cap_hours = np.asarray(self.site.capacity_hours) == True
+                E_net_max_feasible = np.asarray(self.gen_max_feasible, dtype=float)[cap_hours]  # [kWh]
 
                 if type(self).__name__ != 'Grid':
                     W_ac_nom = self.calc_nominal_capacity(interconnect_kw)
                 else:
                     W_ac_nom = np.min((self.hybrid_nominal_capacity, interconnect_kw))
 
-                if len(sel_df.index) > 0 and W_ac_nom > 0:
-                    capacity_value = sum(np.minimum(sel_df['E_net_max_feasible'].values/(W_ac_nom*t_step), 1.0)) / len(sel_df.index) * 100
+                if len(E_net_max_feasible) > 0 and W_ac_nom > 0:
+                    capacity_value = np.minimum(E_net_max_feasible/(W_ac_nom*t_step), 1.0).sum() / len(E_net_max_feasible) * 100
                     capacity_value = np.min((100, capacity_value))       # [%]
                 else:
                     capacity_value = 0
@@ -4,10 +4,10 @@ from pathlib import Path
 from typing import Union
 import requests
 import json
-import time
 
 from hopp.utilities.log import hybrid_logger as logger
 from hopp.simulation.technologies.resource.resource import Resource
+from hopp.simulation.technologies.resource.download_manager import get_download_manager
 from hopp import ROOT_DIR
 
 CAMBIUM_BASE_URL = "https://scenarioviewer.nrel.gov/api/get-data-cache/"
@@ -213,82 +213,47 @@ class CambiumData(Resource):
             base=CAMBIUM_BASE_URL, project_uuid='0f92fe57-3365-428a-8fe8-0afc326b3b43', scenario='Mid-case with 100% decarbonization by 2035', location_type='GEA Regions 2023',
             latitude=self.latitude, longitude=self.longitude, year=2031, time_type=self.time_type, metric_col='generation'
         )
-        response = json.loads(requests.get(url).text)
+        r = get_download_manager().get(url)
+        if r is None:
+            raise requests.exceptions.ConnectionError(f"Unable to query the GEA region from {CAMBIUM_BASE_URL}")
+        response = json.loads(r.text)
         gea = response['query']['location'].replace(" ","_")
 
         return gea
 
     def call_api(self, filename):
+        urls = dict()
+        # Emissions metrics and 'generation' metric
+        for metric in self.lrmer_metric_cols + [self.gen_metric_cols[0]]:
+            urls[metric] = "{base}?project_uuid={project_uuid}&scenario={scenario}&location_type={location_type}&latitude={latitude}&longitude={longitude}&year={year}&time_type={time_type}&metric_col={metric_col}".format(
+            base=CAMBIUM_BASE_URL, project_uuid=self.project_uuid, scenario=self.scenario, location_type=self.location_type,
+            latitude=self.latitude, longitude=self.longitude, year=self.year_to_check, time_type=self.time_type, metric_col = metric
+            )
+        # Technology specific generation metrics (metric_col='*_MWh', additional arg -> technology='<technology_map[metric_col]>')
+        for metric in self.gen_metric_cols[1:]:
+            urls[metric] = "{base}?project_uuid={project_uuid}&scenario={scenario}&location_type={location_type}&latitude={latitude}&longitude={longitude}&year={year}&time_type={time_type}&metric_col=*_MWh&technology={technology}".format(
+            base=CAMBIUM_BASE_URL, project_uuid=self.project_uuid, scenario=self.scenario, location_type=self.location_type,
+            latitude=self.latitude, longitude=self.longitude, year=self.year_to_check, time_type=self.time_type, technology=self.technology_map[metric]
+            )
+
+        # Call API concurrently for all metrics, retries and errors are handled by the download manager
+        responses = get_download_manager().get_many(list(urls.values()))
+        if any(r is None for r in responses):
+            return False
+
         # Instantiate dictionary to hold data for all variables before writing to file
         response_dict = {}
+        for metric, r in zip(urls.keys(), responses):
+            response_dict[metric] = json.loads(r.text)['message'][0]['values']
 
-        n_tries = 0 
-        success = False
-        while n_tries < 5:
+        # Save the response dict as a csv file
+        localfile = open(filename, mode="w+")
+        w = csv.writer(localfile)
+        w.writerow(list(response_dict.keys()))
+        w.writerows(zip(*list(response_dict.values())))
+        localfile.close()
 
-            try:
-                # Loop through emissions and 'generation' metric and call API to pull data
-                for metric in self.lrmer_metric_cols + [self.gen_metric_cols[0]]:
-                    # Define URL for emissions metrics and 'generation' metric
-                    url="{base}?project_uuid={project_uuid}&scenario={scenario}&location_type={location_type}&latitude={latitude}&longitude={longitude}&year={year}&time_type={time_type}&metric_col={metric_col}".format(
-                    base=CAMBIUM_BASE_URL, project_uuid=self.project_uuid, scenario=self.scenario, location_type=self.location_type,
-                    latitude=self.latitude, longitude=self.longitude, year=self.year_to_check, time_type=self.time_type, metric_col = metric
-                    )
-                    r = requests.get(url)
-                    if r:
-                        response_dict[metric] = json.loads(r.text)['message'][0]['values']
-                    elif r.status_code == 400 or r.status_code == 403:
-                        print(r.url)
-                        err = r.text
-                        text_json = json.loads(r.text)
-                        if 'errors' in text_json.keys():
-                            err = text_json['errors']
-                        raise requests.exceptions.HTTPError(err)
-                    elif r.status_code == 404:
-                        print(filename)
-                        raise requests.exceptions.HTTPError
-                    elif r.status_code == 429:
-                        raise RuntimeError("Maximum API request rate exceeded!")
-                    else:
-                        n_tries +=1
-                # Loop through technology specific generation metrics and call API to pull data
-                for metric in self.gen_metric_cols[1:]:
-                    # Define URL for technology specific generation metrics (metric_col='*_MWh', additional arg -> technology='<technology_map[metric_col]>')
-                    url="{base}?project_uuid={project_uuid}&scenario={scenario}&location_type={location_type}&latitude={latitude}&longitude={longitude}&year={year}&time_type={time_type}&metric_col=*_MWh&technology={technology}".format(
-                    base=CAMBIUM_BASE_URL, project_uuid=self.project_uuid, scenario=self.scenario, location_type=self.location_type,
-                    latitude=self.latitude, longitude=self.longitude, year=self.year_to_check, time_type=self.time_type, technology=self.technology_map[metric]
-                    )
-                    r = requests.get(url)
-                    if r:
-                        response_dict[metric] = json.loads(r.text)['message'][0]['values']
-                    elif r.status_code == 400 or r.status_code == 403:
-                        print(r.url)
-                        err = r.text
-                        text_json = json.loads(r.text)
-                        if 'errors' in text_json.keys():
-                            err = text_json['errors']
-                        raise requests.exceptions.HTTPError(err)
-                    elif r.status_code == 404:
-                        print(filename)
-                        raise requests.exceptions.HTTPError
-                    elif r.status_code == 429:
-                        raise RuntimeError("Maximum API request rate exceeded!")
-                    else:
-                        n_tries +=1
-                # Save the response dict as a csv file
-                localfile = open(filename, mode="w+")
-                w = csv.writer(localfile)
-                w.writerow(list(response_dict.keys()))
-                w.writerows(zip(*list(response_dict.values())))
-                localfile.close()
-                if os.path.isfile(filename):
-                    success = True
-                    break
-            except requests.exceptions.Timeout:
-                time.sleep(0.2)
-                n_tries +=1
-
-        return success
+        return os.path.isfile(filename)
 
     def download_resource(self):
         success = self.call_api(filename=self.filename)
@@ -0,0 +1,320 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from hopp.utilities.atomic_write import atomic_write
+from hopp.utilities.log import hybrid_logger as logger
+
+#: suffix of partially downloaded files, which are resumed by later downloads of the same file
+PARTIAL_DOWNLOAD_SUFFIX = ".part"
+
+#: suffix of the lock files held while a file is downloaded
+DOWNLOAD_LOCK_SUFFIX = ".lock"
+
+
+class DownloadManager:
+    """Downloads resource files over a shared, connection-pooled HTTP session.
+
+    Requests are retried with exponential backoff on timeouts, connection errors and server errors. Rate limited
+    requests (status 429) are retried after the delay given by their `Retry-After` header, or raise a RuntimeError
+    if the server does not say when to retry. Client errors (status 400, 403 and 404) raise an HTTPError.
+
+    Files are streamed to a partial file next to the destination and moved into place once complete, so an
+    interrupted download never leaves a truncated resource file behind. If a connection drops mid-download, the
+    next attempt asks the server for the remaining bytes only. Downloads of the same file, e.g., by simulations in
+    other processes, hold an exclusive lock on it while they write the partial file and move it into place, so they
+    run one at a time and a download that waited for the lock uses the file completed meanwhile.
+
+    Several files can be downloaded concurrently with `download_many`, bounded by `max_workers` threads, which
+    share the pooled connections of the session.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        max_tries: int = 5,
+        backoff: float = 0.2,
+        max_backoff: float = 60.,
+        timeout: Optional[float] = 300.,
+        chunk_size: int = 1 << 16,
+    ):
+        """
+        Args:
+            max_workers: maximum number of concurrent downloads and pooled connections per host
+            max_tries: maximum number of attempts per request
+            backoff: delay before the first retry in seconds, doubled with every retry
+            max_backoff: maximum delay between retries in seconds, also caps `Retry-After` delays
+            timeout: connect and read timeout of each request in seconds, None to wait forever
+            chunk_size: number of bytes written to file at a time
+        """
+        if max_workers < 1:
+            raise ValueError("'max_workers' must be at least 1")
+        if max_tries < 1:
+            raise ValueError("'max_tries' must be at least 1")
+        self.max_workers = max_workers
+        self.max_tries = max_tries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.chunk_size = chunk_size
+
+        self._session = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """The HTTP session shared by all requests of the manager, created on first use."""
+        with self._session_lock:
+            if self._session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._session = session
+            return self._session
+
+    def close(self):
+        """Closes the pooled connections of the session."""
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def get(self, url: str) -> Optional[requests.Response]:
+        """Requests `url`, retrying failed attempts.
+
+        Returns:
+            the response, or None if all attempts timed out or failed
+        """
+        return self._request(url, lambda r: r, name=url)
+
+    def get_many(self, urls: Sequence[str]) -> List[Optional[requests.Response]]:
+        """Concurrently requests several urls, see `get`. Responses are returned in the order of `urls`."""
+        return self._map(self.get, [(url,) for url in urls])
+
+    def download(
+        self,
+        url: str,
+        filename: Union[str, Path],
+        transform: Optional[Callable[[str], str]] = None,
+    ) -> bool:
+        """Downloads `url` to `filename`, retrying failed attempts and resuming interrupted ones.
+
+        Args:
+            url: the url to download
+            filename: the file the downloaded data is written to
+            transform: optional function applied to the downloaded text before it is written
+
+        Returns:
+            True if the file was downloaded, False if all attempts timed out or failed
+        """
+        filename = Path(filename)
+        partial = filename.with_name(filename.name + PARTIAL_DOWNLOAD_SUFFIX)
+        lock_path = filename.with_name(filename.name + DOWNLOAD_LOCK_SUFFIX)
+        # an existing file is downloaded again, e.g., to refresh it, otherwise a concurrent download of it suffices
+        existed = filename.is_file()
+
+        encoding = None
+
+        def write(r: requests.Response) -> Path:
+            nonlocal encoding
+            encoding = r.encoding
+            # the server only honors the range request if it replies with partial content
+            mode = "ab" if r.status_code == 206 else "wb"
+            with open(partial, mode) as f:
+                for chunk in r.iter_content(chunk_size=self.chunk_size):
+                    f.write(chunk)
+            return partial
+
+        def headers() -> dict:
+            if partial.is_file() and partial.stat().st_size > 0:
+                return {"Range": f"bytes={partial.stat().st_size}-"}
+            return {}
+
+        def restart():
+            if partial.is_file():
+                os.remove(partial)
+
+        with _exclusive_lock(lock_path):
+            if not existed and filename.is_file():
+                # downloaded by another process or thread while this one waited for the lock
+                return True
+
+            result = self._request(url, write, name=str(filename), headers=headers, restart=restart, stream=True)
+            if result is None:
+                return False
+
+            with open(partial, "rb") as f:
+                text = f.read().decode(encoding or "utf-8", errors="replace")
+            if transform is not None:
+                text = transform(text)
+            _write_atomic(filename, text)
+            os.remove(partial)
+        return filename.is_file()
+
+    def download_many(
+        self,
+        items: Iterable[Tuple[str, Union[str, Path]]],
+        transform: Optional[Callable[[str], str]] = None,
+    ) -> List[bool]:
+        """Concurrently downloads several files, see `download`.
+
+        Args:
+            items: pairs of url and filename
+            transform: optional function applied to the downloaded text of each file before it is written
+
+        Returns:
+            whether each file was downloaded, in the order of `items`
+        """
+        return self._map(lambda url, filename: self.download(url, filename, transform), list(items))
+
+    def _map(self, func: Callable, args: List[tuple]) -> list:
+        if len(args) <= 1 or self.max_workers == 1:
+            return [func(*a) for a in args]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(args))) as executor:
+            futures = [executor.submit(func, *a) for a in args]
+            # raises the first error in the order of the requests
+            return [future.result() for future in futures]
+
+    def _request(
+        self,
+        url: str,
+        handle: Callable[[requests.Response], object],
+        name: str,
+        headers: Optional[Callable[[], dict]] = None,
+        restart: Optional[Callable[[], None]] = None,
+        stream: bool = False,
+    ):
+        n_tries = 0
+        while n_tries < self.max_tries:
+            n_tries += 1
+            delay = self._backoff_delay(n_tries)
+            try:
+                with self.session.get(
+                    url,
+                    headers=headers() if headers is not None else None,
+                    timeout=self.timeout,
+                    stream=stream,
+                ) as r:
+                    if r:
+                        return handle(r)
+                    elif r.status_code == 400 or r.status_code == 403:
+                        print(r.url)
+                        err = r.text
+                        try:
+                            text_json = json.loads(r.text)
+                        except ValueError:
+                            text_json = dict()
+                        if isinstance(text_json, dict) and 'errors' in text_json.keys():
+                            err = text_json['errors']
+                        raise requests.exceptions.HTTPError(err, response=r)
+                    elif r.status_code == 404:
+                        print(name)
+                        raise requests.exceptions.HTTPError(response=r)
+                    elif r.status_code == 429:
+                        retry_after = _retry_after(r)
+                        if retry_after is None or n_tries == self.max_tries:
+                            raise RuntimeError("Maximum API request rate exceeded!")
+                        delay = min(retry_after, self.max_backoff)
+                        logger.warning(f"Rate limited downloading {name}, retrying in {delay:.1f} s")
+                    elif r.status_code == 416 and restart is not None:
+                        # the partial download cannot be resumed, start over
+                        restart()
+                    else:
+                        # don't repeat endlessly (and exceed request limit) if API returns unexpected code
+                        logger.warning(f"Unexpected status {r.status_code} downloading {name}")
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError,
+                    requests.exceptions.ChunkedEncodingError) as e:
+                logger.warning(f"Attempt {n_tries} of {self.max_tries} downloading {name} failed: {e}")
+            if n_tries < self.max_tries:
+                time.sleep(delay)
+        return None
+
+    def _backoff_delay(self, n_tries: int) -> float:
+        return min(self.backoff * 2 ** (n_tries - 1), self.max_backoff)
+
+
+def _retry_after(r: requests.Response) -> Optional[float]:
+    """Returns the number of seconds to wait before retrying a rate limited request, if the server says so."""
+    value = r.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.)
+    except (TypeError, ValueError):
+        return None
+
+
+@contextmanager
+def _exclusive_lock(lock_path: Path):
+    """Holds an exclusive lock on `lock_path` across threads and processes, removing the lock file when released.
+
+    Without fcntl, e.g., on Windows, downloads are not locked.
+    """
+    if fcntl is None:
+        yield
+        return
+
+    while True:
+        lock_file = open(lock_path, "a")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            # the previous holder removes the lock file on release, so lock the current file rather than a removed one
+            if os.path.samestat(os.fstat(lock_file.fileno()), os.stat(lock_path)):
+                break
+        except FileNotFoundError:
+            pass
+        except BaseException:
+            lock_file.close()
+            raise
+        lock_file.close()
+
+    try:
+        yield
+    finally:
+        # removed before the lock is released, so every waiter locks a new file
+        os.remove(lock_path)
+        lock_file.close()
+
+
+def _write_atomic(filename: Path, text: str):
+    with atomic_write(filename, "w") as f:
+        f.write(text)
+
+
+_download_manager = None
+_download_manager_lock = threading.Lock()
+
+
+def get_download_manager() -> DownloadManager:
+    """Returns the download manager shared by all resource downloads."""
+    global _download_manager
+    with _download_manager_lock:
+        if _download_manager is None:
+            _download_manager = DownloadManager()
+        return _download_manager
+
+
+def set_download_manager(manager: DownloadManager):
+    """Replaces the download manager shared by all resource downloads, e.g., to change its concurrency or retries."""
+    global _download_manager
+    with _download_manager_lock:
+        _download_manager = manager
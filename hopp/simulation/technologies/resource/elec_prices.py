@@ -13,7 +13,7 @@ class ElectricityPrices(Resource):
     """
 
     """
-    def __init__(self, lat, lon, year, path_resource="", filepath=""):
+    def __init__(self, lat, lon, year, path_resource="", filepath="", use_cache=None):
         """
 
         :param lat: float
@@ -21,9 +21,10 @@ class ElectricityPrices(Resource):
         :param year: int
         :param path_resource: directory where to save downloaded files
         :param filepath: file path of resource file to load
+        :param use_cache: whether to cache the parsed resource file, see `Resource`, defaults to `Resource.use_cache`
         :param kwargs:
         """
-        super().__init__(lat, lon, year)
+        super().__init__(lat, lon, year, use_cache=use_cache)
 
         if os.path.isdir(path_resource):
             self.path_resource = path_resource
@@ -49,10 +50,13 @@ class ElectricityPrices(Resource):
     def format_data(self):
         if not os.path.isfile(self.filename):
             raise IOError(f"ElectricityPrices error: {self.filename} does not exist.")
+        self._data = self.load_data(self.filename, self._parse_resource_file)
+
+    def _parse_resource_file(self):
         try:
-            self._data = np.loadtxt(self.filename)
+            return np.loadtxt(self.filename)
         except ValueError:
-            self._data = np.loadtxt(self.filename, skiprows=1)
+            return np.loadtxt(self.filename, skiprows=1)
 
     def data(self):
         if not os.path.isfile(self.filename):
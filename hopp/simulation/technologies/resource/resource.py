@@ -1,18 +1,43 @@
 from abc import ABCMeta, abstractmethod
 import os
-import json
-import requests
-import time
 from pathlib import Path
+from typing import Optional
 from hopp import ROOT_DIR
+from hopp.simulation.technologies.resource.download_manager import get_download_manager
+from hopp.simulation.technologies.resource.resource_cache import (
+    load_resource_data_with_arrays,
+    resource_data_as_arrays,
+)
+
+
+def _format_units(text):
+    # degree signs are garbled when the API doesn't declare the encoding of its response
+    for degree in ("Â°", "°"):
+        text = text.replace(f"({degree}C)", "(C)").replace(f"({degree})", "(deg)")
+    return text
+
 
 class Resource(metaclass=ABCMeta):
     """
     Class to manage resource data for a given lat & lon. If a resource file doesn't exist,
     it is downloaded and saved to 'resource_files' folder. The resource file is then read
     to the appropriate SAM resource data format.
+
+    Parsed resource files can be cached in binary files, see
+    `hopp.simulation.technologies.resource.resource_cache.load_resource_data`. Caching is off by default. Set
+    `use_cache` to True, for the class, with the `use_cache` argument of a resource or with SiteInfo's
+    `use_resource_cache`, to write the caches to the user cache directory (``$HOPP_RESOURCE_CACHE_DIR``, or
+    ``hopp/resource`` in ``$XDG_CACHE_HOME`` or ``~/.cache``), or set `cache_dir` to cache elsewhere.
+
+    `data` holds the resource data in SAM's format, with lists that can be passed to PySAM. `data_arrays` holds the
+    same data with its sequences as arrays, which are memory-mapped read-only if they were read from the cache.
     """
-    def __init__(self, lat, lon, year, **kwargs):
+    #: whether to load parsed resource data from a binary cache of the resource file
+    use_cache: bool = False
+    #: directory of the binary caches, defaults to `resource_cache.default_resource_cache_dir`
+    cache_dir: Optional[str] = None
+
+    def __init__(self, lat, lon, year, use_cache: Optional[bool] = None, **kwargs):
         """
         Parameters
         ---------
@@ -22,6 +47,8 @@ class Resource(metaclass=ABCMeta):
             The longitude
         year: int
             The year of resource_files data
+        use_cache: bool, optional
+            Whether to cache the parsed resource file, defaults to the class attribute `Resource.use_cache`
         """
 
         self.latitude = lat
@@ -42,11 +69,15 @@ class Resource(metaclass=ABCMeta):
         self.path_current = os.path.dirname(os.path.abspath(__file__))
         self.path_resource = os.path.join(ROOT_DIR, 'simulation', 'resource_files')
         self.filename = None #: filepath of resource data file, defaults to None
+        self.use_cache = Resource.use_cache if use_cache is None else use_cache
+        self.cache_dir = Resource.cache_dir
         
         # update any passed in
         self.__dict__.update(kwargs)
 
         self._data = dict()
+        # the data the arrays were made of, and the arrays
+        self._data_arrays = None
 
     def check_download_dir(self):
         """Creates directory for the resource file if it does not exist.
@@ -59,6 +90,9 @@ class Resource(metaclass=ABCMeta):
     @staticmethod
     def call_api(url, filename):
         """
+        Downloads with the shared download manager, see
+        `hopp.simulation.technologies.resource.download_manager.DownloadManager.download`.
+
         Args:
             url (str): The API endpoint to return data from
             filename (str): The filename where data should be written
@@ -67,40 +101,20 @@ class Resource(metaclass=ABCMeta):
             True if downloaded file successfully, False if encountered error in downloading
             
         """
+        return get_download_manager().download(url, filename, transform=_format_units)
 
-        n_tries = 0
-        success = False
-        while n_tries < 5:
-
-            try:
-                r = requests.get(url)
-                if r:
-                    localfile = open(filename, mode='w+')
-                    txt = r.text.replace("(Â°C)","(C)").replace("(Â°)","(deg)")
-                    localfile.write(txt)
-                    localfile.close()
-                    if os.path.isfile(filename):
-                        success = True
-                        break
-                elif r.status_code == 400 or r.status_code == 403:
-                    print(r.url)
-                    err = r.text
-                    text_json = json.loads(r.text)
-                    if 'errors' in text_json.keys():
-                        err = text_json['errors']
-                    raise requests.exceptions.HTTPError(err)
-                elif r.status_code == 404:
-                    print(filename)
-                    raise requests.exceptions.HTTPError
-                elif r.status_code == 429:
-                    raise RuntimeError("Maximum API request rate exceeded!")
-                else:
-                    n_tries += 1 # Won't repeat endlessly (and exceed request limit) if API returns unexpected code
-            except requests.exceptions.Timeout:
-                time.sleep(0.2)
-                n_tries += 1
-
-        return success
+    @staticmethod
+    def call_api_many(items):
+        """
+        Concurrently downloads several files with the shared download manager.
+
+        Args:
+            items (list): Pairs of API endpoint and the filename where its data should be written
+
+        Returns:
+            list of True if downloaded file successfully, False if encountered error in downloading, per file
+        """
+        return get_download_manager().download_many(items, transform=_format_units)
 
     @abstractmethod
     def download_resource(self):
@@ -115,6 +129,32 @@ class Resource(metaclass=ABCMeta):
         """Get data as dictionary formatted for SAM"""
         return self._data
 
+    @property
+    def data_arrays(self):
+        """Get data with its sequences as arrays, memory-mapped read-only if they were read from the cache"""
+        if self._data_arrays is None or self._data_arrays[0] is not self._data:
+            self._data_arrays = (self._data, resource_data_as_arrays(self._data))
+        return self._data_arrays[1]
+
+    def load_data(self, filename, parse, **kwargs):
+        """
+        Loads the parsed resource file, from its binary cache if `use_cache` is True, and keeps its arrays for
+        `data_arrays`. See `resource_cache.load_resource_data` for the arguments.
+
+        :return: the parsed resource data
+        """
+        data, arrays = load_resource_data_with_arrays(
+            filename, parse, use_cache=self.use_cache, cache_dir=self.cache_dir, **kwargs
+        )
+        self._data_arrays = None if arrays is None else (data, arrays)
+        return data
+
+    def __getstate__(self):
+        # the arrays are made again when they are accessed, instead of being copied with the data
+        state = self.__dict__.copy()
+        state['_data_arrays'] = None
+        return state
+
     @data.setter
     @abstractmethod
     def data(self, data_dict):
@@ -0,0 +1,272 @@
+import glob
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Callable, Optional, Tuple, Union
+
+import numpy as np
+
+from hopp.utilities.atomic_write import atomic_write
+from hopp.utilities.log import hybrid_logger as logger
+
+#: version of the cache file format and of the resource parsers, caches written by other versions are reparsed. Bump
+#: it when a change to a parser is not detected by `parser_fingerprint`, e.g., a change to a function it calls.
+RESOURCE_CACHE_VERSION = 4
+
+#: suffix of the metadata files of the resource caches, the arrays are stored in .npy files next to them
+RESOURCE_CACHE_SUFFIX = ".hopp_cache.json"
+
+#: environment variable that overrides the default resource cache directory
+RESOURCE_CACHE_DIR_ENV = "HOPP_RESOURCE_CACHE_DIR"
+
+
+def default_resource_cache_dir() -> Path:
+    """Returns the default resource cache directory.
+
+    This is ``$HOPP_RESOURCE_CACHE_DIR`` if set, otherwise ``hopp/resource`` in the user cache directory
+    (``$XDG_CACHE_HOME``, or ``~/.cache``), so caches are never written into the installed package.
+    """
+    cache_dir = os.environ.get(RESOURCE_CACHE_DIR_ENV)
+    if cache_dir:
+        return Path(cache_dir)
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(cache_home) / "hopp" / "resource"
+
+
+def resource_cache_path(filename: Union[str, Path], cache_dir: Optional[Union[str, Path]] = None) -> Path:
+    """Returns the path of the metadata file of the binary cache of a resource file.
+
+    The cache file is named after the resource file and a hash of its absolute path, so resource files with the same
+    name in different directories have separate caches.
+
+    Args:
+        filename: path to the resource file
+        cache_dir: directory of the cache files, defaults to `default_resource_cache_dir`
+    """
+    filename = Path(filename)
+    if cache_dir is None:
+        cache_dir = default_resource_cache_dir()
+    path_hash = hashlib.sha256(str(filename.resolve()).encode()).hexdigest()[:16]
+    return Path(cache_dir) / f"{filename.name}.{path_hash}{RESOURCE_CACHE_SUFFIX}"
+
+
+def parser_fingerprint(parser: Callable) -> str:
+    """Returns the identity of a parse function, its qualified name and a hash of its code.
+
+    Changes to the function itself, including nested functions and lambdas, change the fingerprint. Changes to other
+    functions it calls do not, see `RESOURCE_CACHE_VERSION`.
+    """
+    function = getattr(parser, "__func__", parser)
+    name = f"{getattr(function, '__module__', '')}.{getattr(function, '__qualname__', type(function).__qualname__)}"
+    code = getattr(function, "__code__", None)
+    if code is None:
+        return name
+    code_hash = hashlib.sha256()
+    _hash_code(code_hash, code)
+    return f"{name}:{code_hash.hexdigest()}"
+
+
+def _hash_code(code_hash, code):
+    code_hash.update(code.co_code)
+    for const in code.co_consts:
+        if hasattr(const, "co_code"):
+            _hash_code(code_hash, const)
+        elif isinstance(const, frozenset):
+            # the iteration order of sets of strings changes between interpreter runs
+            code_hash.update(repr(sorted(repr(c) for c in const)).encode())
+        else:
+            code_hash.update(repr(const).encode())
+    code_hash.update(repr(code.co_names).encode())
+
+
+def resource_cache_key(
+    filename: Union[str, Path],
+    options: Optional[dict] = None,
+    parser: Optional[Callable] = None,
+) -> str:
+    """Returns the cache key of a resource file, a hash of the file contents, the parse options and the parser."""
+    key = hashlib.sha256()
+    with open(filename, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            key.update(block)
+    key.update(json.dumps({
+        "version": RESOURCE_CACHE_VERSION,
+        "options": options,
+        "parser": None if parser is None else parser_fingerprint(parser),
+    }, sort_keys=True).encode())
+    return key.hexdigest()
+
+
+def load_resource_data(
+    filename: Union[str, Path],
+    parse: Callable[[], Union[dict, np.ndarray]],
+    options: Optional[dict] = None,
+    use_cache: bool = True,
+    parser: Optional[Callable] = None,
+    cache_dir: Optional[Union[str, Path]] = None,
+) -> Union[dict, np.ndarray]:
+    """Loads parsed resource data from the binary cache of `filename`, or parses the file and writes the cache.
+
+    The cache is a JSON metadata file in `cache_dir` with an uncompressed ``.npy`` file per sequence, keyed by a hash
+    of the file contents, `options` and the fingerprint of `parser`, so it is reparsed whenever the file or the way it
+    is parsed changes. Scalars are stored in the metadata. Sequences are returned as the same type they were parsed
+    as (list, tuple or array), so the data can be passed to PySAM's resource data tables, which do not accept arrays;
+    see `load_resource_data_with_arrays` for the memory-mapped arrays. If the cache cannot be written, e.g., in a
+    read-only directory, the parsed data is returned without caching.
+
+    Args:
+        filename: path to the resource file
+        parse: function that parses the resource file, returning either a dictionary of scalars and sequences or an
+            array
+        options: parse options that change the parsed data, e.g., the parser arguments
+        use_cache: if False, always parse the resource file
+        parser: the function that does the parsing, if `parse` wraps it, e.g., a lambda; defaults to `parse`
+        cache_dir: directory of the cache files, defaults to `default_resource_cache_dir`
+
+    Returns:
+        the parsed resource data
+    """
+    return load_resource_data_with_arrays(filename, parse, options, use_cache, parser, cache_dir)[0]
+
+
+def load_resource_data_with_arrays(
+    filename: Union[str, Path],
+    parse: Callable[[], Union[dict, np.ndarray]],
+    options: Optional[dict] = None,
+    use_cache: bool = True,
+    parser: Optional[Callable] = None,
+    cache_dir: Optional[Union[str, Path]] = None,
+) -> Tuple[Union[dict, np.ndarray], Optional[Union[dict, np.ndarray]]]:
+    """Loads parsed resource data like `load_resource_data`, together with its sequences as arrays.
+
+    Arrays read from the cache are memory-mapped read-only, so processes loading the same resource file share them.
+
+    Returns:
+        the parsed resource data, and the data with its sequences as arrays, or None if the data is not cached
+    """
+    if not use_cache:
+        return parse(), None
+
+    key = resource_cache_key(filename, options, parse if parser is None else parser)
+    cache_path = resource_cache_path(filename, cache_dir)
+    if cache_path.is_file():
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta["key"] == key:
+                arrays = {
+                    name: np.load(_array_path(cache_path, key, index), mmap_mode="r", allow_pickle=False)
+                    for index, name in enumerate(meta["kinds"])
+                }
+                return _decode(meta, arrays), _decode(meta, arrays, as_arrays=True)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Could not read resource cache {cache_path}: {e}")
+
+    data = parse()
+    try:
+        meta, arrays = _encode(key, data)
+    except TypeError as e:
+        logger.warning(f"Could not cache resource data of {filename}: {e}")
+        return data, None
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        _write_cache(cache_path, meta, arrays)
+    except OSError as e:
+        logger.warning(f"Could not write resource cache {cache_path}: {e}")
+    # return the same types whether or not the data was read from the cache
+    return _decode(meta, arrays), _decode(meta, arrays, as_arrays=True)
+
+
+def resource_data_as_arrays(data: Union[dict, np.ndarray]) -> Union[dict, np.ndarray]:
+    """Returns resource data with its sequences converted to arrays, e.g., of resource data that is not cached."""
+    if not isinstance(data, dict):
+        return np.asarray(data)
+    return {
+        name: value if isinstance(value, (str, bool, int, float)) or value is None else np.asarray(value)
+        for name, value in data.items()
+    }
+
+
+def _encode(key: str, data: Union[dict, np.ndarray]) -> Tuple[dict, dict]:
+    """Splits resource data into JSON metadata, including scalar values, and arrays."""
+    is_array = not isinstance(data, dict)
+    if is_array:
+        data = {"data": data}
+
+    scalars = dict()
+    kinds = dict()
+    arrays = dict()
+    for name, value in data.items():
+        if isinstance(value, np.ndarray):
+            kinds[name] = "array"
+        elif isinstance(value, tuple):
+            kinds[name] = "tuple"
+        elif isinstance(value, (str, bool, int, float)) or value is None:
+            scalars[name] = value
+            continue
+        else:
+            # lists and other sequences, e.g., pandas Series
+            kinds[name] = "list"
+        array = np.asarray(value)
+        if array.dtype == object:
+            raise TypeError(f"resource data '{name}' cannot be stored as an array")
+        arrays[name] = array
+
+    meta = {
+        "key": key,
+        "is_array": is_array,
+        "order": list(data.keys()),
+        "scalars": scalars,
+        "kinds": kinds,
+    }
+    return meta, arrays
+
+
+def _decode(meta: dict, arrays: dict, as_arrays: bool = False) -> Union[dict, np.ndarray]:
+    """Reassembles resource data from its metadata and arrays, with its sequences as the types they were parsed as, or
+    as the given arrays if `as_arrays` is True."""
+    data = dict(meta["scalars"])
+    for name, kind in meta["kinds"].items():
+        if as_arrays:
+            data[name] = arrays[name]
+        elif kind == "list":
+            data[name] = arrays[name].tolist()
+        elif kind == "tuple":
+            data[name] = tuple(arrays[name].tolist())
+        else:
+            # a writable copy, independent of the arrays
+            data[name] = np.array(arrays[name])
+
+    if meta["is_array"]:
+        return data["data"]
+    return {name: data[name] for name in meta["order"]}
+
+
+def _array_path(cache_path: Path, key: str, index: int) -> Path:
+    """Returns the path of an array of a resource cache, named after the cache key so writers of different versions of
+    a resource file do not overwrite each other's arrays."""
+    stem = cache_path.name[:-len(RESOURCE_CACHE_SUFFIX)]
+    return cache_path.parent / f"{stem}.{key[:16]}.{index}.npy"
+
+
+def _write_cache(cache_path: Path, meta: dict, arrays: dict):
+    # the arrays are written before the metadata that refers to them
+    array_paths = set()
+    for index, array in enumerate(arrays.values()):
+        array_path = _array_path(cache_path, meta["key"], index)
+        with atomic_write(array_path, "wb") as f:
+            np.save(f, array, allow_pickle=False)
+        array_paths.add(array_path)
+    with atomic_write(cache_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+
+    # remove the arrays of earlier versions of the resource file
+    stem = cache_path.name[:-len(RESOURCE_CACHE_SUFFIX)]
+    for array_path in cache_path.parent.glob(f"{glob.escape(stem)}.*.npy"):
+        if array_path not in array_paths:
+            try:
+                array_path.unlink()
+            except OSError:
+                pass
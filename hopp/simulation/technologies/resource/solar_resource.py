@@ -32,6 +32,7 @@ class SolarResource(Resource):
         filepath: Union[str, Path] ="", 
         use_api: bool = False,
         resource_data: Optional[dict] = None,
+        use_cache: Optional[bool] = None,
         **kwargs
     ):
         """Resource class to download solar resource data using API call or set with preloaded dictionary
@@ -44,9 +45,10 @@ class SolarResource(Resource):
             filepath (Union[str, Path], optional): full filepath to solar resource data file. Defaults to "".
             use_api (bool, optional): Make an API call even if there's an existing file. Defaults to False.
             resource_data (Optional[dict], optional): dictionary of preloaded and formatted solar resource data. Defaults to None.
+            use_cache (Optional[bool], optional): whether to cache the parsed resource file, see `Resource`. Defaults to `Resource.use_cache`.
             kwargs: extra kwargs
         """
-        super().__init__(lat, lon, year)
+        super().__init__(lat, lon, year, use_cache=use_cache)
 
         # if resource_data is input as a dictionary then set_data
         if isinstance(resource_data,dict):
@@ -127,24 +129,34 @@ class SolarResource(Resource):
             self._data = data_info
             self.filename = None
         else:
-            self._data = SAM_CSV_to_solar_data(data_info)
-            # TODO: Update ResourceTools.py in pySAM to include pressure and dew point or relative humidity
-            with open(data_info) as file_in:
-                wfd = defaultdict(list)
-                for i in range(2):
-                    file_in.readline()
-                reader = csv.DictReader(file_in)
-                for row in reader:
-                    for col, dat in row.items():
-                        if len(col) > 0:
-                            wfd[col].append(float(dat))
-
-            if 'Dew Point' in wfd:
-                self._data['tdew'] = wfd.pop('Dew Point')
-            elif 'RH' in wfd:
-                self._data['rh'] = wfd.pop('RH')
-            elif 'Pressure' in wfd:
-                self._data['pres'] = wfd.pop('Pressure')
+            self._data = self.load_data(
+                data_info,
+                lambda: self._parse_resource_file(data_info),
+                parser=SolarResource._parse_resource_file,
+            )
+
+    @staticmethod
+    def _parse_resource_file(filename) -> dict:
+        """Parses an NSRDB CSV file into a 'solar_resource_data' dictionary."""
+        data = SAM_CSV_to_solar_data(filename)
+        # TODO: Update ResourceTools.py in pySAM to include pressure and dew point or relative humidity
+        with open(filename) as file_in:
+            wfd = defaultdict(list)
+            for i in range(2):
+                file_in.readline()
+            reader = csv.DictReader(file_in)
+            for row in reader:
+                for col, dat in row.items():
+                    if len(col) > 0:
+                        wfd[col].append(float(dat))
+
+        if 'Dew Point' in wfd:
+            data['tdew'] = wfd.pop('Dew Point')
+        elif 'RH' in wfd:
+            data['rh'] = wfd.pop('RH')
+        elif 'Pressure' in wfd:
+            data['pres'] = wfd.pop('Pressure')
+        return data
 
 
     def roll_timezone(self, roll_hours:Union[int,float], timezone:int):
@@ -167,4 +179,6 @@ class SolarResource(Resource):
                 self._data[key] = weather_array_rolled.tolist()
 
         self._data['tz'] = timezone
+        # the arrays are made again from the rolled data
+        self._data_arrays = None
         logger.info('Rolled solar data by {} hours for timezone {}'.format(roll_hours, timezone))
@@ -1,4 +1,5 @@
 import os
+from typing import Optional
 import pandas as pd
 import PySAM.TidalFileReader as tidalfile
 
@@ -20,6 +21,7 @@ class TidalResource(Resource):
         year: int, 
         path_resource: str = "", 
         filepath: str = "", 
+        use_cache: Optional[bool] = None,
         **kwargs
     ):
         """
@@ -31,6 +33,7 @@ class TidalResource(Resource):
             year (int): Year of the resource data.
             path_resource (str, optional): Directory where downloaded files are saved. Defaults to "".
             filepath (str, optional): File path of the resource file to load. Defaults to "".
+            use_cache (bool, optional): Whether to cache the parsed resource file, see `Resource`. Defaults to `Resource.use_cache`.
             **kwargs: Additional keyword arguments.
 
         Notes:
@@ -44,7 +47,7 @@ class TidalResource(Resource):
             Example file: 
                 `hopp/simulation/resource_files/tidal/Tidal_resource_timeseries.csv`
         """
-        super().__init__(lat, lon, year)
+        super().__init__(lat, lon, year, use_cache=use_cache)
 
         if os.path.isdir(path_resource):
             self.path_resource = path_resource
@@ -102,6 +105,10 @@ class TidalResource(Resource):
         If the time series is incomplete (less than 8760 hours), the function 
         linearly interpolates missing values to create a complete hourly dataset.
         """
+        self._data = self.load_data(self.filename, self._parse_resource_file)
+
+    def _parse_resource_file(self) -> dict:
+        """Reads the resource file with PySAM and formats it as a dictionary, see `data`."""
         tidalfile_model = tidalfile.new()
         #Load resource file
         tidalfile_model.WeatherReader.tidal_resource_filename = str(self.filename)
@@ -158,4 +165,4 @@ class TidalResource(Resource):
         else:
             raise ValueError("Resource time-series cannot be subhourly.")
 
-        self._data = dic
\ No newline at end of file
+        return dic
\ No newline at end of file
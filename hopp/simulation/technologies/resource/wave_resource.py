@@ -1,3 +1,5 @@
+from typing import Optional
+
 import pandas as pd
 import PySAM.WaveFileReader as wavefile
 
@@ -20,6 +22,7 @@ class WaveResource(Resource):
         year: int, 
         path_resource: str = "", 
         filepath: str = "", 
+        use_cache: Optional[bool] = None,
         **kwargs
     ):
         """
@@ -31,6 +34,7 @@ class WaveResource(Resource):
             year (int): Year of the resource data.
             path_resource (str, optional): Directory where downloaded files are saved. Defaults to "".
             filepath (str, optional): File path of the resource file to load. Defaults to "".
+            use_cache (bool, optional): Whether to cache the parsed resource file, see `Resource`. Defaults to `Resource.use_cache`.
             **kwargs: Additional keyword arguments.
 
         Notes:
@@ -45,7 +49,7 @@ class WaveResource(Resource):
             Example file: 
             `hopp/simulation/resource_files/wave/Wave_resource_timeseries.csv`
         """
-        super().__init__(lat, lon, year)
+        super().__init__(lat, lon, year, use_cache=use_cache)
 
         if os.path.isdir(path_resource):
             self.path_resource = path_resource
@@ -108,6 +112,10 @@ class WaveResource(Resource):
         If the time series is incomplete (less than 8760 hours), the function 
         linearly interpolates missing values to create a complete hourly dataset.
         """
+        self._data = self.load_data(self.filename, self._parse_resource_file)
+
+    def _parse_resource_file(self) -> dict:
+        """Reads the resource file with PySAM and formats it as a dictionary, see `data`."""
         wavefile_model = wavefile.new()
         #Load resource file
         wavefile_model.WeatherReader.wave_resource_filename_ts = str(self.filename)
@@ -169,4 +177,4 @@ class WaveResource(Resource):
         else:
             raise ValueError("Resource time-series cannot be subhourly.")
 
-        self._data = dic
\ No newline at end of file
+        return dic
\ No newline at end of file
@@ -38,6 +38,7 @@ class WindResource(Resource):
         source: str ="WTK", 
         use_api: bool = False,
         resource_data: Optional[dict] = None,
+        use_cache: Optional[bool] = None,
         **kwargs
     ):
         """Resource class to download wind resource data using API call or set with preloaded dictionary
@@ -52,9 +53,10 @@ class WindResource(Resource):
             source (str): Which API to use. Options are TAP and WIND Toolkit (WTK).
             use_api (bool, optional): Make an API call even if there's an existing file. Defaults to False.
             resource_data (Optional[dict], optional): dictionary of preloaded and formatted wind resource data. Defaults to None.
+            use_cache (Optional[bool], optional): whether to cache the parsed resource file, see `Resource`. Defaults to `Resource.use_cache`.
             kwargs: extra kwargs
         """
-        super().__init__(lat, lon, year)   
+        super().__init__(lat, lon, year, use_cache=use_cache)   
 
         # if resource_data is input as a dictionary then set_data   
         if isinstance(resource_data,dict):
@@ -127,7 +129,7 @@ class WindResource(Resource):
         self.calculate_heights_to_download()
 
     def download_resource(self):
-        success = False
+        downloads = []
 
         for height, f in self.file_resource_heights.items():
             url = ""
@@ -141,7 +143,10 @@ class WindResource(Resource):
                     base=TAP_BASE_URL, year=self.year, lat=self.latitude, lon=self.longitude, hubheight=height
                 )
 
-            success = self.call_api(url, filename=f)
+            downloads.append((url, f))
+
+        # heights are downloaded concurrently over the shared session
+        success = all(self.call_api_many(downloads))
 
         if not success:
             raise ValueError('Unable to download wind data')
@@ -186,4 +191,8 @@ class WindResource(Resource):
         if isinstance(data_info,dict):
             self._data = data_info
         else:
-            self._data = SRW_to_wind_data(data_info)
+            self._data = self.load_data(
+                data_info,
+                lambda: SRW_to_wind_data(data_info),
+                parser=SRW_to_wind_data,
+            )
@@ -77,6 +77,9 @@ class SiteInfo(BaseClass):
         wind_resource_origin: Which wind resource API to use, defaults to "WTK" for WIND Toolkit.
             Options are "WTK", "TAP" or "BC-HRRR".
         site_buffer (Optional): value to buffer site polygon. Defaults to 1e-8.
+        use_resource_cache: Whether to cache the parsed solar, wind, wave, tidal and price files in binary files in
+            the user cache directory (``$HOPP_RESOURCE_CACHE_DIR``, or ``hopp/resource`` in ``$XDG_CACHE_HOME`` or
+            ``~/.cache``), so later simulations of the same files skip parsing them. Defaults to False.
         solar_resource (Optional): dictionary or object containing solar resource data.
         wind_resource (Optional): dictionary or object containing wind resource data.
         wind_resource_region (Optional): which region to use for wind resource data. Defaults to "conus". Options are: 
@@ -140,6 +143,7 @@ class SiteInfo(BaseClass):
     wind_resource_region: str = field(default="conus", validator=contains(["conus", "ak"]), converter=(str.strip, str.lower))
 
     site_buffer: Optional[float] = field(default = 1e-8)
+    use_resource_cache: bool = field(default=False)
 
     # Set in post init hook
     lat: hopp_float_type = field(init=False)
@@ -221,10 +225,10 @@ class SiteInfo(BaseClass):
             if self.elev is None:
                 self.elev = data['elev']
         if self.wave:
-            self.wave_resource = WaveResource(data['lat'], data['lon'], data['year'], filepath = self.wave_resource_file)
+            self.wave_resource = WaveResource(data['lat'], data['lon'], data['year'], filepath = self.wave_resource_file, use_cache=self.use_resource_cache)
             self.n_timesteps = 8760
         if self.tidal:
-            self.tidal_resource = TidalResource(data['lat'], data['lon'], data['year'], filepath = self.tidal_resource_file)
+            self.tidal_resource = TidalResource(data['lat'], data['lon'], data['year'], filepath = self.tidal_resource_file, use_cache=self.use_resource_cache)
             self.n_timesteps = 8760
         if self.wind:
             # TODO: allow hub height to be used as an optimization variable
@@ -235,7 +239,7 @@ class SiteInfo(BaseClass):
             elif self.n_timesteps != n_timesteps:
                 raise ValueError(f"Wind resource timesteps of {n_timesteps} different than other resource timesteps of {self.n_timesteps}")
 
-        self.elec_prices = ElectricityPrices(data['lat'], data['lon'], data['year'], filepath=self.grid_resource_file)
+        self.elec_prices = ElectricityPrices(data['lat'], data['lon'], data['year'], filepath=self.grid_resource_file, use_cache=self.use_resource_cache)
         self.n_periods_per_day = self.n_timesteps // 365  # TODO: Does not handle leap years well
         self.interval = int((60*24)/self.n_periods_per_day)
         self.urdb_label = data['urdb_label'] if 'urdb_label' in data.keys() else None
@@ -359,7 +363,7 @@ class SiteInfo(BaseClass):
 
         if self.solar_resource is None:
             if self.renewable_resource_origin == "API":
-                solar_resource = SolarResource(solar_lat, solar_lon, solar_year, path_resource=self.path_resource, filepath=self.solar_resource_file)
+                solar_resource = SolarResource(solar_lat, solar_lon, solar_year, path_resource=self.path_resource, filepath=self.solar_resource_file, use_cache=self.use_resource_cache)
             else:
                 solar_resource = HPCSolarData(solar_lat, solar_lon, solar_year,nsrdb_source_path = self.nsrdb_source_path, filepath=self.solar_resource_file)
             return solar_resource
@@ -412,7 +416,8 @@ class SiteInfo(BaseClass):
                                    wind_turbine_hub_ht=self.hub_height,
                                    path_resource=self.path_resource, 
                                    filepath=self.wind_resource_file, 
-                                   source=self.wind_resource_origin)
+                                   source=self.wind_resource_origin,
+                                   use_cache=self.use_resource_cache)
             elif self.wind_resource_origin == "BC-HRRR":
                 return BCHRRRWindData(wind_lat, wind_lon, wind_year, 
                                      hub_height_meters=self.hub_height,
@@ -1,3 +1,5 @@
+from collections import OrderedDict
+import hashlib
 from pathlib import Path
 from typing import TYPE_CHECKING, Tuple
 
@@ -49,6 +51,9 @@ class Floris(BaseClass):
     turb_velocities: np.ndarray = field(init = False)
     turb_powers: np.ndarray = field(init = False)
 
+    # wind-rose bin results, keyed by floris layout and then by (wind direction, wind speed) bin
+    _bin_cache: OrderedDict = field(init = False)
+
     def __attrs_post_init__(self):
         """Set-up and initialize floris_config and floris model. This method does the following:
 
@@ -83,6 +88,7 @@ class Floris(BaseClass):
         self.fi = FlorisModel(floris_config)
         self._timestep = self.config.timestep
         self._operational_losses = self.config.operational_losses
+        self._bin_cache = OrderedDict()
         
         if self.config.resource_parse_method == "average":
             self.speeds, self.wind_dirs = parse_resource_data(self.site.wind_resource)
@@ -207,6 +213,7 @@ class Floris(BaseClass):
         """
         if value is not None:
             self.fi.set(**{name:value})
+            self.clear_bin_cache()
     
     def set_floris_param(self, param, value):
         """Set parameter of FlorisModel object using the `set_param` function.
@@ -217,6 +224,7 @@ class Floris(BaseClass):
         """
         if value is not None:
             self.fi.set_param(param,value)
+            self.clear_bin_cache()
     
     def get_floris_param(self, param):
         """Get parameter of FlorisModel object using the `get_param` function.
@@ -250,21 +258,29 @@ class Floris(BaseClass):
         power_turbines = np.zeros((self.nTurbs, 8760))
         power_farm = np.zeros(8760)
 
-        time_series = TimeSeries(
-            wind_directions=self.wind_dirs[self.start_idx:self.end_idx],
-            wind_speeds=self.speeds[self.start_idx:self.end_idx],
-            turbulence_intensities=self.fi.core.flow_field.turbulence_intensities[0]
-        )
+        wind_dirs = self.wind_dirs[self.start_idx:self.end_idx]
+        speeds = self.speeds[self.start_idx:self.end_idx]
+        if self.config.floris_wind_rose_binning:
+            turbine_powers, turbine_velocities = self.run_binned_floris(wind_dirs, speeds)
+            power_turbines[:, self.start_idx:self.end_idx] = turbine_powers.T
+            power_farm[self.start_idx:self.end_idx] = turbine_powers.sum(axis=1)
+        else:
+            time_series = TimeSeries(
+                wind_directions=wind_dirs,
+                wind_speeds=speeds,
+                turbulence_intensities=self.fi.core.flow_field.turbulence_intensities[0]
+            )
 
-        self.fi.set(wind_data=time_series)
-        self.fi.run()
+            self.fi.set(wind_data=time_series)
+            self.fi.run()
 
-        power_turbines[:, self.start_idx:self.end_idx] = self.fi.get_turbine_powers().reshape(
-            (self.nTurbs, self.end_idx - self.start_idx)
-        )
-        power_farm[self.start_idx:self.end_idx] = self.fi.get_farm_power().reshape(
-            (self.end_idx - self.start_idx)
-        )
+            power_turbines[:, self.start_idx:self.end_idx] = self.fi.get_turbine_powers().reshape(
+                (self.nTurbs, self.end_idx - self.start_idx)
+            )
+            power_farm[self.start_idx:self.end_idx] = self.fi.get_farm_power().reshape(
+                (self.end_idx - self.start_idx)
+            )
+            turbine_velocities = self.fi.turbine_average_velocities
 
         operational_efficiency = ((100 - self._operational_losses)/100)
         # Adding losses from PySAM defaults (excluding turbine and wake losses)
@@ -275,8 +291,71 @@ class Floris(BaseClass):
         self.annual_energy_pre_curtailment_ac = np.sum(self.gen) # kWh
         if self.config.store_turbine_performance_results:
             self.turb_powers = power_turbines * operational_efficiency / 1000 # kW
-            self.turb_velocities = self.fi.turbine_average_velocities
-        
+            self.turb_velocities = turbine_velocities
+
+    def run_binned_floris(self, wind_dirs, speeds):
+        """Simulate the wind farm on a wind rose of (wind direction, wind speed) bins. Each timestep is
+        assigned to the nearest bin center, FLORIS is only run for bins that are not already cached for the
+        current layout, and the bin results are mapped back to the timesteps.
+
+        Args:
+            wind_dirs (np.ndarray): wind direction of each timestep in degrees.
+            speeds (np.ndarray): wind speed of each timestep in m/s.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: turbine powers in W and turbine average velocities in m/s,
+                both with shape (number of timesteps, number of turbines).
+        """
+        direction_width = self.config.wind_direction_bin_width
+        speed_width = self.config.wind_speed_bin_width
+        bin_dirs = np.mod(np.round(np.asarray(wind_dirs) / direction_width) * direction_width, 360.0)
+        bin_speeds = np.round(np.asarray(speeds) / speed_width) * speed_width
+        bins, bin_index = np.unique(np.column_stack((bin_dirs, bin_speeds)), axis=0, return_inverse=True)
+
+        layout_key = self.layout_hash()
+        if layout_key in self._bin_cache:
+            self._bin_cache.move_to_end(layout_key)
+        else:
+            self._bin_cache[layout_key] = {}
+            while len(self._bin_cache) > self.config.floris_cache_size:
+                self._bin_cache.popitem(last=False)
+        layout_cache = self._bin_cache[layout_key]
+
+        bin_keys = [tuple(b) for b in bins.tolist()]
+        # calm bins produce no power and are not solvable by the wake models
+        for key in bin_keys:
+            if key[1] <= 0 and key not in layout_cache:
+                layout_cache[key] = (np.zeros(self.nTurbs), np.zeros(self.nTurbs))
+        missing = [i for i, key in enumerate(bin_keys) if key not in layout_cache]
+        if len(missing) > 0:
+            logger.info(f"running FLORIS for {len(missing)} of {len(bin_keys)} wind rose bins")
+            wind_rose = TimeSeries(
+                wind_directions=bins[missing, 0],
+                wind_speeds=bins[missing, 1],
+                turbulence_intensities=self.fi.core.flow_field.turbulence_intensities[0]
+            )
+            self.fi.set(wind_data=wind_rose)
+            self.fi.run()
+            bin_powers = self.fi.get_turbine_powers()
+            bin_velocities = self.fi.turbine_average_velocities
+            for j, i in enumerate(missing):
+                layout_cache[bin_keys[i]] = (bin_powers[j], bin_velocities[j])
+
+        turbine_powers = np.array([layout_cache[key][0] for key in bin_keys]).reshape(len(bins), self.nTurbs)
+        turbine_velocities = np.array([layout_cache[key][1] for key in bin_keys]).reshape(len(bins), self.nTurbs)
+        bin_index = bin_index.ravel()
+        return turbine_powers[bin_index], turbine_velocities[bin_index]
+
+    def layout_hash(self):
+        """Return a hash of the turbine coordinates of the FLORIS model, used to key cached wind rose results."""
+        xcoords, ycoords = self.fi.get_turbine_layout()
+        layout = np.column_stack((xcoords, ycoords)).astype(float)
+        return hashlib.sha256(layout.tobytes()).hexdigest()
+
+    def clear_bin_cache(self):
+        """Clear the cached wind rose results, e.g., after a change to the turbine or wake model."""
+        self._bin_cache.clear()
+
 
     def export(self):
         """
@@ -354,6 +433,7 @@ class Floris(BaseClass):
         """
         turbine_lib_res = floris_tools.check_libraries_for_turbine_name_floris(turbine_name, self)
         self.fi.set(turbine_type=[turbine_lib_res])
+        self.clear_bin_cache()
         self.value("wind_turbine_rotor_diameter", turbine_lib_res["rotor_diameter"])
         self.value("wind_turbine_powercurve_powerout", turbine_lib_res["power_thrust_table"]["power"])
         self.turb_rating = np.round(max(turbine_lib_res["power_thrust_table"]["power"]), decimals = 1)
@@ -78,6 +78,14 @@ class WindConfig(BaseClass):
             and the turbine hub-height. Defaults to False.
         recalculate_pysam_powercurve (bool): If True, recalculates the turbine power-curve for the rotor diameter and turbine rating. 
             If False, only scales turbine power-curve for turbine rated power. Defaults to False. Only used if ``model_name = 'pysam'``
+        floris_wind_rose_binning (bool): If running FLORIS, whether to bin the wind resource into (wind direction, wind speed)
+            bins and only simulate the unique bins instead of every timestep. Defaults to False.
+        wind_direction_bin_width (float): width of the wind direction bins in degrees. Defaults to 5.0.
+            Only used if ``floris_wind_rose_binning = True``
+        wind_speed_bin_width (float): width of the wind speed bins in m/s. Defaults to 0.5.
+            Only used if ``floris_wind_rose_binning = True``
+        floris_cache_size (int): number of layouts for which binned FLORIS results are cached. Defaults to 16.
+            Only used if ``floris_wind_rose_binning = True``
     """
     # TODO: put `resource_parse_method`, `store_turbine_performance_results`, and `verbose` in "floris_kwargs" dictionary
     num_turbines: int = field(validator=gt_zero)
@@ -123,6 +131,10 @@ class WindConfig(BaseClass):
     store_floris_config_dict: bool = field(default = True)
     override_wind_resource_height: bool = field(default = False)
     recalculate_pysam_powercurve: bool = field(default = False)
+    floris_wind_rose_binning: bool = field(default = False)
+    wind_direction_bin_width: float = field(default = 5.0, validator=gt_zero)
+    wind_speed_bin_width: float = field(default = 0.5, validator=gt_zero)
+    floris_cache_size: int = field(default = 16, validator=gt_zero)
 
     def __attrs_post_init__(self):
         if self.model_name == 'floris' and self.timestep is None:
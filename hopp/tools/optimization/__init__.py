@@ -4,4 +4,5 @@ from .data_logging.data_recorder import DataRecorder
 from .data_logging.null_data_recorder import NullDataRecorder
 from .data_logging.JSON_lines_record_logger import JSONLinesRecordLogger
 from .data_logging.table_data_recorder import TableDataRecorder
+from .data_logging.columnar_data_recorder import ColumnarDataRecorder
 from .command_line_tools.run_utils import setup_run
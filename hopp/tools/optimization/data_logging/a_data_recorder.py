@@ -76,6 +76,25 @@ class ADataRecorder:
     def get_column_map(self) -> {}:
         pass
     
+    @abstractmethod
+    def checkpoint(self) -> any:
+        """
+        Returns the state of the recorded data, which is part of the checkpoint of a run and passed to restore() when
+        the run is resumed. Recorders that keep their data in memory return their records, recorders that write their
+        data out return the position of the written data.
+        :return: picklable state of the recorded data
+        """
+        pass
+    
+    @abstractmethod
+    def restore(self, state: any) -> None:
+        """
+        Restores the recorded data to a state returned by checkpoint(), e.g., when resuming a run from a checkpoint.
+        Call this after set_schema().
+        :param state: state of the recorded data to restore
+        """
+        pass
+    
     @abstractmethod
     def close(self) -> None:
         """
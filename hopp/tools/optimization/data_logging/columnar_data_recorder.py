@@ -0,0 +1,409 @@
+import json
+import os
+import pickle
+import re
+import shutil
+from typing import (
+    Iterator,
+    Optional,
+    )
+
+import numpy as np
+
+from hopp.utilities.atomic_write import atomic_write
+from .a_data_recorder import ADataRecorder
+
+#: version of the recorder's directory format
+COLUMNAR_FORMAT_VERSION = 1
+
+_MANIFEST_NAME = 'manifest.json'
+_CHUNK_PATTERN = re.compile(r'^chunk_\d{6}$')
+
+# dtype kinds that are stored as memory-mappable arrays: booleans, numbers, strings, dates and times
+_TYPED_KINDS = 'biufcUSmM'
+
+
+class ColumnarDataRecorder(ADataRecorder):
+    """
+    Records data column by column in chunked files in a directory, instead of keeping every record in memory and
+    logging each of them as it is stored.
+
+    Stored records are buffered in memory and written out batch_size records at a time as a chunk, with one file per
+    column. Values of a column that form an array of numbers, booleans or strings are stored as a typed .npy file,
+    which is memory-mapped when read back, so reading a column only reads that column's data. Other values, e.g.,
+    None or lists of evaluations, are pickled. The dtype of a typed column is set by its first chunk, later chunks
+    that cannot be cast to it are pickled.
+
+    A manifest lists the complete chunks and is replaced atomically after each chunk is written, so the recorded data
+    of a run that is killed is readable up to its last flush. Recorded data is read back by creating a recorder for
+    the directory with mode='r'.
+
+    The checkpoint of a run only holds the position of the recorded data in the manifest, see checkpoint(). A run
+    resumed from a checkpoint continues recording to the same directory with mode='a', and restore() drops the records
+    that were recorded after the checkpoint.
+    """
+
+    def __init__(self,
+                 path: str,
+                 batch_size: int = 1024,
+                 mode: str = 'w',
+                 ) -> None:
+        """
+        :param path: directory to write the recorded data to, existing recorded data in it is replaced
+        :param batch_size: number of records buffered in memory before they are written out as a chunk
+        :param mode: 'w' to record a new run, 'a' to continue recording the data in path, e.g., of a run resumed from
+            a checkpoint, or 'r' to read the data recorded in path
+        """
+        if batch_size < 1:
+            raise ValueError("'batch_size' must be at least 1")
+        if mode not in ('w', 'a', 'r'):
+            raise ValueError(f"Unknown mode: '{mode}'")
+        self._path: str = str(path)
+        self._batch_size: int = batch_size
+        self._read_only: bool = mode == 'r'
+        self._is_setup: bool = False
+        self._column_map: {any, int} = {}
+        self._column_list: [] = []
+        self._column_types: [Optional[dict]] = []
+        self._chunks: [dict] = []
+        self._chunk_offsets: [int] = [0]
+        self._buffer: [[]] = []
+        self._record: [] = []
+        self._record_index: int = 0
+        self._loaded: {(int, int): any} = {}
+        # columns of the recorded data that is continued, which must match the columns that are added
+        self._appended_columns: Optional[list] = None
+
+        if self._read_only:
+            self._column_list = self._read_manifest()['columns']
+            self._column_map = {name: i for i, name in enumerate(self._column_list)}
+            self._buffer = [[] for _ in self._column_list]
+            self._is_setup = True
+            self._initialize_record()
+        else:
+            os.makedirs(self._path, exist_ok=True)
+            if mode == 'a' and os.path.isfile(os.path.join(self._path, _MANIFEST_NAME)):
+                self._appended_columns = self._read_manifest()['columns']
+                self._remove_unlisted_chunks()
+            else:
+                self._remove_chunks()
+
+    def __del__(self):
+        # noinspection PyBroadException
+        try:
+            self.close()
+        except:
+            pass
+
+    def __len__(self) -> int:
+        return self._chunk_offsets[-1] + self._buffer_size()
+
+    def __bool__(self) -> bool:
+        # a recorder without records is still a recorder, e.g., for `recorder or NullDataRecorder()`
+        return True
+
+    def add_columns(self, *column_names) -> None:
+        if self._is_setup:
+            raise Exception("Adding columns after accumulating data is not supported.")
+        for column_name in column_names:
+            self._column_list.append(column_name)
+            self._column_map[column_name] = len(self._column_map)
+
+    def set_schema(self) -> None:
+        if self._appended_columns is None:
+            self._column_types = [None] * len(self._column_list)
+        elif self._column_list != self._appended_columns:
+            raise ValueError(f"Columns {self._column_list} do not match the columns {self._appended_columns} "
+                             f"recorded in {self._path}")
+        self._buffer = [[] for _ in self._column_list]
+        self._write_manifest()
+        self._is_setup = True
+        self._initialize_record()
+
+    def accumulate(self, *data, **kwdata) -> None:
+        # accumulate data list
+        num_data = len(data)
+        for i in range(num_data):
+            self._record[self._record_index + i] = data[i]
+        self._record_index += num_data
+
+        # accumulate keyword data
+        for key, value in kwdata.items():
+            self._record[self._column_map[key]] = value
+
+    def store(self) -> None:
+        if not self._is_setup:
+            raise Exception("Writing data before setting the schema is not supported.")
+        if self._read_only:
+            raise Exception("Writing data to a recorder opened for reading is not supported.")
+
+        for column, value in zip(self._buffer, self._record):
+            column.append(value)
+        self._initialize_record()
+        if self._buffer_size() >= self._batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes the buffered records out as a chunk
+        """
+        if self._read_only or self._buffer_size() == 0:
+            return
+
+        index = len(self._chunks)
+        name = f'chunk_{index:06d}'
+        chunk_path = os.path.join(self._path, name)
+        os.makedirs(chunk_path, exist_ok=True)
+        formats = []
+        for column_index, values in enumerate(self._buffer):
+            array = self._to_typed_array(column_index, values)
+            if array is None:
+                with open(os.path.join(chunk_path, f'{column_index}.pkl'), 'wb') as f:
+                    pickle.dump(values, f, protocol=pickle.HIGHEST_PROTOCOL)
+                formats.append('pickle')
+            else:
+                np.save(os.path.join(chunk_path, f'{column_index}.npy'), array, allow_pickle=False)
+                formats.append('npy')
+
+        self._chunks.append({'name': name, 'size': self._buffer_size(), 'formats': formats})
+        self._chunk_offsets.append(self._chunk_offsets[-1] + self._buffer_size())
+        self._buffer = [[] for _ in self._column_list]
+        self._write_manifest()
+
+    def is_setup(self) -> bool:
+        return self._is_setup
+
+    def get_column(self, name) -> []:
+        """
+        gets a column from the recorded data
+        :param name: column name
+        :return: an array if the column is typed, otherwise a list
+        """
+        parts = list(self.iter_column_chunks(name))
+        if all(isinstance(part, np.ndarray) for part in parts):
+            if len(parts) == 0:
+                return []
+            return np.asarray(np.concatenate(parts))
+        column = []
+        for part in parts:
+            column.extend(list(part))
+        return column
+
+    def iter_column_chunks(self, name) -> Iterator:
+        """
+        Iterates over a column chunk by chunk, without reading the other chunks into memory
+        :param name: column name
+        :return: iterator over memory-mapped arrays of the typed chunks and lists of the others, including the
+            records that are still buffered
+        """
+        column_index = self._column_map[name]
+        for chunk_index in range(len(self._chunks)):
+            yield self._load(chunk_index, column_index)
+        if self._buffer_size() > 0:
+            values = self._buffer[column_index]
+            array = self._to_typed_array(column_index, values, set_type=False)
+            yield values if array is None else array
+
+    def get_record(self, index) -> []:
+        """
+        :return: the record, with numbers as Python scalars and arrays as in-memory copies
+        """
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("record index out of range")
+
+        if index >= self._chunk_offsets[-1]:
+            return [column[index - self._chunk_offsets[-1]] for column in self._buffer]
+        chunk_index = int(np.searchsorted(self._chunk_offsets, index, side='right')) - 1
+        offset = index - self._chunk_offsets[chunk_index]
+        return [_to_value(self._load(chunk_index, column_index)[offset])
+                for column_index in range(len(self._column_list))]
+
+    def get_records(self) -> []:
+        """
+        :return: list of the records, with numbers as Python scalars and arrays as in-memory copies
+        """
+        records = []
+        for chunk_index in range(len(self._chunks)):
+            columns = [_to_values(self._load(chunk_index, column_index))
+                       for column_index in range(len(self._column_list))]
+            records.extend(list(record) for record in zip(*columns))
+        records.extend(list(record) for record in zip(*self._buffer))
+        return records
+
+    def get_column_map(self) -> {}:
+        return self._column_map
+
+    def checkpoint(self) -> int:
+        """
+        Writes the buffered records out, so all records are listed in the manifest
+        :return: the number of records, the position of the recorded data to restore
+        """
+        self.flush()
+        return len(self)
+
+    def restore(self, state: int) -> None:
+        """
+        Restores the recorded data to a position returned by checkpoint(), removing the chunks that were written after
+        it. The data recorded by an earlier run is only kept if the recorder was created with mode='a'.
+        :param state: number of records to keep
+        """
+        if not self._is_setup:
+            raise Exception("Restoring data before setting the schema is not supported.")
+        if self._read_only:
+            raise Exception("Restoring data of a recorder opened for reading is not supported.")
+        num_chunks = int(np.searchsorted(self._chunk_offsets, state))
+        if num_chunks == len(self._chunk_offsets) or self._chunk_offsets[num_chunks] != state:
+            raise ValueError(f"The data recorded in {self._path} has no checkpoint after {state} records")
+
+        self._chunks = self._chunks[:num_chunks]
+        self._chunk_offsets = self._chunk_offsets[:num_chunks + 1]
+        self._loaded.clear()
+        self._column_types = [self._first_chunk_type(column_index) for column_index in range(len(self._column_list))]
+        self._buffer = [[] for _ in self._column_list]
+        self._initialize_record()
+        # the manifest is replaced before the chunks it no longer lists are removed
+        self._write_manifest()
+        self._remove_unlisted_chunks()
+
+    def close(self) -> None:
+        if self._is_setup:
+            self.flush()
+        self._loaded.clear()
+
+    @staticmethod
+    def make_data_recorder(output_path: str, log_name: str = 'log', batch_size: int = 1024) -> 'ColumnarDataRecorder':
+        '''
+        Makes a ColumnarDataRecorder for logging this run, like DataRecorder.make_data_recorder()
+        :param log_name: what to name the directory of recorded data (has .columns appended to it)
+        :param batch_size: number of records buffered in memory before they are written out as a chunk
+        :return: a ColumnarDataRecorder for this run
+        '''
+        return ColumnarDataRecorder(os.path.join(output_path, log_name + '.columns'), batch_size=batch_size)
+
+    def _initialize_record(self) -> None:
+        self._record = [None] * len(self._column_list)
+        self._record_index = 0
+
+    def _buffer_size(self) -> int:
+        return len(self._buffer[0]) if len(self._buffer) > 0 else 0
+
+    def _to_typed_array(self, column_index: int, values: [], set_type: bool = True) -> Optional[np.ndarray]:
+        """
+        :param set_type: if True and the column has no type yet, sets it to the type of values
+        :return: values as an array of the column's type, or None if they cannot be stored as a typed array
+        """
+        # sequences other than arrays, e.g., tuples of numbers and strings, would not be read back as they were stored
+        if not all(isinstance(value, (bool, int, float, complex, str, bytes, np.generic, np.ndarray))
+                   for value in values):
+            return None
+        try:
+            array = np.asarray(values)
+        except (TypeError, ValueError):
+            return None
+        if array.dtype.kind not in _TYPED_KINDS:
+            return None
+        if array.dtype.kind in 'US' and not all(np.asarray(value).dtype.kind in 'US' for value in values):
+            return None
+
+        column_type = self._column_types[column_index]
+        if column_type is None:
+            if set_type:
+                self._column_types[column_index] = {'dtype': array.dtype.str, 'shape': list(array.shape[1:])}
+            return array
+
+        dtype = np.dtype(column_type['dtype'])
+        if list(array.shape[1:]) != column_type['shape'] or not np.can_cast(array.dtype, dtype, 'same_kind'):
+            return None
+        if dtype.kind in 'US' and array.dtype.itemsize > dtype.itemsize:
+            # longer strings would be truncated
+            return None
+        return array.astype(dtype, copy=False)
+
+    def _load(self, chunk_index: int, column_index: int):
+        key = (chunk_index, column_index)
+        if key not in self._loaded:
+            chunk = self._chunks[chunk_index]
+            chunk_path = os.path.join(self._path, chunk['name'])
+            if chunk['formats'][column_index] == 'npy':
+                self._loaded[key] = np.load(os.path.join(chunk_path, f'{column_index}.npy'), mmap_mode='r')
+            else:
+                with open(os.path.join(chunk_path, f'{column_index}.pkl'), 'rb') as f:
+                    self._loaded[key] = pickle.load(f)
+        return self._loaded[key]
+
+    def _first_chunk_type(self, column_index: int) -> Optional[dict]:
+        """
+        :return: the type of a column, which is the type of its first typed chunk, or None if it has none
+        """
+        for chunk_index, chunk in enumerate(self._chunks):
+            if chunk['formats'][column_index] == 'npy':
+                array = self._load(chunk_index, column_index)
+                return {'dtype': array.dtype.str, 'shape': list(array.shape[1:])}
+        return None
+
+    def _remove_chunks(self) -> None:
+        self._chunks = []
+        self._chunk_offsets = [0]
+        self._loaded.clear()
+        self._remove_unlisted_chunks()
+
+    def _remove_unlisted_chunks(self) -> None:
+        """
+        Removes the chunks that are not listed in the manifest, including chunks of a killed run that were written
+        after its last manifest
+        """
+        listed = {chunk['name'] for chunk in self._chunks}
+        for name in os.listdir(self._path):
+            if _CHUNK_PATTERN.match(name) and name not in listed:
+                shutil.rmtree(os.path.join(self._path, name))
+
+    def _read_manifest(self) -> dict:
+        """
+        Reads the types and chunks of the recorded data from the manifest
+        :return: the manifest
+        """
+        with open(os.path.join(self._path, _MANIFEST_NAME), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('version') != COLUMNAR_FORMAT_VERSION:
+            raise ValueError(f"Unsupported recorded data format in {self._path}")
+        self._column_types = manifest['types']
+        self._chunks = manifest['chunks']
+        self._chunk_offsets = [0]
+        for chunk in self._chunks:
+            self._chunk_offsets.append(self._chunk_offsets[-1] + chunk['size'])
+        return manifest
+
+    def _write_manifest(self) -> None:
+        manifest = {
+            'version': COLUMNAR_FORMAT_VERSION,
+            'columns': self._column_list,
+            'types': self._column_types,
+            'chunks': self._chunks,
+            }
+        with atomic_write(os.path.join(self._path, _MANIFEST_NAME), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, default=str)
+
+
+def _to_value(value):
+    """
+    :return: a value read from a chunk, with numpy scalars converted to Python scalars and memory-mapped arrays
+        copied into memory
+    """
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return np.array(value)
+    return value
+
+
+def _to_values(column) -> []:
+    """
+    :return: list of the values of a chunk of a column, converted by _to_value()
+    """
+    if isinstance(column, np.ndarray):
+        if column.ndim == 1:
+            return column.tolist()
+        return list(np.array(column))
+    return [_to_value(value) for value in column]
@@ -78,6 +78,22 @@ class DataRecorder(ADataRecorder):
     def get_column_map(self) -> {}:
         return self._column_map
     
+    def checkpoint(self) -> []:
+        return list(self._records)
+    
+    def restore(self, state: []) -> None:
+        """
+        Replaces the recorded data with the records returned by checkpoint() and logs them to the logger
+        """
+        if not self._is_setup:
+            raise Exception("Restoring data before setting the schema is not supported.")
+        
+        self._records = [list(record) for record in state]
+        for record in self._records:
+            self._logger.write(record)
+        self._logger.flush()
+        self._initialize_record()
+    
     def close(self) -> None:
         self._logger.close()
     
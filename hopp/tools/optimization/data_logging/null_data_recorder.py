@@ -38,5 +38,11 @@ class NullDataRecorder(ADataRecorder):
     def get_column_map(self) -> {}:
         return {}
     
+    def checkpoint(self) -> None:
+        return None
+    
+    def restore(self, state: None) -> None:
+        pass
+    
     def close(self) -> None:
         pass
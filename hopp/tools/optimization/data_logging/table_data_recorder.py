@@ -71,6 +71,19 @@ class TableDataRecorder(ADataRecorder):
         self._logger.write_and_flush(self._record)
         self._initialize_record()
 
+    def checkpoint(self) -> []:
+        return list(self._records)
+
+    def restore(self, state: []) -> None:
+        if not self._is_setup:
+            raise Exception("Restoring data before setting the schema is not supported.")
+
+        self._records = [list(record) for record in state]
+        for record in self._records:
+            self._logger.write(record)
+        self._logger.flush()
+        self._initialize_record()
+
     def _initialize_record(self) -> None:
         self._record = [None] * len(self._column_list)
         self._record_index = 0
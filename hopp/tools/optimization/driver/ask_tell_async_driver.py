@@ -0,0 +1,349 @@
+import os
+import signal
+import time
+from collections import OrderedDict
+from multiprocessing import cpu_count, get_context
+from multiprocessing.connection import wait
+from typing import (
+    Callable,
+    Optional,
+    Tuple,
+    )
+
+from hopp.utilities.log import hybrid_logger as logger
+from ..data_logging.data_recorder import DataRecorder
+from ..driver.ask_tell_driver import AskTellDriver
+from ..driver.evaluation_cache import EvaluationCache
+from ..optimizer.ask_tell_optimizer import AskTellOptimizer
+from .ask_tell_parallel_driver_fns import worker_loop
+
+
+class _Worker:
+    """
+    A worker process with its own connection, so that it can be killed and replaced while evaluating a candidate
+    """
+
+    def __init__(self, context, objective):
+        self.connection, child_connection = context.Pipe()
+        self.process = context.Process(target=worker_loop, args=(child_connection, objective), daemon=True)
+        self.process.start()
+        child_connection.close()
+        self.task_id: Optional[int] = None
+        self.deadline: Optional[float] = None
+
+    def submit(self, task_id: int, candidate: any, timeout: Optional[float]) -> None:
+        self.task_id = task_id
+        self.deadline = None if timeout is None else time.monotonic() + timeout
+        self.connection.send((task_id, candidate))
+
+    def kill(self) -> None:
+        """
+        Kills the worker and any subprocesses it started, e.g., solvers
+        """
+        try:
+            if hasattr(os, 'killpg'):
+                os.killpg(self.process.pid, signal.SIGKILL)
+            else:
+                self.process.kill()
+        except (ProcessLookupError, PermissionError):
+            self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+    def close(self) -> None:
+        try:
+            self.connection.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.kill()
+        else:
+            self.connection.close()
+
+
+class AskTellAsyncDriver(AskTellDriver):
+    """
+    Evaluates candidates asynchronously in worker processes, telling the optimizer as soon as enough evaluations
+    have completed, instead of waiting for the slowest candidate of each generation.
+
+    Up to max_in_flight candidates are evaluated at a time. Whenever a worker becomes idle, new candidates are asked
+    from the optimizer in its current state, so candidates may be told after the optimizer was updated with others.
+    Candidates are asked in blocks of the optimizer's candidate block size and only complete blocks are told, in the
+    order they were asked. Optimizers that support incremental tell are told every tell_size evaluations, which
+    defaults to the block size; other optimizers are told a generation of get_num_candidates() evaluations at a
+    time.
+
+    Evaluations that take longer than timeout seconds are killed, together with any subprocesses of the worker, e.g.,
+    hung solvers, and the worker is replaced. Evaluations that raise an exception, or whose worker exits, are logged
+    and counted as failed. The block of a killed or failed candidate is not told. After max_consecutive_failures
+    killed or failed evaluations in a row, e.g., if the objective always raises, the run is stopped with an error.
+    If the optimizer asks no candidates while none are being evaluated, the evaluations completed so far are told.
+    """
+
+    def __init__(self,
+                 nprocs: int = cpu_count(),
+                 max_in_flight: Optional[int] = None,
+                 tell_size: Optional[int] = None,
+                 timeout: Optional[float] = None,
+                 evaluation_cache: Optional[EvaluationCache] = None,
+                 max_consecutive_failures: int = 20,
+                 ) -> None:
+        """
+        :param nprocs: number of worker processes
+        :param max_in_flight: maximum number of candidates being evaluated or waiting for a worker, defaults to nprocs
+        :param tell_size: number of evaluations per call to the optimizer's tell(), rounded up to whole blocks
+        :param timeout: optional time limit of each evaluation in seconds
+        :param evaluation_cache: optional cache of objective evaluations, to only evaluate each distinct candidate once
+        :param max_consecutive_failures: number of killed or failed evaluations in a row that stops the run
+        """
+        if nprocs < 1:
+            raise ValueError("'nprocs' must be at least 1")
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError("'max_in_flight' must be at least 1")
+        if timeout is not None and timeout <= 0:
+            raise ValueError("'timeout' must be positive")
+        if max_consecutive_failures < 1:
+            raise ValueError("'max_consecutive_failures' must be at least 1")
+        self._num_evaluations: int = 0
+        self._num_iterations: int = 0
+        self._num_timeouts: int = 0
+        self._num_failures: int = 0
+        self._num_consecutive_failures: int = 0
+        self._max_consecutive_failures = max_consecutive_failures
+        self._nprocs = nprocs
+        self._max_in_flight = nprocs if max_in_flight is None else max_in_flight
+        self._tell_size = tell_size
+        self._timeout = timeout
+        self.evaluation_cache: Optional[EvaluationCache] = evaluation_cache
+
+        self._context = get_context()
+        self._objective = None
+        self._workers: [_Worker] = []
+        self._next_task_id: int = 0
+        # task id -> (block id, index in block, candidate, cache key, conforming penalty)
+        self._queued: OrderedDict = OrderedDict()
+        self._running: {int: tuple} = {}
+        # block id -> evaluations of the block's candidates, None until evaluated, False if failed
+        self._blocks: OrderedDict = OrderedDict()
+        self._next_block_id: int = 0
+        # evaluations of completed blocks beyond the last generation told to an optimizer without incremental tell
+        self._completed: list = []
+
+    def __getstate__(self):
+        """
+        This prevents the worker processes from being pickled
+        """
+        self_dict = self.__dict__.copy()
+        for name in ('_context', '_workers', '_queued', '_running', '_blocks'):
+            del self_dict[name]
+        return self_dict
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._context = get_context()
+        self._workers = []
+        self._queued = OrderedDict()
+        self._running = {}
+        self._blocks = OrderedDict()
+
+    def __del__(self):
+        # noinspection PyBroadException
+        try:
+            self.close()
+        except:
+            pass
+
+    def setup(
+            self,
+            objective: Callable[[any], Tuple[float, float, any]],
+            recorder: DataRecorder,
+            conformer: Optional[Callable[[any], Tuple[object, any]]] = None,
+            ) -> None:
+        """
+        Must be called before calling step() or run().
+        Sets the objective function for this driver and the data recorder.
+        :param objective: objective function for evaluating candidate solutions
+        :param recorder: data recorder
+        :param conformer: optional function returning the conforming candidate and its penalty, used to key the
+            evaluation cache
+        :return:
+        """
+        self.close()
+        self._objective = objective
+        self._workers = [_Worker(self._context, objective) for _ in range(self._nprocs)]
+        if self.evaluation_cache is not None and self.evaluation_cache.conformer is None:
+            self.evaluation_cache.conformer = conformer
+
+    def step(self,
+             optimizer: AskTellOptimizer,
+             ) -> bool:
+        """
+        Keeps the workers busy with candidates from the optimizer until enough evaluations have completed, and tells
+        them to the optimizer.
+        :param optimizer: the optimizer to use
+        :return: True if the optimizer reached a stopping point (via calling optimizer.stop())
+        """
+        block_size = max(optimizer.get_candidate_block_size(), 1)
+        if optimizer.supports_incremental_tell():
+            tell_size = block_size if self._tell_size is None else self._tell_size
+        else:
+            tell_size = optimizer.get_num_candidates() or self._max_in_flight
+        # a tell needs whole blocks of candidates
+        tell_size = block_size * max(-(-tell_size // block_size), 1)
+
+        evaluations = self._completed
+        self._completed = []
+        while len(evaluations) < tell_size:
+            self._fill(optimizer, block_size)
+            evaluations.extend(self._pop_completed_blocks())
+            if len(evaluations) < tell_size:
+                if len(self._queued) == 0 and len(self._running) == 0:
+                    # the optimizer asked no candidates and none are being evaluated, waiting would never end
+                    logger.warning(f"Optimizer has no more candidates, telling {len(evaluations)} evaluations "
+                                   f"instead of {tell_size}")
+                    break
+                self._wait()
+        if not optimizer.supports_incremental_tell():
+            # told a generation at a time, the remaining blocks are told with the next generation
+            self._completed = evaluations[tell_size:]
+            del evaluations[tell_size:]
+
+        # some optimizers truncate the list they are told
+        self._num_evaluations += len(evaluations)
+        optimizer.tell(evaluations)
+        self._num_iterations += 1
+        return optimizer.stop()
+
+    def close(self) -> None:
+        """
+        Stops the worker processes. Candidates that are being evaluated are discarded.
+        """
+        for worker in self._workers:
+            if worker.task_id is None:
+                worker.close()
+            else:
+                worker.kill()
+        self._workers = []
+        self._queued.clear()
+        self._running.clear()
+        self._blocks.clear()
+
+    def get_num_evaluations(self) -> int:
+        return self._num_evaluations
+
+    def get_num_iterations(self) -> int:
+        return self._num_iterations
+
+    def get_num_timeouts(self) -> int:
+        return self._num_timeouts
+
+    def get_num_failures(self) -> int:
+        return self._num_failures
+
+    def _fill(self, optimizer: AskTellOptimizer, block_size: int) -> None:
+        """
+        Asks blocks of candidates until max_in_flight candidates are pending, and submits them to idle workers
+        """
+        num_pending = len(self._queued) + len(self._running)
+        while num_pending < self._max_in_flight:
+            candidates = optimizer.ask(block_size)
+            block_id = self._next_block_id
+            self._next_block_id += 1
+            self._blocks[block_id] = [None] * len(candidates)
+            for i, candidate in enumerate(candidates):
+                self._queue(block_id, i, candidate)
+            num_pending = len(self._queued) + len(self._running)
+            if len(candidates) == 0 or all(evaluation is not None for evaluation in self._blocks[block_id]):
+                # nothing to evaluate, the completed block is told before asking again
+                break
+
+        for worker in self._workers:
+            if worker.task_id is None and len(self._queued) > 0:
+                task_id, task = self._queued.popitem(last=False)
+                self._running[task_id] = task
+                worker.submit(task_id, task[2], self._timeout)
+
+    def _queue(self, block_id: int, index: int, candidate: any) -> None:
+        key, penalty, conformed = None, 0.0, None
+        if self.evaluation_cache is not None:
+            key, penalty, conformed = self.evaluation_cache.prepare(candidate)
+            if key is not None:
+                evaluation = self.evaluation_cache.get(key, penalty, conformed)
+                if evaluation is not None:
+                    self._blocks[block_id][index] = evaluation
+                    return
+        task_id = self._next_task_id
+        self._next_task_id += 1
+        self._queued[task_id] = (block_id, index, candidate, key, penalty)
+
+    def _wait(self) -> None:
+        """
+        Waits for a worker to finish an evaluation, or for the earliest deadline, and records the results
+        """
+        busy = [worker for worker in self._workers if worker.task_id is not None]
+        if len(busy) == 0:
+            return
+        deadlines = [worker.deadline for worker in busy if worker.deadline is not None]
+        timeout = None if len(deadlines) == 0 else max(min(deadlines) - time.monotonic(), 0.0)
+        ready = wait([worker.connection for worker in busy], timeout=timeout)
+
+        for worker in busy:
+            if worker.connection in ready:
+                try:
+                    task_id, evaluation, error = worker.connection.recv()
+                except EOFError:
+                    block_id, index, candidate, _, _ = self._running.pop(worker.task_id)
+                    self._replace(worker)
+                    self._num_failures += 1
+                    self._fail(block_id, index, f"Worker process exited while evaluating candidate {candidate}",
+                               RuntimeError("Worker process exited while evaluating a candidate"))
+                    continue
+                block_id, index, candidate, key, penalty = self._running.pop(task_id)
+                worker.task_id = None
+                worker.deadline = None
+                if error is not None:
+                    self._num_failures += 1
+                    self._fail(block_id, index, f"Evaluation of candidate {candidate} failed: {error!r}", error)
+                    continue
+                if key is not None:
+                    self.evaluation_cache.put(key, penalty, evaluation)
+                self._blocks[block_id][index] = evaluation
+                self._num_consecutive_failures = 0
+            elif worker.deadline is not None and worker.deadline <= time.monotonic():
+                block_id, index, candidate, _, _ = self._running.pop(worker.task_id)
+                self._replace(worker)
+                self._num_timeouts += 1
+                message = f"Evaluation of candidate {candidate} exceeded the {self._timeout} s timeout"
+                self._fail(block_id, index, message, TimeoutError(message))
+
+    def _fail(self, block_id: int, index: int, message: str, error: BaseException) -> None:
+        """
+        Marks the block of a killed or failed candidate as failed, and stops the run after too many failures in a row
+        """
+        logger.warning(message)
+        self._blocks[block_id][index] = False
+        self._num_consecutive_failures += 1
+        if self._num_consecutive_failures >= self._max_consecutive_failures:
+            raise RuntimeError(f"{self._num_consecutive_failures} evaluations in a row failed or timed out") from error
+
+    def _replace(self, worker: _Worker) -> None:
+        worker.kill()
+        self._workers[self._workers.index(worker)] = _Worker(self._context, self._objective)
+
+    def _pop_completed_blocks(self) -> list:
+        """
+        :return: evaluations of the completed blocks, in the order they were asked, skipping failed blocks
+        """
+        evaluations = []
+        for block_id in list(self._blocks.keys()):
+            block = self._blocks[block_id]
+            if any(evaluation is None for evaluation in block):
+                continue
+            del self._blocks[block_id]
+            if any(evaluation is False for evaluation in block):
+                # the completed evaluations of a failed block are counted, but not told
+                self._num_evaluations += sum(evaluation is not False for evaluation in block)
+                continue
+            evaluations.extend(block)
+        return evaluations
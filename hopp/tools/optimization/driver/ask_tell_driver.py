@@ -16,12 +16,15 @@ class AskTellDriver:
             self,
             objective: Callable[[any], Tuple[float, float, any]],
             recorder: DataRecorder,
+            conformer: Optional[Callable[[any], Tuple[object, any]]] = None,
             ) -> None:
         """
         Must be called before calling step() or run().
         Sets the objective function for this driver and the data recorder.
         :param objective: objective function for evaluating candidate solutions
         :param recorder: data recorder
+        :param conformer: optional function returning the conforming candidate and its penalty, used to key the
+            evaluation cache
         :return:
         """
         pass
@@ -41,16 +44,23 @@ class AskTellDriver:
     def run(self,
             optimizer: AskTellOptimizer,
             max_iter: Optional[int] = None,
+            callback: Optional[Callable[[], None]] = None,
             ) -> int:
         """
         Runs the optimizer through max_iter iterations.
         May stop early if the optimizer returns True to a call to stop().
         :param optimizer: the optimizer to use
         :param max_iter: maximum number of iterations, or None to use no maximum
+        :param callback: optional function called after each iteration, e.g., to checkpoint the run
         :return: number of iterations (calls to step()) applied
         """
         i: int = 0
-        while self.step(optimizer) and (max_iter is None or max_iter > i):
+        while True:
+            result = self.step(optimizer)
+            if callback is not None:
+                callback()
+            if not (result and (max_iter is None or max_iter > i)):
+                break
             i += 1
         return i
     
@@ -1,11 +1,13 @@
 from multiprocessing import Pool, cpu_count
 from typing import (
     Callable,
+    Optional,
     Tuple,
     )
 
 from ..data_logging.data_recorder import DataRecorder
 from ..driver.ask_tell_driver import AskTellDriver
+from ..driver.evaluation_cache import EvaluationCache
 from ..optimizer.ask_tell_optimizer import AskTellOptimizer
 from .ask_tell_parallel_driver_fns import *
 
@@ -13,11 +15,17 @@ from .ask_tell_parallel_driver_fns import *
 class AskTellParallelDriver(AskTellDriver):
     
     def __init__(self,
-                 nprocs: int = cpu_count()):
+                 nprocs: int = cpu_count(),
+                 evaluation_cache: Optional[EvaluationCache] = None):
+        """
+        :param nprocs: number of worker processes
+        :param evaluation_cache: optional cache of objective evaluations, to only evaluate each distinct candidate once
+        """
         self._num_evaluations: int = 0
         self._num_iterations: int = 0
         self._nprocs = nprocs
         self._pool = None
+        self.evaluation_cache: Optional[EvaluationCache] = evaluation_cache
         
         # self.evaluations = []
     
@@ -26,8 +34,8 @@ class AskTellParallelDriver(AskTellDriver):
         This prevents the pool from being pickled when using the pool...
         """
         self_dict = self.__dict__.copy()
-        if 'pool' in self_dict:
-            del self_dict['pool']
+        if '_pool' in self_dict:
+            del self_dict['_pool']
         return self_dict
     
     def __setstate__(self, state):
@@ -35,6 +43,7 @@ class AskTellParallelDriver(AskTellDriver):
         This prevents the pool from being pickled when using the pool...
         """
         self.__dict__.update(state)
+        self._pool = None
     
     def __del__(self):
         """
@@ -49,17 +58,22 @@ class AskTellParallelDriver(AskTellDriver):
             self,
             objective: Callable[[any], Tuple[float, float, any]],
             recorder: DataRecorder,
+            conformer: Optional[Callable[[any], Tuple[object, any]]] = None,
             ) -> None:
         """
         Must be called before calling step() or run().
         Sets the objective function for this driver and the data recorder.
         :param objective: objective function for evaluating candidate solutions
         :param recorder: data recorder
+        :param conformer: optional function returning the conforming candidate and its penalty, used to key the
+            evaluation cache
         :return:
         """
         self._pool = Pool(
             initializer=make_initializer(objective),
             processes=self._nprocs)
+        if self.evaluation_cache is not None and self.evaluation_cache.conformer is None:
+            self.evaluation_cache.conformer = conformer
     
     def step(self,
              optimizer: AskTellOptimizer,
@@ -73,7 +87,11 @@ class AskTellParallelDriver(AskTellDriver):
         # print('step()')
         num_candidates = optimizer.get_num_candidates()
         candidates = optimizer.ask(num_candidates)
-        evaluations = self._pool.map(evaluate, candidates)
+        if self.evaluation_cache is None:
+            evaluations = self._pool.map(evaluate, candidates)
+        else:
+            # only distinct, uncached candidates are sent to the pool
+            evaluations = self.evaluation_cache.evaluate(candidates, lambda c: self._pool.map(evaluate, c))
         num_candidates = len(evaluations)
         # print('telling')
         # self.evaluations = list(evaluations)
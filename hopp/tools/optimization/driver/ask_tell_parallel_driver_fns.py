@@ -1,3 +1,4 @@
+import os
 from functools import partial
 
 """
@@ -29,6 +30,33 @@ def evaluate(candidate):
     global __objective
     return __objective(candidate)
 
+def worker_loop(connection, objective):
+    """
+    Evaluates candidates received on the connection until it receives None or is closed. Used by
+    AskTellAsyncDriver, which sends (task id, candidate) and receives (task id, evaluation, error).
+    
+    The worker starts its own process group, so that a hung evaluation can be killed with any solver subprocesses.
+    """
+    if hasattr(os, 'setpgrp'):
+        os.setpgrp()
+    set_objective(objective)
+    while True:
+        try:
+            task = connection.recv()
+        except EOFError:
+            break
+        if task is None:
+            break
+        task_id, candidate = task
+        try:
+            connection.send((task_id, evaluate(candidate), None))
+        except Exception as error:
+            try:
+                connection.send((task_id, None, error))
+            except Exception:
+                # the error can't be pickled
+                connection.send((task_id, None, RuntimeError(repr(error))))
+
 # def flatten_list(nested_list: [[any]]) -> [any]:
 #     result = []
 #     for sublist in nested_list:
@@ -1,34 +1,46 @@
 from typing import (
     Callable,
+    Optional,
     Tuple,
     )
 
 from ..data_logging.data_recorder import DataRecorder
 from ..driver.ask_tell_driver import AskTellDriver
+from ..driver.evaluation_cache import EvaluationCache
 from ..optimizer.ask_tell_optimizer import AskTellOptimizer
 
 
 class AskTellSerialDriver(AskTellDriver):
     
-    def __init__(self):
+    def __init__(self,
+                 evaluation_cache: Optional[EvaluationCache] = None):
+        """
+        :param evaluation_cache: optional cache of objective evaluations, to only evaluate each distinct candidate once
+        """
         self._num_evaluations: int = 0
         self._num_iterations: int = 0
         self._objective = None
+        self.evaluation_cache: Optional[EvaluationCache] = evaluation_cache
         # self.evaluations = []
     
     def setup(
             self,
             objective: Callable[[any], Tuple[float, float, any]],
             recorder: DataRecorder,
+            conformer: Optional[Callable[[any], Tuple[object, any]]] = None,
             ) -> None:
         """
         Must be called before calling step() or run().
         Sets the objective function for this driver and the data recorder.
         :param objective: objective function for evaluating candidate solutions
         :param recorder: data recorder
+        :param conformer: optional function returning the conforming candidate and its penalty, used to key the
+            evaluation cache
         :return:
         """
         self._objective = objective
+        if self.evaluation_cache is not None and self.evaluation_cache.conformer is None:
+            self.evaluation_cache.conformer = conformer
     
     def step(self,
              optimizer: AskTellOptimizer,
@@ -40,13 +52,21 @@ class AskTellSerialDriver(AskTellDriver):
         :return: True if the optimizer reached a stopping point (via calling optimizer.stop())
         """
         candidates: [any] = optimizer.ask()
-        evaluations: [Tuple[float, float, any]] = [self._objective(candidate) for candidate in candidates]
+        evaluations: [Tuple[float, float, any]] = self._evaluate(candidates)
         # self.evaluations = list(evaluations)
         optimizer.tell(evaluations)
         self._num_evaluations += len(evaluations)
         self._num_iterations += 1
         return optimizer.stop()
     
+    def _evaluate(self, candidates: [any]) -> [Tuple[float, float, any]]:
+        def evaluate_many(to_evaluate):
+            return [self._objective(candidate) for candidate in to_evaluate]
+        
+        if self.evaluation_cache is None:
+            return evaluate_many(candidates)
+        return self.evaluation_cache.evaluate(candidates, evaluate_many)
+    
     def get_num_evaluations(self) -> int:
         return self._num_evaluations
     
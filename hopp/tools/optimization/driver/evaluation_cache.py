@@ -0,0 +1,200 @@
+import hashlib
+import pickle
+import sqlite3
+from collections import OrderedDict
+from contextlib import closing
+from typing import (
+    Callable,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    )
+
+import numpy as np
+
+
+class EvaluationCache:
+    """
+    Memoizes objective evaluations of candidates across iterations of an ask-tell driver.
+
+    Candidates are keyed by their conformed vector, i.e., after clamping to the problem bounds with the conformer, so
+    candidates that conform to the same point are only simulated once. The vector is quantized to multiples of
+    `quantization` before hashing, so points closer than the quantization also share an evaluation.
+
+    Scores are assumed to be the score of the conformed candidate minus the candidate's conforming penalty, like in
+    OptimizationProblem.objective. The cache stores the score of the conformed candidate and subtracts each
+    candidate's own penalty on a hit. Without a conformer, candidates are keyed by their own vector and evaluations
+    are returned as they were stored.
+
+    Entries are held in an in-memory LRU cache of `max_size` candidates. If `path` is given, entries are also written
+    to a SQLite database, which can be shared between iterations, runs and restarts of an optimization.
+    """
+
+    def __init__(self,
+                 quantization: Union[float, Sequence[float]] = 1e-9,
+                 max_size: int = 100000,
+                 path: Optional[str] = None,
+                 salt: str = "",
+                 conformer: Optional[Callable[[any], Tuple[object, float]]] = None,
+                 ) -> None:
+        """
+        :param quantization: quantum of each dimension of the candidate vector, or 0 to key on exact values
+        :param max_size: maximum number of evaluations held in memory
+        :param path: optional SQLite database file for persistent storage of evaluations
+        :param salt: additional key material that identifies the problem, e.g., its name and settings
+        :param conformer: optional function returning the conforming candidate and its penalty, if not set it is
+            set by the driver that uses the cache
+        """
+        if max_size < 1:
+            raise ValueError("'max_size' must be at least 1")
+        if np.any(np.asarray(quantization) < 0):
+            raise ValueError("'quantization' must not be negative")
+        self.quantization = quantization
+        self.max_size = max_size
+        self.path = path
+        self.conformer = conformer
+        self.hits: int = 0
+        self.misses: int = 0
+        self._salt = salt.encode()
+        self._entries: OrderedDict = OrderedDict()
+
+        if self.path is not None:
+            with closing(sqlite3.connect(self.path, timeout=60)) as connection, connection:
+                connection.execute("CREATE TABLE IF NOT EXISTS evaluations (key TEXT PRIMARY KEY, evaluation BLOB)")
+
+    def prepare(self, candidate: any) -> Tuple[Optional[str], float, any]:
+        """
+        :param candidate: candidate as asked from the optimizer
+        :return: the candidate's key, or None if it cannot be cached, its conforming penalty and the conformed
+            candidate, or None without a conformer
+        """
+        penalty = 0.0
+        conformed = None
+        vector = candidate
+        if self.conformer is not None:
+            conformed, penalty = self.conformer(candidate)
+            vector = conformed
+
+        try:
+            vector = np.asarray(vector, dtype=float).ravel()
+        except (TypeError, ValueError):
+            return None, penalty, conformed
+
+        quantum = np.broadcast_to(np.asarray(self.quantization, dtype=float), vector.shape)
+        vector = np.where(quantum > 0, np.round(vector / np.where(quantum > 0, quantum, 1.0)), vector)
+        # normalize negative zeros so that they share a key with zeros
+        vector = vector + 0.0
+        key = hashlib.sha256(self._salt)
+        key.update(vector.tobytes())
+        return key.hexdigest(), penalty, conformed
+
+    def get(self, key: str, penalty: float, conformed: any) -> Optional[Tuple[float, float, any]]:
+        """
+        :param key: the candidate's key, from prepare()
+        :param penalty: the candidate's conforming penalty, from prepare()
+        :param conformed: the conformed candidate, from prepare()
+        :return: the candidate's cached evaluation, or None if it is not cached
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        elif self.path is not None:
+            entry = self._read_entry(key)
+            if entry is not None:
+                self._add_entry(key, entry)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return self._unpack(entry, penalty, conformed)
+
+    def put(self, key: str, penalty: float, evaluation: Tuple[float, float, any]) -> tuple:
+        """
+        Stores the evaluation of a candidate
+        :param key: the candidate's key, from prepare()
+        :param penalty: the candidate's conforming penalty, from prepare()
+        :param evaluation: the objective's (score, evaluation, candidate) tuple
+        :return: the stored entry
+        """
+        entry = (evaluation[0] + penalty, *evaluation[1:])
+        self._add_entry(key, entry)
+        if self.path is not None:
+            self._write_entry(key, entry)
+        return entry
+
+    def evaluate(self,
+                 candidates: [any],
+                 evaluate_many: Callable[[list], list],
+                 ) -> list:
+        """
+        Evaluates candidates, taking evaluations from the cache and evaluating each distinct uncached candidate once
+        :param candidates: candidates as asked from the optimizer
+        :param evaluate_many: function that evaluates a list of candidates with the objective
+        :return: evaluations of each candidate, in order
+        """
+        prepared = [self.prepare(candidate) for candidate in candidates]
+        evaluations: list = [None] * len(candidates)
+        pending: OrderedDict = OrderedDict()
+        uncacheable = []
+        for i, (key, penalty, conformed) in enumerate(prepared):
+            if key is None:
+                uncacheable.append(i)
+                continue
+            if key in pending:
+                # duplicate of a candidate in the same batch
+                self.hits += 1
+                pending[key].append(i)
+                continue
+            evaluations[i] = self.get(key, penalty, conformed)
+            if evaluations[i] is None:
+                pending[key] = [i]
+
+        to_evaluate = [indices[0] for indices in pending.values()] + uncacheable
+        results = evaluate_many([candidates[i] for i in to_evaluate]) if to_evaluate else []
+        for i, result in zip(to_evaluate, results):
+            evaluations[i] = result
+
+        for key, indices in pending.items():
+            first = indices[0]
+            entry = self.put(key, prepared[first][1], evaluations[first])
+            for i in indices[1:]:
+                evaluations[i] = self._unpack(entry, prepared[i][1], prepared[i][2])
+        return evaluations
+
+    def clear(self) -> None:
+        """
+        Clears the in-memory cache. Entries in the SQLite database are kept.
+        """
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _unpack(self, entry: tuple, penalty: float, conformed: any) -> Tuple[float, float, any]:
+        score = entry[0] - penalty
+        if conformed is not None and len(entry) > 2:
+            return (score, entry[1], np.copy(conformed), *entry[3:])
+        return (score, *entry[1:])
+
+    def _add_entry(self, key: str, entry: tuple) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def _read_entry(self, key: str) -> Optional[tuple]:
+        with closing(sqlite3.connect(self.path, timeout=60)) as connection, connection:
+            row = connection.execute("SELECT evaluation FROM evaluations WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        return pickle.loads(row[0])
+
+    def _write_entry(self, key: str, entry: tuple) -> None:
+        with closing(sqlite3.connect(self.path, timeout=60)) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO evaluations (key, evaluation) VALUES (?, ?)",
+                (key, pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)),
+                )
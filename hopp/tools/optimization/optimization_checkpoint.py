@@ -0,0 +1,73 @@
+import io
+import pickle
+import random
+from typing import Optional
+
+import numpy as np
+
+from hopp.utilities.atomic_write import atomic_write
+
+#: version of the checkpoint file format, checkpoints written by other versions cannot be resumed
+CHECKPOINT_VERSION = 2
+
+
+def write_checkpoint(path: str, state: dict, shared: dict) -> None:
+    """
+    Atomically writes a checkpoint of an optimization run, together with the state of the random number generators.
+
+    The checkpoint is written to a temporary file next to `path` and moved into place once complete, so a run that
+    is killed while checkpointing leaves the previous checkpoint intact.
+    :param path: checkpoint file
+    :param state: picklable state of the run, e.g., the driver and the optimizer
+    :param shared: objects that are referenced by name instead of being pickled, e.g., the objective function and
+        the data recorder, which are provided again by the resuming run
+    """
+    checkpoint = {
+        'version': CHECKPOINT_VERSION,
+        'state': state,
+        'random_state': random.getstate(),
+        'numpy_random_state': np.random.get_state(),
+        }
+    buffer = io.BytesIO()
+    _SharedPickler(buffer, shared).dump(checkpoint)
+
+    with atomic_write(path, 'wb', fsync=True) as f:
+        f.write(buffer.getvalue())
+
+
+def read_checkpoint(path: str, shared: dict, restore_random_state: bool = True) -> dict:
+    """
+    Reads a checkpoint written by write_checkpoint()
+    :param path: checkpoint file
+    :param shared: objects referenced by name in the checkpoint
+    :param restore_random_state: if True, restores the state of the random number generators to the checkpoint's
+    :return: the state of the run
+    """
+    with open(path, 'rb') as f:
+        checkpoint = _SharedUnpickler(f, shared).load()
+    if not isinstance(checkpoint, dict) or checkpoint.get('version') != CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported optimization checkpoint {path}")
+    if restore_random_state:
+        random.setstate(checkpoint['random_state'])
+        np.random.set_state(checkpoint['numpy_random_state'])
+    return checkpoint['state']
+
+
+class _SharedPickler(pickle.Pickler):
+    def __init__(self, file, shared: dict):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._names = {id(obj): name for name, obj in shared.items() if obj is not None}
+
+    def persistent_id(self, obj) -> Optional[str]:
+        return self._names.get(id(obj))
+
+
+class _SharedUnpickler(pickle.Unpickler):
+    def __init__(self, file, shared: dict):
+        super().__init__(file)
+        self._shared = shared
+
+    def persistent_load(self, name):
+        if name not in self._shared:
+            raise ValueError(f"Optimization checkpoint references {name}, which is not provided")
+        return self._shared[name]
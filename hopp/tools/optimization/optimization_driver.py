@@ -1,3 +1,4 @@
+from multiprocessing import cpu_count
 from typing import (
     Optional,
     Callable,
@@ -7,9 +8,15 @@ from typing import (
 from .data_logging.data_recorder import DataRecorder
 from .data_logging.null_data_recorder import NullDataRecorder
 
+from .optimization_checkpoint import (
+    read_checkpoint,
+    write_checkpoint,
+)
 from .optimization_problem import OptimizationProblem
 from .driver.ask_tell_parallel_driver import AskTellDriver, AskTellParallelDriver
 from .driver.ask_tell_serial_driver import AskTellSerialDriver
+from .driver.ask_tell_async_driver import AskTellAsyncDriver
+from .driver.evaluation_cache import EvaluationCache
 from .optimizer.CEM_optimizer import CEMOptimizer
 from .optimizer.CMA_ES_optimizer import CMAESOptimizer
 from .optimizer.GA_optimizer import GAOptimizer
@@ -30,6 +37,12 @@ class ConvertingOptimizationDriver:
         + drivers for running & parallelizing the generation-evaluation-update optimization cycle
     Each combination of objective function and optimizer will require a compatible set of initial conditions which
     should be provided by the prototype
+
+    If a checkpoint path is given, the driver, the optimizer, the state of the recorder and the state of the random
+    number generators are written to it every checkpoint_interval iterations. A run that was interrupted continues
+    from its last checkpoint by creating the driver as before and calling resume(). Recorders that write their data
+    out, e.g., ColumnarDataRecorder, only checkpoint the position of their data, so the resumed run records to the
+    same place, e.g., with a ColumnarDataRecorder created with mode='a'.
     """
 
     def __init__(self,
@@ -39,8 +52,24 @@ class ConvertingOptimizationDriver:
                  conformer: Optional[Callable[[any], Tuple[object, any]]],
                  objective: Callable[[any], Tuple[float, float, any]],
                  recorder: DataRecorder = NullDataRecorder(),
+                 checkpoint_path: Optional[str] = None,
+                 checkpoint_interval: int = 1,
                  ) -> None:
+        """
+        :param driver: driver for evaluating candidates and updating the optimizer
+        :param optimizer: the optimizer
+        :param prototype: initial conditions of the optimizer
+        :param conformer: function returning the conforming candidate and its penalty
+        :param objective: objective function for evaluating candidate solutions
+        :param recorder: data recorder
+        :param checkpoint_path: optional file to checkpoint the run to
+        :param checkpoint_interval: number of iterations between checkpoints
+        """
+        if checkpoint_interval < 1:
+            raise ValueError("'checkpoint_interval' must be at least 1")
         self.recorder: DataRecorder = recorder
+        self.checkpoint_path: Optional[str] = checkpoint_path
+        self.checkpoint_interval: int = checkpoint_interval
 
         self._driver: AskTellDriver = driver
         self._optimizer: AskTellOptimizer = optimizer
@@ -49,7 +78,7 @@ class ConvertingOptimizationDriver:
         self._objective: Callable[[any], Tuple[float, float, any]] = objective
 
         self._optimizer.setup(self._prototype, recorder)
-        self._driver.setup(self._objective, recorder)
+        self._driver.setup(self._objective, recorder, self._conformer)
 
         self.recorder.add_columns('iteration', 'num_evaluations', 'best_score', 'best_evaluation', 'best_solution')
         self.recorder.set_schema()
@@ -78,6 +107,7 @@ class ConvertingOptimizationDriver:
                                  self._driver.get_num_evaluations(),
                                  *self.best_solution())
         self.recorder.store()
+        self._checkpoint_if_due()
         return result
 
     def run(self, max_iter: Optional[int] = None) -> int:
@@ -87,7 +117,64 @@ class ConvertingOptimizationDriver:
         :param max_iter: maximum number of iterations, or None to use no maximum
         :return: number of iterations (calls to step()) applied
         """
-        return self._driver.run(self._optimizer, max_iter)
+        return self._driver.run(self._optimizer, max_iter, callback=self._checkpoint_if_due)
+
+    def save_checkpoint(self, path: Optional[str] = None) -> None:
+        """
+        Atomically writes the driver, the optimizer, the state of the recorder and the state of the random number
+        generators to a checkpoint file. Candidates that are being evaluated when the checkpoint is written, e.g., by
+        an asynchronous driver, are not part of the checkpoint.
+        :param path: checkpoint file, defaults to checkpoint_path
+        """
+        path = path or self.checkpoint_path
+        if path is None:
+            raise ValueError("No checkpoint path given")
+        state = {
+            'driver': self._driver,
+            'optimizer': self._optimizer,
+            'recorder_state': self.recorder.checkpoint(),
+            }
+        write_checkpoint(path, state, self._checkpoint_shared_objects())
+
+    def resume(self, path: Optional[str] = None) -> None:
+        """
+        Restores a run from a checkpoint written by save_checkpoint(), to continue from the last checkpointed
+        iteration. The driver must have been created with the same optimizer, prototype, objective and conformer as
+        the checkpointed run. The recorder is restored to its checkpointed state with its restore().
+        :param path: checkpoint file, defaults to checkpoint_path
+        """
+        path = path or self.checkpoint_path
+        if path is None:
+            raise ValueError("No checkpoint path given")
+        state = read_checkpoint(path, self._checkpoint_shared_objects())
+        if type(state['optimizer']) is not type(self._optimizer):
+            raise ValueError(f"Checkpoint {path} is of a {type(state['optimizer']).__name__} run, "
+                             f"not of a {type(self._optimizer).__name__} run")
+        if type(state['driver']) is not type(self._driver):
+            raise ValueError(f"Checkpoint {path} is of a {type(state['driver']).__name__} run, "
+                             f"not of a {type(self._driver).__name__} run")
+
+        if hasattr(self._driver, 'close'):
+            self._driver.close()
+        self._driver = state['driver']
+        self._optimizer = state['optimizer']
+        self._driver.setup(self._objective, self.recorder, self._conformer)
+        self.recorder.restore(state['recorder_state'])
+
+    def _checkpoint_if_due(self) -> None:
+        if self.checkpoint_path is not None and self.num_iterations() % self.checkpoint_interval == 0:
+            self.save_checkpoint()
+
+    def _checkpoint_shared_objects(self) -> dict:
+        """
+        :return: objects that are provided by the resuming run instead of being checkpointed
+        """
+        return {
+            'recorder': self.recorder,
+            'objective': self._objective,
+            'conformer': self._conformer,
+            'problem': getattr(self._objective, '__self__', None),
+            }
 
     def best_solution(self) -> [Tuple[float, float, any]]:
         """
@@ -106,6 +193,8 @@ class ConvertingOptimizationDriver:
         return score, evaluation, self._conformer(solution)[0]
 
     def close(self) -> None:
+        if hasattr(self._driver, 'close'):
+            self._driver.close()
         self.recorder.close()
 
 
@@ -120,8 +209,29 @@ class OptimizationDriver(ConvertingOptimizationDriver):
                  method: str,
                  recorder: DataRecorder,
                  nprocs: Optional[int] = None,
+                 evaluation_cache: Optional[EvaluationCache] = None,
+                 checkpoint_path: Optional[str] = None,
+                 checkpoint_interval: int = 1,
+                 asynchronous: bool = False,
+                 timeout: Optional[float] = None,
                  **kwargs
                  ) -> None:
+        """
+        :param problem: the optimization problem
+        :param method: the optimizer, one of 'GA', 'CEM', 'CMA-ES', 'SPSA' or 'Stationary'
+        :param recorder: data recorder
+        :param nprocs: number of worker processes, or 1 to evaluate candidates in this process
+        :param evaluation_cache: optional cache of objective evaluations, keyed by the conformed candidates
+        :param checkpoint_path: optional file to checkpoint the run to, see resume()
+        :param checkpoint_interval: number of iterations between checkpoints
+        :param asynchronous: if True, evaluate candidates in nprocs worker processes with AskTellAsyncDriver, which
+            tells the optimizer as evaluations complete instead of waiting for whole generations
+        :param timeout: optional time limit of each evaluation in seconds, after which it is killed; requires
+            asynchronous
+        :param kwargs: keyword arguments of the optimizer
+        """
+        if timeout is not None and not asynchronous:
+            raise ValueError("'timeout' requires an asynchronous driver, set 'asynchronous' to True")
         self.problem: OptimizationProblem = problem
 
         optimizer: AskTellOptimizer
@@ -139,7 +249,13 @@ class OptimizationDriver(ConvertingOptimizationDriver):
         else:
             raise ValueError('Unknown optimizer: "' + method + '"')
 
-        driver = AskTellSerialDriver() if nprocs == 1 else AskTellParallelDriver(nprocs)
+        driver: AskTellDriver
+        if asynchronous:
+            driver = AskTellAsyncDriver(nprocs or cpu_count(), timeout=timeout, evaluation_cache=evaluation_cache)
+        elif nprocs == 1:
+            driver = AskTellSerialDriver(evaluation_cache)
+        else:
+            driver = AskTellParallelDriver(nprocs, evaluation_cache)
         super().__init__(
             driver,
             optimizer,
@@ -148,6 +264,8 @@ class OptimizationDriver(ConvertingOptimizationDriver):
             conformer=self.problem.conform_candidate_and_get_penalty,
             objective=self.problem.objective,
             recorder=recorder,
+            checkpoint_path=checkpoint_path,
+            checkpoint_interval=checkpoint_interval,
         )
 
     @staticmethod
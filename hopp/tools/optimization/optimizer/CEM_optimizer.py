@@ -19,6 +19,11 @@ from .dimension.gaussian_dimension import DimensionInfo, Gaussian
 class CEMOptimizer(AskTellOptimizer):
     """
     A prototype implementation of the cross-entropy method.
+
+    The sampling distribution is fit to the best candidates of the last generation_size evaluations told. Told a
+    generation at a time, this is the last generation. Told fewer evaluations at a time, e.g., by an asynchronous
+    driver, the window slides over the most recent evaluations, which may have been sampled from earlier
+    distributions.
     """
     
     def __init__(self,
@@ -30,6 +35,7 @@ class CEMOptimizer(AskTellOptimizer):
         self._generation_size: int = generation_size
         self._selection_proportion: float = selection_proportion
         self._best_candidate: Optional[Tuple[float, float, any]] = None
+        self._window: [Tuple[float, float, any]] = []
         
         self._mean = np.empty(0)
         self._covariance = np.empty(0)
@@ -79,21 +85,29 @@ class CEMOptimizer(AskTellOptimizer):
         def best_key(e):
             return e[1], e[0]
 
+        if len(evaluations) == 0:
+            return
         best = max(evaluations, key=best_key)
         self._best_candidate = best if self._best_candidate is None else max((self._best_candidate, best), key=best_key)
         
-        evaluations.sort(key=lambda evaluation: (evaluation[0], evaluation[1]), reverse=True)
-        selection_size = math.ceil(self._selection_proportion * len(evaluations))
-        del evaluations[selection_size:]
+        self._window.extend(evaluations)
+        del self._window[:-self._generation_size]
+        
+        selected = sorted(self._window, key=lambda evaluation: (evaluation[0], evaluation[1]), reverse=True)
+        selection_size = math.ceil(self._selection_proportion * len(selected))
+        del selected[selection_size:]
+        # the sampling distribution needs at least two samples, e.g., after the first incremental tell
+        if len(selected) < 2:
+            return
         
-        samples = np.empty((self._mean.size, len(evaluations)))
-        for i, e in enumerate(evaluations):
+        samples = np.empty((self._mean.size, len(selected)))
+        for i, e in enumerate(selected):
             samples[:, i] = e[2]
         
         self._mean = np.mean(samples, 1)
         self._covariance = np.cov(samples, ddof=1) * self._variance_scales
         
-        self._recorder.accumulate(evaluations, self.mean(), self.variance(), self._covariance)
+        self._recorder.accumulate(selected, self.mean(), self.variance(), self._covariance)
     
     def best_solution(self) -> Optional[Tuple[float, float, any]]:
         """
@@ -107,6 +121,9 @@ class CEMOptimizer(AskTellOptimizer):
     def get_num_candidates(self) -> int:
         return self._generation_size
     
+    def supports_incremental_tell(self) -> bool:
+        return True
+    
     def get_num_dimensions(self) -> int:
         return self._mean.size
     
@@ -106,11 +106,14 @@ class GAOptimizer(AskTellOptimizer, ABC):
         self._population.extend(evaluations)
         self._population.sort(key=lambda evaluation: evaluation[0], reverse=True)
         
-        selection_size = math.ceil(self._selection_proportion * len(evaluations))
+        # the population size is kept constant when told fewer candidates than a generation
+        selection_size = math.ceil(self._selection_proportion * max(len(evaluations), self._generation_size))
         del self._population[selection_size:]
         
-        for i, dimension in enumerate(self._dimensions):
-            dimension.update([evaluation[1][i] for evaluation in self._population])
+        # the sampling distributions need at least two samples, e.g., after an incremental tell
+        if len(self._population) > 1:
+            for i, dimension in enumerate(self._dimensions):
+                dimension.update([evaluation[1][i] for evaluation in self._population])
         
         self._recorder.accumulate(evaluations, self._population)
         
@@ -131,6 +134,9 @@ class GAOptimizer(AskTellOptimizer, ABC):
     def get_num_candidates(self) -> int:
         return self._generation_size
     
+    def supports_incremental_tell(self) -> bool:
+        return True
+    
     def get_num_dimensions(self) -> int:
         return len(self._dimensions)
     
@@ -155,6 +155,12 @@ class SPSAOptimizer(AskTellOptimizer, ABC):
         """
         return 2
     
+    def supports_incremental_tell(self) -> bool:
+        """
+        :return: True, each pair of candidates gives a gradient estimate
+        """
+        return True
+    
     def get_num_dimensions(self) -> int:
         """
         :return: number of dimensions being optimized over, or None if not implemented or applicable
@@ -82,6 +82,13 @@ class AskTellOptimizer:
         """
         return 1
     
+    def supports_incremental_tell(self) -> bool:
+        """
+        :return: True if tell() can be called with any number of blocks of candidates, e.g., as soon as they are
+            evaluated by an asynchronous driver, rather than with a whole generation
+        """
+        return False
+    
     def get_num_dimensions(self) -> Optional[int]:
         """
         :return: number of dimensions being optimized over, or None if not implemented or applicable
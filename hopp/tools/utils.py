@@ -1,5 +1,5 @@
 import numpy as np
-from typing import Sequence
+from typing import Sequence, Tuple
 
 
 def flatten_dict(d):
@@ -78,4 +78,12 @@ def export_all(obj):
 
 def array_not_scalar(array):
     """Return True if array is array-like and not a scalar"""
-    return isinstance(array, Sequence) or (isinstance(array, np.ndarray) and hasattr(array, "__len__"))
\ No newline at end of file
+    return isinstance(array, Sequence) or (isinstance(array, np.ndarray) and hasattr(array, "__len__"))
+
+
+def run_lengths(mask) -> Tuple[np.ndarray, np.ndarray]:
+    """Run-length encodes the True values of a boolean array, returning the start index and length of each run"""
+    padded = np.concatenate(([False], np.asarray(mask, dtype=bool), [False]))
+    edges = np.flatnonzero(padded[1:] != padded[:-1])
+    starts = edges[::2]
+    return starts, edges[1::2] - starts
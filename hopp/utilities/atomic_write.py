@@ -0,0 +1,38 @@
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import IO, Iterator, Union
+
+
+@contextmanager
+def atomic_write(path: Union[str, os.PathLike], mode: str = "wb", fsync: bool = False, **open_kwargs) -> Iterator[IO]:
+    """Opens a temporary file next to ``path`` for writing and moves it to ``path`` when the block exits.
+
+    The file is written under a unique temporary name in the same directory and then renamed with ``os.replace``,
+    so other threads and processes, e.g., concurrent simulations sharing a cache directory, see either the previous
+    file or the complete new one, never a partial file. If the block raises, the temporary file is removed and
+    ``path`` is left unchanged.
+
+    Args:
+        path: file to write
+        mode: file mode of the temporary file, either ``'w'`` or ``'wb'``
+        fsync: if True, the file is flushed to disk before it is renamed
+        **open_kwargs: other arguments of ``open``, e.g., ``encoding``
+
+    Yields:
+        the open temporary file
+    """
+    path = os.fspath(path)
+    directory, name = os.path.split(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=name, suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, mode, **open_kwargs) as f:
+            yield f
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
@@ -0,0 +1,67 @@
+from multiprocessing import get_all_start_methods, get_context
+from typing import Any, Callable, Iterable, List, Optional
+
+# The object shared with the tasks of (this process in) a fork pool
+_pool_object = None
+
+
+def is_fork_available() -> bool:
+    """Returns True if processes can be started with the 'fork' start method on this platform."""
+    return "fork" in get_all_start_methods()
+
+
+class ForkPool:
+    """A pool of forked worker processes, each inheriting a copy of an object, e.g., a hybrid simulation.
+
+    Objects that are expensive to build or cannot be pickled, such as PySAM and Pyomo models, are inherited by the
+    workers when they are forked, so only the task arguments and results are pickled between processes.
+
+    Tasks are functions that take the worker's copy of the object as their first argument. They must be picklable,
+    i.e., module-level functions or functions of a class, e.g., ``HybridSimulation.evaluate_candidate``.
+    """
+
+    def __init__(
+        self,
+        obj: Any,
+        processes: int,
+        initializer: Optional[Callable[[Any], None]] = None,
+    ):
+        """
+        Args:
+            obj: object inherited by each worker
+            processes: number of worker processes
+            initializer: (optional) function called with the worker's copy of the object when the worker starts
+        """
+        self._pool = get_context("fork").Pool(
+            processes=processes,
+            initializer=_set_pool_object,
+            initargs=(obj, initializer),
+        )
+
+    def starmap(self, function: Callable, args: Iterable[tuple]) -> List[Any]:
+        """Calls ``function(obj, *arg)`` for each tuple of arguments in the workers and returns the results in order."""
+        return self._pool.starmap(_call, [(function, tuple(arg)) for arg in args], chunksize=1)
+
+    def close(self):
+        """Stops the worker processes."""
+        self._pool.terminate()
+        self._pool.join()
+
+    def __enter__(self) -> "ForkPool":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _set_pool_object(obj: Any, initializer: Optional[Callable[[Any], None]]):
+    """Sets the object for (this process in) the pool"""
+    global _pool_object
+    _pool_object = obj
+    if initializer is not None:
+        initializer(_pool_object)
+
+
+def _call(function: Callable, args: tuple) -> Any:
+    """Calls the task with this process' object"""
+    return function(_pool_object, *args)
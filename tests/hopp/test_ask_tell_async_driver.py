@@ -0,0 +1,211 @@
+import itertools
+import os
+import subprocess
+import time
+
+import numpy as np
+import pytest
+
+from hopp.tools.optimization.data_logging.null_data_recorder import NullDataRecorder
+from hopp.tools.optimization.driver.ask_tell_async_driver import AskTellAsyncDriver
+from hopp.tools.optimization.optimization_driver import OptimizationDriver
+from hopp.tools.optimization.optimizer.ask_tell_optimizer import AskTellOptimizer
+from hopp.tools.optimization.optimizer.CEM_optimizer import CEMOptimizer
+from hopp.tools.optimization.optimizer.dimension.gaussian_dimension import Gaussian
+from tests.hopp.utils import QuadraticProblem
+
+HANG = -1.0
+FAIL = -2.0
+EXIT = -3.0
+
+
+class DriverObjective:
+    """Scores a candidate by its value, or hangs in a solver subprocess, raises or exits for the special values"""
+
+    def __init__(self, pid_file=None):
+        self.pid_file = pid_file
+
+    def __call__(self, candidate):
+        value = float(candidate[0])
+        if value == HANG:
+            solver = subprocess.Popen(["sleep", "60"])
+            with open(self.pid_file, "w") as f:
+                f.write(str(solver.pid))
+            solver.wait()
+        elif value == FAIL:
+            raise ValueError("Candidate can't be simulated")
+        elif value == EXIT:
+            os._exit(1)
+        return value, value, candidate
+
+
+class SequenceOptimizer(AskTellOptimizer):
+    """Asks candidates with the given values, then increasing values unless finite, and records what it is told"""
+
+    def __init__(self, values, generation_size=4, incremental=True, finite=False):
+        self._values = iter(values) if finite else itertools.chain(values, itertools.count(1.0))
+        self._generation_size = generation_size
+        self._incremental = incremental
+        self.told = []
+
+    def setup(self, dimensions, recorder):
+        pass
+
+    def stop(self):
+        return False
+
+    def ask(self, num=None):
+        num = self._generation_size if num is None else num
+        return [np.array([value]) for value in itertools.islice(self._values, num)]
+
+    def tell(self, evaluations):
+        self.told.append([e[0] for e in evaluations])
+
+    def best_solution(self):
+        return None
+
+    def central_solution(self):
+        return None, None, None
+
+    def get_num_candidates(self):
+        return self._generation_size
+
+    def supports_incremental_tell(self):
+        return self._incremental
+
+
+def is_running(pid):
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            return "zombie" not in f.read()
+    except FileNotFoundError:
+        return False
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc"), reason="Requires /proc to check processes")
+def test_async_driver_timeout(tmp_path):
+    pid_file = tmp_path / "solver.pid"
+    driver = AskTellAsyncDriver(nprocs=1, tell_size=3, timeout=1.0)
+    driver.setup(DriverObjective(pid_file), NullDataRecorder())
+    worker_pid = driver._workers[0].process.pid
+
+    optimizer = SequenceOptimizer([HANG])
+    driver.step(optimizer)
+
+    # The hung evaluation is killed and not told, and the following candidates are evaluated by a new worker
+    assert optimizer.told == [[1.0, 2.0, 3.0]]
+    assert driver.get_num_timeouts() == 1
+    assert driver.get_num_evaluations() == 3
+    assert len(driver._workers) == 1
+    assert driver._workers[0].process.pid != worker_pid
+    assert driver._workers[0].process.is_alive()
+
+    # The solver subprocess of the hung worker is killed with it
+    solver_pid = int(pid_file.read_text())
+    for _ in range(50):
+        if not is_running(solver_pid):
+            break
+        time.sleep(0.1)
+    assert not is_running(solver_pid)
+    driver.close()
+
+
+def test_async_driver_incremental_tell():
+    driver = AskTellAsyncDriver(nprocs=2)
+    driver.setup(DriverObjective(), NullDataRecorder())
+
+    # Optimizers that support incremental tell are told the blocks that have completed, without waiting for the
+    # candidates still being evaluated
+    incremental = SequenceOptimizer([], generation_size=4, incremental=True)
+    for _ in range(6):
+        driver.step(incremental)
+    assert all(1 <= len(told) <= 2 for told in incremental.told)
+    told = list(itertools.chain(*incremental.told))
+    assert len(set(told)) == len(told) == driver.get_num_evaluations()
+
+    # Other optimizers are told whole generations
+    generational = SequenceOptimizer([], generation_size=4, incremental=False)
+    for _ in range(2):
+        driver.step(generational)
+    assert [len(told) for told in generational.told] == [4, 4]
+    driver.close()
+
+    # A tell size groups blocks
+    driver = AskTellAsyncDriver(nprocs=2, tell_size=3)
+    driver.setup(DriverObjective(), NullDataRecorder())
+    driver.step(incremental)
+    assert len(incremental.told[-1]) >= 3
+    driver.close()
+
+
+def test_async_driver_cem_incremental_tell():
+    np.random.seed(0)
+    problem = QuadraticProblem()
+    optimizer = CEMOptimizer(generation_size=8, selection_proportion=0.5)
+    optimizer.setup([Gaussian(0.0, 1.0), Gaussian(0.0, 1.0)], NullDataRecorder())
+    assert optimizer.supports_incremental_tell()
+
+    driver = AskTellAsyncDriver(nprocs=1)
+    driver.setup(problem.objective, NullDataRecorder(), problem.conform_candidate_and_get_penalty)
+    for _ in range(40):
+        driver.step(optimizer)
+
+    assert driver.get_num_evaluations() == 40
+    # The distribution is fit to the best of the last generation_size evaluations
+    assert len(optimizer._window) == 8
+    assert np.linalg.norm(optimizer.mean() - problem.target) < np.linalg.norm(problem.target)
+    driver.close()
+
+
+def test_async_driver_errors():
+    driver = AskTellAsyncDriver(nprocs=1, tell_size=4)
+    driver.setup(DriverObjective(), NullDataRecorder())
+
+    # Failed evaluations and exited workers are counted, and their blocks are not told
+    optimizer = SequenceOptimizer([FAIL, EXIT])
+    driver.step(optimizer)
+    assert optimizer.told == [[1.0, 2.0, 3.0, 4.0]]
+    assert driver.get_num_failures() == 2
+    assert len(driver._workers) == 1
+    assert driver._workers[0].process.is_alive()
+    driver.close()
+
+    # Failing every evaluation stops the run with the objective's error
+    driver = AskTellAsyncDriver(nprocs=2, max_consecutive_failures=3)
+    driver.setup(DriverObjective(), NullDataRecorder())
+    with pytest.raises(RuntimeError) as error:
+        driver.step(SequenceOptimizer(itertools.repeat(FAIL)))
+    assert isinstance(error.value.__cause__, ValueError)
+    driver.close()
+
+
+def test_async_driver_no_candidates():
+    driver = AskTellAsyncDriver(nprocs=1, max_in_flight=1, tell_size=4)
+    driver.setup(DriverObjective(), NullDataRecorder())
+
+    # The evaluations of the last candidates are told once the optimizer has no more candidates
+    optimizer = SequenceOptimizer([1.0, 2.0, 3.0, 4.0, 5.0, 6.0], finite=True)
+    driver.step(optimizer)
+    driver.step(optimizer)
+    assert optimizer.told == [[1.0, 2.0, 3.0, 4.0], [5.0, 6.0]]
+
+    # An optimizer without candidates is told nothing, instead of waiting forever
+    driver.step(optimizer)
+    assert optimizer.told[-1] == []
+    assert driver.get_num_evaluations() == 6
+    driver.close()
+
+
+def test_optimization_driver_asynchronous():
+    kwargs = {"prior_scale": 1.0, "generation_size": 8, "selection_proportion": 0.5}
+    with pytest.raises(ValueError):
+        OptimizationDriver(QuadraticProblem(), "CEM", NullDataRecorder(), nprocs=2, timeout=10.0, **kwargs)
+
+    driver = OptimizationDriver(QuadraticProblem(), "CEM", NullDataRecorder(), nprocs=2, asynchronous=True,
+                                timeout=10.0, **kwargs)
+    assert isinstance(driver._driver, AskTellAsyncDriver)
+    for _ in range(10):
+        driver.step()
+    assert driver.num_iterations() == 10
+    assert driver.best_solution()[0] is not None
+    driver.close()
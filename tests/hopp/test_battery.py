@@ -5,6 +5,7 @@ import pytest
 from pytest import fixture
 
 from hopp.simulation.technologies.battery import Battery, BatteryConfig
+from hopp.simulation.technologies.power_source import PowerSource
 from tests.hopp.utils import create_default_site_info
 
 
@@ -102,3 +103,50 @@ def test_battery_initialization(site, subtests):
 
     with subtests.test("battery footprint area"):
         assert battery.footprint_area == pytest.approx(250.0, 1e-3) #TODO: verify system mass. Current value is just based on output at writing.
+
+
+def test_battery_simulate_with_control(site):
+    control = [1e3, -2e3, -5e3, 0., 4e3, -1e3] * 4    # kW
+
+    batteries = []
+    for _ in range(2):
+        battery = Battery(site, config=BatteryConfig.from_dict(config_data))
+        battery.value("control_mode", 1.0)
+        battery.value("input_power", 0.)
+        battery.setup_performance_model()
+        batteries.append(battery)
+    stepped, batched = batteries
+
+    for t, power in enumerate(control):
+        stepped.value("dt_hr", 1.0)
+        stepped.value("input_power", power)
+        stepped.simulate_power(time_step=t)
+    batched.simulate_with_control(control, 1.0, sim_start_time=0)
+
+    for attr in stepped.outputs.stateful_attributes:
+        assert getattr(batched.outputs, attr) == pytest.approx(getattr(stepped.outputs, attr))
+    assert batched.value("SOC") == pytest.approx(stepped.value("SOC"))
+
+
+def test_battery_value_owner(site):
+    battery = Battery(site, config=BatteryConfig.from_dict(config_data))
+
+    assert battery.value_owner("system_capacity_kw") is battery
+    owner = battery.value_owner("minimum_SOC")
+    assert owner.minimum_SOC == battery.value("minimum_SOC")
+
+    battery.value("minimum_SOC", 15.)
+    assert owner.minimum_SOC == 15.
+    assert battery.value_owner("ppa_price_input") is not None
+    # financial variables are not in the system model, which is not searched again
+    system_groups = PowerSource._value_group_cache[type(battery._system_model)]
+    assert "ppa_price_input" in system_groups
+    assert system_groups["ppa_price_input"] is None
+
+    with pytest.raises(ValueError):
+        battery.value("not_a_variable")
+
+    model_owner = PowerSource.model_value_owner(battery._system_model, "maximum_SOC")
+    assert model_owner.maximum_SOC == battery.value("maximum_SOC")
+    with pytest.raises(ValueError):
+        PowerSource.model_value_owner(battery._system_model, "not_a_variable")
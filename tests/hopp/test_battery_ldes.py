@@ -140,4 +140,28 @@ def test_battery_initialization_with_replacement_schedule(site, subtests):
         config = BatteryConfig.from_dict(data)
         battery = Battery(site, config=config)
 
-        assert battery._financial_model == fin_model
\ No newline at end of file
+        assert battery._financial_model == fin_model
+
+def test_battery_simulate_with_control(site):
+    control = [2e3, -5e3, -5e3, -6e3, 0., 5e3, 5e3, 5e3] * 3    # kW
+
+    batteries = []
+    for _ in range(2):
+        battery = Battery(site, config=BatteryConfig.from_dict(config_data))
+        battery.value("control_mode", 1.0)
+        batteries.append(battery)
+    stepped, batched = batteries
+
+    power, soc = [], []
+    for t, control_power in enumerate(control):
+        stepped.value("input_power", control_power)
+        stepped.simulate_power()
+        power.append(stepped._system_model.state.P)
+        soc.append(stepped._system_model.state.SOC)
+    batched.simulate_with_control(control, 1.0, sim_start_time=0)
+
+    assert batched.outputs.P[:len(control)] == pytest.approx(power)
+    assert batched.outputs.gen[:len(control)] == pytest.approx(power)
+    assert batched.outputs.SOC[:len(control)] == pytest.approx(soc)
+    assert batched._system_model.state.SOC == pytest.approx(stepped._system_model.state.SOC)
+    assert max(batched.outputs.SOC) <= batched.config.maximum_SOC + 1e-6
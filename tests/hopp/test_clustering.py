@@ -416,3 +416,39 @@ def test_cluster_avgs_from_timeseries():
     assert max(list_lengths) == min(list_lengths)
     assert sum(cluster_averages[0]) == approx(495893, 1e-3)
     assert sum(cluster_averages[-1]) == approx(2734562, 1e-3)
+
+
+def test_affinity_propagation_dtype_and_chunking():
+    rng = np.random.default_rng(0)
+    centers = np.array([[0.0, 0.0], [5.0, 5.0], [0.0, 10.0]])
+    data = np.vstack([c + 0.5 * rng.standard_normal((n, 2)) for c, n in zip(centers, (30, 40, 50))])
+
+    distances = clustering.pairwise_squared_distances(data, data)
+    assert clustering.pairwise_squared_distances(data, data, chunk_size=7) == approx(distances)
+    assert distances == approx(((data[:, np.newaxis, :] - data[np.newaxis, :, :]) ** 2).sum(2))
+
+    results = []
+    for dtype, chunk_size in [(np.float64, 256), (np.float32, 16)]:
+        alg = clustering.AffinityPropagation(preference=-50.0, dtype=dtype, chunk_size=chunk_size)
+        alg.fit_predict(data)
+        results.append(alg)
+
+    assert results[0].n_clusters == 3
+    assert results[1].n_clusters == 3
+    assert results[0].converged and results[1].converged
+    assert list(results[1].exemplars) == list(results[0].exemplars)
+    assert list(results[1].cluster_index) == list(results[0].cluster_index)
+    assert results[1].wcss == approx(results[0].wcss, 1e-4)
+
+
+def test_affinity_propagation_single_precision_ties():
+    # Points on a grid have many equal similarities, which are broken by noise that must survive single precision
+    grid = np.array([[i, j] for i in range(6) for j in range(6)], dtype=float)
+    for seed in (4, 6):
+        data = grid[np.random.default_rng(seed).choice(len(grid), 20, replace=False)]
+        results = []
+        for dtype in (np.float64, np.float32):
+            alg = clustering.AffinityPropagation(preference=-20.0, dtype=dtype)
+            alg.fit_predict(data)
+            results.append(alg)
+        assert list(results[1].cluster_index) == list(results[0].cluster_index)
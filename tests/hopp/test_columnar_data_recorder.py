@@ -0,0 +1,162 @@
+import os
+
+import numpy as np
+import pytest
+
+from hopp.tools.optimization.data_logging.columnar_data_recorder import ColumnarDataRecorder
+
+
+def make_recorder(path, batch_size=3):
+    recorder = ColumnarDataRecorder(str(path), batch_size=batch_size)
+    recorder.add_columns('iteration', 'score', 'solution', 'evaluations')
+    recorder.set_schema()
+    return recorder
+
+
+def store_records(recorder, start, stop):
+    for i in range(start, stop):
+        recorder.accumulate(i, -float(i), np.array([i, i + 0.5]), [(float(i), None)])
+        recorder.store()
+
+
+def chunk_names(path):
+    return sorted(name for name in os.listdir(path) if name.startswith('chunk_'))
+
+
+def test_columnar_data_recorder_flush(tmp_path):
+    recorder = make_recorder(tmp_path, batch_size=3)
+    assert len(recorder) == 0
+    assert recorder
+
+    # Records are buffered until batch_size of them are stored
+    store_records(recorder, 0, 2)
+    assert chunk_names(tmp_path) == []
+    assert len(recorder) == 2
+    store_records(recorder, 2, 3)
+    assert chunk_names(tmp_path) == ['chunk_000000']
+    store_records(recorder, 3, 7)
+    assert chunk_names(tmp_path) == ['chunk_000000', 'chunk_000001']
+    assert len(recorder) == 7
+
+    # Buffered records are read with the written ones
+    assert recorder.get_column('iteration').tolist() == list(range(7))
+    assert recorder.get_record(-1)[0] == 6
+
+    # Closing writes out the buffered records
+    recorder.close()
+    assert chunk_names(tmp_path) == ['chunk_000000', 'chunk_000001', 'chunk_000002']
+
+
+def test_columnar_data_recorder_read(tmp_path):
+    recorder = make_recorder(tmp_path, batch_size=3)
+    store_records(recorder, 0, 5)
+    recorder.close()
+
+    reader = ColumnarDataRecorder(str(tmp_path), mode='r')
+    assert reader.is_setup()
+    assert len(reader) == 5
+    assert reader.get_column_map() == {'iteration': 0, 'score': 1, 'solution': 2, 'evaluations': 3}
+    np.testing.assert_array_equal(reader.get_column('score'), [0.0, -1.0, -2.0, -3.0, -4.0])
+    np.testing.assert_array_equal(reader.get_column('solution')[4], [4.0, 4.5])
+    assert [len(chunk) for chunk in reader.iter_column_chunks('iteration')] == [3, 2]
+    with pytest.raises(Exception):
+        reader.store()
+
+    # Records hold plain values instead of numpy scalars or memory-mapped views
+    record = reader.get_record(3)
+    assert type(record[0]) is int and record[0] == 3
+    assert type(record[1]) is float and record[1] == -3.0
+    assert type(record[2]) is np.ndarray and not isinstance(record[2], np.memmap)
+    np.testing.assert_array_equal(record[2], [3.0, 3.5])
+    records = reader.get_records()
+    assert len(records) == 5
+    assert all(type(r[0]) is int and type(r[1]) is float and type(r[2]) is np.ndarray for r in records)
+    assert records[3][:2] == record[:2]
+
+    # Returned arrays are copies
+    records[3][2][0] = -1.0
+    assert reader.get_record(3)[2][0] == 3.0
+
+
+def test_columnar_data_recorder_pickle_fallback(tmp_path):
+    recorder = make_recorder(tmp_path, batch_size=2)
+    store_records(recorder, 0, 2)
+    # Values that cannot be cast to the column's dtype, set by its first chunk, are pickled
+    recorder.accumulate('three', None, np.array([3.0, 3.5]), [])
+    recorder.store()
+    recorder.accumulate(4, -4.0, np.array([4.0, 4.5]), [])
+    recorder.store()
+    recorder.close()
+
+    chunk = tmp_path / 'chunk_000000'
+    assert sorted(os.listdir(chunk)) == ['0.npy', '1.npy', '2.npy', '3.pkl']
+    chunk = tmp_path / 'chunk_000001'
+    assert sorted(os.listdir(chunk)) == ['0.pkl', '1.pkl', '2.npy', '3.pkl']
+
+    reader = ColumnarDataRecorder(str(tmp_path), mode='r')
+    assert reader.get_column('iteration') == [0, 1, 'three', 4]
+    assert reader.get_column('score') == [0.0, -1.0, None, -4.0]
+    assert reader.get_column('evaluations') == [[(0.0, None)], [(1.0, None)], [], []]
+    assert reader.get_record(2)[:2] == ['three', None]
+
+
+def test_columnar_data_recorder_restore(tmp_path):
+    recorder = make_recorder(tmp_path, batch_size=2)
+    store_records(recorder, 0, 3)
+    # the checkpoint writes the buffered record out and only holds the position of the recorded data
+    position = recorder.checkpoint()
+    assert position == 3
+    assert chunk_names(tmp_path) == ['chunk_000000', 'chunk_000001']
+    records = recorder.get_records()
+    # records recorded after the checkpoint, e.g., by a run that was killed later
+    store_records(recorder, 3, 8)
+    recorder.close()
+    os.makedirs(tmp_path / 'chunk_000099')
+
+    # A resumed run continues the recorded data, restored to the checkpoint
+    resumed = ColumnarDataRecorder(str(tmp_path), batch_size=2, mode='a')
+    with pytest.raises(Exception):
+        resumed.restore(position)
+    resumed.add_columns('iteration', 'score', 'solution', 'evaluations')
+    resumed.set_schema()
+    assert len(resumed) == 8
+    with pytest.raises(ValueError):
+        resumed.restore(4)
+    resumed.restore(position)
+    assert len(resumed) == 3
+    assert chunk_names(tmp_path) == ['chunk_000000', 'chunk_000001']
+    assert resumed.get_column('iteration').tolist() == [0, 1, 2]
+    store_records(resumed, 3, 4)
+    resumed.close()
+
+    reader = ColumnarDataRecorder(str(tmp_path), mode='r')
+    assert reader.get_column('iteration').tolist() == [0, 1, 2, 3]
+    for record, expected in zip(reader.get_records(), records):
+        assert record[:2] == expected[:2]
+        np.testing.assert_array_equal(record[2], expected[2])
+        assert record[3] == expected[3]
+    with pytest.raises(Exception):
+        reader.restore(position)
+
+    # Restoring to the start resets the column types, and continued data needs the same columns
+    restarted = make_recorder(tmp_path / 'restarted')
+    restarted.accumulate('zero', None, None, None)
+    restarted.store()
+    restarted.restore(restarted.checkpoint() - 1)
+    store_records(restarted, 0, 1)
+    assert restarted.get_column('iteration').tolist() == [0]
+    restarted.close()
+    other = ColumnarDataRecorder(str(tmp_path), mode='a')
+    other.add_columns('iteration')
+    with pytest.raises(ValueError):
+        other.set_schema()
+
+
+def test_columnar_data_recorder_make_data_recorder(tmp_path):
+    recorder = ColumnarDataRecorder.make_data_recorder(str(tmp_path), 'run', batch_size=2)
+    recorder.add_columns('iteration')
+    recorder.set_schema()
+    recorder.accumulate(0)
+    recorder.store()
+    recorder.close()
+    assert ColumnarDataRecorder(str(tmp_path / 'run.columns'), mode='r').get_column('iteration').tolist() == [0]
@@ -6,6 +6,9 @@ from hopp.simulation import HoppInterface
 from hopp.simulation.technologies.dispatch.power_sources.csp_dispatch import CspDispatch
 from hopp.simulation.technologies.csp.tower_plant import TowerPlant, TowerConfig
 from hopp.simulation.technologies.csp.trough_plant import TroughPlant, TroughConfig
+from hopp.simulation.technologies.csp.csp_plant import CspResultCache
+from hopp.simulation.technologies.csp.pySSC_daotk import ssc_wrap
+from hopp.simulation.technologies.csp.pySSC_daotk.ssc_wrap import PysscWrap
 from tests.hopp.utils import create_default_site_info
 
 
@@ -81,6 +84,123 @@ def test_pySSC_tower_increment_simulation(site):
     assert increments_annual_energy == pytest.approx(wo_increments_annual_energy, 1e-5)
 
 
+def test_pySSC_incremental_data_table(site):
+    """Testing that only changed inputs are pushed to the long-lived ssc data container"""
+    tower_config = {'cycle_capacity_kw': 100 * 1000,
+                    'solar_multiple': 2.0,
+                    'tes_hours': 6.0}
+
+    config = TowerConfig.from_dict(tower_config)
+    csp = TowerPlant(site, config=config)
+    csp.generate_field()
+
+    output_names = ['time_start', 'time_stop', 'gen', 'e_ch_tes']
+    for day in [100, 101]:
+        start_datetime, end_datetime = CspDispatch.get_start_end_datetime(day*24, 24)
+        csp.ssc.set({'time_start': CspDispatch.seconds_since_newyear(start_datetime),
+                     'time_stop': CspDispatch.seconds_since_newyear(end_datetime)})
+        incremental_outputs = csp.ssc.execute(output_names)
+
+    fresh_ssc = PysscWrap(csp.ssc.tech_name, csp.ssc.financial_name, csp.ssc.export_params())
+    fresh_outputs = fresh_ssc.execute()
+
+    assert set(incremental_outputs.keys()) == set(output_names + ['tech_model', 'financial_model', 'cmod_success'])
+    for name in output_names:
+        assert incremental_outputs[name] == pytest.approx(fresh_outputs[name])
+
+
+class _CounterSSC:
+    """In-memory stand-in for the ssc API with a 'counter' module: INPUT 'x', INOUT 'count' and OUTPUTs 'y' and
+    'positive', which is only written if x > 0"""
+    VARIABLES = [('x', 2, 1), ('count', 2, 3), ('y', 2, 2), ('positive', 2, 2)]
+
+    def data_create(self):
+        return {}
+
+    def data_free(self, data):
+        data.clear()
+
+    def data_unassign(self, data, name):
+        data.pop(name, None)
+
+    def data_query(self, data, name):
+        return 2 if name in data else 0
+
+    def data_set_number(self, data, name, value):
+        data[name] = value
+
+    def data_get_number(self, data, name):
+        return data[name]
+
+    def module_create(self, name):
+        return name
+
+    def module_free(self, cmod):
+        pass
+
+    def module_var_info(self, cmod, index):
+        return index
+
+    def info_data_type(self, index):
+        return self.VARIABLES[index][1] if index < len(self.VARIABLES) else 0
+
+    def info_name(self, index):
+        return self.VARIABLES[index][0].encode("ascii")
+
+    def info_var_type(self, index):
+        return self.VARIABLES[index][2]
+
+    def module_exec_set_print(self, prn):
+        pass
+
+    def module_exec(self, cmod, data):
+        data[b'count'] = data.get(b'count', 0) + 1
+        data[b'y'] = data[b'x'] * 2
+        if data[b'x'] > 0:
+            data[b'positive'] = 1
+        return 1
+
+
+def test_pySSC_data_container_reset(monkeypatch):
+    """Testing that values written by a previous run do not carry into the next run of the data container"""
+    monkeypatch.setattr(ssc_wrap, "PySSC", _CounterSSC)
+    wrap = PysscWrap('counter', 'none')
+
+    wrap.set({'x': 1})
+    outputs = wrap.execute()
+    assert outputs['y'] == 2 and outputs['positive'] == 1 and outputs['count'] == 1
+
+    # like a new container, the output that is not written and the INOUT that is not a parameter are unset
+    wrap.set({'x': -1})
+    outputs = wrap.execute()
+    assert outputs['y'] == -2 and 'positive' not in outputs and outputs['count'] == 1
+
+    # INOUT parameters are reset from the parameters every run
+    wrap.set({'count': 10})
+    assert wrap.execute()['count'] == 11
+    assert wrap.execute()['count'] == 11
+
+
+def test_csp_result_cache():
+    cache = CspResultCache(max_size=2)
+    result = {'gen': [1.0, 2.0]}
+    cache.put('a', result)
+
+    # results are copied in and out of the cache
+    result['gen'][0] = -1.0
+    cached = cache.get('a')
+    assert cached == {'gen': [1.0, 2.0]}
+    cached['gen'][1] = -1.0
+    assert cache.get('a') == {'gen': [1.0, 2.0]}
+
+    # the least recently used result is evicted
+    cache.put('b', {})
+    cache.get('a')
+    cache.put('c', {})
+    assert len(cache) == 2 and 'a' in cache and 'b' not in cache
+    assert cache.get('b') is None
+
+
 def test_pySSC_trough_model(site):
     """Testing pySSC trough model using heuristic dispatch method"""
     trough_config = {'cycle_capacity_kw': 100 * 1000,
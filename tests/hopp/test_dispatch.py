@@ -1,4 +1,11 @@
+import io
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import get_context
 from pathlib import Path
+from types import SimpleNamespace
+import numpy as np
+from numpy.testing import assert_array_equal
 import pytest
 import pyomo.environ as pyomo
 from pyomo.environ import units as u
@@ -22,7 +29,9 @@ from hopp.simulation.technologies.battery import Battery, BatteryConfig
 
 from hopp.simulation.technologies.dispatch.power_storage.linear_voltage_convex_battery_dispatch import ConvexLinearVoltageBatteryDispatch
 from hopp.simulation.technologies.dispatch.power_storage.simple_battery_dispatch import SimpleBatteryDispatch
-from hopp.simulation.technologies.dispatch.hybrid_dispatch_builder_solver import HybridDispatchBuilderSolver, HybridDispatchOptions
+from hopp.simulation.technologies.dispatch.power_storage.simple_battery_dispatch_heuristic import SimpleBatteryDispatchHeuristic
+from hopp.simulation.technologies.dispatch.hybrid_dispatch_builder_solver import HybridDispatchBuilderSolver, HybridDispatchOptions, GLPK_SOLVER_OPTIONS
+from hopp.utilities.fork_pool import is_fork_available
 from hopp.simulation.technologies.dispatch.power_sources.pv_dispatch import PvDispatch
 from hopp.simulation.technologies.dispatch.power_sources.wind_dispatch import WindDispatch
 
@@ -524,6 +533,90 @@ def test_simple_battery_dispatch(site):
         assert battery.outputs.P[i] == pytest.approx(dispatch_power, 1e-3 * abs(dispatch_power))
 
 
+def test_dispatch_horizon_parameters(site):
+    dispatch_n_look_ahead = 24
+
+    config = BatteryConfig.from_dict(technologies['battery'])
+    battery = Battery(site, config=config)
+
+    model = pyomo.ConcreteModel(name='battery_only')
+    model.forecast_horizon = pyomo.Set(initialize=range(dispatch_n_look_ahead))
+    battery._dispatch = SimpleBatteryDispatch(model,
+                                              model.forecast_horizon,
+                                              battery._system_model,
+                                              battery._financial_model,
+                                              "battery",
+                                              dispatch_options=HybridDispatchOptions())
+    battery.dispatch.initialize_parameters()
+
+    # Scalar values are set on every block
+    battery.dispatch.cost_per_charge = 1.234567
+    assert battery.dispatch.cost_per_charge == 1.2346
+    assert_array_equal(battery.dispatch.get_horizon_array("cost_per_charge"), np.full(dispatch_n_look_ahead, 1.2346))
+
+    # Arrays are set per block
+    durations = np.linspace(0.5, 1.0, dispatch_n_look_ahead)
+    battery.dispatch.time_duration = durations
+    assert_array_equal(battery.dispatch.get_horizon_array("time_duration"), np.round(durations, 4))
+    assert battery.dispatch.time_duration == pytest.approx(list(durations), abs=1e-4)
+
+    durations[3] = 2.0
+    battery.dispatch.time_duration = durations
+    assert model.battery[3].time_duration.value == 2.0
+
+    # Values set on the model directly are overwritten by the next update, even if it is unchanged
+    model.battery[3].time_duration.set_value(5.0)
+    battery.dispatch.time_duration = durations
+    assert model.battery[3].time_duration.value == 2.0
+
+    with pytest.raises(ValueError):
+        battery.dispatch.time_duration = durations[1:]
+
+    # Unsolved variables are NaN
+    assert np.isnan(battery.dispatch.get_horizon_array("charge_power")).all()
+
+
+def test_simple_battery_dispatch_heuristic(site):
+    dispatch_n_look_ahead = 24
+
+    config = BatteryConfig.from_dict(technologies['battery'])
+    battery = Battery(site, config=config)
+
+    model = pyomo.ConcreteModel(name='battery_only')
+    model.forecast_horizon = pyomo.Set(initialize=range(dispatch_n_look_ahead))
+    battery._dispatch = SimpleBatteryDispatchHeuristic(model,
+                                                       model.forecast_horizon,
+                                                       battery._system_model,
+                                                       battery._financial_model,
+                                                       dispatch_options=HybridDispatchOptions({'battery_dispatch': 'heuristic'}))
+    battery.dispatch.initialize_parameters()
+    battery.dispatch.update_dispatch_initial_soc(initial_soc=50.0)
+    battery.dispatch.user_fixed_dispatch = [0.0] * 6 + [-1.0] * 6 + [1.0] * 6 + [0.0] * 6
+
+    maximum_power = battery.dispatch.maximum_power
+    gen = [0.5 * maximum_power] * 12 + [0.0] * 12
+    grid_limit = [0.6 * maximum_power] * dispatch_n_look_ahead
+    battery.dispatch.set_fixed_dispatch(gen, grid_limit)
+
+    expected_dispatch = [0.0] * 6 + [-0.5] * 6 + [0.6] * 6 + [0.0] * 6
+    assert battery.dispatch.fixed_dispatch == pytest.approx(expected_dispatch)
+    assert battery.dispatch.charge_power == pytest.approx([max(-fd, 0.0) * maximum_power for fd in expected_dispatch])
+    assert battery.dispatch.discharge_power == pytest.approx([max(fd, 0.0) * maximum_power for fd in expected_dispatch])
+    assert battery.dispatch.power == pytest.approx([fd * maximum_power for fd in expected_dispatch])
+
+    soc0 = battery.dispatch.initial_soc / 100.0
+    expected_soc = []
+    for fd in expected_dispatch:
+        soc0 = battery.dispatch.update_soc(fd, soc0)
+        expected_soc.append(soc0 * 100.0)
+    assert battery.dispatch.soc == pytest.approx(expected_soc)
+    assert battery.dispatch.soc[11] > battery.dispatch.soc[5]
+    assert battery.dispatch.soc[17] < battery.dispatch.soc[11]
+
+    # The schedule is not written to the Pyomo model
+    assert np.isnan(battery.dispatch.get_horizon_array("charge_power")).all()
+
+
 def test_simple_battery_dispatch_lifecycle_count(site):
     expected_objective = 24378.6
     expected_lifecycles = [0.75048, 1.50096]
@@ -716,6 +809,173 @@ def test_pv_wind_battery_hybrid_dispatch(site):
         assert system_generation[t] * 1e3 >= 0.0
 
 
+def test_dispatch_solver_pool(site):
+    builder = HybridDispatchBuilderSolver(site, {})
+
+    glpk = builder.pooled_solver("glpk")
+    assert builder.pooled_solver("glpk") is glpk
+    assert builder.pooled_solver("cbc") is not glpk
+
+    nl_solver = builder.pooled_solver("gurobi", executable="/opt/solvers/gurobi", solver_io="nl")
+    assert builder.pooled_solver("gurobi", solver_io="nl", executable="/opt/solvers/gurobi") is nl_solver
+
+    # Solvers are owned by the builder
+    assert HybridDispatchBuilderSolver(site, {}).pooled_solver("glpk") is not glpk
+
+    builder.close_solvers()
+    assert builder.pooled_solver("glpk") is not glpk
+
+
+def test_dispatch_solver_pool_options(site):
+    builder = HybridDispatchBuilderSolver(site, {}, {'solver_options': {'tmlim': 10}, 'log_in_memory': True})
+
+    glpk_options = builder.pooled_solver_options(GLPK_SOLVER_OPTIONS, "glpk")
+    assert glpk_options["tmlim"] == 10
+    assert GLPK_SOLVER_OPTIONS["tmlim"] == 30
+    assert builder.pooled_solver_options(GLPK_SOLVER_OPTIONS, "glpk") is glpk_options
+    assert builder.solver_logging
+    assert builder.solver_log.getvalue() == ""
+
+    builder.close_solvers()
+    assert builder.pooled_solver_options(GLPK_SOLVER_OPTIONS, "glpk") is not glpk_options
+
+
+def test_dispatch_solver_pool_reuse(site):
+    wind_battery = {key: technologies[key] for key in ('wind', 'battery', 'grid')}
+
+    for tech in wind_battery.keys():
+        wind_battery[tech]["fin_model"] = DEFAULT_FIN_CONFIG
+
+    hopp_config = {
+        "site": site,
+        "technologies": wind_battery,
+        "config": {
+            "dispatch_options": {
+                'solver': 'cbc',
+                'is_test_start_year': True
+            }
+        }
+    }
+    hi = HoppInterface(hopp_config)
+    hi.simulate(1)
+
+    # Pooled solvers are closed at the end of the simulation
+    builder = hi.system.dispatch_builder
+    assert len(builder._solver_pool) == 0
+
+    objectives = []
+    solvers = []
+    for _ in range(2):
+        builder.solve_dispatch_model(0, 1)
+        objectives.append(builder.dispatch.objective_value)
+        solvers.append(list(builder._solver_pool.values()))
+
+    assert len(solvers[0]) == 1
+    assert solvers[1][0] is solvers[0][0]
+    assert objectives[1] == pytest.approx(objectives[0])
+
+
+def test_dispatch_solver_logs(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    log_name = str(tmp_path / "dispatch.log")
+
+    def solve(i):
+        HybridDispatchBuilderSolver.append_solve_to_log(log_name, "solve {}\n".format(i))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(solve, range(20)))
+
+    with open(log_name) as f:
+        lines = f.read().splitlines()
+    assert lines.count("=" * 50) == 20
+    assert sorted(line for line in lines if line.startswith("solve")) == sorted("solve {}".format(i) for i in range(20))
+
+    # Appends from forked processes are not interleaved, even when they are too large for a single write call
+    if is_fork_available():
+        def append_solves(i):
+            for j in range(10):
+                HybridDispatchBuilderSolver.append_solve_to_log(log_name, ("process {} ".format(i) * 100000) + "\n")
+
+        processes = [get_context("fork").Process(target=append_solves, args=(i,)) for i in range(4)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        with open(log_name) as f:
+            lines = f.read().splitlines()
+        for i in range(4):
+            assert lines.count(("process {} ".format(i) * 100000)) == 10
+
+    # The solver output is captured in memory, without solver log files, and written to the in-memory sink and the
+    # optional log file
+    class EchoSolver:
+        def solve(self, pyomo_model, options):
+            assert "log" not in options
+            self._log = "solved with {}\n".format(sorted(options.keys()))
+            return SimpleNamespace(solver=SimpleNamespace(termination_condition=TerminationCondition.optimal))
+
+    solver_log = io.StringIO()
+    for log_file in ("", log_name):
+        HybridDispatchBuilderSolver.glpk_solve_call(
+            pyomo.ConcreteModel(), log_file, solver=EchoSolver(), log_stream=solver_log
+        )
+    assert solver_log.getvalue().count("solved with ['cuts', 'presol', 'tmlim']") == 2
+    with open(log_name) as f:
+        assert f.read().endswith("=" * 50 + "\nsolved with ['cuts', 'presol', 'tmlim']\n")
+    assert list(tmp_path.glob("*.log")) == [Path(log_name)]
+
+    # Infeasible model dumps go to a unique file without redirecting stdout
+    model = pyomo.ConcreteModel()
+    model.blocks = pyomo.Block([0])
+    model.blocks[0].p = pyomo.Param(initialize=1.0, mutable=True)
+    stdout = sys.stdout
+    with pytest.raises(ValueError, match="infeasible_instance_"):
+        HybridDispatchBuilderSolver.print_infeasible_problem(model)
+    assert sys.stdout is stdout
+    dumps = list(tmp_path.glob("infeasible_instance_*.txt"))
+    assert len(dumps) == 1
+    assert "Parameter:  p" in dumps[0].read_text()
+
+
+def test_dispatch_solve_cache(site, tmp_path):
+    dispatch_options = {
+        'use_solve_cache': True,
+        'solve_cache_path': str(tmp_path / "dispatch_solves.sqlite"),
+        'is_test_start_year': True,
+    }
+    solar_battery = {key: technologies[key] for key in ('pv', 'battery', 'grid')}
+    for tech in solar_battery.keys():
+        solar_battery[tech]["fin_model"] = DEFAULT_FIN_CONFIG
+
+    def simulate():
+        hopp_config = {
+            "site": site,
+            "technologies": solar_battery,
+            "config": {
+                "dispatch_options": dispatch_options
+            }
+        }
+        hi = HoppInterface(hopp_config)
+        hi.simulate(1)
+        return hi.system
+
+    first = simulate()
+    n_solves = len(first.dispatch_builder.problem_state.objective)
+    assert n_solves > 0
+    assert first.dispatch_builder.solve_cache.hits + first.dispatch_builder.solve_cache.misses == n_solves
+
+    # Every window of an identical simulation is restored from the on-disk cache
+    second = simulate()
+    assert second.dispatch_builder.solve_cache.hits == n_solves
+    assert second.dispatch_builder.solve_cache.misses == 0
+    assert second.dispatch_builder.problem_state.objective == pytest.approx(first.dispatch_builder.problem_state.objective)
+    assert second.battery.outputs.dispatch_P == pytest.approx(first.battery.outputs.dispatch_P)
+    assert second.battery.outputs.P == pytest.approx(first.battery.outputs.P)
+
+    with pytest.raises(ValueError):
+        HybridDispatchOptions({'use_solve_cache': True, 'solve_cache_size': 0})
+
+
 def test_hybrid_dispatch_heuristic(site):
     dispatch_options = {'battery_dispatch': 'heuristic', 'grid_charging': False}
     wind_solar_battery = {key: technologies[key] for key in ('pv', 'wind', 'battery', 'grid')}
@@ -1140,4 +1400,100 @@ def test_dispatch_ldes_load_following_heuristic_with_wave(site, subtests):
     with subtests.test("charge power"):
         assert sum(discharge) > 0.0
     with subtests.test("discharge power"):
-        assert sum(charge) < 0.0
\ No newline at end of file
+        assert sum(charge) < 0.0
+
+def test_persistent_horizon_dispatch(site):
+    wind_battery = {key: technologies[key] for key in ('wind', 'battery', 'grid')}
+
+    for tech in wind_battery.keys():
+        wind_battery[tech]["fin_model"] = DEFAULT_FIN_CONFIG
+
+    objectives = []
+    for use_persistent_horizon in (False, True):
+        hopp_config = {
+            "site": site,
+            "technologies": wind_battery,
+            "config": {
+                "dispatch_options": {
+                    'solver': 'cbc',
+                    'is_test_start_year': True,
+                    'use_persistent_horizon': use_persistent_horizon
+                }
+            }
+        }
+        hi = HoppInterface(hopp_config)
+        hi.simulate(1)
+        objectives.append(hi.system.dispatch_builder.problem_state.objective)
+
+    assert len(objectives[1]) == 5
+    assert objectives[1] == pytest.approx(objectives[0], 1e-3)
+
+
+def test_persistent_horizon_unsupported_solver():
+    with pytest.raises(ValueError):
+        HybridDispatchOptions({'solver': 'glpk', 'use_persistent_horizon': True})
+
+
+def test_persistent_solve_time_limit():
+    class Solver:
+        def solve(self, model, timelimit, options, warmstart):
+            self.timelimit = timelimit
+            self.options = options
+            return SimpleNamespace(solver=SimpleNamespace(termination_condition=TerminationCondition.optimal))
+
+    opt = Solver()
+    HybridDispatchBuilderSolver.persistent_solve_call(opt, None)
+    assert opt.timelimit == 60
+    HybridDispatchBuilderSolver.persistent_solve_call(opt, None, {"seconds": 10, "ratioGap": 0.01})
+    assert opt.timelimit == 10
+    assert opt.options == {"seconds": 10, "ratioGap": 0.01}
+    user_options = {"timelimit": 5}
+    HybridDispatchBuilderSolver.persistent_solve_call(opt, None, user_options)
+    assert opt.timelimit == 5
+    assert opt.options == {}
+    assert user_options == {"timelimit": 5}
+
+
+def test_parallel_cluster_dispatch(site):
+    wind_battery = {key: technologies[key] for key in ('wind', 'battery', 'grid')}
+
+    for tech in wind_battery.keys():
+        wind_battery[tech]["fin_model"] = DEFAULT_FIN_CONFIG
+
+    systems = []
+    for n_cluster_processes in (1, 2):
+        hopp_config = {
+            "site": site,
+            "technologies": wind_battery,
+            "config": {
+                "dispatch_options": {
+                    'solver': 'cbc',
+                    'use_clustering': True,
+                    'n_clusters': 4,
+                    'n_cluster_processes': n_cluster_processes
+                }
+            }
+        }
+        hi = HoppInterface(hopp_config)
+        hi.simulate(1)
+        systems.append(hi.system)
+
+    serial, parallel = systems
+    assert len(parallel.dispatch_builder.problem_state.objective) == len(serial.dispatch_builder.problem_state.objective)
+
+    # Clusters are simulated in rounds of 2. The first cluster of each round has the same known states at 12 am as
+    # when simulated in series: none for the first round, those of the first two clusters for the second round.
+    clustering = serial.dispatch_builder.clustering
+    counts = clustering.clusters["count"]
+    order = sorted(range(len(counts)), key=counts.__getitem__)[:clustering.clusters["n_cluster"]]
+    for cluster_id in (order[0], order[2]):
+        hour_start, hour_end = clustering.get_soln_start_end_times(cluster_id)
+        for key in ('gen', 'SOC'):
+            assert getattr(parallel.battery.outputs, key)[hour_start:hour_end] == pytest.approx(
+                getattr(serial.battery.outputs, key)[hour_start:hour_end], 1e-3)
+    assert sum(parallel.battery.outputs.gen) != 0
+
+
+def test_cluster_processes_invalid():
+    with pytest.raises(ValueError):
+        HybridDispatchOptions({'n_cluster_processes': 0})
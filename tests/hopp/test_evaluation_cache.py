@@ -0,0 +1,135 @@
+import numpy as np
+import pytest
+
+from hopp.tools.optimization.driver.ask_tell_serial_driver import AskTellSerialDriver
+from hopp.tools.optimization.driver.evaluation_cache import EvaluationCache
+
+
+def conformer(candidate):
+    """Clamps candidates to [0, 1], with a penalty equal to the distance moved"""
+    candidate = np.asarray(candidate, dtype=float)
+    conformed = np.clip(candidate, 0.0, 1.0)
+    return conformed, float(np.abs(candidate - conformed).sum())
+
+
+class CountingObjective:
+    """Objective like OptimizationProblem.objective, scoring the conformed candidate minus its penalty"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, candidate):
+        self.calls.append(np.copy(candidate))
+        conformed, penalty = conformer(candidate)
+        score = -float(np.sum((conformed - 0.5) ** 2))
+        return score - penalty, score, conformed
+
+    def evaluate_many(self, candidates):
+        return [self(candidate) for candidate in candidates]
+
+
+class FixedOptimizer:
+    """Asks the same candidates every iteration"""
+
+    def __init__(self, candidates):
+        self.candidates = candidates
+        self.told = []
+
+    def ask(self, num=None):
+        return [np.copy(candidate) for candidate in self.candidates]
+
+    def tell(self, evaluations):
+        self.told.append(evaluations)
+
+    def stop(self):
+        return False
+
+
+def test_evaluation_cache_hit():
+    objective = CountingObjective()
+    driver = AskTellSerialDriver(evaluation_cache=EvaluationCache())
+    driver.setup(objective, None, conformer)
+
+    optimizer = FixedOptimizer([np.array([0.2, 0.3]), np.array([0.7, 0.1])])
+    driver.step(optimizer)
+    assert len(objective.calls) == 2
+
+    # The repeated candidates are taken from the cache without calling the objective
+    driver.step(optimizer)
+    assert len(objective.calls) == 2
+    assert driver.get_num_evaluations() == 4
+    assert driver.evaluation_cache.hits == 2
+    for first, second in zip(*optimizer.told):
+        assert second[0] == pytest.approx(first[0])
+        assert second[1] == pytest.approx(first[1])
+        np.testing.assert_array_equal(second[2], first[2])
+
+
+def test_evaluation_cache_batch_duplicates():
+    objective = CountingObjective()
+    cache = EvaluationCache(quantization=1e-3, conformer=conformer)
+
+    # Candidates closer than the quantization are evaluated once per batch
+    candidates = [np.array([0.2, 0.3]), np.array([0.2 + 1e-5, 0.3]), np.array([0.6, 0.6]), np.array([0.2, 0.3])]
+    evaluations = cache.evaluate(candidates, objective.evaluate_many)
+    assert len(objective.calls) == 2
+    assert cache.hits == 2
+    assert len(cache) == 2
+    assert evaluations[1][0] == pytest.approx(evaluations[0][0])
+    assert evaluations[3][0] == pytest.approx(evaluations[0][0])
+    assert evaluations[2][0] == pytest.approx(objective(candidates[2])[0])
+
+    # Returned candidates are copies, which the optimizer may modify
+    evaluations[1][2][0] = -1.0
+    assert evaluations[0][2][0] == pytest.approx(0.2)
+
+
+def test_evaluation_cache_conforming_penalty():
+    objective = CountingObjective()
+    cache = EvaluationCache(conformer=conformer)
+
+    # All candidates conform to [1, 0.5], with different penalties
+    candidates = [np.array([1.0, 0.5]), np.array([1.5, 0.5]), np.array([3.0, 0.5])]
+    evaluations = cache.evaluate(candidates, objective.evaluate_many)
+    assert len(objective.calls) == 1
+
+    repeated = cache.evaluate([np.array([2.0, 0.5])], objective.evaluate_many)
+    assert len(objective.calls) == 1
+
+    for candidate, evaluation in zip(candidates + [np.array([2.0, 0.5])], evaluations + repeated):
+        expected = objective(candidate)
+        assert evaluation[0] == pytest.approx(expected[0])
+        assert evaluation[1] == pytest.approx(expected[1])
+        np.testing.assert_array_equal(evaluation[2], [1.0, 0.5])
+    assert [evaluation[0] for evaluation in evaluations] == pytest.approx([-0.25, -0.75, -2.25])
+
+
+def test_evaluation_cache_persistence(tmp_path):
+    path = str(tmp_path / "evaluations.sqlite")
+    candidates = [np.array([0.2, 0.3]), np.array([1.5, 0.3])]
+
+    objective = CountingObjective()
+    cache = EvaluationCache(path=path, salt="problem", conformer=conformer)
+    evaluations = cache.evaluate(candidates, objective.evaluate_many)
+    assert len(objective.calls) == 2
+
+    # Another cache instance, e.g., of a restarted optimization, reads the evaluations from the database
+    restarted_objective = CountingObjective()
+    restarted = EvaluationCache(path=path, salt="problem", conformer=conformer)
+    assert len(restarted) == 0
+    restored = restarted.evaluate(candidates, restarted_objective.evaluate_many)
+    assert len(restarted_objective.calls) == 0
+    assert restarted.hits == 2
+    for evaluation, expected in zip(restored, evaluations):
+        assert evaluation[0] == pytest.approx(expected[0])
+        np.testing.assert_array_equal(evaluation[2], expected[2])
+
+    # Clearing the in-memory cache keeps the database
+    restarted.clear()
+    restarted.evaluate(candidates[:1], restarted_objective.evaluate_many)
+    assert len(restarted_objective.calls) == 0
+
+    # Caches of other problems do not share evaluations
+    other = EvaluationCache(path=path, salt="other problem", conformer=conformer)
+    other.evaluate(candidates, restarted_objective.evaluate_many)
+    assert len(restarted_objective.calls) == 2
@@ -1,4 +1,5 @@
 import platform
+import pytest
 from pytest import approx
 from hopp.simulation.technologies.layout.flicker_data.plot_flicker import *
 
@@ -198,4 +199,45 @@ def test_single_turbine_point(subtests):
     with subtests.test("average shadow"):
         assert(np.average(shadow) == approx(0.004629629629629629, 1e-4))
     with subtests.test("nonzero shadow count"):
-        assert(np.count_nonzero(shadow) == approx(2, 1e-4))
\ No newline at end of file
+        assert(np.count_nonzero(shadow) == approx(2, 1e-4))
+
+def test_single_turbine_raster(subtests):
+    FlickerMismatch.diam_mult_nwe = 3
+    FlickerMismatch.diam_mult_s = 1
+    FlickerMismatch.steps_per_hour = 1
+    FlickerMismatch.periodic = False
+    FlickerMismatch.turbine_tower_shadow = True
+
+    with subtests.test("invalid engine"):
+        with pytest.raises(ValueError):
+            FlickerMismatch(lat, lon, engine="shapely")
+
+    # same cases as test_single_turbine_multiple_angles, test_single_turbine_time_weighted and test_grid
+    with subtests.test("poa and power"):
+        flicker = FlickerMismatch(lat, lon, angles_per_step=3, engine="raster")
+        shadow, loss = flicker.create_heat_maps(range(3185, 3187), ("poa", "power"))
+
+        assert(np.max(shadow) == approx(1.0, 1e-4))
+        assert(np.average(shadow) == approx(0.0042229, 1e-4))
+        assert(np.count_nonzero(shadow) == 698)
+        assert(np.max(loss) == approx(0.313968, 1e-3))
+        assert(np.average(loss) == approx(0.0043577, 1e-3))
+        assert(np.count_nonzero(loss) == 3010)
+
+    with subtests.test("time"):
+        flicker = FlickerMismatch(lat, lon, angles_per_step=None, engine="raster")
+        (hours_shaded, ) = flicker.create_heat_maps(range(3187, 3189), ("time",))
+
+        assert(np.max(hours_shaded) == approx(0.5))
+        assert(np.average(hours_shaded) == approx(0.0016010, 1e-2))
+
+    with subtests.test("grid"):
+        flicker = FlickerMismatchGrid(lat, lon, 1, 2, 0, angles_per_step=1, engine="raster")
+        shadow, loss = flicker.create_heat_maps(range(3185, 3187), ("poa", "power"))
+
+        assert(np.max(shadow) == approx(1.0, 1e-4))
+        assert(np.average(shadow) == approx(0.031547, 1e-4))
+        assert(np.count_nonzero(shadow) == 390)
+        assert(np.max(loss) == approx(0.41805, 1e-3))
+        assert(np.average(loss) == approx(0.033173, 1e-3))
+        assert(np.count_nonzero(loss) == 1364)
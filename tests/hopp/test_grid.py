@@ -160,4 +160,29 @@ def test_simulate_grid_connection(mock_simulate_power, site, subtests):
         )
         assert grid.missed_load_percentage == 0., msg
 
-        assert_array_equal(grid.schedule_curtailed, np.repeat([0], timesteps)) 
\ No newline at end of file
+        assert_array_equal(grid.schedule_curtailed, np.repeat([0], timesteps)) 
+    with subtests.test("follow desired schedule: higher hours"):
+        # schedule alternates between 3 hours of 3 MW and 5 hours of 6 MW
+        desired_schedule = np.tile([3, 3, 3, 6, 6, 6, 6, 6], site.n_timesteps // 8)
+        site2 = create_default_site_info(
+            desired_schedule=desired_schedule,
+            curtailment_value_type = "desired_schedule"
+        )
+        config = GridConfig.from_dict({"interconnect_kw": interconnect_kw})
+        grid = Grid(site2, config=config)
+        dispatch_options = MagicMock(
+            use_higher_hours=True,
+            higher_hours={'min_regulation_hours': 3, 'min_regulation_power': 1000}
+        )
+        grid.simulate_grid_connection(
+            hybrid_size_kw,
+            total_gen,
+            project_life,
+            lifetime_sim,
+            total_gen_max_feasible_year1,
+            dispatch_options
+        )
+
+        # 5000 kW - 0.95 * 3000 kW > 1000 kW only during the 3 MW hours
+        assert grid.total_number_hours == 3 * timesteps // 8
+        assert_approx_equal(grid.time_load_met, 3 / 8 * 100)
@@ -6,6 +6,7 @@ from pytest import approx, fixture, raises
 
 import numpy as np
 import json
+import pickle
 
 from hopp.simulation import HoppInterface
 
@@ -703,6 +704,245 @@ def test_hybrid_pv_only(hybrid_config, subtests):
         assert npvs.hybrid == approx(-5121293, 1e3)
 
 
+def test_hybrid_evaluate_batch(hybrid_config, subtests):
+    technologies = hybrid_config["technologies"]
+    solar_only = {key: technologies[key] for key in ("pv", "grid")}
+    hybrid_config["technologies"] = solar_only
+    hi = HoppInterface(hybrid_config)
+
+    hybrid_plant = hi.system
+    pv_size_kw = hybrid_plant.pv.system_capacity_kw
+    candidates = [
+        {"pv": {"system_capacity_kw": pv_size_kw / 2}},
+        {},
+        {"pv": {"system_capacity_kw": pv_size_kw / 2, "dc_ac_ratio": 1.5}},
+    ]
+
+    results = hybrid_plant.evaluate_batch(candidates)
+
+    with subtests.test("one row per candidate"):
+        assert len(results) == len(candidates)
+        assert "pv.system_capacity_kw" in results.columns
+        assert "Hybrid AEP (GWh)" in results.columns
+
+    with subtests.test("unset values are restored"):
+        assert results["pv.system_capacity_kw"][1] == approx(pv_size_kw)
+        assert results["Pv AEP (GWh)"][1] == approx(10789795.03 / 1e6, 1e-3)
+        # re-assigning the capacity re-discretizes the PV layout
+        assert hybrid_plant.pv.system_capacity_kw == approx(pv_size_kw, 1e-3)
+
+    with subtests.test("matches single simulation"):
+        hi = HoppInterface(hybrid_config)
+        hi.system.pv.system_capacity_kw = pv_size_kw / 2
+        hi.simulate()
+        assert results["Pv AEP (GWh)"][0] == approx(hi.system.annual_energies.pv / 1e6)
+        assert results["Hybrid Net Present Value ($-million)"][0] == approx(hi.system.net_present_values.hybrid / 1e6)
+        assert results["pv.dc_ac_ratio"][2] == 1.5
+        assert results["Pv AEP (GWh)"][2] != approx(results["Pv AEP (GWh)"][0])
+
+    with subtests.test("process pool"):
+        parallel_results = hybrid_plant.evaluate_batch(candidates, n_processes=2)
+        assert parallel_results["Hybrid AEP (GWh)"].values == approx(results["Hybrid AEP (GWh)"].values, 1e-3)
+
+    with subtests.test("invalid technology"):
+        with raises(ValueError):
+            hybrid_plant.evaluate_batch([{"wind": {"num_turbines": 2}}])
+
+
+def test_hybrid_evaluate_batch_order_independent(hybrid_config, subtests):
+    technologies = hybrid_config["technologies"]
+    hybrid_config["technologies"] = {key: technologies[key] for key in ("pv", "battery", "grid")}
+    # clustering rewrites the battery's initial state of charge during a simulation
+    hybrid_config["config"]["dispatch_options"] = {"solver": "cbc", "use_clustering": True, "n_clusters": 4}
+    hi = HoppInterface(hybrid_config)
+
+    hybrid_plant = hi.system
+    battery_size_kwh = hybrid_plant.battery.system_capacity_kwh
+    candidates = [
+        {"battery": {"system_capacity_kwh": battery_size_kwh / 2}},
+        {},
+        {"battery": {"system_capacity_kwh": battery_size_kwh * 2}},
+    ]
+    columns = ["Battery AEP (GWh)", "Hybrid AEP (GWh)", "Hybrid Net Present Value ($-million)"]
+
+    results = hybrid_plant.evaluate_batch(candidates)
+    reversed_results = hybrid_plant.evaluate_batch(candidates[::-1])
+
+    with subtests.test("same results in any order"):
+        for column in columns:
+            assert results[column].values == approx(reversed_results[column].values[::-1])
+
+    with subtests.test("matches fresh plant"):
+        fresh = HoppInterface(hybrid_config)
+        fresh.system.battery.system_capacity_kwh = battery_size_kwh * 2
+        fresh.simulate()
+        assert results["Battery AEP (GWh)"][2] == approx(fresh.system.annual_energies.battery / 1e6)
+        assert results["Hybrid AEP (GWh)"][2] == approx(fresh.system.annual_energies.hybrid / 1e6)
+
+    with subtests.test("plant restored after error"):
+        # the second value cannot be set, after the first one was
+        with raises(IOError):
+            hybrid_plant.evaluate_batch([{"battery": {"system_capacity_kwh": battery_size_kwh / 2,
+                                                      "minimum_SOC": "not a number"}}])
+        assert hybrid_plant.battery.system_capacity_kwh == approx(battery_size_kwh)
+
+
+def test_hybrid_evaluate_batch_csp(hybrid_config, subtests):
+    hybrid_config["technologies"] = {
+        "tower": {"cycle_capacity_kw": 50 * 1000, "solar_multiple": 2.0, "tes_hours": 12.0},
+        "pv": {"system_capacity_kw": 50 * 1000},
+        "grid": {"interconnect_kw": 50000, "ppa_price": 0.12},
+    }
+    hybrid_config["config"]["dispatch_options"] = {"is_test_start_year": True, "is_test_end_year": True}
+    hi = HoppInterface(hybrid_config)
+
+    hybrid_plant = hi.system
+    tes_hours = hybrid_plant.tower.tes_hours
+    candidates = [
+        {"tower": {"tes_hours": tes_hours / 2}},
+        {},
+    ]
+
+    results = hybrid_plant.evaluate_batch(candidates)
+
+    with subtests.test("one row per candidate"):
+        assert len(results) == len(candidates)
+        assert results["tower.tes_hours"][1] == approx(tes_hours)
+        assert hybrid_plant.tower.tes_hours == approx(tes_hours)
+
+    with subtests.test("matches single simulation"):
+        fresh = HoppInterface(hybrid_config)
+        fresh.system.tower.tes_hours = tes_hours / 2
+        fresh.simulate()
+        assert results["Tower AEP (GWh)"][0] == approx(fresh.system.annual_energies.tower / 1e6)
+        assert results["Hybrid AEP (GWh)"][0] == approx(fresh.system.annual_energies.hybrid / 1e6)
+
+    with subtests.test("process pool"):
+        parallel_results = hybrid_plant.evaluate_batch(candidates, n_processes=2)
+        assert parallel_results["Hybrid AEP (GWh)"].values == approx(results["Hybrid AEP (GWh)"].values, 1e-3)
+
+
+def test_hybrid_snapshot_restore_copy(hybrid_config, subtests):
+    technologies = hybrid_config["technologies"]
+    hybrid_config["technologies"] = {key: technologies[key] for key in ("pv", "grid")}
+    hi = HoppInterface(hybrid_config)
+
+    hybrid_plant = hi.system
+    snapshot = hybrid_plant.snapshot()
+    hybrid_plant.simulate()
+    pv_size_kw = hybrid_plant.pv.system_capacity_kw
+    aep = hybrid_plant.annual_energies.hybrid
+    npv = hybrid_plant.net_present_values.hybrid
+
+    hybrid_plant.pv.system_capacity_kw = pv_size_kw / 2
+    hybrid_plant.pv.dc_ac_ratio = 1.5
+    hybrid_plant.ppa_price = 0.05
+    hybrid_plant.simulate()
+    assert hybrid_plant.annual_energies.hybrid != approx(aep)
+
+    with subtests.test("restore"):
+        hybrid_plant.restore(snapshot)
+        assert hybrid_plant.pv.system_capacity_kw == approx(pv_size_kw)
+        assert hybrid_plant.ppa_price == approx((hybrid_config["technologies"]["grid"]["ppa_price"],))
+        hybrid_plant.simulate()
+        assert hybrid_plant.annual_energies.hybrid == approx(aep)
+        assert hybrid_plant.net_present_values.hybrid == approx(npv)
+
+    with subtests.test("copy"):
+        clone = hybrid_plant.copy()
+        assert clone is not hybrid_plant
+        assert clone.site is hybrid_plant.site
+        clone.pv.system_capacity_kw = pv_size_kw / 4
+        assert hybrid_plant.pv.system_capacity_kw == approx(pv_size_kw)
+        # a pickled snapshot restores into another plant
+        clone.restore(pickle.loads(pickle.dumps(snapshot)))
+        clone.simulate()
+        assert clone.annual_energies.hybrid == approx(aep)
+        assert clone.net_present_values.hybrid == approx(npv)
+
+    with subtests.test("mismatched technologies"):
+        hybrid_config["technologies"] = {key: technologies[key] for key in ("battery", "grid")}
+        with raises(ValueError):
+            HoppInterface(hybrid_config).system.restore(snapshot)
+
+
+def test_hybrid_snapshot_restore_copy_battery(hybrid_config, subtests):
+    technologies = hybrid_config["technologies"]
+    hybrid_config["technologies"] = {key: technologies[key] for key in ("pv", "battery", "grid")}
+    hybrid_config["config"]["dispatch_options"] = {"solver": "cbc", "is_test_start_year": True}
+    hi = HoppInterface(hybrid_config)
+
+    hybrid_plant = hi.system
+    snapshot = hybrid_plant.snapshot()
+    hybrid_plant.simulate()
+    battery_size_kwh = hybrid_plant.battery.system_capacity_kwh
+    aeps = hybrid_plant.annual_energies
+    base_energies = {"pv": aeps.pv, "battery": aeps.battery, "hybrid": aeps.hybrid}
+
+    hybrid_plant.battery.system_capacity_kwh = battery_size_kwh / 2
+    hybrid_plant.pv.system_capacity_kw = hybrid_plant.pv.system_capacity_kw / 2
+    hybrid_plant.simulate()
+    assert hybrid_plant.annual_energies.hybrid != approx(base_energies["hybrid"])
+
+    with subtests.test("restore"):
+        hybrid_plant.restore(snapshot)
+        assert hybrid_plant.battery.system_capacity_kwh == approx(battery_size_kwh)
+        hybrid_plant.simulate()
+        for key, energy in base_energies.items():
+            assert getattr(hybrid_plant.annual_energies, key) == approx(energy)
+
+    with subtests.test("copy"):
+        clone = hybrid_plant.copy()
+        clone.battery.system_capacity_kwh = battery_size_kwh / 4
+        assert hybrid_plant.battery.system_capacity_kwh == approx(battery_size_kwh)
+        clone.restore(snapshot)
+        clone.simulate()
+        for key, energy in base_energies.items():
+            assert getattr(clone.annual_energies, key) == approx(energy)
+
+
+def test_hybrid_snapshot_restore_copy_csp(hybrid_config, subtests):
+    technologies = {
+        "tower": {"cycle_capacity_kw": 50 * 1000, "solar_multiple": 2.0, "tes_hours": 12.0},
+        "pv": {"system_capacity_kw": 50 * 1000},
+        "grid": {"interconnect_kw": 50000, "ppa_price": 0.12},
+    }
+    hybrid_config["technologies"] = technologies
+    hybrid_config["config"]["dispatch_options"] = {"is_test_start_year": True, "is_test_end_year": True}
+    hi = HoppInterface(hybrid_config)
+
+    hybrid_plant = hi.system
+    hybrid_plant.tower.value("helio_width", 8.0)
+    hybrid_plant.tower.value("helio_height", 8.0)
+    snapshot = hybrid_plant.snapshot()
+    hybrid_plant.simulate()
+    tes_hours = hybrid_plant.tower.tes_hours
+    aeps = hybrid_plant.annual_energies
+    base_energies = {"pv": aeps.pv, "tower": aeps.tower, "hybrid": aeps.hybrid}
+
+    hybrid_plant.tower.tes_hours = tes_hours / 2
+    hybrid_plant.simulate()
+    assert hybrid_plant.annual_energies.tower != approx(base_energies["tower"])
+
+    with subtests.test("restore"):
+        hybrid_plant.restore(snapshot)
+        assert hybrid_plant.tower.tes_hours == approx(tes_hours)
+        hybrid_plant.simulate()
+        for key, energy in base_energies.items():
+            assert getattr(hybrid_plant.annual_energies, key) == approx(energy)
+
+    with subtests.test("copy"):
+        clone = hybrid_plant.copy()
+        assert clone.tower.ssc.ssc is not hybrid_plant.tower.ssc.ssc
+        clone.tower.tes_hours = tes_hours / 4
+        assert hybrid_plant.tower.tes_hours == approx(tes_hours)
+        # a pickled snapshot restores into another plant
+        clone.restore(pickle.loads(pickle.dumps(snapshot)))
+        clone.simulate()
+        for key, energy in base_energies.items():
+            assert getattr(clone.annual_energies, key) == approx(energy)
+
+
 def test_hybrid_pv_only_custom_fin(hybrid_config, subtests):
     solar_only = {
         "pv": {
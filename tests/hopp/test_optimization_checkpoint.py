@@ -0,0 +1,146 @@
+import shutil
+
+import numpy as np
+import pytest
+
+from hopp.tools.optimization.data_logging.columnar_data_recorder import ColumnarDataRecorder
+from hopp.tools.optimization.data_logging.data_recorder import DataRecorder
+from hopp.tools.optimization.optimization_checkpoint import read_checkpoint
+from hopp.tools.optimization.optimization_driver import OptimizationDriver
+from tests.hopp.utils import QuadraticProblem
+
+CEM_KWARGS = {"prior_scale": 1.0, "generation_size": 8, "selection_proportion": 0.5}
+
+
+def assert_records_equal(records, expected):
+    assert len(records) == len(expected)
+    for record, expected_record in zip(records, expected):
+        assert len(record) == len(expected_record)
+        for value, expected_value in zip(record, expected_record):
+            if isinstance(expected_value, list):
+                assert len(value) == len(expected_value)
+                for item, expected_item in zip(value, expected_value):
+                    np.testing.assert_equal(item, expected_item)
+            else:
+                np.testing.assert_equal(value, expected_value)
+
+
+def test_checkpoint_resume_serial_cem(tmp_path):
+    checkpoint_path = str(tmp_path / "checkpoint.pkl")
+    interrupted_path = str(tmp_path / "interrupted.pkl")
+
+    # Uninterrupted run, checkpointing every iteration
+    np.random.seed(0)
+    driver = OptimizationDriver(QuadraticProblem(), "CEM", DataRecorder(), nprocs=1,
+                                checkpoint_path=checkpoint_path, **CEM_KWARGS)
+    for i in range(6):
+        driver.step()
+        if i == 2:
+            shutil.copy(checkpoint_path, interrupted_path)
+    expected_records = driver.recorder.get_records()
+    expected_best = driver.best_solution()
+    expected_mean = driver._optimizer.mean()
+    driver.close()
+
+    # A run resumed from the checkpoint of the third iteration reproduces the uninterrupted run
+    np.random.seed(1)
+    resumed = OptimizationDriver(QuadraticProblem(), "CEM", DataRecorder(), nprocs=1,
+                                 checkpoint_path=interrupted_path, **CEM_KWARGS)
+    resumed.resume()
+    assert resumed.num_iterations() == 3
+    assert resumed.num_evaluations() == 24
+    for _ in range(3):
+        resumed.step()
+
+    assert resumed.num_iterations() == 6
+    assert resumed.num_evaluations() == driver.num_evaluations()
+    np.testing.assert_array_equal(resumed._optimizer.mean(), expected_mean)
+    best = resumed.best_solution()
+    assert best[0] == expected_best[0]
+    np.testing.assert_array_equal(best[2], expected_best[2])
+    assert_records_equal(resumed.recorder.get_records(), expected_records)
+    resumed.close()
+
+
+def test_checkpoint_resume_columnar_recorder(tmp_path):
+    checkpoint_path = str(tmp_path / "checkpoint.pkl")
+    interrupted_path = str(tmp_path / "interrupted.pkl")
+    records_path = tmp_path / "records"
+
+    np.random.seed(0)
+    driver = OptimizationDriver(QuadraticProblem(), "CEM", ColumnarDataRecorder(str(records_path), batch_size=4),
+                                nprocs=1, checkpoint_path=checkpoint_path, **CEM_KWARGS)
+    for i in range(6):
+        driver.step()
+        if i == 2:
+            shutil.copy(checkpoint_path, interrupted_path)
+    expected_records = driver.recorder.get_records()
+    driver.close()
+
+    # The resumed run drops the records written after the checkpoint and continues recording to the same directory
+    np.random.seed(1)
+    resumed = OptimizationDriver(QuadraticProblem(), "CEM", ColumnarDataRecorder(str(records_path), mode='a'),
+                                 nprocs=1, checkpoint_path=interrupted_path, **CEM_KWARGS)
+    # the checkpoint holds the position of the recorded data instead of the records
+    state = read_checkpoint(interrupted_path, resumed._checkpoint_shared_objects(), restore_random_state=False)
+    assert state['recorder_state'] == 3
+    resumed.resume()
+    assert len(resumed.recorder) == 3
+    for _ in range(3):
+        resumed.step()
+    assert_records_equal(resumed.recorder.get_records(), expected_records)
+    resumed.close()
+
+
+def test_checkpoint_resume_mismatch(tmp_path):
+    checkpoint_path = str(tmp_path / "checkpoint.pkl")
+    driver = OptimizationDriver(QuadraticProblem(), "CEM", DataRecorder(), nprocs=1,
+                                checkpoint_path=checkpoint_path, **CEM_KWARGS)
+    driver.step()
+    driver.close()
+
+    # Resuming with another optimizer fails
+    other_optimizer = OptimizationDriver(QuadraticProblem(), "GA", DataRecorder(), nprocs=1, **CEM_KWARGS)
+    with pytest.raises(ValueError):
+        other_optimizer.resume(checkpoint_path)
+    other_optimizer.close()
+
+    # Resuming with another driver fails
+    other_driver = OptimizationDriver(QuadraticProblem(), "CEM", DataRecorder(), nprocs=2, **CEM_KWARGS)
+    with pytest.raises(ValueError):
+        other_driver.resume(checkpoint_path)
+    other_driver.close()
+
+    # Resuming without a checkpoint path fails
+    no_path = OptimizationDriver(QuadraticProblem(), "CEM", DataRecorder(), nprocs=1, **CEM_KWARGS)
+    with pytest.raises(ValueError):
+        no_path.resume()
+    no_path.close()
+
+
+def test_data_recorder_restore():
+    recorder = DataRecorder()
+    recorder.add_columns('iteration', 'score', 'solution')
+    recorder.set_schema()
+    for i in range(3):
+        recorder.accumulate(i, -float(i), np.array([i, i + 1.0]))
+        recorder.store()
+    records = recorder.checkpoint()
+
+    restored = DataRecorder()
+    restored.add_columns('iteration', 'score', 'solution')
+    restored.set_schema()
+    restored.restore(records)
+    assert_records_equal(restored.get_records(), records)
+    assert restored.get_column('score') == [0.0, -1.0, -2.0]
+
+    # Restored records are copies, and recording continues after them
+    records[0][1] = 10.0
+    assert restored.get_record(0)[1] == 0.0
+    restored.accumulate(3, -3.0, np.array([3.0, 4.0]))
+    restored.store()
+    assert restored.get_column('iteration') == [0, 1, 2, 3]
+
+    # Restoring before setting the schema fails
+    with pytest.raises(Exception):
+        DataRecorder().restore(records)
@@ -1,10 +1,26 @@
+import multiprocessing
 import os
+import shutil
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
+import numpy as np
+import PySAM.Pvwattsv8 as Pvwattsv8
 import requests
 import pytest
 import responses
 
-from hopp.simulation.technologies.resource import Resource
+from hopp import ROOT_DIR
+from hopp.simulation.technologies.resource import Resource, SolarResource
+from hopp.simulation.technologies.resource.download_manager import DownloadManager
+from hopp.simulation.technologies.resource.resource_cache import (
+    RESOURCE_CACHE_DIR_ENV,
+    load_resource_data,
+    parser_fingerprint,
+    resource_cache_path,
+)
 
 api_url = "https://api.example.com/data"
 fname = "testfile.csv"
@@ -72,4 +88,230 @@ def test_call_api_429_error():
         status=429
     )
     with pytest.raises(RuntimeError):
-        Resource.call_api(api_url, fname)
\ No newline at end of file
+        Resource.call_api(api_url, fname)
+
+def test_resource_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv(RESOURCE_CACHE_DIR_ENV, str(tmp_path / "cache"))
+    solar_file = ROOT_DIR / "simulation" / "resource_files" / "solar" / "35.2018863_-101.945027_psmv3_60_2012.csv"
+    filepath = tmp_path / solar_file.name
+    shutil.copy(solar_file, filepath)
+    cache_path = resource_cache_path(filepath)
+    assert cache_path.parent == tmp_path / "cache"
+
+    # caching is opt-in
+    uncached = SolarResource(35.2018863, -101.945027, 2012, filepath=filepath)
+    assert not cache_path.exists()
+
+    # the first load writes the cache, the second reads it
+    cached = SolarResource(35.2018863, -101.945027, 2012, filepath=filepath, use_cache=True)
+    assert cache_path.exists()
+    reloaded = SolarResource(35.2018863, -101.945027, 2012, filepath=filepath, use_cache=True)
+    for solar in (cached, reloaded):
+        assert solar.data == uncached.data
+        assert isinstance(solar.data["gh"], list)
+        for key, value in uncached.data.items():
+            assert np.array_equal(solar.data_arrays[key], value)
+
+    # the arrays read from the cache are memory-mapped and read-only, the data can be passed to PySAM
+    assert isinstance(reloaded.data_arrays["gh"], np.memmap)
+    assert not reloaded.data_arrays["gh"].flags.writeable
+    assert isinstance(uncached.data_arrays["gh"], np.ndarray)
+    pvwatts = Pvwattsv8.new()
+    pvwatts.SolarResource.solar_resource_data = reloaded.data
+
+    # changes to the resource file invalidate the cache
+    lines = filepath.read_text().splitlines(keepends=True)
+    values = lines[3].split(",")
+    gh_index = lines[2].split(",").index("GHI")
+    values[gh_index] = "1234"
+    lines[3] = ",".join(values)
+    filepath.write_text("".join(lines))
+    modified = SolarResource(35.2018863, -101.945027, 2012, filepath=filepath, use_cache=True)
+    assert modified.data["gh"][0] == 1234
+    assert modified.data["gh"][1:] == uncached.data["gh"][1:]
+    # the arrays of the earlier version of the file are removed
+    assert len(list(cache_path.parent.glob("*.npy"))) == len([v for v in modified.data.values() if isinstance(v, list)])
+
+
+def test_resource_cache_array(tmp_path, monkeypatch):
+    monkeypatch.setenv(RESOURCE_CACHE_DIR_ENV, str(tmp_path / "cache"))
+    filepath = tmp_path / "prices.csv"
+    np.savetxt(filepath, np.arange(8760) / 8760)
+
+    def parse_prices():
+        return np.loadtxt(filepath)
+
+    load_resource_data(filepath, parse_prices)
+    data = load_resource_data(filepath, lambda: pytest.fail("resource file should not be parsed"), parser=parse_prices)
+    assert isinstance(data, np.ndarray)
+    assert np.array_equal(data, np.arange(8760) / 8760)
+
+    # other parse options are cached separately
+    data = load_resource_data(filepath, lambda: np.loadtxt(filepath)[:24], options={"hours": 24})
+    assert len(data) == 24
+
+
+def test_resource_cache_parser(tmp_path, monkeypatch):
+    monkeypatch.setenv(RESOURCE_CACHE_DIR_ENV, str(tmp_path / "cache"))
+    filepath = tmp_path / "prices.csv"
+    np.savetxt(filepath, np.arange(24))
+
+    def parse_prices():
+        return np.loadtxt(filepath)
+
+    def parse_scaled_prices():
+        return np.loadtxt(filepath) * 2
+
+    def parse_scaled_prices_changed():
+        return np.loadtxt(filepath) * 3
+
+    # the cache is not written next to the resource file
+    load_resource_data(filepath, parse_prices)
+    assert resource_cache_path(filepath).is_file()
+    assert list(tmp_path.glob("*.npy")) == []
+
+    # a different parser, or a change to the parser's code, misses the cache
+    assert parser_fingerprint(parse_scaled_prices) != parser_fingerprint(parse_scaled_prices_changed)
+    assert load_resource_data(filepath, parse_scaled_prices)[1] == 2
+    data = load_resource_data(filepath, lambda: parse_scaled_prices_changed(), parser=parse_scaled_prices_changed)
+    assert data[1] == 3
+
+    # a parse function wrapping the parser is identified by the parser
+    data = load_resource_data(filepath, lambda: pytest.fail("resource file should not be parsed"),
+                              parser=parse_scaled_prices_changed)
+    assert data[1] == 3
+
+    # the cache directory can be set
+    load_resource_data(filepath, parse_prices, cache_dir=tmp_path / "other")
+    assert resource_cache_path(filepath, tmp_path / "other").is_file()
+
+
+resource_body = ("Source,Location ID\nNSRDB,12345\nYear,Temperature (\u00b0C),Wind Direction (\u00b0)\n"
+                 + "".join(f"2012,{i},{i * 2}\n" for i in range(500))).encode()
+
+
+class StubResourceHandler(BaseHTTPRequestHandler):
+    """Local resource API which fails, rate limits or truncates the first requests of some paths."""
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests[self.path] += 1
+            n = server.requests[self.path]
+        if self.path.startswith("/slow"):
+            with server.lock:
+                server.active[self.path] += 1
+                server.max_active[self.path] = max(server.max_active[self.path], server.active[self.path])
+            time.sleep(0.1)
+            self._send(200, resource_body)
+            with server.lock:
+                server.active[self.path] -= 1
+        elif self.path.startswith("/flaky") and n <= 2:
+            self._send(503, b"")
+        elif self.path.startswith("/rate_limited") and n == 1:
+            self._send(429, b"", {"Retry-After": "0"})
+        elif self.path.startswith("/truncated") and n == 1:
+            # promise the full file but drop the connection halfway through
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(resource_body)))
+            self.end_headers()
+            self.wfile.write(resource_body[:len(resource_body) // 2])
+            self.wfile.flush()
+            self.close_connection = True
+        elif self.path.startswith("/truncated") and "Range" in self.headers:
+            start = int(self.headers["Range"][len("bytes="):-1])
+            with server.lock:
+                server.ranges.append(start)
+            self._send(206, resource_body[start:], {
+                "Content-Range": f"bytes {start}-{len(resource_body) - 1}/{len(resource_body)}"
+            })
+        else:
+            self._send(200, resource_body)
+
+    def _send(self, status, body, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", "text/csv; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def resource_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubResourceHandler)
+    server.lock = threading.Lock()
+    server.requests = defaultdict(int)
+    server.ranges = []
+    server.active = defaultdict(int)
+    server.max_active = defaultdict(int)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_download_manager(resource_server, tmp_path):
+    base_url = f"http://127.0.0.1:{resource_server.server_address[1]}"
+    manager = DownloadManager(max_workers=4, backoff=0.01)
+    paths = ["/ok", "/flaky", "/rate_limited"] + [f"/site_{i}" for i in range(6)]
+    items = [(base_url + path, tmp_path / f"{path[1:]}.csv") for path in paths]
+
+    assert manager.download_many(items) == [True] * len(items)
+    for _, filename in items:
+        assert filename.read_bytes() == resource_body
+    assert resource_server.requests["/flaky"] == 3
+    assert resource_server.requests["/rate_limited"] == 2
+    assert not list(tmp_path.glob("*.part"))
+
+    # downloads through the resource API reformat units
+    filename = tmp_path / "solar.csv"
+    assert Resource.call_api(base_url + "/ok", filename)
+    header = filename.read_text().splitlines()[2]
+    assert header == "Year,Temperature (C),Wind Direction (deg)"
+    manager.close()
+
+
+def test_download_manager_resume(resource_server, tmp_path):
+    base_url = f"http://127.0.0.1:{resource_server.server_address[1]}"
+    manager = DownloadManager(backoff=0.01, chunk_size=256)
+    filename = tmp_path / "truncated.csv"
+
+    assert manager.download(base_url + "/truncated", filename)
+    assert filename.read_bytes() == resource_body
+    # the second request only asked for the part of the file that was not written yet
+    assert len(resource_server.ranges) == 1
+    assert 0 < resource_server.ranges[0] <= len(resource_body) // 2
+    assert not filename.with_name(filename.name + ".part").exists()
+
+    with pytest.raises(ValueError):
+        DownloadManager(max_workers=0)
+    manager.close()
+
+
+def _download_slow(base_url, filename):
+    return DownloadManager(backoff=0.01).download(base_url + "/slow", filename)
+
+
+def test_download_manager_concurrent(resource_server, tmp_path):
+    base_url = f"http://127.0.0.1:{resource_server.server_address[1]}"
+    filename = tmp_path / "slow.csv"
+
+    # downloads of the same file in other processes and threads wait for each other instead of sharing the partial file
+    with multiprocessing.get_context("fork").Pool(4) as pool:
+        assert pool.starmap(_download_slow, [(base_url, filename)] * 4) == [True] * 4
+    manager = DownloadManager(max_workers=4, backoff=0.01)
+    filename.unlink()
+    assert manager.download_many([(base_url + "/slow", filename)] * 4) == [True] * 4
+    manager.close()
+
+    assert filename.read_bytes() == resource_body
+    assert resource_server.max_active["/slow"] == 1
+    assert not list(tmp_path.glob("*.part"))
+    assert not list(tmp_path.glob("*.lock"))
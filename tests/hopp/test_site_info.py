@@ -39,6 +39,24 @@ def site():
     )
 
 
+def test_site_resource_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOPP_RESOURCE_CACHE_DIR", str(tmp_path))
+    uncached = SiteInfo(flatirons_site, solar_resource_file=solar_resource_file,
+                        wind_resource_file=wind_resource_file, grid_resource_file=grid_resource_file)
+    assert list(tmp_path.iterdir()) == []
+
+    # the resource caches are only written if asked for
+    for _ in range(2):
+        cached = SiteInfo(flatirons_site, solar_resource_file=solar_resource_file,
+                          wind_resource_file=wind_resource_file, grid_resource_file=grid_resource_file,
+                          use_resource_cache=True)
+        assert len(list(tmp_path.glob("*.hopp_cache.json"))) == 3
+        assert cached.solar_resource.data == uncached.solar_resource.data
+        assert cached.wind_resource.data == uncached.wind_resource.data
+        assert_array_equal(cached.elec_prices.data, uncached.elec_prices.data)
+        assert_array_equal(cached.wind_resource.data_arrays["data"], uncached.wind_resource.data["data"])
+
+
 def test_site_init(site):
     """Site should initialize properly."""
     assert site is not None
@@ -1,3 +1,5 @@
+from unittest.mock import MagicMock
+
 import pytest
 from pytest import fixture
 
@@ -30,6 +32,7 @@ def test_trough_config(subtests):
         assert config.fin_model is None
         assert config.optimize_field_before_sim == True
         assert config.scale_input_params == False
+        assert config.field_cache_dir is None
         assert config.name == "TowerPlant"
 
     with subtests.test("with invalid tech_name"):
@@ -59,4 +62,47 @@ def test_trough_init(site, subtests):
         data = config_data.copy()
         data["scale_input_params"] = True
 
-        TowerPlant(site, config=config)
\ No newline at end of file
+        TowerPlant(site, config=config)
+
+def test_tower_field_cache(site, tmp_path):
+    data = config_data.copy()
+    data["optimize_field_before_sim"] = False
+    data["field_cache_dir"] = str(tmp_path)
+
+    tower = TowerPlant(site, config=TowerConfig.from_dict(data))
+    field_and_flux_maps = tower.create_field_layout_and_simulate_flux_eta_maps()
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+    # Changing storage hours doesn't change the field, so SolarPILOT is skipped
+    TowerPlant._field_and_flux_maps_cache.clear()
+    data["tes_hours"] = 10.0
+    cached_tower = TowerPlant(site, config=TowerConfig.from_dict(data))
+    cached_tower.ssc.execute = MagicMock(side_effect=AssertionError("SolarPILOT should not run"))
+    cached_field_and_flux_maps = cached_tower.create_field_layout_and_simulate_flux_eta_maps()
+
+    assert cached_field_and_flux_maps["N_hel"] == field_and_flux_maps["N_hel"]
+    assert_array_equal(cached_tower.ssc.get("helio_positions"), tower.ssc.get("helio_positions"))
+
+
+def test_tower_field_cache_key(site):
+    data = config_data.copy()
+    data["optimize_field_before_sim"] = False
+
+    tower = TowerPlant(site, config=TowerConfig.from_dict(data))
+    tower.ssc.set({'field_model_type': 1})
+    cache_key = tower.field_and_flux_maps_cache_key()
+    field_and_flux_maps = tower.create_field_layout_and_simulate_flux_eta_maps()
+
+    # The generated layout replaces inputs, e.g., heliostat positions, that are not part of the key
+    tower.ssc.set({'field_model_type': 1})
+    assert tower.field_and_flux_maps_cache_key() == cache_key
+
+    # Only inputs that drive the field layout and flux/eta maps change the key
+    tower.ssc.set({'disp_frequency': tower.ssc.get('disp_frequency') + 1})
+    assert tower.field_and_flux_maps_cache_key() == cache_key
+    tower.ssc.set({'helio_width': tower.ssc.get('helio_width') + 1})
+    assert tower.field_and_flux_maps_cache_key() != cache_key
+
+    # Cached layouts are copies
+    field_and_flux_maps["N_hel"] = -1
+    assert TowerPlant._field_and_flux_maps_cache.get(cache_key)["N_hel"] != -1
@@ -1,8 +1,11 @@
+from unittest.mock import MagicMock
+
 import pytest
 from pytest import fixture
 
 from numpy.testing import assert_array_equal
 
+from hopp.simulation.technologies.csp.csp_plant import FORECAST_OUTPUT_NAMES
 from hopp.simulation.technologies.csp.trough_plant import TroughConfig, TroughPlant
 from tests.hopp.utils import create_default_site_info
 
@@ -29,6 +32,7 @@ def test_trough_config(subtests):
         assert config.tes_hours == config_data["tes_hours"]
         assert config.fin_model is None
         assert config.name == "TroughPlant"
+        assert config.forecast_cache_dir is None
 
     with subtests.test("with invalid tech_name"):
         data = config_data.copy()
@@ -46,4 +50,29 @@ def test_trough_init(site, subtests):
 
         assert trough._financial_model is not None
         param_files_keys = ["tech_model_params_path", "cf_params_path", "wlim_series_path"]
-        assert_array_equal(list(trough.param_files.keys()), param_files_keys)
\ No newline at end of file
+        assert_array_equal(list(trough.param_files.keys()), param_files_keys)
+
+def test_trough_thermal_forecast_cache(site, tmp_path):
+    data = config_data.copy()
+    data["forecast_cache_dir"] = str(tmp_path)
+
+    trough = TroughPlant(site, config=TroughConfig.from_dict(data))
+    trough.setup_performance_model()
+    assert len(list(tmp_path.glob("*.npz"))) == 1
+
+    # Changing storage hours doesn't change the forecast, so the year-long simulation is skipped
+    TroughPlant._thermal_forecast_cache.clear()
+    data["tes_hours"] = 10.0
+    cached_trough = TroughPlant(site, config=TroughConfig.from_dict(data))
+    cached_trough.ssc.execute = MagicMock(side_effect=AssertionError("Forecast should not run"))
+    cached_trough.setup_performance_model()
+
+    assert cached_trough.solar_thermal_resource == pytest.approx(trough.solar_thermal_resource)
+    assert cached_trough.cycle_efficiency_tables.keys() == trough.cycle_efficiency_tables.keys()
+    assert cached_trough.value("tshours") == 10.0
+
+    # Simulated and cached forecasts return the same outputs, as copies
+    forecast = cached_trough.run_year_for_max_thermal_gen()
+    assert set(forecast.keys()) <= set(FORECAST_OUTPUT_NAMES)
+    forecast['Q_thermal'][0] = -1.0
+    assert cached_trough.run_year_for_max_thermal_gen()['Q_thermal'][0] != -1.0
@@ -210,6 +210,33 @@ def test_changing_system_capacity_floris(site):
     assert model._system_model.nTurbs == new_num_turbs
     assert model._system_model.system_capacity == new_capacity_kW 
 
+def test_floris_wind_rose_binning(site):
+    floris_config_path = (
+        ROOT_DIR.parent / "tests" / "hopp" / "inputs" / "floris_config.yaml"
+    )
+    site.wind_resource.hub_height_meters = 90.0
+    config_dict = {'num_turbines': 4, "turbine_rating_kw": 5000, "model_name": "floris", "timestep": [0, 8760], "floris_config": floris_config_path}
+    model = WindPlant(site, config=WindConfig.from_dict(config_dict))
+    model.simulate_power(1)
+
+    config_dict["floris_wind_rose_binning"] = True
+    binned_model = WindPlant(site, config=WindConfig.from_dict(config_dict))
+    binned_model.simulate_power(1)
+    assert binned_model.annual_energy_kwh == approx(model.annual_energy_kwh, rel=1e-2)
+    assert len(binned_model._system_model._bin_cache) == 1
+
+    # repeated layouts reuse the cached bins, new layouts are added to the cache
+    gen = binned_model._system_model.gen
+    binned_model.simulate_power(1)
+    assert binned_model._system_model.gen == approx(gen)
+    assert len(binned_model._system_model._bin_cache) == 1
+
+    xcoords, ycoords = binned_model._system_model.wind_farm_layout
+    binned_model._system_model.set_wind_farm_layout(xcoords, ycoords + 500.0)
+    binned_model.simulate_power(1)
+    assert len(binned_model._system_model._bin_cache) == 2
+
+
 def test_alaska_wind_pysam():
     site_data = {
         "lat": 66.68,
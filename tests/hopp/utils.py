@@ -1,5 +1,8 @@
+import numpy as np
+
 from hopp import ROOT_DIR
 from hopp.simulation.technologies.sites import SiteInfo, flatirons_site
+from hopp.tools.optimization.optimization_problem import OptimizationProblem
 
 # default resource files
 DEFAULT_SOLAR_RESOURCE_FILE = ROOT_DIR / "simulation" / "resource_files" / "solar" / "35.2018863_-101.945027_psmv3_60_2012.csv"
@@ -60,4 +63,22 @@ def create_default_site_info(**kwargs):
         solar_resource_file=DEFAULT_SOLAR_RESOURCE_FILE,
         wind_resource_file=DEFAULT_WIND_RESOURCE_FILE,
         **kwargs
-    )
\ No newline at end of file
+    )
+
+
+class QuadraticProblem(OptimizationProblem):
+    """Optimization problem with a quadratic objective, with its maximum at `target`, to test optimization drivers."""
+
+    def __init__(self, target=(0.5, -0.5)):
+        super().__init__()
+        self.target = np.asarray(target, dtype=float)
+        for i in range(len(self.target)):
+            self.candidate_dict[f"x{i}"] = {"min": -2.0, "max": 2.0, "prior": {"mu": 0.0, "sigma": 1.0}}
+
+    def _set_simulation_to_candidate(self, candidate):
+        return 0.0, candidate
+
+    def objective(self, candidate):
+        conformed, penalty = self.conform_candidate_and_get_penalty(candidate)
+        score = -float(np.sum((conformed - self.target) ** 2))
+        return score - penalty, score, conformed